@@ -0,0 +1 @@
+"""Benchmarks das rotas da API."""
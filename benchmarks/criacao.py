@@ -0,0 +1,150 @@
+"""Mede o custo das rotas de criação.
+
+Para cada ``POST`` de criação informa a latência média e quantos comandos
+SQL cada requisição executa. Roda contra o banco de ``DATABASE_URL``, que
+deve ser descartável: as tabelas são criadas e as linhas ficam gravadas.
+
+Uso: ``DATABASE_URL=sqlite:///bench.db PYTHONPATH=src uv run python
+benchmarks/criacao.py [--repeticoes N]``.
+"""
+
+import argparse
+import logging
+import time
+from collections.abc import Callable
+from itertools import count
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app import app
+from database import engine
+
+logger = logging.getLogger(__name__)
+
+Corpo = Callable[[int], dict[str, Any]]
+
+# Cada rota recebe o número da repetição para gerar valores únicos; as
+# chaves estrangeiras apontam para o usuário, o evento e a obra de id 1,
+# criados pelas primeiras rotas da lista.
+ROTAS: list[tuple[str, Corpo]] = [
+    (
+        "/usuarios/",
+        lambda i: {
+            "nome": f"Usuário {i}",
+            "email": f"usuario{i}@example.com",
+            "funcao": 2,
+            "biografia": "",
+            "senha": "x",
+        },
+    ),
+    ("/categorias/", lambda i: {"nome": f"Categoria {i}"}),
+    (
+        "/eventos/",
+        lambda i: {
+            "nome": f"Evento {i}",
+            "endereco": "Rua A",
+            "local": "Galeria",
+            "data": "2025-01-01T00:00:00",
+            "id_organizador": 1,
+            "id_responsavel": 1,
+        },
+    ),
+    (
+        "/obras/",
+        lambda i: {
+            "titulo": f"Obra {i}",
+            "autor": "Autor",
+            "ano_producao": 2020,
+            "tecnica_criacao": "Óleo",
+            "altura_centimetros": 50,
+            "largura_centimetros": 40,
+            "peso_quilos": 2,
+            "tags": ["azul", f"tag{i % 10}"],
+            "preco": 100,
+            "status": True,
+            "data_postagem": "2025-01-01T00:00:00",
+            "usuario_id": 1,
+            "categoria_id": 1,
+        },
+    ),
+    (
+        "/links_rede/",
+        lambda i: {
+            "link": f"https://example.com/{i}",
+            "nome_rede": "rede",
+            "nome_usuario": f"u{i}",
+            "id_usuario": 1,
+        },
+    ),
+    (
+        "/comentarios/",
+        lambda i: {"usuario_id": 1, "evento_id": 1, "comentario": f"c{i}"},
+    ),
+    (
+        "/comentarios_obra/",
+        lambda i: {"texto": f"c{i}", "usuario_id": 1, "obra_id": 1},
+    ),
+    (
+        "/avaliacoes/",
+        lambda i: {
+            "usuario_id": 1,
+            "evento_id": 1,
+            "gostou": "sim",
+            "avaliacao": i % 5 + 1,
+        },
+    ),
+]
+
+
+def medir(
+    cliente: TestClient, rota: str, corpo: Corpo, repeticoes: int
+) -> tuple[float, float]:
+    """Envia ``repeticoes`` criações para ``rota``.
+
+    Returns:
+        tuple[float, float]: Milissegundos e comandos SQL por requisição.
+
+    Raises:
+        RuntimeError: Se alguma criação não responder 200.
+
+    """
+    comandos = count()
+
+    def contar(*_args: object) -> None:
+        next(comandos)
+
+    event.listen(engine, "before_cursor_execute", contar)
+    try:
+        inicio = time.perf_counter()
+        for i in range(repeticoes):
+            resposta = cliente.post(rota, json=corpo(i))
+            if resposta.status_code != 200:  # noqa: PLR2004
+                message = f"{rota}: {resposta.status_code} {resposta.text}"
+                raise RuntimeError(message)
+        decorrido = time.perf_counter() - inicio
+    finally:
+        event.remove(engine, "before_cursor_execute", contar)
+    return decorrido * 1000 / repeticoes, next(comandos) / repeticoes
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Mede cada rota de criação e registra uma linha por rota."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeticoes", type=int, default=200)
+    argumentos = parser.parse_args(argv)
+
+    with TestClient(app) as cliente:
+        logger.info("%-20s %10s %10s", "rota", "ms/req", "SQL/req")
+        for rota, corpo in ROTAS:
+            milissegundos, comandos = medir(
+                cliente, rota, corpo, argumentos.repeticoes
+            )
+            logger.info("%-20s %10.2f %10.1f", rota, milissegundos, comandos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Compara a exportação de obras com a leitura crua da mesma consulta.
+
+Cadastra ``--quantidade`` obras e mede o tempo de percorrer a consulta da
+exportação direto no banco, de ``GET /exports/obras.csv`` e de
+``GET /exports/obras.parquet``. Roda contra o banco de ``DATABASE_URL``,
+que deve ser descartável.
+
+Uso: ``DATABASE_URL=sqlite:///bench.db PYTHONPATH=src uv run python
+benchmarks/exportacoes.py [--quantidade N]``.
+"""
+
+import argparse
+import logging
+import time
+from itertools import batched
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from app import app
+from database import engine
+from exportacao import parquet_disponivel
+from models.lote import LIMITE_LOTE
+from repositories.exportacao import selecionar_exportacao
+
+logger = logging.getLogger(__name__)
+
+
+def obra(i: int) -> dict[str, Any]:
+    """Monta o corpo de uma obra do usuário e da categoria de id 1.
+
+    Returns:
+        dict[str, Any]: Corpo da obra de número ``i``.
+
+    """
+    return {
+        "titulo": f"Obra {i}",
+        "autor": "Autor",
+        "ano_producao": 2020,
+        "tecnica_criacao": "Óleo",
+        "altura_centimetros": 50,
+        "largura_centimetros": 40,
+        "peso_quilos": 2,
+        "tags": ["azul", f"tag{i % 10}"],
+        "preco": 100,
+        "status": True,
+        "usuario_id": 1,
+        "categoria_id": 1,
+    }
+
+
+def _leitura_crua() -> int:
+    linhas = 0
+    with engine.connect() as conexao:
+        resultado = conexao.execute(
+            selecionar_exportacao([]).execution_options(yield_per=1000)
+        )
+        for parte in resultado.partitions():
+            linhas += len(parte)
+    return linhas
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Mede a leitura crua e as exportações e registra o tempo de cada."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quantidade", type=int, default=100_000)
+    quantidade = parser.parse_args(argv).quantidade
+
+    with TestClient(app) as cliente:
+        cliente.post(
+            "/usuarios/",
+            json={
+                "nome": "Artista",
+                "email": "artista@example.com",
+                "funcao": 2,
+                "biografia": "",
+                "senha": "x",
+            },
+        )
+        cliente.post("/categorias/", json={"nome": "Pintura"})
+        for lote in batched(range(quantidade), LIMITE_LOTE):
+            cliente.post(
+                "/obras/bulk", json=[obra(i) for i in lote]
+            ).raise_for_status()
+
+        inicio = time.perf_counter()
+        linhas = _leitura_crua()
+        logger.info(
+            "leitura crua: %d linhas em %.2f s",
+            linhas,
+            time.perf_counter() - inicio,
+        )
+
+        rotas = ["/exports/obras.csv"]
+        if parquet_disponivel():
+            rotas.append("/exports/obras.parquet")
+        for rota in rotas:
+            inicio = time.perf_counter()
+            with cliente.stream("GET", rota) as resposta:
+                tamanho = sum(map(len, resposta.iter_bytes()))
+            logger.info(
+                "%s: %.1f MB em %.2f s",
+                rota,
+                tamanho / 1e6,
+                time.perf_counter() - inicio,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compara a criação de obras uma a uma com a criação em lote.
+
+Cria ``--quantidade`` obras com um ``POST /obras/`` por obra e depois o
+mesmo número em um único ``POST /obras/bulk``, registrando o tempo total
+de cada forma. Roda contra o banco de ``DATABASE_URL``, que deve ser
+descartável.
+
+Uso: ``DATABASE_URL=sqlite:///bench.db PYTHONPATH=src uv run python
+benchmarks/lote.py [--quantidade N]``.
+"""
+
+import argparse
+import logging
+import time
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+from app import app
+
+logger = logging.getLogger(__name__)
+
+
+def obra(i: int) -> dict[str, Any]:
+    """Monta o corpo de uma obra do usuário e da categoria de id 1.
+
+    Returns:
+        dict[str, Any]: Corpo da obra de número ``i``.
+
+    """
+    return {
+        "titulo": f"Obra {i}",
+        "autor": "Autor",
+        "ano_producao": 2020,
+        "tecnica_criacao": "Óleo",
+        "altura_centimetros": 50,
+        "largura_centimetros": 40,
+        "peso_quilos": 2,
+        "tags": ["azul", f"tag{i % 10}"],
+        "preco": 100,
+        "status": True,
+        "usuario_id": 1,
+        "categoria_id": 1,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Mede as duas formas de criação e registra o tempo de cada uma."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quantidade", type=int, default=5_000)
+    quantidade = parser.parse_args(argv).quantidade
+
+    with TestClient(app) as cliente:
+        cliente.post(
+            "/usuarios/",
+            json={
+                "nome": "Artista",
+                "email": "artista@example.com",
+                "funcao": 2,
+                "biografia": "",
+                "senha": "x",
+            },
+        ).raise_for_status()
+        cliente.post("/categorias/", json={"nome": "Pintura"})
+
+        inicio = time.perf_counter()
+        for i in range(quantidade):
+            cliente.post("/obras/", json=obra(i)).raise_for_status()
+        uma_a_uma = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        resposta = cliente.post(
+            "/obras/bulk", json=[obra(i) for i in range(quantidade)]
+        )
+        resposta.raise_for_status()
+        em_lote = time.perf_counter() - inicio
+
+    logger.info("%d obras uma a uma: %.2f s", quantidade, uma_a_uma)
+    logger.info("%d obras em lote:   %.2f s", quantidade, em_lote)
+    logger.info("erros no lote: %d", len(resposta.json()["erros"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Compara o custo por linha de montar as respostas JSON das listagens.
+
+Cadastra ``--quantidade`` obras e usuários, lê as linhas do banco e mede,
+por linha, o caminho anterior (``model_validate`` em cada linha, nova
+validação e serialização da página pelo FastAPI e ``json.dumps``) e o
+atual (``construir`` e ``RespostaJSON``). Roda contra o banco de
+``DATABASE_URL``, que deve ser descartável.
+
+Uso: ``DATABASE_URL=sqlite:///bench.db PYTHONPATH=src uv run python
+benchmarks/respostas.py [--quantidade N] [--repeticoes N]``.
+"""
+
+import argparse
+import logging
+import time
+from collections.abc import Callable, Sequence
+from functools import cache
+from itertools import batched
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, TypeAdapter
+from sqlmodel import Session, select
+
+from app import app
+from database import engine
+from models.lote import LIMITE_LOTE
+from models.obra import ObraDB, ObraResponse
+from models.paginacao import Pagina
+from models.usuario import UsuarioDB, UsuarioResponse
+from serializacao import RespostaJSON, construir
+
+logger = logging.getLogger(__name__)
+
+
+def obra(i: int) -> dict[str, Any]:
+    """Monta o corpo de uma obra do usuário e da categoria de id 1.
+
+    Returns:
+        dict[str, Any]: Corpo da obra de número ``i``.
+
+    """
+    return {
+        "titulo": f"Obra {i}",
+        "autor": "Autor",
+        "ano_producao": 2020,
+        "tecnica_criacao": "Óleo",
+        "altura_centimetros": 50,
+        "largura_centimetros": 40,
+        "peso_quilos": 2,
+        "tags": ["azul", f"tag{i % 10}"],
+        "preco": 100,
+        "status": True,
+        "usuario_id": 1,
+        "categoria_id": 1,
+    }
+
+
+def usuario(i: int) -> dict[str, Any]:
+    """Monta o corpo de um usuário.
+
+    Returns:
+        dict[str, Any]: Corpo do usuário de número ``i``.
+
+    """
+    return {
+        "nome": f"Usuário {i}",
+        "email": f"usuario{i}@example.com",
+        "funcao": 2,
+        "biografia": "",
+        "senha": "x",
+    }
+
+
+@cache
+def _adaptador_pagina(modelo: type[BaseModel]) -> TypeAdapter[Any]:
+    # O FastAPI monta o validador da resposta uma vez, ao registrar a rota.
+    return TypeAdapter(Pagina[modelo])
+
+
+def antes(modelo: type[BaseModel], linhas: Sequence[object]) -> bytes:
+    """Monta a página como as rotas faziam antes.
+
+    Returns:
+        bytes: Corpo da resposta.
+
+    """
+    adaptador = _adaptador_pagina(modelo)
+    pagina = Pagina(itens=list(map(modelo.model_validate, linhas)))
+    conteudo = adaptador.dump_python(
+        adaptador.validate_python(pagina), mode="json"
+    )
+    return bytes(JSONResponse(conteudo).body)
+
+
+def depois(modelo: type[BaseModel], linhas: Sequence[object]) -> bytes:
+    """Monta a página como as rotas fazem agora.
+
+    Returns:
+        bytes: Corpo da resposta.
+
+    """
+    pagina = Pagina[modelo].model_construct(
+        itens=[construir(modelo, linha) for linha in linhas],
+        proximo_cursor=None,
+    )
+    return bytes(RespostaJSON(pagina).body)
+
+
+def _medir(
+    caminho: Callable[[type[BaseModel], Sequence[object]], bytes],
+    modelo: type[BaseModel],
+    linhas: Sequence[object],
+    repeticoes: int,
+) -> float:
+    caminho(modelo, linhas)
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        caminho(modelo, linhas)
+    return (time.perf_counter() - inicio) / repeticoes / len(linhas)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Mede os dois caminhos e registra o custo por linha de cada."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quantidade", type=int, default=1000)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    argumentos = parser.parse_args(argv)
+
+    with TestClient(app) as cliente:
+        cliente.post("/categorias/", json={"nome": "Pintura"})
+        for lote in batched(range(argumentos.quantidade), LIMITE_LOTE):
+            cliente.post(
+                "/usuarios/bulk", json=[usuario(i) for i in lote]
+            ).raise_for_status()
+            cliente.post(
+                "/obras/bulk", json=[obra(i) for i in lote]
+            ).raise_for_status()
+
+    with Session(engine) as session:
+        casos = [
+            (ObraResponse, session.exec(select(ObraDB)).all()),
+            (UsuarioResponse, session.exec(select(UsuarioDB)).all()),
+        ]
+        for modelo, linhas in casos:
+            for caminho in (antes, depois):
+                custo = _medir(caminho, modelo, linhas, argumentos.repeticoes)
+                logger.info(
+                    "%s, %s: %.1f us por linha",
+                    modelo.__name__,
+                    caminho.__name__,
+                    custo * 1e6,
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
+import sys
 from logging.config import fileConfig
+from pathlib import Path
 
 from alembic import context
 from sqlalchemy import Connection, Engine, engine_from_config, pool
 from sqlmodel import SQLModel
 
-from src.config import settings
-from src.models import *  # noqa: F403
+# Importa os modelos pelo mesmo caminho usado pela aplicação (src/), para
+# que a migração e o código da API compartilhem os mesmos módulos.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import settings  # noqa: E402
+from models import *  # noqa: E402, F403
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
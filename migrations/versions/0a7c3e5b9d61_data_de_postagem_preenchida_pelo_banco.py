@@ -0,0 +1,52 @@
+"""Data de postagem preenchida pelo banco
+
+Revision ID: 0a7c3e5b9d61
+Revises: f6d1b4c8e275
+Create Date: 2026-10-18 16:40:12.118305
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a7c3e5b9d61'
+down_revision: Union[str, Sequence[str], None] = 'f6d1b4c8e275'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _alterar_padrao(padrao: sa.TextClause | None) -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column('obras', 'data_postagem', server_default=padrao)
+        return
+
+    # O SQLite só troca o padrão recriando a tabela, o que descarta os
+    # triggers da busca textual; eles são lidos antes e recriados depois.
+    triggers = op.get_bind().execute(
+        sa.text(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type = 'trigger' AND tbl_name = 'obras'"
+        )
+    ).scalars().all()
+    with op.batch_alter_table('obras', recreate='always') as batch_op:
+        batch_op.alter_column(
+            'data_postagem',
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=padrao,
+        )
+    for trigger in triggers:
+        op.execute(trigger)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _alterar_padrao(sa.text('CURRENT_TIMESTAMP'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _alterar_padrao(None)
@@ -0,0 +1,75 @@
+"""Versão das obras e eventos
+
+Revision ID: 1b5e8d2f7c40
+Revises: 0a7c3e5b9d61
+Create Date: 2026-10-18 17:30:41.205871
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b5e8d2f7c40'
+down_revision: Union[str, Sequence[str], None] = '0a7c3e5b9d61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABELAS = ('obras', 'eventos')
+
+
+def _colunas() -> list[sa.Column]:
+    return [
+        sa.Column(
+            'versao', sa.Integer(), nullable=False, server_default='1'
+        ),
+        sa.Column(
+            'atualizado_em',
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+        ),
+    ]
+
+
+def _alterar_no_sqlite(tabela: str, adicionar: bool) -> None:
+    # O SQLite não aceita ADD COLUMN com padrão não constante: a tabela é
+    # recriada, o que descarta os triggers da busca textual; eles são lidos
+    # antes e recriados depois.
+    triggers = op.get_bind().execute(
+        sa.text(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type = 'trigger' AND tbl_name = :tabela"
+        ),
+        {'tabela': tabela},
+    ).scalars().all()
+    with op.batch_alter_table(tabela, recreate='always') as batch_op:
+        for coluna in _colunas():
+            if adicionar:
+                batch_op.add_column(coluna)
+            else:
+                batch_op.drop_column(coluna.name)
+    for trigger in triggers:
+        op.execute(trigger)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for tabela in TABELAS:
+        if op.get_bind().dialect.name == 'postgresql':
+            for coluna in _colunas():
+                op.add_column(tabela, coluna)
+        else:
+            _alterar_no_sqlite(tabela, adicionar=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for tabela in TABELAS:
+        if op.get_bind().dialect.name == 'postgresql':
+            op.drop_column(tabela, 'atualizado_em')
+            op.drop_column(tabela, 'versao')
+        else:
+            _alterar_no_sqlite(tabela, adicionar=False)
@@ -0,0 +1,134 @@
+"""Registro de alterações para a sincronização incremental
+
+Revision ID: 2c6f9a4e8b13
+Revises: 1b5e8d2f7c40
+Create Date: 2026-10-18 18:12:06.540913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c6f9a4e8b13'
+down_revision: Union[str, Sequence[str], None] = '1b5e8d2f7c40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABELAS = ('obras', 'eventos', 'categorias', 'usuarios')
+OPERACOES = (('INSERT', 'new'), ('UPDATE', 'new'), ('DELETE', 'old'))
+
+
+def _upgrade_postgres() -> None:
+    op.execute('CREATE SEQUENCE IF NOT EXISTS alteracoes_seq AS bigint')
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION registrar_alteracao() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('alteracoes'));
+            INSERT INTO alteracoes (entidade, registro_id, seq, removido)
+            VALUES (
+                TG_TABLE_NAME,
+                CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END,
+                nextval('alteracoes_seq'),
+                TG_OP = 'DELETE'
+            )
+            ON CONFLICT (entidade, registro_id) DO UPDATE
+            SET seq = excluded.seq, removido = excluded.removido;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for tabela in TABELAS:
+        op.execute(
+            f"""
+            CREATE CONSTRAINT TRIGGER {tabela}_alteracoes
+            AFTER INSERT OR UPDATE OR DELETE ON {tabela}
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION registrar_alteracao()
+            """
+        )
+        op.execute(
+            f"""
+            INSERT INTO alteracoes (entidade, registro_id, seq, removido)
+            SELECT '{tabela}', id, nextval('alteracoes_seq'), false
+            FROM (SELECT id FROM {tabela} ORDER BY id) AS existentes
+            """
+        )
+
+
+def _upgrade_sqlite() -> None:
+    for tabela in TABELAS:
+        for operacao, linha in OPERACOES:
+            op.execute(
+                f"""
+                CREATE TRIGGER {tabela}_alteracoes_{operacao.lower()}
+                AFTER {operacao} ON {tabela} BEGIN
+                    INSERT INTO alteracoes (
+                        entidade, registro_id, seq, removido
+                    )
+                    VALUES (
+                        '{tabela}',
+                        {linha}.id,
+                        (SELECT coalesce(max(seq), 0) + 1 FROM alteracoes),
+                        {int(operacao == 'DELETE')}
+                    )
+                    ON CONFLICT (entidade, registro_id) DO UPDATE
+                    SET seq = excluded.seq, removido = excluded.removido;
+                END
+                """
+            )
+        op.execute(
+            f"""
+            INSERT INTO alteracoes (entidade, registro_id, seq, removido)
+            SELECT '{tabela}', id,
+                   (SELECT coalesce(max(seq), 0) FROM alteracoes)
+                   + row_number() OVER (ORDER BY id),
+                   0
+            FROM {tabela}
+            """
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'alteracoes',
+        sa.Column(
+            'entidade', sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column('registro_id', sa.Integer(), nullable=False),
+        sa.Column('seq', sa.BigInteger(), nullable=False),
+        sa.Column('removido', sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint('entidade', 'registro_id'),
+    )
+    op.create_index('ix_alteracoes_seq', 'alteracoes', ['seq'], unique=True)
+
+    # Os registros existentes entram como alterados, para que a
+    # sincronização sem token devolva o catálogo inteiro.
+    if op.get_bind().dialect.name == 'postgresql':
+        _upgrade_postgres()
+    else:
+        _upgrade_sqlite()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        for tabela in TABELAS:
+            op.execute(f'DROP TRIGGER IF EXISTS {tabela}_alteracoes ON {tabela}')
+        op.execute('DROP FUNCTION IF EXISTS registrar_alteracao()')
+        op.execute('DROP SEQUENCE IF EXISTS alteracoes_seq')
+    else:
+        for tabela in TABELAS:
+            for operacao, _ in OPERACOES:
+                op.execute(
+                    f'DROP TRIGGER IF EXISTS '
+                    f'{tabela}_alteracoes_{operacao.lower()}'
+                )
+    op.drop_index('ix_alteracoes_seq', table_name='alteracoes')
+    op.drop_table('alteracoes')
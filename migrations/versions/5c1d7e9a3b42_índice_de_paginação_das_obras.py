@@ -0,0 +1,32 @@
+"""Índice de paginação das obras por data de postagem
+
+Revision ID: 5c1d7e9a3b42
+Revises: 2ef38f04ef3d
+Create Date: 2026-10-18 10:12:31.481203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1d7e9a3b42'
+down_revision: Union[str, Sequence[str], None] = '2ef38f04ef3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_obras_data_postagem_id',
+        'obras',
+        ['data_postagem', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_obras_data_postagem_id', table_name='obras')
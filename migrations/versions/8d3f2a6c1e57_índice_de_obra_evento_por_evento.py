@@ -0,0 +1,50 @@
+"""Tabela obra_evento e índice de busca por evento
+
+Revision ID: 8d3f2a6c1e57
+Revises: 5c1d7e9a3b42
+Create Date: 2026-10-18 11:02:47.913554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f2a6c1e57'
+down_revision: Union[str, Sequence[str], None] = '5c1d7e9a3b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A tabela de associação só existia via create_all da aplicação.
+    if not sa.inspect(op.get_bind()).has_table('obra_evento'):
+        op.create_table(
+            'obra_evento',
+            sa.Column('id_obra', sa.Integer(), nullable=False),
+            sa.Column('id_evento', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['id_obra'], ['obras.id']),
+            sa.ForeignKeyConstraint(['id_evento'], ['eventos.id']),
+            sa.PrimaryKeyConstraint('id_obra', 'id_evento'),
+        )
+    op.create_index(
+        'ix_obra_evento_id_evento_id_obra',
+        'obra_evento',
+        ['id_evento', 'id_obra'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_obra_evento_id_evento_id_obra', table_name='obra_evento')
+    # Com associações, a tabela pode ter vindo do create_all e é mantida;
+    # vazia, ela sai para não impedir o downgrade de eventos.
+    vazia = op.get_bind().scalar(
+        sa.text('SELECT 1 FROM obra_evento LIMIT 1')
+    ) is None
+    if vazia:
+        op.drop_table('obra_evento')
@@ -0,0 +1,46 @@
+"""atualizado_em com fuso horário
+
+Revision ID: 9e4a6c2b8f17
+Revises: 2c6f9a4e8b13
+Create Date: 2026-10-18 19:05:23.481902
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4a6c2b8f17'
+down_revision: Union[str, Sequence[str], None] = '2c6f9a4e8b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABELAS = ('obras', 'eventos')
+
+
+def _alterar_tipo(com_fuso: bool) -> None:
+    # O now() foi gravado no TimeZone da sessão, que é o mesmo usado na
+    # conversão. O SQLite não tem o tipo e já guarda UTC.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for tabela in TABELAS:
+        op.alter_column(
+            tabela,
+            'atualizado_em',
+            type_=sa.DateTime(timezone=com_fuso),
+            existing_type=sa.DateTime(timezone=not com_fuso),
+            existing_nullable=False,
+            existing_server_default=sa.text('CURRENT_TIMESTAMP'),
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _alterar_tipo(com_fuso=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _alterar_tipo(com_fuso=False)
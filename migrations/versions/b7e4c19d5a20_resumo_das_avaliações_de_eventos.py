@@ -0,0 +1,79 @@
+"""Resumo das avaliações de eventos
+
+Revision ID: b7e4c19d5a20
+Revises: 8d3f2a6c1e57
+Create Date: 2026-10-18 12:20:05.337120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c19d5a20'
+down_revision: Union[str, Sequence[str], None] = '8d3f2a6c1e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOTAS = range(1, 6)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A tabela de avaliações só existia via create_all da aplicação.
+    if not sa.inspect(op.get_bind()).has_table('avaliacoes_eventos'):
+        op.create_table(
+            'avaliacoes_eventos',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('usuario_id', sa.Integer(), nullable=False),
+            sa.Column('evento_id', sa.Integer(), nullable=False),
+            sa.Column(
+                'gostou', sqlmodel.sql.sqltypes.AutoString(), nullable=False
+            ),
+            sa.Column('avaliacao', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['usuario_id'], ['usuarios.id']),
+            sa.ForeignKeyConstraint(['evento_id'], ['eventos.id']),
+            sa.PrimaryKeyConstraint('id'),
+        )
+
+    op.create_table(
+        'resumo_avaliacoes_eventos',
+        sa.Column('evento_id', sa.Integer(), nullable=False),
+        sa.Column('quantidade', sa.Integer(), nullable=False),
+        sa.Column('soma', sa.Integer(), nullable=False),
+        sa.Column('gostaram', sa.Integer(), nullable=False),
+        *(
+            sa.Column(f'nota_{nota}', sa.Integer(), nullable=False)
+            for nota in NOTAS
+        ),
+        sa.ForeignKeyConstraint(['evento_id'], ['eventos.id']),
+        sa.PrimaryKeyConstraint('evento_id'),
+    )
+
+    notas = ', '.join(
+        f'SUM(CASE WHEN avaliacao = {nota} THEN 1 ELSE 0 END)'
+        for nota in NOTAS
+    )
+    op.execute(
+        'INSERT INTO resumo_avaliacoes_eventos (evento_id, quantidade, '
+        'soma, gostaram, nota_1, nota_2, nota_3, nota_4, nota_5) '
+        'SELECT evento_id, COUNT(*), COALESCE(SUM(avaliacao), 0), '
+        "SUM(CASE WHEN LOWER(TRIM(gostou)) IN ('sim', 's', 'true', '1', "
+        "'yes') THEN 1 ELSE 0 END), "
+        f'{notas} FROM avaliacoes_eventos GROUP BY evento_id'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('resumo_avaliacoes_eventos')
+    # Com avaliações, a tabela pode ter vindo do create_all e é mantida;
+    # vazia, ela sai para não impedir o downgrade de eventos.
+    vazia = op.get_bind().scalar(
+        sa.text('SELECT 1 FROM avaliacoes_eventos LIMIT 1')
+    ) is None
+    if vazia:
+        op.drop_table('avaliacoes_eventos')
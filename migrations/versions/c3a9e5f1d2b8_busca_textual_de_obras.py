@@ -0,0 +1,111 @@
+"""Busca textual de obras (tsvector no PostgreSQL, FTS5 no SQLite)
+
+Revision ID: c3a9e5f1d2b8
+Revises: b7e4c19d5a20
+Create Date: 2026-10-18 13:41:19.602751
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9e5f1d2b8'
+down_revision: Union[str, Sequence[str], None] = 'b7e4c19d5a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUNAS_FTS = 'titulo, autor, tecnica_criacao, tags'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+        op.execute(
+            """
+            CREATE OR REPLACE FUNCTION imutavel_unaccent(text) RETURNS text
+            AS $$ SELECT public.unaccent('public.unaccent', $1) $$
+            LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+            """
+        )
+        op.execute(
+            """
+            ALTER TABLE obras ADD COLUMN busca tsvector GENERATED ALWAYS AS (
+                setweight(
+                    to_tsvector('portuguese', imutavel_unaccent(titulo)), 'A'
+                )
+                || setweight(
+                    to_tsvector('portuguese', imutavel_unaccent(autor)), 'B'
+                )
+                || setweight(
+                    to_tsvector(
+                        'portuguese', imutavel_unaccent(tecnica_criacao)
+                    ),
+                    'C'
+                )
+                || setweight(
+                    to_tsvector('portuguese', imutavel_unaccent(tags::text)),
+                    'D'
+                )
+            ) STORED
+            """
+        )
+        op.execute('CREATE INDEX ix_obras_busca ON obras USING GIN (busca)')
+        return
+
+    op.execute(
+        f"""
+        CREATE VIRTUAL TABLE obras_fts USING fts5(
+            {COLUNAS_FTS},
+            content='obras', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER obras_fts_insercao AFTER INSERT ON obras BEGIN
+            INSERT INTO obras_fts (rowid, {COLUNAS_FTS})
+            VALUES (new.id, new.titulo, new.autor, new.tecnica_criacao,
+                    new.tags);
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER obras_fts_remocao AFTER DELETE ON obras BEGIN
+            INSERT INTO obras_fts (obras_fts, rowid, {COLUNAS_FTS})
+            VALUES ('delete', old.id, old.titulo, old.autor,
+                    old.tecnica_criacao, old.tags);
+        END
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER obras_fts_atualizacao AFTER UPDATE ON obras BEGIN
+            INSERT INTO obras_fts (obras_fts, rowid, {COLUNAS_FTS})
+            VALUES ('delete', old.id, old.titulo, old.autor,
+                    old.tecnica_criacao, old.tags);
+            INSERT INTO obras_fts (rowid, {COLUNAS_FTS})
+            VALUES (new.id, new.titulo, new.autor, new.tecnica_criacao,
+                    new.tags);
+        END
+        """
+    )
+    op.execute("INSERT INTO obras_fts (obras_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_obras_busca')
+        op.execute('ALTER TABLE obras DROP COLUMN IF EXISTS busca')
+        op.execute('DROP FUNCTION IF EXISTS imutavel_unaccent(text)')
+        return
+
+    op.execute('DROP TRIGGER IF EXISTS obras_fts_atualizacao')
+    op.execute('DROP TRIGGER IF EXISTS obras_fts_remocao')
+    op.execute('DROP TRIGGER IF EXISTS obras_fts_insercao')
+    op.execute('DROP TABLE IF EXISTS obras_fts')
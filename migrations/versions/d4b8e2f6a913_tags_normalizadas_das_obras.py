@@ -0,0 +1,71 @@
+"""Tags normalizadas das obras e contagem por tag
+
+Revision ID: d4b8e2f6a913
+Revises: c3a9e5f1d2b8
+Create Date: 2026-10-18 14:52:37.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8e2f6a913'
+down_revision: Union[str, Sequence[str], None] = 'c3a9e5f1d2b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOTE = 1000
+
+obras = sa.table(
+    'obras', sa.column('id', sa.Integer), sa.column('tags', sa.JSON)
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    obra_tags = op.create_table(
+        'obra_tags',
+        sa.Column('obra_id', sa.Integer(), nullable=False),
+        sa.Column('tag', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.ForeignKeyConstraint(['obra_id'], ['obras.id']),
+        sa.PrimaryKeyConstraint('obra_id', 'tag'),
+    )
+    op.create_index(
+        'ix_obra_tags_tag_obra_id',
+        'obra_tags',
+        ['tag', 'obra_id'],
+        unique=False,
+    )
+    op.create_table(
+        'tags',
+        sa.Column('nome', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('quantidade', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('nome'),
+    )
+
+    # Converte a lista JSON de cada obra em linhas de obra_tags, com a mesma
+    # normalização de models.tag.normalizar_tags.
+    conexao = op.get_bind()
+    linhas = []
+    for obra_id, tags in conexao.execute(sa.select(obras.c.id, obras.c.tags)):
+        normalizadas = {' '.join(tag.split()).lower() for tag in tags or []}
+        linhas += [
+            {'obra_id': obra_id, 'tag': tag} for tag in normalizadas if tag
+        ]
+    for inicio in range(0, len(linhas), LOTE):
+        conexao.execute(sa.insert(obra_tags), linhas[inicio:inicio + LOTE])
+    op.execute(
+        'INSERT INTO tags (nome, quantidade) '
+        'SELECT tag, COUNT(*) FROM obra_tags GROUP BY tag'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('tags')
+    op.drop_index('ix_obra_tags_tag_obra_id', table_name='obra_tags')
+    op.drop_table('obra_tags')
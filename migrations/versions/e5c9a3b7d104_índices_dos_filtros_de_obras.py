@@ -0,0 +1,43 @@
+"""Índices dos filtros de obras
+
+Revision ID: e5c9a3b7d104
+Revises: d4b8e2f6a913
+Create Date: 2026-10-18 15:36:08.442917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c9a3b7d104'
+down_revision: Union[str, Sequence[str], None] = 'd4b8e2f6a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Filtros de igualdade combinados com a ordem da listagem (data_postagem, id)
+# e os filtros de faixa mais usados no catálogo.
+INDICES = {
+    'ix_obras_categoria_id_data_postagem_id': [
+        'categoria_id', 'data_postagem', 'id'
+    ],
+    'ix_obras_usuario_id_data_postagem_id': [
+        'usuario_id', 'data_postagem', 'id'
+    ],
+    'ix_obras_status_data_postagem_id': ['status', 'data_postagem', 'id'],
+    'ix_obras_tecnica_criacao_preco': ['tecnica_criacao', 'preco'],
+    'ix_obras_preco': ['preco'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for nome, colunas in INDICES.items():
+        op.create_index(nome, 'obras', colunas, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for nome in INDICES:
+        op.drop_index(nome, table_name='obras')
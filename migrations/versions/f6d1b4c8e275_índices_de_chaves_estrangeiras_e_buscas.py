@@ -0,0 +1,82 @@
+"""Índices de chaves estrangeiras e buscas frequentes
+
+Revision ID: f6d1b4c8e275
+Revises: e5c9a3b7d104
+Create Date: 2026-10-18 16:18:44.905312
+
+"""
+from contextlib import nullcontext
+from typing import ContextManager, Sequence, Union
+
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6d1b4c8e275'
+down_revision: Union[str, Sequence[str], None] = 'e5c9a3b7d104'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# obras.usuario_id e obras.categoria_id já são a primeira coluna dos índices
+# compostos de e5c9a3b7d104, que também atendem às chaves estrangeiras.
+INDICES = {
+    'ix_comentario_eventos_evento_id': ('comentario_eventos', 'evento_id'),
+    'ix_comentario_eventos_usuario_id': ('comentario_eventos', 'usuario_id'),
+    'ix_avaliacoes_eventos_evento_id': ('avaliacoes_eventos', 'evento_id'),
+    'ix_avaliacoes_eventos_usuario_id': ('avaliacoes_eventos', 'usuario_id'),
+    'ix_comentario_obras_obra_id': ('comentario_obras', 'obra_id'),
+    'ix_comentario_obras_usuario_id': ('comentario_obras', 'usuario_id'),
+    'ix_link_redes_id_usuario': ('link_redes', 'id_usuario'),
+    'ix_eventos_data': ('eventos', 'data'),
+    'ix_eventos_id_organizador': ('eventos', 'id_organizador'),
+    'ix_eventos_id_responsavel': ('eventos', 'id_responsavel'),
+}
+
+
+def _concorrente() -> bool:
+    """Indica se os índices podem ser criados com CONCURRENTLY.
+
+    CONCURRENTLY só existe no PostgreSQL e não roda dentro de transação.
+    Uma conexão recebida em ``config.attributes`` (como nos testes) já chega
+    com a transação de quem chamou aberta, então o Alembic não pode
+    passá-la para autocommit.
+    """
+    return (
+        op.get_bind().dialect.name == 'postgresql'
+        and 'connection' not in context.config.attributes
+    )
+
+
+def _bloco(concorrente: bool) -> ContextManager[object]:
+    if concorrente:
+        return op.get_context().autocommit_block()
+    return nullcontext()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # No PostgreSQL os índices são criados sem bloquear escritas nas tabelas.
+    concorrente = _concorrente()
+    with _bloco(concorrente):
+        for nome, (tabela, coluna) in INDICES.items():
+            op.create_index(
+                nome,
+                tabela,
+                [coluna],
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=concorrente,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    concorrente = _concorrente()
+    with _bloco(concorrente):
+        for nome, (tabela, _) in INDICES.items():
+            op.drop_index(
+                nome,
+                table_name=tabela,
+                if_exists=True,
+                postgresql_concurrently=concorrente,
+            )
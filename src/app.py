@@ -3,16 +3,26 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
-from database import init_db
+from barramento import iniciar_barramento
+from database import engine, init_db
+from errors import CursorInvalidoError, ObrasInexistentesError
+from routers.avaliacoes_eventos import rota as avaliacoes_eventos_rota
 from routers.categoria import rota as categoria_rota
 from routers.comentario_evento import rota as comentario_evento_rota
 from routers.comentario_obra import rota as comentario_obra_rota
 from routers.evento import rota as evento_rota
+from routers.exportacao import rota as exportacao_rota
 from routers.link_rede import rota as link_rede_rota
+from routers.metricas import rota as metricas_rota
 from routers.obra import rota as obra_rota
+from routers.obra_evento import rota as obra_evento_rota
+from routers.sincronizacao import rota as sincronizacao_rota
+from routers.tag import rota as tag_rota
 from routers.usuario import rota as usuario_rota
+from serializacao import RespostaJSON
 
 
 @asynccontextmanager
@@ -27,10 +37,42 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: RUF029
 
     """
     init_db()
+    barramento = iniciar_barramento(engine)
     yield
+    if barramento is not None:
+        barramento.parar()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=RespostaJSON)
+
+
+@app.exception_handler(CursorInvalidoError)
+async def tratar_cursor_invalido(  # noqa: RUF029
+    _request: Request, _exc: CursorInvalidoError
+) -> JSONResponse:
+    """Responde 400 quando o cliente envia um cursor adulterado.
+
+    Returns:
+        JSONResponse: Erro de requisição inválida.
+
+    """
+    return JSONResponse(status_code=400, content={"detail": "Cursor inválido"})
+
+
+@app.exception_handler(ObrasInexistentesError)
+async def tratar_obras_inexistentes(  # noqa: RUF029
+    _request: Request, exc: ObrasInexistentesError
+) -> JSONResponse:
+    """Responde 422 quando a associação cita obras que não existem.
+
+    Returns:
+        JSONResponse: Erro com os ids das obras inexistentes.
+
+    """
+    return JSONResponse(
+        status_code=422,
+        content={"detail": "Obras inexistentes", "obras": exc.ids},
+    )
 
 
 @app.get("/")
@@ -49,5 +91,11 @@ app.include_router(link_rede_rota)
 app.include_router(categoria_rota)
 app.include_router(evento_rota)
 app.include_router(comentario_evento_rota)
+app.include_router(avaliacoes_eventos_rota)
 app.include_router(comentario_obra_rota)
 app.include_router(obra_rota)
+app.include_router(obra_evento_rota)
+app.include_router(tag_rota)
+app.include_router(exportacao_rota)
+app.include_router(sincronizacao_rota)
+app.include_router(metricas_rota)
@@ -0,0 +1,135 @@
+"""Barramento de invalidação do cache de entidades entre processos.
+
+Cada processo da API escuta, em uma conexão própria com o PostgreSQL, o
+canal em que as escritas publicam as chaves alteradas (``NOTIFY``, enviado
+na transação da escrita e entregue só após o commit). Ao receber uma
+invalidação de outro processo, descarta as entradas em memória e as
+leituras em andamento da chave, normalmente poucos milissegundos depois do
+commit.
+
+Se a conexão cair, as notificações do intervalo se perdem: ao reconectar,
+todos os caches do processo são limpos.
+"""
+
+import json
+import logging
+import select
+import threading
+from typing import Any
+
+import psycopg2
+from sqlalchemy.engine import Engine
+
+from cache import (
+    CANAL_INVALIDACAO,
+    ORIGEM,
+    cache_registrado,
+    caches_registrados,
+)
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def aplicar_invalidacoes(carga: str) -> int:
+    """Aplica nos caches do processo as invalidações de uma notificação.
+
+    Notificações do próprio processo são ignoradas, pois ele já invalidou
+    as chaves depois do commit.
+
+    Returns:
+        int: Quantidade de invalidações aplicadas.
+
+    """
+    mensagem = json.loads(carga)
+    if mensagem["origem"] == ORIGEM:
+        return 0
+    aplicadas = 0
+    for nome, chave in mensagem["invalidacoes"]:
+        cache = cache_registrado(nome)
+        if cache is not None:
+            cache.invalidar_local(chave)
+            aplicadas += 1
+    return aplicadas
+
+
+def _limpar_caches() -> None:
+    for cache in caches_registrados():
+        cache.invalidar_local(None)
+
+
+class BarramentoInvalidacao:
+    """Escuta as invalidações dos outros processos em uma thread própria."""
+
+    def __init__(self, engine: Engine, intervalo: float = 1.0) -> None:
+        self.engine = engine
+        self.intervalo = intervalo
+        self._parada = threading.Event()
+        self._reconectando = False
+        self._thread = threading.Thread(
+            target=self._executar, name="barramento-cache", daemon=True
+        )
+
+    def iniciar(self) -> None:
+        """Começa a escutar o canal de invalidação."""
+        self._thread.start()
+
+    def parar(self) -> None:
+        """Para de escutar e fecha a conexão."""
+        self._parada.set()
+        self._thread.join(self.intervalo * 2)
+
+    def _executar(self) -> None:
+        while not self._parada.is_set():
+            try:
+                self._escutar()
+            except (psycopg2.Error, OSError):
+                logger.exception("Barramento de cache desconectado")
+                self._reconectando = True
+                self._parada.wait(self.intervalo)
+
+    def _conectar(self) -> Any:  # noqa: ANN401
+        # A conexão sai do pool: fica presa ao LISTEN enquanto o processo
+        # estiver de pé.
+        conexao = self.engine.raw_connection()
+        conexao.detach()
+        dbapi: Any = conexao.dbapi_connection
+        dbapi.autocommit = True
+        with dbapi.cursor() as cursor:
+            cursor.execute(f"LISTEN {CANAL_INVALIDACAO}")
+        return dbapi
+
+    def _escutar(self) -> None:
+        dbapi = self._conectar()
+        try:
+            if self._reconectando:
+                _limpar_caches()
+                self._reconectando = False
+            while not self._parada.is_set():
+                prontos, _, _ = select.select([dbapi], [], [], self.intervalo)
+                if not prontos:
+                    continue
+                dbapi.poll()
+                while dbapi.notifies:
+                    carga = dbapi.notifies.pop(0).payload
+                    try:
+                        aplicar_invalidacoes(carga)
+                    except (ValueError, KeyError, TypeError):
+                        logger.exception("Invalidação inválida: %s", carga)
+        finally:
+            dbapi.close()
+
+
+def iniciar_barramento(engine: Engine) -> BarramentoInvalidacao | None:
+    """Inicia o barramento se ``CACHE_BARRAMENTO`` valer e o banco permitir.
+
+    Returns:
+        BarramentoInvalidacao | None: Barramento iniciado, ou None fora do
+            PostgreSQL ou com o barramento desligado.
+
+    """
+    if not settings.cache_barramento or engine.dialect.name != "postgresql":
+        return None
+    barramento = BarramentoInvalidacao(engine)
+    barramento.iniciar()
+    return barramento
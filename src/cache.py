@@ -0,0 +1,377 @@
+"""Cache das leituras de entidades por id.
+
+Cada entidade tem um ``CacheEntidade``, que guarda as linhas em um backend:
+em memória no processo (LRU com TTL) ou compartilhado entre os processos,
+em um servidor com protocolo Redis (``CACHE_BACKEND=redis``). O que vai ao
+backend é a projeção da linha no ``modelo`` do cache, com só os campos que
+as respostas usam (sem a senha dos usuários, por exemplo). As escritas
+invalidam a chave alterada depois do commit. No PostgreSQL, as
+invalidações também são publicadas por ``NOTIFY`` na própria transação, e
+o barramento (``barramento.py``) as repassa aos caches dos demais
+processos.
+
+Uma leitura que começou antes de uma invalidação não guarda o resultado: a
+linha lida pode ser anterior à escrita que invalidou a chave. Pelo mesmo
+motivo, as faltas são carregadas do primário, e não da réplica de leitura
+da requisição.
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple, Protocol, cast
+
+from pydantic import BaseModel
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from sqlmodel import Session as SessaoModelo
+
+from config import settings
+from database import sessao_primaria
+from models.metricas import EstatisticasCache
+
+CANAL_INVALIDACAO = "cache_invalidacao"
+# O PostgreSQL limita a carga de um NOTIFY a 8000 bytes.
+TAMANHO_MAXIMO_CARGA = 7900
+ORIGEM = uuid.uuid4().hex
+
+_caches: dict[str, "CacheEntidade[Any]"] = {}
+
+Invalidacao = tuple[str, Hashable | None]
+
+
+class ContadoresBackend(NamedTuple):
+    tamanho: int | None = None
+    expiracoes: int | None = None
+    despejos: int | None = None
+
+
+class BackendCache(Protocol):
+    """Armazenamento das entradas de um ``CacheEntidade``.
+
+    Backends ``compartilhado`` são vistos por todos os processos: uma
+    invalidação recebida de outro processo não precisa removê-las de novo.
+    """
+
+    @property
+    def nome(self) -> str: ...
+
+    @property
+    def compartilhado(self) -> bool: ...
+
+    def obter(self, chave: Hashable) -> object | None: ...
+
+    def guardar(self, chave: Hashable, valor: object, ttl: float) -> None: ...
+
+    def remover(self, chave: Hashable) -> None: ...
+
+    def limpar(self) -> None: ...
+
+    def contadores(self) -> ContadoresBackend: ...
+
+
+class BackendMemoria:
+    """Entradas no próprio processo, descartadas por TTL e por LRU."""
+
+    nome = "memoria"
+    compartilhado = False
+
+    def __init__(
+        self,
+        tamanho_maximo: int,
+        relogio: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.tamanho_maximo = tamanho_maximo
+        self._relogio = relogio
+        self._lock = threading.Lock()
+        self._itens: OrderedDict[Hashable, tuple[float, object]] = (
+            OrderedDict()
+        )
+        self.expiracoes = 0
+        self.despejos = 0
+
+    def obter(self, chave: Hashable) -> object | None:
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is None:
+                return None
+            if item[0] <= self._relogio():
+                del self._itens[chave]
+                self.expiracoes += 1
+                return None
+            self._itens.move_to_end(chave)
+            return item[1]
+
+    def guardar(self, chave: Hashable, valor: object, ttl: float) -> None:
+        with self._lock:
+            self._itens[chave] = (self._relogio() + ttl, valor)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.tamanho_maximo:
+                self._itens.popitem(last=False)
+                self.despejos += 1
+
+    def remover(self, chave: Hashable) -> None:
+        with self._lock:
+            self._itens.pop(chave, None)
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._itens.clear()
+
+    def contadores(self) -> ContadoresBackend:
+        with self._lock:
+            return ContadoresBackend(
+                len(self._itens), self.expiracoes, self.despejos
+            )
+
+
+def criar_backend(
+    nome: str, tamanho_maximo: int, modelo: type[BaseModel] | None = None
+) -> BackendCache:
+    """Cria o backend configurado em ``CACHE_BACKEND`` para um cache.
+
+    O Redis guarda os valores em JSON pelo esquema de ``modelo``; caches
+    sem modelo ficam em memória.
+
+    Returns:
+        BackendCache: Backend em memória ou no Redis, com as chaves
+            prefixadas por ``nome``.
+
+    """
+    if settings.cache_backend == "redis" and modelo is not None:
+        from cache_redis import BackendRedis, cliente_redis  # noqa: PLC0415
+
+        return BackendRedis(cliente_redis(), f"cache:{nome}", modelo)
+    return BackendMemoria(tamanho_maximo)
+
+
+class CacheEntidade[V]:
+    """Cache das linhas de uma entidade, por chave primária.
+
+    Com ``modelo``, as linhas carregadas são convertidas nele antes de
+    serem guardadas e devolvidas.
+    """
+
+    def __init__(
+        self,
+        nome: str,
+        ttl: float,
+        tamanho_maximo: int,
+        backend: BackendCache | None = None,
+        *,
+        modelo: type[BaseModel] | None = None,
+    ) -> None:
+        """Cria o cache vazio e o registra nas métricas e no barramento."""
+        self.nome = nome
+        self.ttl = ttl
+        self.tamanho_maximo = tamanho_maximo
+        self.modelo = modelo
+        self.backend = backend or criar_backend(nome, tamanho_maximo, modelo)
+        self._lock = threading.Lock()
+        self._geracao = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.invalidacoes = 0
+        _caches[nome] = self
+
+    def obter(self, chave: Hashable) -> V | None:
+        """Busca ``chave`` no cache, sem consultar o banco.
+
+        Returns:
+            V | None: Valor guardado ou None se ausente ou vencido.
+
+        """
+        if not settings.cache_habilitado:
+            return None
+        valor = cast("V | None", self.backend.obter(chave))
+        with self._lock:
+            if valor is None:
+                self.faltas += 1
+            else:
+                self.acertos += 1
+        return valor
+
+    def obter_ou_carregar(
+        self,
+        chave: Hashable,
+        session: SessaoModelo,
+        carregar: Callable[[SessaoModelo], object | None],
+    ) -> V | None:
+        """Busca ``chave`` no cache ou a carrega e guarda.
+
+        Com o cache ligado, ``carregar`` recebe uma sessão no primário (veja
+        ``sessao_primaria``); desligado, a própria ``session``. Valores None
+        (linhas inexistentes) não são guardados.
+
+        Returns:
+            V | None: Valor guardado ou o devolvido por ``carregar``,
+                convertido no ``modelo`` do cache.
+
+        """
+        if not settings.cache_habilitado:
+            return self._projetar(carregar(session))
+        valor = self.obter(chave)
+        if valor is not None:
+            return valor
+        geracao = self._geracao
+        with sessao_primaria(session) as primaria:
+            valor = self._projetar(carregar(primaria))
+        if valor is not None:
+            self._guardar(chave, valor, geracao)
+        return valor
+
+    def _projetar(self, linha: object | None) -> V | None:
+        if linha is None or self.modelo is None:
+            return cast("V | None", linha)
+        return cast(
+            "V", self.modelo.model_validate(linha, from_attributes=True)
+        )
+
+    def _guardar(self, chave: Hashable, valor: V, geracao: int) -> None:
+        with self._lock:
+            if geracao == self._geracao:
+                self.backend.guardar(chave, valor, self.ttl)
+
+    def invalidar(self, chave: Hashable) -> None:
+        """Descarta ``chave`` e as leituras em andamento."""
+        with self._lock:
+            self._geracao += 1
+            self.invalidacoes += 1
+            self.backend.remover(chave)
+
+    def limpar(self) -> None:
+        """Descarta todas as chaves e as leituras em andamento."""
+        with self._lock:
+            self._geracao += 1
+            self.invalidacoes += 1
+            self.backend.limpar()
+
+    def invalidar_local(self, chave: Hashable | None) -> None:
+        """Aplica a invalidação de uma escrita feita por outro processo.
+
+        O processo que escreveu já removeu ``chave`` (ou tudo, com None) de
+        um backend compartilhado; aqui só as leituras em andamento e as
+        entradas em memória são descartadas.
+        """
+        if self.backend.compartilhado:
+            with self._lock:
+                self._geracao += 1
+                self.invalidacoes += 1
+        elif chave is None:
+            self.limpar()
+        else:
+            self.invalidar(chave)
+
+    def estatisticas(self) -> EstatisticasCache:
+        """Gera um retrato dos contadores do cache.
+
+        Contadores que o backend não acompanha, como as expirações no
+        Redis, ficam None.
+
+        Returns:
+            EstatisticasCache: Ocupação, acertos, faltas e descartes.
+
+        """
+        contadores = self.backend.contadores()
+        with self._lock:
+            return EstatisticasCache(
+                nome=self.nome,
+                backend=self.backend.nome,
+                habilitado=settings.cache_habilitado,
+                tamanho=contadores.tamanho,
+                tamanho_maximo=self.tamanho_maximo,
+                ttl_segundos=self.ttl,
+                acertos=self.acertos,
+                faltas=self.faltas,
+                expiracoes=contadores.expiracoes,
+                despejos=contadores.despejos,
+                invalidacoes=self.invalidacoes,
+            )
+
+
+def caches_registrados() -> list[CacheEntidade[Any]]:
+    """Lista os caches de entidades criados no processo.
+
+    Returns:
+        list[CacheEntidade[Any]]: Caches na ordem de criação.
+
+    """
+    return list(_caches.values())
+
+
+def cache_registrado(nome: str) -> CacheEntidade[Any] | None:
+    """Busca o cache de entidades de nome ``nome``.
+
+    Returns:
+        CacheEntidade[Any] | None: Cache encontrado ou None.
+
+    """
+    return _caches.get(nome)
+
+
+def invalidar_apos_commit(
+    session: Session, cache: CacheEntidade[Any], chave: Hashable | None
+) -> None:
+    """Invalida ``chave`` quando a transação de ``session`` for confirmada.
+
+    Invalidar antes do commit deixaria outra requisição guardar de novo a
+    linha antiga, ainda visível até lá. Com ``chave`` None, todo o cache é
+    descartado.
+    """
+    session.info.setdefault("invalidacoes_cache", []).append((cache, chave))
+
+
+def carga_invalidacoes(invalidacoes: list[Invalidacao]) -> str:
+    """Codifica as invalidações de uma transação para o ``NOTIFY``.
+
+    Se a lista não couber no limite do PostgreSQL, cada cache citado é
+    invalidado por inteiro.
+
+    Returns:
+        str: JSON com a origem e os pares ``[cache, chave]``.
+
+    """
+    carga = json.dumps({"origem": ORIGEM, "invalidacoes": invalidacoes})
+    if len(carga.encode()) <= TAMANHO_MAXIMO_CARGA:
+        return carga
+    nomes = dict.fromkeys(nome for nome, _ in invalidacoes)
+    return json.dumps(
+        {"origem": ORIGEM, "invalidacoes": [[nome, None] for nome in nomes]}
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _publicar_pendentes(session: Session) -> None:
+    # O NOTIFY só é entregue aos outros processos se o commit acontecer.
+    pendentes = session.info.get("invalidacoes_cache")
+    if (
+        not pendentes
+        or not settings.cache_barramento
+        or session.get_bind().dialect.name != "postgresql"
+    ):
+        return
+    invalidacoes = [(cache.nome, chave) for cache, chave in pendentes]
+    session.execute(
+        text("SELECT pg_notify(:canal, :carga)"),
+        {
+            "canal": CANAL_INVALIDACAO,
+            "carga": carga_invalidacoes(invalidacoes),
+        },
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidar_pendentes(session: Session) -> None:
+    for cache, chave in session.info.pop("invalidacoes_cache", []):
+        if chave is None:
+            cache.limpar()
+        else:
+            cache.invalidar(chave)
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar_pendentes(session: Session) -> None:
+    session.info.pop("invalidacoes_cache", None)
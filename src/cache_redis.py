@@ -0,0 +1,114 @@
+"""Backend do cache de entidades em um servidor com protocolo Redis.
+
+As entradas são compartilhadas por todos os processos da API, então uma
+escrita em um processo vale para os demais assim que a chave é removida.
+Os valores são gravados em JSON pelo esquema do modelo do cache, que só
+tem os campos das respostas; nada é desserializado além desse esquema.
+Falhas de conexão e entradas que não seguem o esquema contam como faltas,
+e a leitura segue para o banco.
+
+Depende do pacote ``redis``, instalado com o extra ``redis``.
+"""
+
+import logging
+from collections.abc import Hashable, Iterator
+from functools import cache
+from typing import Any, Protocol, cast
+
+import redis
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from cache import ContadoresBackend
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ClienteRedis(Protocol):
+    """Comandos do Redis usados pelo backend."""
+
+    def get(self, name: str) -> object: ...
+
+    def set(self, name: str, value: bytes, *, px: int) -> object: ...
+
+    def delete(self, *names: str) -> object: ...
+
+    def scan_iter(self, match: str) -> Iterator[object]: ...
+
+
+@cache
+def cliente_redis() -> ClienteRedis:
+    """Conecta ao servidor de ``CACHE_REDIS_URL``, uma vez por processo.
+
+    Returns:
+        ClienteRedis: Cliente com pool de conexões próprio.
+
+    """
+    return redis.Redis.from_url(settings.cache_redis_url)
+
+
+class BackendRedis:
+    """Entradas no Redis, com prazo de validade do próprio servidor.
+
+    A política de despejo quando a memória acaba é a do servidor
+    (``maxmemory-policy``), por isso ``tamanho_maximo`` não se aplica.
+    """
+
+    nome = "redis"
+    compartilhado = True
+
+    def __init__(
+        self, cliente: ClienteRedis, prefixo: str, modelo: type[BaseModel]
+    ) -> None:
+        self.cliente = cliente
+        self.prefixo = prefixo
+        self._adaptador: TypeAdapter[Any] = TypeAdapter(modelo)
+
+    def _chave(self, chave: Hashable) -> str:
+        return f"{self.prefixo}:{chave}"
+
+    def obter(self, chave: Hashable) -> object | None:
+        try:
+            dados = self.cliente.get(self._chave(chave))
+        except redis.RedisError:
+            logger.warning("Cache %s indisponível", self.prefixo)
+            return None
+        if dados is None:
+            return None
+        try:
+            return self._adaptador.validate_json(cast("bytes", dados))
+        except ValidationError:
+            logger.warning("Entrada inválida em %s", self._chave(chave))
+            return None
+
+    def guardar(self, chave: Hashable, valor: object, ttl: float) -> None:
+        try:
+            self.cliente.set(
+                self._chave(chave),
+                self._adaptador.dump_json(valor),
+                px=int(ttl * 1000),
+            )
+        except redis.RedisError:
+            logger.warning("Cache %s indisponível", self.prefixo)
+
+    def remover(self, chave: Hashable) -> None:
+        # Uma remoção perdida deixa a linha antiga até o TTL vencer.
+        try:
+            self.cliente.delete(self._chave(chave))
+        except redis.RedisError:
+            logger.exception("Falha ao invalidar %s", self._chave(chave))
+
+    def limpar(self) -> None:
+        try:
+            chaves = [
+                cast("str", chave)
+                for chave in self.cliente.scan_iter(match=f"{self.prefixo}:*")
+            ]
+            if chaves:
+                self.cliente.delete(*chaves)
+        except redis.RedisError:
+            logger.exception("Falha ao limpar o cache %s", self.prefixo)
+
+    @staticmethod
+    def contadores() -> ContadoresBackend:
+        return ContadoresBackend()
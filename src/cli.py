@@ -0,0 +1,114 @@
+"""Comandos de manutenção executados fora da API.
+
+Uso: ``uv run python src/cli.py <comando> [opções]``.
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+from sqlmodel import Session
+
+from database import engine
+from repositories.avaliacoes_eventos import reconstruir_resumos_avaliacoes
+from repositories.importacao import LOTE_IMPORTACAO, importar_obras_csv
+from repositories.tag import reconstruir_tags
+
+logger = logging.getLogger(__name__)
+
+
+def reconstruir_avaliacoes(argumentos: argparse.Namespace) -> None:
+    """Recalcula os resumos de avaliações a partir das avaliações gravadas."""
+    with Session(engine) as session:
+        total = reconstruir_resumos_avaliacoes(session, argumentos.evento)
+    logger.info("Resumos de avaliações reconstruídos: %d eventos", total)
+
+
+def reconstruir_tags_obras(_argumentos: argparse.Namespace) -> None:
+    """Regrava as tags normalizadas e as contagens a partir das obras."""
+    with Session(engine) as session:
+        total = reconstruir_tags(session)
+    logger.info("Tags reconstruídas: %d tags distintas", total)
+
+
+def importar_obras(argumentos: argparse.Namespace) -> None:
+    """Importa as obras de um arquivo CSV e informa as linhas rejeitadas."""
+    # utf-8-sig aceita arquivos exportados com BOM por planilhas.
+    with (
+        argumentos.arquivo.open(newline="", encoding="utf-8-sig") as arquivo,
+        Session(engine) as session,
+    ):
+        relatorio = importar_obras_csv(arquivo, session, argumentos.lote)
+    logger.info(
+        "Obras importadas: %d de %d linhas, %d com erro",
+        relatorio.importadas,
+        relatorio.lidas,
+        relatorio.total_erros,
+    )
+    for erro in relatorio.erros:
+        logger.warning(
+            "Linha %d: %s",
+            erro.indice,
+            "; ".join(
+                f"{'.'.join(map(str, detalhe.loc))}: {detalhe.msg}"
+                for detalhe in erro.erros
+            ),
+        )
+    if argumentos.relatorio is not None:
+        argumentos.relatorio.write_text(
+            relatorio.model_dump_json(indent=2), encoding="utf-8"
+        )
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Monta o parser com um subcomando por tarefa de manutenção.
+
+    Returns:
+        argparse.ArgumentParser: Parser dos comandos disponíveis.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    comandos = parser.add_subparsers(required=True)
+
+    reconstruir = comandos.add_parser(
+        "reconstruir-avaliacoes",
+        help="Recalcula os resumos de avaliações dos eventos.",
+    )
+    reconstruir.add_argument(
+        "--evento", type=int, help="Reconstrói apenas este evento."
+    )
+    reconstruir.set_defaults(executar=reconstruir_avaliacoes)
+
+    comandos.add_parser(
+        "reconstruir-tags",
+        help="Regrava as tags normalizadas das obras e suas contagens.",
+    ).set_defaults(executar=reconstruir_tags_obras)
+
+    importar = comandos.add_parser(
+        "importar-obras", help="Importa obras de um arquivo CSV."
+    )
+    importar.add_argument("arquivo", type=Path, help="CSV com cabeçalho.")
+    importar.add_argument(
+        "--lote",
+        type=int,
+        default=LOTE_IMPORTACAO,
+        help="Linhas validadas e copiadas por vez.",
+    )
+    importar.add_argument(
+        "--relatorio",
+        type=Path,
+        help="Grava o relatório completo em JSON neste arquivo.",
+    )
+    importar.set_defaults(executar=importar_obras)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Executa o comando informado na linha de comando."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    argumentos = criar_parser().parse_args(argv)
+    argumentos.executar(argumentos)
+
+
+if __name__ == "__main__":
+    main()
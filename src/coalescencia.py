@@ -0,0 +1,172 @@
+"""Coalescência de leituras idênticas e simultâneas (single-flight).
+
+Quando muitas requisições pedem a mesma rota com os mesmos parâmetros ao
+mesmo tempo, só a primeira consulta o banco; as demais aguardam o resultado
+dela. Quem espera além do ``timeout`` desiste e faz a própria consulta.
+
+Uma leitura em andamento não é aproveitada depois de um commit no processo:
+ela pode ter começado antes da escrita, e quem escreveu deve ler o próprio
+dado.
+"""
+
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable, Hashable
+from operator import itemgetter
+from typing import Any
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel import Session as SessionModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from config import settings
+from database import SessaoBanco
+from models.metricas import EstatisticasCoalescencia
+
+_coalescedores: list["Coalescedor"] = []
+_commits = itertools.count(1)
+_ultimo_commit = 0
+
+
+@event.listens_for(Session, "after_commit")
+def _registrar_commit(_session: Session) -> None:
+    global _ultimo_commit  # noqa: PLW0603
+    _ultimo_commit = next(_commits)
+
+
+class Coalescedor:
+    """Compartilha entre requisições simultâneas as leituras de uma rota."""
+
+    def __init__(self, nome: str, timeout: float) -> None:
+        """Cria o coalescedor e o registra nas métricas."""
+        self.nome = nome
+        self.timeout = timeout
+        self._em_andamento: dict[Hashable, tuple[int, asyncio.Task[Any]]] = {}
+        self.execucoes = 0
+        self.coalescidas = 0
+        self.timeouts = 0
+        _coalescedores.append(self)
+
+    async def executar[T](
+        self, chave: Hashable, carregar: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Executa ``carregar`` ou aguarda a execução em andamento da chave.
+
+        A execução continua mesmo se a requisição que a iniciou for
+        cancelada, pois outras podem estar aguardando.
+
+        Returns:
+            T: Resultado de ``carregar``, próprio ou compartilhado.
+
+        """
+        if not settings.coalescencia_habilitada:
+            return await carregar()
+        # Cada event loop tem as próprias tarefas.
+        chave = (asyncio.get_running_loop(), chave)
+        voo = self._em_andamento.get(chave)
+        if voo is not None and voo[0] == _ultimo_commit:
+            try:
+                resultado = await asyncio.wait_for(
+                    asyncio.shield(voo[1]), self.timeout
+                )
+            except TimeoutError:
+                self.timeouts += 1
+                return await carregar()
+            self.coalescidas += 1
+            return resultado
+
+        tarefa = asyncio.ensure_future(carregar())
+        self._em_andamento[chave] = (_ultimo_commit, tarefa)
+        self.execucoes += 1
+        tarefa.add_done_callback(lambda _: self._encerrar(chave, tarefa))
+        return await asyncio.shield(tarefa)
+
+    def _encerrar(self, chave: Hashable, tarefa: asyncio.Task[Any]) -> None:
+        if self._em_andamento.get(chave, (0, None))[1] is tarefa:
+            del self._em_andamento[chave]
+        # Marca a exceção como tratada mesmo se ninguém mais aguardava.
+        if not tarefa.cancelled():
+            tarefa.exception()
+
+    def estatisticas(self) -> EstatisticasCoalescencia:
+        """Gera um retrato dos contadores do coalescedor.
+
+        Returns:
+            EstatisticasCoalescencia: Consultas executadas, requisições
+                atendidas por outra consulta e esperas encerradas pelo
+                timeout.
+
+        """
+        return EstatisticasCoalescencia(
+            nome=self.nome,
+            habilitado=settings.coalescencia_habilitada,
+            timeout_segundos=self.timeout,
+            em_andamento=len(self._em_andamento),
+            execucoes=self.execucoes,
+            coalescidas=self.coalescidas,
+            timeouts=self.timeouts,
+        )
+
+
+def coalescedores_registrados() -> list[Coalescedor]:
+    """Lista os coalescedores criados no processo.
+
+    Returns:
+        list[Coalescedor]: Coalescedores na ordem de criação.
+
+    """
+    return list(_coalescedores)
+
+
+async def executar_coalescido[T](
+    coalescedor: Coalescedor,
+    request: Request,
+    session: SessaoBanco,
+    funcao: Callable[..., T],
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> T:
+    """Executa uma função de repositório como ``executar``, coalescida.
+
+    A chave é o caminho e os parâmetros de consulta da requisição e o banco
+    da sessão: leituras roteadas ao primário (read-your-writes) não
+    aproveitam as feitas em uma réplica. A consulta compartilhada usa uma
+    sessão própria no mesmo banco, que não é fechada junto com a
+    requisição que a iniciou.
+
+    Returns:
+        T: Valor retornado pela função de repositório.
+
+    """
+    chave = (
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items(), key=itemgetter(0))),
+        id(session.bind),
+    )
+
+    async def carregar() -> T:
+        if isinstance(session, AsyncSession):
+            async with AsyncSession(
+                session.bind, expire_on_commit=False
+            ) as propria:
+                return await propria.run_sync(
+                    lambda sessao: funcao(*args, session=sessao, **kwargs)
+                )
+        return await run_in_threadpool(
+            _em_sessao_propria, session, funcao, *args, **kwargs
+        )
+
+    return await coalescedor.executar(chave, carregar)
+
+
+def _em_sessao_propria[T](
+    session: SessionModel,
+    funcao: Callable[..., T],
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> T:
+    with SessionModel(session.bind, expire_on_commit=False) as propria:
+        return funcao(*args, session=propria, **kwargs)
@@ -0,0 +1,156 @@
+"""Respostas condicionais com ``ETag`` e ``Last-Modified``.
+
+O ETag de um registro vem do id, da ``versao`` e dos campos pedidos em
+``?fields=``; o de uma página, das versões dos itens e do restante do
+corpo (cursor, facetas). Uma requisição com ``If-None-Match`` igual ao
+ETag atual (ou, sem ele, ``If-Modified-Since`` igual ou posterior à última
+escrita) recebe 304, sem corpo.
+
+Páginas não trazem ``Last-Modified``: a data da última escrita dos itens
+não muda quando um item sai da página.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import NamedTuple
+
+from fastapi import Request, Response
+
+from models.campos import Campos
+from models.versao import Versao, Versionada
+
+
+def gerar_etag(*partes: object) -> str:
+    """Gera um ETag forte a partir da representação de ``partes``.
+
+    Returns:
+        str: Resumo entre aspas.
+
+    """
+    resumo = hashlib.blake2b(repr(partes).encode(), digest_size=16)
+    return f'"{resumo.hexdigest()}"'
+
+
+def _em_utc(data: datetime) -> datetime:
+    # Só o SQLite devolve a data sem fuso, e o CURRENT_TIMESTAMP dele é UTC.
+    if data.tzinfo is None:
+        return data.replace(tzinfo=UTC)
+    return data.astimezone(UTC)
+
+
+class Validadores(NamedTuple):
+    etag: str
+    modificado_em: datetime | None = None
+
+    @classmethod
+    def do_registro(
+        cls, chave: int, versao: Versao, campos: Campos | None = None
+    ) -> "Validadores":
+        """Monta os validadores de um registro na versão ``versao``.
+
+        Returns:
+            Validadores: ETag e data da última escrita.
+
+        """
+        return cls(
+            gerar_etag(chave, versao.versao, campos and sorted(campos)),
+            versao.atualizado_em,
+        )
+
+    @classmethod
+    def da_pagina(
+        cls, itens: Iterable[Versionada], *restante: object
+    ) -> "Validadores":
+        """Monta o ETag de uma página com os ``itens`` e o ``restante``.
+
+        Returns:
+            Validadores: ETag, sem data de modificação.
+
+        """
+        versoes = [(item.id, item.versao) for item in itens]
+        return cls(gerar_etag(versoes, *restante))
+
+    def cabecalhos(self) -> dict[str, str]:
+        """Monta os cabeçalhos ``ETag`` e ``Last-Modified``.
+
+        Returns:
+            dict[str, str]: Cabeçalhos da resposta.
+
+        """
+        cabecalhos = {"ETag": self.etag}
+        if self.modificado_em is not None:
+            cabecalhos["Last-Modified"] = format_datetime(
+                _em_utc(self.modificado_em), usegmt=True
+            )
+        return cabecalhos
+
+
+def cabecalhos_registro(
+    linha: Versionada | None, campos: Campos | None = None
+) -> dict[str, str] | None:
+    """Monta os cabeçalhos de validação de um registro carregado.
+
+    Returns:
+        dict[str, str] | None: ``ETag`` e ``Last-Modified``, ou None se o
+            registro não existir.
+
+    """
+    if linha is None:
+        return None
+    return Validadores.do_registro(
+        linha.id, Versao.da_linha(linha), campos
+    ).cabecalhos()
+
+
+def condicional(request: Request) -> bool:
+    """Indica se a requisição traz ``If-None-Match`` ou ``If-Modified-Since``.
+
+    Returns:
+        bool: True se vale consultar a versão antes do registro.
+
+    """
+    return (
+        "if-none-match" in request.headers
+        or "if-modified-since" in request.headers
+    )
+
+
+def nao_modificado(request: Request, validadores: Validadores) -> bool:
+    """Avalia as pré-condições do cliente contra os validadores atuais.
+
+    ``If-None-Match`` usa a comparação fraca (ignora ``W/``), como manda o
+    HTTP para ``GET``, e tem precedência sobre ``If-Modified-Since``, que
+    compara em segundos.
+
+    Returns:
+        bool: True se a cópia do cliente continua válida.
+
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = {
+            etag.strip().removeprefix("W/")
+            for etag in if_none_match.split(",")
+        }
+        return "*" in etags or validadores.etag in etags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validadores.modificado_em is None:
+        return False
+    try:
+        desde = _em_utc(parsedate_to_datetime(if_modified_since))
+    except (TypeError, ValueError):
+        return False
+    modificado_em = _em_utc(validadores.modificado_em).replace(microsecond=0)
+    return modificado_em <= desde
+
+
+def resposta_nao_modificada(validadores: Validadores) -> Response:
+    """Monta a resposta 304 com os validadores atuais.
+
+    Returns:
+        Response: Resposta sem corpo.
+
+    """
+    return Response(status_code=304, headers=validadores.cabecalhos())
@@ -1,5 +1,7 @@
 """Application configuration module."""
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,6 +9,31 @@ class Config(BaseSettings):
     """Custom base settings class."""
 
     database_url: str
+    database_async: bool = False
+    database_async_url: str | None = None
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0
+    database_pool_recycle: int = -1
+    database_pool_pre_ping: bool = False
+    database_statement_timeout_ms: int | None = None
+    database_replica_urls: list[str] = []
+    database_replica_estrategia: Literal["round_robin", "menos_carregada"] = (
+        "round_robin"
+    )
+    database_leitura_pos_escrita_segundos: float = 5.0
+    database_streaming_lote: int = 1000
+    cache_habilitado: bool = True
+    cache_backend: Literal["memoria", "redis"] = "memoria"
+    cache_redis_url: str = "redis://localhost:6379/0"
+    cache_barramento: bool = True
+    cache_tamanho_maximo: int = 1024
+    cache_ttl_categorias: float = 3600.0
+    cache_ttl_obras: float = 60.0
+    cache_ttl_eventos: float = 60.0
+    cache_ttl_usuarios: float = 60.0
+    coalescencia_habilitada: bool = True
+    coalescencia_timeout: float = 5.0
 
     model_config = SettingsConfigDict(
         env_file=".env",
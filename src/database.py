@@ -1,13 +1,254 @@
 """Configuração e gerenciamento do banco de dados."""
 
-from collections.abc import Generator
+import itertools
+import threading
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterator,
+    Sequence,
+)
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any
 
+from fastapi import Request, Response
+from sqlalchemy import Row, Select
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import Pool, QueuePool
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 
 from config import settings
+from pool import PoolAssincronoMonitorado, PoolMonitorado
 
-engine = create_engine(settings.database_url)
+DRIVERS_ASSINCRONOS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+SessaoBanco = Session | AsyncSession
+
+METODOS_LEITURA = frozenset({"GET", "HEAD"})
+COOKIE_PRIMARIO = "primario_ate"
+
+
+def url_assincrona(database_url: str) -> str:
+    """Troca o driver da URL do banco pelo equivalente assíncrono.
+
+    Returns:
+        str: URL usando ``asyncpg`` (PostgreSQL) ou ``aiosqlite`` (SQLite).
+
+    Raises:
+        ValueError: Se o banco não tiver driver assíncrono suportado.
+
+    """
+    url = make_url(database_url)
+    driver = DRIVERS_ASSINCRONOS.get(url.get_backend_name())
+    if driver is None:
+        message = f"Banco sem driver assíncrono: {url.get_backend_name()}"
+        raise ValueError(message)
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def argumentos_engine(
+    database_url: str, *, assincrono: bool = False
+) -> dict[str, Any]:
+    """Monta os argumentos de pool e conexão definidos em ``Config``.
+
+    O SQLite mantém o pool escolhido pelo dialeto, pois bancos em memória
+    dependem de ``SingletonThreadPool``/``StaticPool``.
+
+    Returns:
+        dict[str, Any]: Argumentos nomeados para ``create_engine``.
+
+    """
+    argumentos: dict[str, Any] = {
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle,
+    }
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        return argumentos
+
+    argumentos |= {
+        "poolclass": (
+            PoolAssincronoMonitorado if assincrono else PoolMonitorado
+        ),
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+    }
+    timeout = settings.database_statement_timeout_ms
+    if timeout is not None and url.get_backend_name() == "postgresql":
+        argumentos["connect_args"] = (
+            {"server_settings": {"statement_timeout": str(timeout)}}
+            if assincrono
+            else {"options": f"-c statement_timeout={timeout}"}
+        )
+    return argumentos
+
+
+engine = create_engine(
+    settings.database_url, **argumentos_engine(settings.database_url)
+)
+
+engines_replica = [
+    create_engine(url, **argumentos_engine(url))
+    for url in settings.database_replica_urls
+]
+
+async_engine: AsyncEngine | None = None
+async_engines_replica: list[AsyncEngine] = []
+if settings.database_async:
+    _url_async = settings.database_async_url or url_assincrona(
+        settings.database_url
+    )
+    async_engine = create_async_engine(
+        _url_async, **argumentos_engine(_url_async, assincrono=True)
+    )
+    async_engines_replica = [
+        create_async_engine(
+            url_assincrona(url), **argumentos_engine(url, assincrono=True)
+        )
+        for url in settings.database_replica_urls
+    ]
+
+
+def _conexoes_em_uso(engine: Engine | AsyncEngine) -> int:
+    if isinstance(engine, AsyncEngine):
+        engine = engine.sync_engine
+    pool = engine.pool
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+class RoteadorLeitura[E: (Engine, AsyncEngine)]:
+    """Escolhe entre o primário e as réplicas de leitura a cada requisição.
+
+    Leituras (``GET``/``HEAD``) vão para uma réplica, em rodízio ou para a
+    de menos conexões em uso. Escritas vão sempre para o primário e
+    gravam o cookie ``primario_ate``; enquanto ele não expira, as
+    leituras do mesmo cliente também usam o primário (read-your-writes).
+    """
+
+    def __init__(
+        self,
+        primario: E,
+        replicas: list[E],
+        estrategia: str = "round_robin",
+        janela_segundos: float = 5.0,
+    ) -> None:
+        self.primario = primario
+        self.replicas = replicas
+        self.estrategia = estrategia
+        self.janela_segundos = janela_segundos
+        self._contador = itertools.count()
+        self._lock = threading.Lock()
+
+    def _proxima_replica(self) -> E:
+        if self.estrategia == "menos_carregada":
+            return min(self.replicas, key=_conexoes_em_uso)
+        with self._lock:
+            indice = next(self._contador) % len(self.replicas)
+        return self.replicas[indice]
+
+    def escolher(self, request: Request, response: Response) -> E:
+        """Seleciona o engine adequado para a requisição.
+
+        Returns:
+            E: Engine do primário ou de uma réplica.
+
+        """
+        if not self.replicas:
+            return self.primario
+
+        agora = time.time()
+        if request.method not in METODOS_LEITURA:
+            response.set_cookie(
+                COOKIE_PRIMARIO,
+                str(agora + self.janela_segundos),
+                max_age=int(self.janela_segundos) + 1,
+                httponly=True,
+            )
+            return self.primario
+
+        try:
+            primario_ate = float(request.cookies.get(COOKIE_PRIMARIO, 0))
+        except ValueError:
+            primario_ate = 0.0
+        if primario_ate > agora:
+            return self.primario
+        return self._proxima_replica()
+
+
+roteador = RoteadorLeitura(
+    engine,
+    engines_replica,
+    settings.database_replica_estrategia,
+    settings.database_leitura_pos_escrita_segundos,
+)
+roteador_async = (
+    RoteadorLeitura(
+        async_engine,
+        async_engines_replica,
+        settings.database_replica_estrategia,
+        settings.database_leitura_pos_escrita_segundos,
+    )
+    if async_engine is not None
+    else None
+)
+
+
+def sessao_primaria(session: Session) -> AbstractContextManager[Session]:
+    """Sessão no primário para leituras que não podem vir de uma réplica.
+
+    Uma linha lida de uma réplica atrasada pode ser anterior a uma escrita
+    já confirmada; quem a guarda (o cache de entidades) precisa lê-la do
+    primário.
+
+    Returns:
+        AbstractContextManager[Session]: A própria ``session``, se ela não
+            estiver em uma réplica, ou uma nova sessão no primário.
+
+    """
+    primarios: dict[Any, Engine] = dict.fromkeys(
+        roteador.replicas, roteador.primario
+    )
+    if roteador_async is not None:
+        primarios |= dict.fromkeys(
+            (replica.sync_engine for replica in roteador_async.replicas),
+            roteador_async.primario.sync_engine,
+        )
+    primario = primarios.get(session.bind)
+    if primario is None:
+        return nullcontext(session)
+    return Session(primario, expire_on_commit=False)
+
+
+def pools_monitorados() -> dict[str, Pool]:
+    """Lista os pools de conexão ativos da aplicação.
+
+    Returns:
+        dict[str, Pool]: Pools indexados por um nome descritivo.
+
+    """
+    pools = {"primario": engine.pool}
+    pools |= {
+        f"replica_{indice}": replica.pool
+        for indice, replica in enumerate(engines_replica)
+    }
+    if async_engine is not None:
+        pools["primario_async"] = async_engine.sync_engine.pool
+    pools |= {
+        f"replica_{indice}_async": replica.sync_engine.pool
+        for indice, replica in enumerate(async_engines_replica)
+    }
+    return pools
 
 
 def init_db() -> None:
@@ -15,12 +256,152 @@ def init_db() -> None:
     SQLModel.metadata.create_all(engine)
 
 
-def get_session() -> Generator[Session, Any, None]:
+def get_session(
+    request: Request, response: Response
+) -> Generator[Session, Any, None]:
     """Cria uma sessão do banco de dados.
 
     Yields:
-        Session: Sessão do banco de dados para realizar operações.
+        Session: Sessão ligada ao primário ou a uma réplica de leitura.
 
     """
-    with Session(engine) as session:
+    with Session(
+        roteador.escolher(request, response), expire_on_commit=False
+    ) as session:
         yield session
+
+
+async def get_async_session(
+    request: Request, response: Response
+) -> AsyncGenerator[AsyncSession, None]:
+    """Cria uma sessão assíncrona do banco de dados.
+
+    Yields:
+        AsyncSession: Sessão assíncrona no primário ou em uma réplica.
+
+    Raises:
+        RuntimeError: Se o modo assíncrono não estiver habilitado.
+
+    """
+    if roteador_async is None:
+        message = "Modo assíncrono desabilitado (DATABASE_ASYNC=false)"
+        raise RuntimeError(message)
+    async with AsyncSession(
+        roteador_async.escolher(request, response), expire_on_commit=False
+    ) as session:
+        yield session
+
+
+obter_sessao = get_async_session if settings.database_async else get_session
+
+
+async def executar[T](
+    session: SessaoBanco,
+    funcao: Callable[..., T],
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> T:
+    """Executa uma função de repositório na sessão informada.
+
+    Com ``AsyncSession`` a função roda via ``run_sync``, aguardando o
+    driver assíncrono sem ocupar uma thread. Com ``Session`` ela é
+    despachada para o threadpool, como nas rotas síncronas.
+
+    Returns:
+        T: Valor retornado pela função de repositório.
+
+    """
+    if isinstance(session, AsyncSession):
+        return await session.run_sync(
+            lambda sessao: funcao(*args, session=sessao, **kwargs)
+        )
+    return await run_in_threadpool(funcao, *args, session=session, **kwargs)
+
+
+def _iterar_em_lotes[T](
+    engine: Engine, statement: SelectOfScalar[T], lote: int
+) -> Iterator[Sequence[T]]:
+    with Session(engine) as session:
+        resultado = session.exec(statement.execution_options(yield_per=lote))
+        yield from resultado.partitions()
+
+
+async def transmitir[T](
+    request: Request,
+    statement: SelectOfScalar[T],
+    lote: int | None = None,
+) -> AsyncIterator[T]:
+    """Percorre o resultado de ``statement`` sem materializá-lo.
+
+    As linhas vêm de um cursor do lado do servidor (``yield_per``) em lotes
+    de ``lote`` registros, então a memória fica constante qualquer que seja
+    o tamanho da tabela. A sessão é aberta aqui, e não pela dependência da
+    rota, porque precisa sobreviver até o fim do ``StreamingResponse``. No
+    modo síncrono há uma troca de thread por lote, e não por registro.
+
+    Yields:
+        T: Cada registro do resultado, na ordem da consulta.
+
+    """
+    lote = lote or settings.database_streaming_lote
+    if roteador_async is not None:
+        async with AsyncSession(
+            roteador_async.escolher(request, Response())
+        ) as session:
+            resultado = await session.stream_scalars(
+                statement.execution_options(yield_per=lote)
+            )
+            async for item in resultado:
+                yield item
+        return
+
+    engine_leitura = roteador.escolher(request, Response())
+    async for parte in iterate_in_threadpool(
+        _iterar_em_lotes(engine_leitura, statement, lote)
+    ):
+        for item in parte:
+            yield item
+
+
+def _iterar_partes(
+    engine: Engine, statement: Select[Any], lote: int
+) -> Iterator[Sequence[Row[Any]]]:
+    with engine.connect() as conexao:
+        resultado = conexao.execute(
+            statement.execution_options(yield_per=lote)
+        )
+        yield from resultado.partitions()
+
+
+async def transmitir_linhas(
+    request: Request,
+    statement: Select[Any],
+    lote: int | None = None,
+) -> AsyncIterator[Sequence[Row[Any]]]:
+    """Percorre as linhas de ``statement`` em lotes, sem materializá-las.
+
+    Como em ``transmitir``, o resultado vem de um cursor do lado do
+    servidor, mas as linhas são as tuplas do Core, sem montar objetos do
+    ORM, e são entregues ``lote`` a ``lote``: no modo síncrono há uma troca
+    de thread por lote, e não por linha.
+
+    Yields:
+        Sequence[Row[Any]]: Cada lote de linhas, na ordem da consulta.
+
+    """
+    lote = lote or settings.database_streaming_lote
+    if roteador_async is not None:
+        engine_async = roteador_async.escolher(request, Response())
+        async with engine_async.connect() as conexao:
+            resultado = await conexao.stream(
+                statement.execution_options(yield_per=lote)
+            )
+            async for parte in resultado.partitions():
+                yield parte
+        return
+
+    engine_leitura = roteador.escolher(request, Response())
+    async for parte in iterate_in_threadpool(
+        _iterar_partes(engine_leitura, statement, lote)
+    ):
+        yield parte
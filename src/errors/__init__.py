@@ -1 +1,13 @@
 """Módulo de tratamento de erros."""
+
+
+class CursorInvalidoError(ValueError):
+    """Cursor de paginação malformado ou incompatível com a listagem."""
+
+
+class ObrasInexistentesError(ValueError):
+    """Associação a obras que não existem."""
+
+    def __init__(self, ids: list[int]) -> None:
+        super().__init__(ids)
+        self.ids = ids
@@ -0,0 +1,157 @@
+"""Respostas de exportação em CSV e Parquet, geradas lote a lote."""
+
+import csv
+import io
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import datetime
+from importlib.util import find_spec
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import JSON, ColumnElement, Row, TypeDecorator
+from sqlalchemy.types import TypeEngine
+
+from models.tag import SEPARADOR_TAGS
+
+MEDIA_TYPE_CSV = "text/csv"
+MEDIA_TYPE_PARQUET = "application/vnd.apache.parquet"
+
+Lotes = AsyncIterator[Sequence[Row[Any]]]
+
+
+def resposta_exportacao(
+    conteudo: AsyncIterator[str] | AsyncIterator[bytes],
+    media_type: str,
+    nome_arquivo: str,
+) -> StreamingResponse:
+    """Monta a resposta que entrega ``conteudo`` como ``nome_arquivo``.
+
+    Returns:
+        StreamingResponse: Resposta com ``Content-Disposition: attachment``.
+
+    """
+    return StreamingResponse(
+        conteudo,
+        media_type=media_type,
+        headers={
+            "content-disposition": f'attachment; filename="{nome_arquivo}"'
+        },
+    )
+
+
+def _valor_csv(valor: Any) -> Any:  # noqa: ANN401
+    # Listas (as tags) viram uma coluna só, no formato aceito pela
+    # importação de obras.
+    if isinstance(valor, list):
+        return SEPARADOR_TAGS.join(map(str, valor))
+    return valor
+
+
+async def gerar_csv(
+    lotes: Lotes, colunas: Iterable[ColumnElement[Any]]
+) -> AsyncIterator[str]:
+    """Escreve o cabeçalho e depois um pedaço de CSV por lote de linhas.
+
+    Yields:
+        str: Cabeçalho e linhas de cada lote, já no formato CSV.
+
+    """
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+    escritor.writerow(coluna.key for coluna in colunas)
+    yield buffer.getvalue()
+    async for lote in lotes:
+        buffer.seek(0)
+        buffer.truncate()
+        escritor.writerows(map(_valor_csv, linha) for linha in lote)
+        yield buffer.getvalue()
+
+
+def parquet_disponivel() -> bool:
+    """Indica se o ``pyarrow``, do extra ``parquet``, está instalado.
+
+    Returns:
+        bool: ``True`` quando a exportação em Parquet pode ser gerada.
+
+    """
+    return find_spec("pyarrow") is not None
+
+
+class _SaidaParquet(io.RawIOBase):
+    # O escritor de Parquet grava as posições de cada bloco no rodapé do
+    # arquivo, então a posição precisa continuar contando depois que os
+    # bytes já escritos são entregues ao cliente.
+    def __init__(self) -> None:
+        super().__init__()
+        self._partes: list[bytes] = []
+        self._posicao = 0
+
+    def writable(self) -> bool:  # noqa: PLR6301
+        return True
+
+    def write(self, dados: Any) -> int:  # noqa: ANN401
+        parte = bytes(dados)
+        self._partes.append(parte)
+        self._posicao += len(parte)
+        return len(parte)
+
+    def tell(self) -> int:
+        return self._posicao
+
+    def esvaziar(self) -> bytes:
+        dados = b"".join(self._partes)
+        self._partes.clear()
+        return dados
+
+
+async def gerar_parquet(
+    lotes: Lotes, colunas: Iterable[ColumnElement[Any]]
+) -> AsyncIterator[bytes]:
+    """Escreve cada lote de linhas como um grupo de linhas do Parquet.
+
+    Os tipos das colunas vêm dos tipos do banco, então um lote sem valores
+    em alguma coluna não muda o esquema do arquivo.
+
+    Yields:
+        bytes: Bytes do arquivo à medida que cada grupo é gravado.
+
+    """
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    tipos_arrow = {
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+        str: pa.string(),
+        datetime: pa.timestamp("us"),
+    }
+
+    def tipo_arrow(tipo: TypeEngine[Any]) -> pa.DataType:
+        # Tipos próprios (como o AutoString do SQLModel) delegam ao tipo
+        # base do SQLAlchemy que decoram.
+        if isinstance(tipo, TypeDecorator):
+            tipo = tipo.impl_instance
+        if isinstance(tipo, JSON):
+            return pa.list_(pa.string())
+        return tipos_arrow[tipo.python_type]
+
+    esquema = pa.schema(
+        (coluna.key, tipo_arrow(coluna.type)) for coluna in colunas
+    )
+    saida = _SaidaParquet()
+    with pq.ParquetWriter(saida, esquema) as escritor:
+        async for lote in lotes:
+            escritor.write_batch(
+                pa.RecordBatch.from_arrays(
+                    [
+                        pa.array(valores, type=campo.type)
+                        for valores, campo in zip(
+                            zip(*lote, strict=True), esquema, strict=True
+                        )
+                    ],
+                    schema=esquema,
+                )
+            )
+            yield saida.esvaziar()
+    yield saida.esvaziar()
@@ -1,6 +1,6 @@
 """Módulo de modelos de banco de dados."""
 
-from .avaliacoes_eventos import AvaliacaoEventoDB
+from .avaliacoes_eventos import AvaliacaoEventoDB, ResumoAvaliacoesDB
 from .categoria import CategoriaDB
 from .comentario_evento import ComentarioEventoDB
 from .comentario_obra import ComentarioObraDB
@@ -8,9 +8,12 @@ from .evento import EventoDB
 from .link_rede import LinkRedeDB
 from .obra import ObraDB
 from .obra_evento import ObraEventoDB
+from .sincronizacao import AlteracaoDB
+from .tag import ObraTagDB, TagDB
 from .usuario import UsuarioDB
 
 __all__ = [
+    "AlteracaoDB",
     "AvaliacaoEventoDB",
     "CategoriaDB",
     "ComentarioEventoDB",
@@ -19,5 +22,8 @@ __all__ = [
     "LinkRedeDB",
     "ObraDB",
     "ObraEventoDB",
+    "ObraTagDB",
+    "ResumoAvaliacoesDB",
+    "TagDB",
     "UsuarioDB",
 ]
@@ -2,6 +2,7 @@
 
 from typing import TYPE_CHECKING
 
+from pydantic import computed_field
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -9,16 +10,36 @@ if TYPE_CHECKING:
     from .usuario import UsuarioDB
 
 
+NOTA_MINIMA = 1
+NOTA_MAXIMA = 5
+RESPOSTAS_POSITIVAS = frozenset({"sim", "s", "true", "1", "yes"})
+
+
+def gostou_positivo(gostou: str) -> bool:
+    """Indica se a resposta de ``gostou`` conta como positiva.
+
+    Returns:
+        bool: ``True`` para respostas como "sim" ou "true".
+
+    """
+    return gostou.strip().lower() in RESPOSTAS_POSITIVAS
+
+
 class AvaliacaoEventoBase(SQLModel):
-    usuario_id: int = Field(foreign_key="usuarios.id")
-    evento_id: int = Field(foreign_key="eventos.id")
+    usuario_id: int = Field(foreign_key="usuarios.id", index=True)
+    evento_id: int = Field(foreign_key="eventos.id", index=True)
     gostou: str
-    avaliacao: int
+    avaliacao: int = Field(ge=NOTA_MINIMA, le=NOTA_MAXIMA)
 
 
 class AvaliacaoEventoCreate(AvaliacaoEventoBase): ...
 
 
+class AvaliacaoEventoAtualizacao(SQLModel):
+    gostou: str | None = None
+    avaliacao: int | None = Field(default=None, ge=NOTA_MINIMA, le=NOTA_MAXIMA)
+
+
 class AvaliacaoEventoResponse(AvaliacaoEventoBase):
     id: int = Field(default=None, primary_key=True)
 
@@ -28,3 +49,45 @@ class AvaliacaoEventoDB(AvaliacaoEventoResponse, table=True):
 
     usuario: "UsuarioDB" = Relationship()
     evento: "EventoDB" = Relationship()
+
+
+class ResumoAvaliacoes(SQLModel):
+    quantidade: int = 0
+    soma: int = 0
+    gostaram: int = 0
+    nota_1: int = Field(default=0, exclude=True)
+    nota_2: int = Field(default=0, exclude=True)
+    nota_3: int = Field(default=0, exclude=True)
+    nota_4: int = Field(default=0, exclude=True)
+    nota_5: int = Field(default=0, exclude=True)
+
+    @computed_field
+    @property
+    def media(self) -> float | None:
+        """Nota média, ou None se ainda não houver avaliações."""
+        return self.soma / self.quantidade if self.quantidade else None
+
+    @computed_field
+    @property
+    def histograma(self) -> dict[int, int]:
+        """Quantidade de avaliações com cada nota de 1 a 5."""
+        return {
+            nota: getattr(self, f"nota_{nota}")
+            for nota in range(NOTA_MINIMA, NOTA_MAXIMA + 1)
+        }
+
+
+class ResumoGuardado(ResumoAvaliacoes):
+    """Resumo guardado no cache, com as contagens por nota serializadas."""
+
+    nota_1: int = 0
+    nota_2: int = 0
+    nota_3: int = 0
+    nota_4: int = 0
+    nota_5: int = 0
+
+
+class ResumoAvaliacoesDB(ResumoAvaliacoes, table=True):
+    __tablename__ = "resumo_avaliacoes_eventos"  # type: ignore
+
+    evento_id: int = Field(foreign_key="eventos.id", primary_key=True)
@@ -0,0 +1,87 @@
+"""Estruturas de busca textual das obras, específicas de cada banco.
+
+No PostgreSQL a coluna gerada ``obras.busca`` guarda o ``tsvector`` com
+configuração ``portuguese`` sobre o texto sem acentos (``unaccent``), com
+pesos por campo e índice GIN. No SQLite, usado em testes e desenvolvimento,
+uma tabela virtual FTS5 espelha as colunas de texto e é mantida por
+triggers. Em ambos os casos o índice acompanha cada escrita em ``obras``.
+"""
+
+from sqlalchemy import DDL, Table, event
+
+DDL_BUSCA_POSTGRES = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    CREATE OR REPLACE FUNCTION imutavel_unaccent(text) RETURNS text
+    AS $$ SELECT public.unaccent('public.unaccent', $1) $$
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    """,
+    """
+    ALTER TABLE obras ADD COLUMN busca tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese', imutavel_unaccent(titulo)), 'A')
+        || setweight(to_tsvector('portuguese', imutavel_unaccent(autor)), 'B')
+        || setweight(
+            to_tsvector('portuguese', imutavel_unaccent(tecnica_criacao)), 'C'
+        )
+        || setweight(
+            to_tsvector('portuguese', imutavel_unaccent(tags::text)), 'D'
+        )
+    ) STORED
+    """,
+    "CREATE INDEX ix_obras_busca ON obras USING GIN (busca)",
+]
+
+DDL_BUSCA_SQLITE = [
+    """
+    CREATE VIRTUAL TABLE obras_fts USING fts5(
+        titulo, autor, tecnica_criacao, tags,
+        content='obras', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER obras_fts_insercao AFTER INSERT ON obras BEGIN
+        INSERT INTO obras_fts (rowid, titulo, autor, tecnica_criacao, tags)
+        VALUES (new.id, new.titulo, new.autor, new.tecnica_criacao,
+                new.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER obras_fts_remocao AFTER DELETE ON obras BEGIN
+        INSERT INTO obras_fts (
+            obras_fts, rowid, titulo, autor, tecnica_criacao, tags
+        )
+        VALUES ('delete', old.id, old.titulo, old.autor,
+                old.tecnica_criacao, old.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER obras_fts_atualizacao AFTER UPDATE ON obras BEGIN
+        INSERT INTO obras_fts (
+            obras_fts, rowid, titulo, autor, tecnica_criacao, tags
+        )
+        VALUES ('delete', old.id, old.titulo, old.autor,
+                old.tecnica_criacao, old.tags);
+        INSERT INTO obras_fts (rowid, titulo, autor, tecnica_criacao, tags)
+        VALUES (new.id, new.titulo, new.autor, new.tecnica_criacao,
+                new.tags);
+    END
+    """,
+]
+
+
+def registrar_ddl_busca(tabela: Table) -> None:
+    """Cria as estruturas de busca junto com ``tabela`` no ``create_all``.
+
+    As migrações criam as mesmas estruturas para bancos já existentes.
+    """
+    for comando in DDL_BUSCA_POSTGRES:
+        event.listen(
+            tabela,
+            "after_create",
+            DDL(comando).execute_if(dialect="postgresql"),
+        )
+    for comando in DDL_BUSCA_SQLITE:
+        event.listen(
+            tabela, "after_create", DDL(comando).execute_if(dialect="sqlite")
+        )
@@ -0,0 +1,118 @@
+"""Seleção dos campos devolvidos pelas rotas (``?fields=``).
+
+O cliente pede só os campos que usa, por exemplo ``?fields=id,titulo``.
+A resposta é validada por um modelo reduzido, com apenas esses campos, e
+os repositórios carregam do banco só as colunas correspondentes.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Annotated, Any
+
+from fastapi import Query
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, create_model, field_validator
+
+Campos = frozenset[str]
+# Combinações de campos com modelo guardado; os clientes escolhem os campos,
+# então as usadas há mais tempo são descartadas.
+MODELOS_PARCIAIS_MAXIMO = 256
+
+
+def campos_da_resposta(
+    modelo: type[BaseModel],
+) -> Callable[..., Campos | None]:
+    """Cria a dependência que lê ``?fields=`` para respostas de ``modelo``.
+
+    Returns:
+        Callable[..., Campos | None]: Dependência que devolve os campos
+            pedidos, ou None quando o parâmetro não é enviado.
+
+    """
+    disponiveis = ", ".join(modelo.model_fields)
+
+    def campos(
+        fields: Annotated[
+            list[str] | None,
+            Query(
+                description=(
+                    "Campos devolvidos, separados por vírgula. Disponíveis: "
+                    f"{disponiveis}."
+                )
+            ),
+        ] = None,
+    ) -> Campos | None:
+        if fields is None:
+            return None
+        pedidos = frozenset(
+            nome.strip()
+            for valor in fields
+            for nome in valor.split(",")
+            if nome.strip()
+        )
+        desconhecidos = sorted(pedidos - modelo.model_fields.keys())
+        if desconhecidos:
+            mensagem = f"Campos inexistentes: {', '.join(desconhecidos)}"
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "value_error",
+                        "loc": ("query", "fields"),
+                        "msg": mensagem,
+                        "input": fields,
+                    }
+                ]
+            )
+        return pedidos or None
+
+    return campos
+
+
+_modelos_parciais: OrderedDict[
+    tuple[type[BaseModel], Campos], type[BaseModel]
+] = OrderedDict()
+
+
+def modelo_parcial(modelo: type[BaseModel], campos: Campos) -> type[BaseModel]:
+    """Monta um modelo com apenas ``campos`` de ``modelo``.
+
+    Os campos mantêm tipos, padrões e validadores de ``modelo``. O modelo
+    das combinações usadas mais recentemente fica guardado e é
+    reaproveitado.
+
+    Returns:
+        type[BaseModel]: Modelo reduzido, validável a partir de atributos.
+
+    """
+    if (modelo, campos) in _modelos_parciais:
+        _modelos_parciais.move_to_end((modelo, campos))
+        return _modelos_parciais[modelo, campos]
+    validadores = {
+        nome: field_validator(
+            *selecionados,
+            mode=decorador.info.mode,  # type: ignore[arg-type]
+        )(decorador.func)
+        for nome, decorador in (
+            modelo.__pydantic_decorators__.field_validators.items()
+        )
+        if (
+            selecionados := [
+                campo for campo in decorador.info.fields if campo in campos
+            ]
+        )
+    }
+    definicoes: dict[str, Any] = {
+        nome: (info.annotation, info)
+        for nome, info in modelo.model_fields.items()
+        if nome in campos
+    }
+    parcial = create_model(
+        f"{modelo.__name__}Parcial",
+        __config__=ConfigDict(from_attributes=True),
+        __validators__=validadores,
+        **definicoes,
+    )
+    _modelos_parciais[modelo, campos] = parcial
+    if len(_modelos_parciais) > MODELOS_PARCIAIS_MAXIMO:
+        _modelos_parciais.popitem(last=False)
+    return parcial
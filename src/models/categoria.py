@@ -16,6 +16,10 @@ class CategoriaCreate(CategoriaBase):
     nome: str
 
 
+class CategoriaAtualizacao(SQLModel):
+    nome: str | None = None
+
+
 class CategoriaResponse(CategoriaBase):
     id: int
 
@@ -16,8 +16,8 @@ class StatusComentario(Enum):
 
 
 class ComentarioEventoBase(SQLModel):
-    usuario_id: int = Field(foreign_key="usuarios.id")
-    evento_id: int = Field(foreign_key="eventos.id")
+    usuario_id: int = Field(foreign_key="usuarios.id", index=True)
+    evento_id: int = Field(foreign_key="eventos.id", index=True)
     comentario: str
     status: StatusComentario = StatusComentario.ATIVO
 
@@ -25,6 +25,11 @@ class ComentarioEventoBase(SQLModel):
 class ComentarioEventoCreate(ComentarioEventoBase): ...
 
 
+class ComentarioEventoAtualizacao(SQLModel):
+    comentario: str | None = None
+    status: StatusComentario | None = None
+
+
 class ComentarioEventoResponse(ComentarioEventoBase):
     id: int
 
@@ -13,13 +13,20 @@ class ComentarioObraBase(SQLModel):
     texto: str
     ativado: bool = True
 
-    usuario_id: int = Field(foreign_key="usuarios.id", nullable=False)
-    obra_id: int = Field(foreign_key="obras.id", nullable=False)
+    usuario_id: int = Field(
+        foreign_key="usuarios.id", nullable=False, index=True
+    )
+    obra_id: int = Field(foreign_key="obras.id", nullable=False, index=True)
 
 
 class ComentarioObraCreate(ComentarioObraBase): ...
 
 
+class ComentarioObraAtualizacao(SQLModel):
+    texto: str | None = None
+    ativado: bool | None = None
+
+
 class ComentarioObraResponse(ComentarioObraBase):
     id: int = Field(default=None, primary_key=True)
 
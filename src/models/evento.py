@@ -1,38 +1,98 @@
 """Modelos de dados para eventos culturais."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from pydantic import field_validator
+from sqlalchemy import DateTime
+from sqlmodel import Field, Relationship, SQLModel, func
 
+from .avaliacoes_eventos import ResumoAvaliacoes, ResumoGuardado
+from .comentario_evento import ComentarioEventoResponse
+from .obra import ObraResponse
 from .obra_evento import ObraEventoDB
+from .paginacao import Pagina
+from .usuario import UsuarioResponse
 
 if TYPE_CHECKING:
     from models import ComentarioEventoDB, ObraDB, UsuarioDB
 
-    from .avaliacoes_eventos import AvaliacaoEventoDB
+    from .avaliacoes_eventos import AvaliacaoEventoDB, ResumoAvaliacoesDB
 
 
 class EventoBase(SQLModel):
     endereco: str
     local: str
-    data: datetime
-    id_organizador: int = Field(foreign_key="usuarios.id")
-    id_responsavel: int = Field(foreign_key="usuarios.id")
+    data: datetime = Field(index=True)
+    id_organizador: int = Field(foreign_key="usuarios.id", index=True)
+    id_responsavel: int = Field(foreign_key="usuarios.id", index=True)
 
 
 class EventoCreate(EventoBase):
     nome: str
 
 
+class EventoAtualizacao(SQLModel):
+    nome: str | None = None
+    endereco: str | None = None
+    local: str | None = None
+    data: datetime | None = None
+    id_organizador: int | None = None
+    id_responsavel: int | None = None
+
+
 class EventoResponse(EventoBase):
     id: int
+    resumo_avaliacoes: ResumoAvaliacoes = Field(
+        default_factory=ResumoAvaliacoes
+    )
+
+    @field_validator("resumo_avaliacoes", mode="before")
+    @classmethod
+    def _validar_resumo(cls, valor: object) -> ResumoAvaliacoes:
+        if valor is None:
+            return ResumoAvaliacoes()
+        return ResumoAvaliacoes.model_validate(valor)
+
+
+class EventoGuardado(EventoResponse):
+    """Evento guardado no cache, com a versão para os validadores HTTP."""
+
+    versao: int = 1
+    atualizado_em: datetime | None = None
+    resumo_avaliacoes: ResumoGuardado = Field(  # type: ignore[assignment]
+        default_factory=ResumoGuardado
+    )
+
+    @field_validator("resumo_avaliacoes", mode="before")
+    @classmethod
+    def _validar_resumo(cls, valor: object) -> ResumoGuardado:
+        if valor is None:
+            return ResumoGuardado()
+        return ResumoGuardado.model_validate(valor, from_attributes=True)
+
+
+class EventoCompleto(EventoResponse):
+    nome: str
+    organizador: UsuarioResponse
+    responsavel: UsuarioResponse
+    obras: Pagina[ObraResponse]
+    comentarios_recentes: list[ComentarioEventoResponse]
 
 
 class EventoDB(EventoCreate, table=True):
     __tablename__ = "eventos"  # type: ignore
 
     id: int = Field(default=None, primary_key=True)
+    # Incrementada e carimbada a cada escrita no evento ou no resumo das
+    # avaliações; geram o ETag e o Last-Modified das respostas.
+    versao: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
+    atualizado_em: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),  # type: ignore[arg-type]
+        sa_column_kwargs={"server_default": func.now()},
+    )
 
     organizador: "UsuarioDB" = Relationship(
         sa_relationship_kwargs={"foreign_keys": ("EventoDB.id_organizador")}
@@ -47,3 +107,6 @@ class EventoDB(EventoCreate, table=True):
     avaliacoes_eventos: list["AvaliacaoEventoDB"] = Relationship(
         back_populates="evento"
     )
+    resumo_avaliacoes: Optional["ResumoAvaliacoesDB"] = Relationship(
+        sa_relationship_kwargs={"lazy": "joined", "uselist": False}
+    )
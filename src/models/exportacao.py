@@ -0,0 +1,22 @@
+"""Modelos da exportação do catálogo de obras."""
+
+from enum import Enum
+
+
+class ColunaExportacao(Enum):
+    ID = "id"
+    TITULO = "titulo"
+    AUTOR = "autor"
+    ANO_PRODUCAO = "ano_producao"
+    TECNICA_CRIACAO = "tecnica_criacao"
+    ALTURA_CENTIMETROS = "altura_centimetros"
+    LARGURA_CENTIMETROS = "largura_centimetros"
+    PESO_QUILOS = "peso_quilos"
+    TAGS = "tags"
+    PRECO = "preco"
+    STATUS = "status"
+    DATA_POSTAGEM = "data_postagem"
+    USUARIO_ID = "usuario_id"
+    USUARIO_NOME = "usuario_nome"
+    CATEGORIA_ID = "categoria_id"
+    CATEGORIA_NOME = "categoria_nome"
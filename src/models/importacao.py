@@ -0,0 +1,25 @@
+"""Modelos da importação de obras por arquivo CSV."""
+
+from operator import attrgetter
+
+from pydantic import BaseModel
+
+from .lote import ErroItem
+
+LIMITE_ERROS = 1000
+
+
+class RelatorioImportacao(BaseModel):
+    lidas: int = 0
+    importadas: int = 0
+    total_erros: int = 0
+    # ``indice`` é a linha do arquivo; só as primeiras falhas são guardadas.
+    erros: list[ErroItem] = []
+
+    def registrar_erros(self, erros: list[ErroItem]) -> None:
+        """Conta os erros e guarda os detalhes até ``LIMITE_ERROS``."""
+        self.total_erros += len(erros)
+        vagas = max(LIMITE_ERROS - len(self.erros), 0)
+        self.erros = sorted(
+            [*self.erros, *erros[:vagas]], key=attrgetter("indice")
+        )
@@ -12,12 +12,18 @@ class LinkRedeBase(SQLModel):
     link: str
     nome_rede: str
     nome_usuario: str
-    id_usuario: int = Field(foreign_key="usuarios.id")
+    id_usuario: int = Field(foreign_key="usuarios.id", index=True)
 
 
 class LinkRedeCreate(LinkRedeBase): ...
 
 
+class LinkRedeAtualizacao(SQLModel):
+    link: str | None = None
+    nome_rede: str | None = None
+    nome_usuario: str | None = None
+
+
 class LinkRedeResponse(LinkRedeBase):
     id: int
 
@@ -0,0 +1,82 @@
+"""Modelos das criações em lote.
+
+Os itens de um lote são validados um a um: os inválidos viram erros com o
+índice na requisição, no mesmo formato de ``loc``/``msg``/``type`` das
+respostas 422, e os demais seguem para o banco.
+"""
+
+from operator import attrgetter
+from typing import Annotated, Any, Self
+
+from fastapi import Body
+from pydantic import BaseModel, ValidationError
+from sqlmodel import SQLModel
+
+LIMITE_LOTE = 50_000
+
+CorpoLote = Annotated[
+    list[dict[str, Any]],
+    Body(min_length=1, max_length=LIMITE_LOTE),
+]
+
+
+class DetalheErro(BaseModel):
+    loc: list[str | int] = []
+    msg: str
+    type: str
+
+
+class ErroItem(BaseModel):
+    indice: int
+    erros: list[DetalheErro]
+
+
+class ItemCriado(BaseModel):
+    indice: int
+    id: int
+
+
+class ResultadoLote(BaseModel):
+    criados: list[ItemCriado] = []
+    erros: list[ErroItem] = []
+
+    def com_erros(self, erros: list[ErroItem]) -> Self:
+        """Acrescenta os erros de validação, ordenando todos por índice.
+
+        Returns:
+            Self: O próprio resultado.
+
+        """
+        self.erros = sorted([*erros, *self.erros], key=attrgetter("indice"))
+        return self
+
+
+def validar_lote(
+    modelo: type[SQLModel], itens: list[dict[str, Any]]
+) -> tuple[dict[int, dict[str, Any]], list[ErroItem]]:
+    """Valida cada item do lote com ``modelo``.
+
+    Campos nulos são omitidos dos valores, para que o banco aplique os
+    padrões das colunas.
+
+    Returns:
+        tuple[dict[int, dict[str, Any]], list[ErroItem]]: Valores dos itens
+            válidos por índice e erros dos inválidos.
+
+    """
+    validos: dict[int, dict[str, Any]] = {}
+    erros: list[ErroItem] = []
+    for indice, item in enumerate(itens):
+        try:
+            validos[indice] = modelo.model_validate(item).model_dump(
+                exclude_none=True
+            )
+        except ValidationError as erro:
+            detalhes = erro.errors(include_url=False, include_context=False)
+            erros.append(
+                ErroItem(
+                    indice=indice,
+                    erros=[DetalheErro.model_validate(d) for d in detalhes],
+                )
+            )
+    return validos, erros
@@ -0,0 +1,41 @@
+"""Modelos de resposta para métricas operacionais da API."""
+
+from sqlmodel import SQLModel
+
+
+class EstatisticasPool(SQLModel):
+    nome: str
+    classe: str
+    tamanho: int = 0
+    em_uso: int = 0
+    ociosas: int = 0
+    overflow: int = 0
+    aquisicoes: int = 0
+    timeouts: int = 0
+    espera_total_segundos: float = 0.0
+    espera_media_segundos: float = 0.0
+    espera_maxima_segundos: float = 0.0
+
+
+class EstatisticasCache(SQLModel):
+    nome: str
+    backend: str
+    habilitado: bool
+    tamanho: int | None
+    tamanho_maximo: int
+    ttl_segundos: float
+    acertos: int = 0
+    faltas: int = 0
+    expiracoes: int | None = 0
+    despejos: int | None = 0
+    invalidacoes: int = 0
+
+
+class EstatisticasCoalescencia(SQLModel):
+    nome: str
+    habilitado: bool
+    timeout_segundos: float
+    em_andamento: int = 0
+    execucoes: int = 0
+    coalescidas: int = 0
+    timeouts: int = 0
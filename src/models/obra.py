@@ -1,12 +1,18 @@
 """Modelos de dados para obras de arte."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated
 
-from sqlalchemy import JSON
+from fastapi import Query
+from pydantic import BaseModel
+from sqlalchemy import JSON, DateTime, Index
 from sqlmodel import Field, Relationship, SQLModel, func
 
+from .busca import registrar_ddl_busca
 from .obra_evento import ObraEventoDB
+from .paginacao import Pagina
+from .tag import ModoTags
 
 if TYPE_CHECKING:
     from models import CategoriaDB, ComentarioObraDB, EventoDB, UsuarioDB
@@ -23,7 +29,7 @@ class ObraBase(SQLModel):
     tags: list[str] = Field(sa_type=JSON)
     preco: float
     status: bool
-    data_postagem: datetime = Field(default=func.now())
+    data_postagem: datetime | None = None
 
     usuario_id: int = Field(foreign_key="usuarios.id", nullable=False)
     categoria_id: int = Field(foreign_key="categorias.id", nullable=False)
@@ -32,12 +38,65 @@ class ObraBase(SQLModel):
 class ObraCreate(ObraBase): ...
 
 
+class ObraAtualizacao(SQLModel):
+    titulo: str | None = None
+    autor: str | None = None
+    ano_producao: int | None = None
+    tecnica_criacao: str | None = None
+    altura_centimetros: float | None = None
+    largura_centimetros: float | None = None
+    peso_quilos: float | None = None
+    tags: list[str] | None = None
+    preco: float | None = None
+    status: bool | None = None
+    categoria_id: int | None = None
+
+
 class ObraResponse(ObraBase):
     id: int = Field(default=None, primary_key=True)
+    data_postagem: datetime  # type: ignore[assignment]
 
 
 class ObraDB(ObraResponse, table=True):
     __tablename__ = "obras"  # type: ignore
+    __table_args__ = (
+        Index("ix_obras_data_postagem_id", "data_postagem", "id"),
+        Index(
+            "ix_obras_categoria_id_data_postagem_id",
+            "categoria_id",
+            "data_postagem",
+            "id",
+        ),
+        Index(
+            "ix_obras_usuario_id_data_postagem_id",
+            "usuario_id",
+            "data_postagem",
+            "id",
+        ),
+        Index(
+            "ix_obras_status_data_postagem_id", "status", "data_postagem", "id"
+        ),
+        Index("ix_obras_tecnica_criacao_preco", "tecnica_criacao", "preco"),
+        Index("ix_obras_preco", "preco"),
+    )
+    # O INSERT devolve no RETURNING o id e a data preenchida pelo banco.
+    __mapper_args__ = {"eager_defaults": True}
+
+    data_postagem: datetime | None = Field(  # type: ignore[assignment]
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
+    # Incrementada e carimbada a cada escrita; geram o ETag e o
+    # Last-Modified das respostas. Com fuso, para que o instante não dependa
+    # do TimeZone da sessão no PostgreSQL.
+    versao: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
+    atualizado_em: datetime | None = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),  # type: ignore[arg-type]
+        sa_column_kwargs={"server_default": func.now()},
+    )
 
     usuario: "UsuarioDB" = Relationship(
         back_populates="obras",
@@ -55,3 +114,102 @@ class ObraDB(ObraResponse, table=True):
     eventos: list["EventoDB"] = Relationship(
         back_populates="obras", link_model=ObraEventoDB
     )
+
+
+registrar_ddl_busca(ObraDB.__table__)  # type: ignore[arg-type]
+
+
+class ObraGuardada(ObraResponse):
+    """Obra guardada no cache, com a versão para os validadores HTTP."""
+
+    versao: int = 1
+    atualizado_em: datetime | None = None
+
+
+class ObraEncontrada(ObraResponse):
+    relevancia: float
+    trecho: str
+
+
+FAIXAS_PRECO = (0, 100, 500, 1_000, 5_000, 10_000)
+
+
+@dataclass
+class FiltrosObra:
+    status: Annotated[
+        bool | None, Query(description="Apenas obras com este status.")
+    ] = None
+    categoria_id: Annotated[
+        int | None, Query(description="Apenas obras desta categoria.")
+    ] = None
+    usuario_id: Annotated[
+        int | None, Query(description="Apenas obras deste usuário.")
+    ] = None
+    tecnica_criacao: Annotated[
+        str | None, Query(description="Apenas obras desta técnica.")
+    ] = None
+    preco_min: Annotated[
+        float | None, Query(description="Preço mínimo, inclusive.")
+    ] = None
+    preco_max: Annotated[
+        float | None, Query(description="Preço máximo, inclusive.")
+    ] = None
+    ano_producao_min: Annotated[
+        int | None, Query(description="Ano de produção mínimo.")
+    ] = None
+    ano_producao_max: Annotated[
+        int | None, Query(description="Ano de produção máximo.")
+    ] = None
+    altura_min: Annotated[
+        float | None, Query(description="Altura mínima em centímetros.")
+    ] = None
+    altura_max: Annotated[
+        float | None, Query(description="Altura máxima em centímetros.")
+    ] = None
+    largura_min: Annotated[
+        float | None, Query(description="Largura mínima em centímetros.")
+    ] = None
+    largura_max: Annotated[
+        float | None, Query(description="Largura máxima em centímetros.")
+    ] = None
+    peso_min: Annotated[
+        float | None, Query(description="Peso mínimo em quilos.")
+    ] = None
+    peso_max: Annotated[
+        float | None, Query(description="Peso máximo em quilos.")
+    ] = None
+    tag: Annotated[
+        list[str] | None,
+        Query(description="Apenas obras com estas tags (pode repetir)."),
+    ] = None
+    modo_tags: Annotated[
+        ModoTags,
+        Query(description="Exige qualquer uma ou todas as tags informadas."),
+    ] = ModoTags.QUALQUER
+
+
+class ContagemCategoria(BaseModel):
+    categoria_id: int
+    quantidade: int
+
+
+class ContagemTecnica(BaseModel):
+    tecnica_criacao: str
+    quantidade: int
+
+
+class FaixaPreco(BaseModel):
+    minimo: float
+    maximo: float | None
+    quantidade: int = 0
+
+
+class FacetasObra(BaseModel):
+    categorias: list[ContagemCategoria] = []
+    tecnicas: list[ContagemTecnica] = []
+    faixas_preco: list[FaixaPreco] = []
+
+
+class PaginaObras(Pagina[ObraResponse]):
+    # Só a primeira página traz as facetas, que valem para a listagem toda.
+    facetas: FacetasObra | None = None
@@ -1,10 +1,34 @@
 """Modelos de dados para associação entre obras e eventos."""
 
+from enum import Enum
+
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
+LIMITE_ASSOCIACAO = 10_000
+
 
 class ObraEventoDB(SQLModel, table=True):
     __tablename__ = "obra_evento"  # type: ignore
+    __table_args__ = (
+        Index("ix_obra_evento_id_evento_id_obra", "id_evento", "id_obra"),
+    )
 
     id_obra: int = Field(foreign_key="obras.id", primary_key=True)
     id_evento: int = Field(foreign_key="eventos.id", primary_key=True)
+
+
+class ModoAssociacao(Enum):
+    DEFINIR = "definir"
+    ADICIONAR = "adicionar"
+    REMOVER = "remover"
+
+
+class AssociacaoObras(SQLModel):
+    obras: list[int] = Field(max_length=LIMITE_ASSOCIACAO)
+    modo: ModoAssociacao = ModoAssociacao.DEFINIR
+
+
+class DiferencaObrasEvento(SQLModel):
+    adicionadas: list[int] = []
+    removidas: list[int] = []
@@ -0,0 +1,27 @@
+"""Modelos de paginação por cursor (keyset) das listagens."""
+
+from dataclasses import dataclass
+from typing import Annotated
+
+from fastapi import Query
+from pydantic import BaseModel
+
+LIMITE_PADRAO = 50
+LIMITE_MAXIMO = 200
+
+
+class Pagina[T](BaseModel):
+    itens: list[T]
+    proximo_cursor: str | None = None
+
+
+@dataclass
+class ParametrosPaginacao:
+    cursor: Annotated[
+        str | None,
+        Query(description="Cursor opaco devolvido pela página anterior."),
+    ] = None
+    limite: Annotated[
+        int,
+        Query(ge=1, le=LIMITE_MAXIMO, description="Itens por página."),
+    ] = LIMITE_PADRAO
@@ -0,0 +1,133 @@
+"""Registro de alterações para a sincronização incremental (``/sync``).
+
+Cada escrita em obras, eventos, categorias e usuários grava, por trigger, a
+linha da entidade em ``alteracoes`` com o próximo número de uma sequência
+crescente; remoções deixam a linha marcada como removida (tombstone). Há
+uma linha por registro, então o tamanho da tabela acompanha o catálogo, e
+o índice em ``seq`` faz cada sincronização ler só o que mudou depois do
+token do cliente.
+
+No PostgreSQL o trigger é adiado para o commit e serializa a numeração com
+uma trava consultiva: a ordem de ``seq`` é a ordem dos commits, e uma
+transação lenta não aparece com um número menor que o de um token já
+entregue. No SQLite as escritas já são serializadas pelo banco.
+"""
+
+from sqlalchemy import DDL, BigInteger, Index, Table, event
+from sqlmodel import Field, SQLModel
+
+from .categoria import CategoriaDB, CategoriaResponse
+from .evento import EventoDB, EventoResponse
+from .obra import ObraDB, ObraResponse
+from .usuario import UsuarioDB, UsuarioResponse
+
+LIMITE_SINCRONIZACAO_PADRAO = 500
+LIMITE_SINCRONIZACAO_MAXIMO = 2_000
+
+
+class AlteracaoDB(SQLModel, table=True):
+    __tablename__ = "alteracoes"  # type: ignore
+    __table_args__ = (Index("ix_alteracoes_seq", "seq", unique=True),)
+
+    entidade: str = Field(primary_key=True)
+    registro_id: int = Field(primary_key=True)
+    seq: int = Field(sa_type=BigInteger)
+    removido: bool = False
+
+
+class RemovidosSincronizacao(SQLModel):
+    obras: list[int] = Field(default_factory=list)
+    eventos: list[int] = Field(default_factory=list)
+    categorias: list[int] = Field(default_factory=list)
+    usuarios: list[int] = Field(default_factory=list)
+
+
+class Sincronizacao(SQLModel):
+    obras: list[ObraResponse] = Field(default_factory=list)
+    eventos: list[EventoResponse] = Field(default_factory=list)
+    categorias: list[CategoriaResponse] = Field(default_factory=list)
+    usuarios: list[UsuarioResponse] = Field(default_factory=list)
+    removidos: RemovidosSincronizacao = Field(
+        default_factory=RemovidosSincronizacao
+    )
+    token: str
+    mais: bool
+
+
+DDL_SINCRONIZACAO_POSTGRES = [
+    "CREATE SEQUENCE IF NOT EXISTS alteracoes_seq AS bigint",
+    """
+    CREATE OR REPLACE FUNCTION registrar_alteracao() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_advisory_xact_lock(hashtext('alteracoes'));
+        INSERT INTO alteracoes (entidade, registro_id, seq, removido)
+        VALUES (
+            TG_TABLE_NAME,
+            CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END,
+            nextval('alteracoes_seq'),
+            TG_OP = 'DELETE'
+        )
+        ON CONFLICT (entidade, registro_id) DO UPDATE
+        SET seq = excluded.seq, removido = excluded.removido;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE CONSTRAINT TRIGGER %(table)s_alteracoes
+    AFTER INSERT OR UPDATE OR DELETE ON %(table)s
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION registrar_alteracao()
+    """,
+]
+
+DDL_SINCRONIZACAO_SQLITE = [
+    f"""
+    CREATE TRIGGER %(table)s_alteracoes_{operacao.lower()}
+    AFTER {operacao} ON %(table)s BEGIN
+        INSERT INTO alteracoes (entidade, registro_id, seq, removido)
+        VALUES (
+            '%(table)s',
+            {linha}.id,
+            (SELECT coalesce(max(seq), 0) + 1 FROM alteracoes),
+            {int(operacao == "DELETE")}
+        )
+        ON CONFLICT (entidade, registro_id) DO UPDATE
+        SET seq = excluded.seq, removido = excluded.removido;
+    END
+    """  # noqa: S608
+    for operacao, linha in (
+        ("INSERT", "new"),
+        ("UPDATE", "new"),
+        ("DELETE", "old"),
+    )
+]
+
+
+def registrar_ddl_sincronizacao(tabela: Table) -> None:
+    """Cria os triggers de alteração junto com ``tabela`` no ``create_all``.
+
+    As migrações criam os mesmos triggers para bancos já existentes.
+    """
+    for comando in DDL_SINCRONIZACAO_POSTGRES:
+        event.listen(
+            tabela,
+            "after_create",
+            DDL(comando).execute_if(dialect="postgresql"),
+        )
+    for comando in DDL_SINCRONIZACAO_SQLITE:
+        event.listen(
+            tabela, "after_create", DDL(comando).execute_if(dialect="sqlite")
+        )
+
+
+# Entidades sincronizadas, pelo nome da tabela gravado em ``entidade``.
+MODELOS_SINCRONIZADOS: dict[str, type[SQLModel]] = {
+    "obras": ObraDB,
+    "eventos": EventoDB,
+    "categorias": CategoriaDB,
+    "usuarios": UsuarioDB,
+}
+
+for _modelo in MODELOS_SINCRONIZADOS.values():
+    registrar_ddl_sincronizacao(_modelo.__table__)  # type: ignore[attr-defined]
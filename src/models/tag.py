@@ -0,0 +1,61 @@
+"""Modelos de dados para as tags das obras.
+
+``obras.tags`` continua guardando a lista exibida na API. Para filtrar por
+tag sem varrer ``obras``, cada tag normalizada também vira uma linha de
+``obra_tags``, indexada por tag; ``tags`` mantém a contagem de obras de
+cada tag, atualizada a cada escrita.
+"""
+
+from collections.abc import Iterable
+from enum import Enum
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+# Separa as tags quando a lista vira uma só coluna de texto, como em CSV.
+SEPARADOR_TAGS = ";"
+
+
+class ModoTags(Enum):
+    QUALQUER = "qualquer"
+    TODAS = "todas"
+
+
+def normalizar_tag(tag: str) -> str:
+    """Padroniza uma tag para comparação: minúsculas e espaços simples.
+
+    Returns:
+        str: Tag normalizada.
+
+    """
+    return " ".join(tag.split()).lower()
+
+
+def normalizar_tags(tags: Iterable[str]) -> set[str]:
+    """Normaliza as tags, descartando vazias e repetidas.
+
+    Returns:
+        set[str]: Tags distintas normalizadas.
+
+    """
+    normalizadas = map(normalizar_tag, tags)
+    return {tag for tag in normalizadas if tag}
+
+
+class ObraTagDB(SQLModel, table=True):
+    __tablename__ = "obra_tags"  # type: ignore
+    __table_args__ = (Index("ix_obra_tags_tag_obra_id", "tag", "obra_id"),)
+
+    obra_id: int = Field(foreign_key="obras.id", primary_key=True)
+    tag: str = Field(primary_key=True)
+
+
+class TagResponse(SQLModel):
+    nome: str
+    quantidade: int = 0
+
+
+class TagDB(TagResponse, table=True):
+    __tablename__ = "tags"  # type: ignore
+
+    nome: str = Field(primary_key=True)
@@ -33,6 +33,14 @@ class UsuarioCreate(UsuarioBase):
     senha: str
 
 
+class UsuarioAtualizacao(SQLModel):
+    nome: str | None = None
+    email: EmailStr | None = None
+    funcao: Funcao | None = None
+    biografia: str | None = None
+    senha: str | None = None
+
+
 class UsuarioResponse(UsuarioBase):
     id: int
 
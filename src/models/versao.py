@@ -0,0 +1,30 @@
+"""Versão das linhas usada nas respostas condicionais."""
+
+from datetime import datetime
+from typing import NamedTuple, Protocol
+
+
+class Versionada(Protocol):
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def versao(self) -> int: ...
+
+    @property
+    def atualizado_em(self) -> datetime | None: ...
+
+
+class Versao(NamedTuple):
+    versao: int
+    atualizado_em: datetime | None
+
+    @classmethod
+    def da_linha(cls, linha: Versionada) -> "Versao":
+        """Extrai a versão de uma linha carregada.
+
+        Returns:
+            Versao: Número e data da última escrita da linha.
+
+        """
+        return cls(linha.versao, linha.atualizado_em)
@@ -0,0 +1,100 @@
+"""Pools de conexão instrumentados e coleta de métricas de uso."""
+
+import threading
+import time
+from collections.abc import Callable
+
+from sqlalchemy import exc
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    Pool,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+from models.metricas import EstatisticasPool
+
+
+class EsperaConexao:
+    """Acumula o tempo gasto esperando por uma conexão do pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.aquisicoes = 0
+        self.timeouts = 0
+        self.espera_total = 0.0
+        self.espera_maxima = 0.0
+
+    def medir(
+        self, conectar: Callable[[], PoolProxiedConnection]
+    ) -> PoolProxiedConnection:
+        """Executa o checkout registrando a duração e eventuais timeouts.
+
+        Returns:
+            PoolProxiedConnection: Conexão obtida do pool.
+
+        Raises:
+            exc.TimeoutError: Se o pool esgotar o ``pool_timeout``.
+
+        """
+        inicio = time.perf_counter()
+        try:
+            return conectar()
+        except exc.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            raise
+        finally:
+            duracao = time.perf_counter() - inicio
+            with self._lock:
+                self.aquisicoes += 1
+                self.espera_total += duracao
+                self.espera_maxima = max(self.espera_maxima, duracao)
+
+
+class PoolMonitorado(QueuePool):
+    """``QueuePool`` que mede a espera de cada checkout."""
+
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        super().__init__(*args, **kwargs)
+        self.espera = EsperaConexao()
+
+    def connect(self) -> PoolProxiedConnection:
+        return self.espera.medir(super().connect)
+
+
+class PoolAssincronoMonitorado(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` que mede a espera de cada checkout."""
+
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        super().__init__(*args, **kwargs)
+        self.espera = EsperaConexao()
+
+    def connect(self) -> PoolProxiedConnection:
+        return self.espera.medir(super().connect)
+
+
+def estatisticas_pool(nome: str, pool: Pool) -> EstatisticasPool:
+    """Gera um retrato do estado atual de um pool de conexões.
+
+    Returns:
+        EstatisticasPool: Conexões em uso, ociosas, overflow e esperas.
+
+    """
+    estatisticas = EstatisticasPool(nome=nome, classe=type(pool).__name__)
+    if isinstance(pool, QueuePool):
+        estatisticas.tamanho = pool.size()
+        estatisticas.em_uso = pool.checkedout()
+        estatisticas.ociosas = pool.checkedin()
+        estatisticas.overflow = max(pool.overflow(), 0)
+    espera = getattr(pool, "espera", None)
+    if isinstance(espera, EsperaConexao):
+        estatisticas.aquisicoes = espera.aquisicoes
+        estatisticas.timeouts = espera.timeouts
+        estatisticas.espera_total_segundos = espera.espera_total
+        estatisticas.espera_maxima_segundos = espera.espera_maxima
+        if espera.aquisicoes:
+            estatisticas.espera_media_segundos = (
+                espera.espera_total / espera.aquisicoes
+            )
+    return estatisticas
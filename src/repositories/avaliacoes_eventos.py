@@ -1,20 +1,54 @@
 """Repositório para operações de avaliações de eventos."""
 
+from collections import Counter, defaultdict
 from collections.abc import Sequence
-
-from sqlmodel import Session, select
-
-from models.avaliacoes_eventos import AvaliacaoEventoDB
-
-
-def buscar_avaliacoes(session: Session) -> Sequence[AvaliacaoEventoDB]:
-    """Retorna todas as avaliações.
+from typing import Any
+
+from sqlalchemy import delete, insert, update
+from sqlmodel import Session, col, func, select
+
+from cache import invalidar_apos_commit
+from models.avaliacoes_eventos import (
+    NOTA_MAXIMA,
+    NOTA_MINIMA,
+    RESPOSTAS_POSITIVAS,
+    AvaliacaoEventoDB,
+    ResumoAvaliacoesDB,
+    gostou_positivo,
+)
+from models.evento import EventoDB
+from models.paginacao import LIMITE_PADRAO
+from repositories.dialeto import inserir_ignorando_conflito
+from repositories.escrita import (
+    atualizar_retornando,
+    incrementar_versoes,
+    remover_retornando,
+)
+from repositories.evento import CACHE as CACHE_EVENTOS
+from repositories.paginacao import Ordenacao, ResultadoPagina, paginar
+
+ORDEM = Ordenacao((AvaliacaoEventoDB.id,))
+COLUNAS_DO_RESUMO = {"evento_id", "gostou", "avaliacao"}
+
+
+def buscar_avaliacoes(
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+) -> ResultadoPagina[AvaliacaoEventoDB]:
+    """Lista as avaliações em ordem de ID.
 
     Returns:
-        Sequence[AvaliacaoEventoDB]: Lista de todas as avaliações.
+        ResultadoPagina[AvaliacaoEventoDB]: Página e o próximo cursor.
 
     """
-    return session.exec(select(AvaliacaoEventoDB)).all()
+    return paginar(
+        session,
+        select(AvaliacaoEventoDB),
+        ORDEM,
+        cursor,
+        limite,
+    )
 
 
 def buscar_avaliacao_por_id(
@@ -61,6 +95,53 @@ def buscar_avaliacoes_por_usuario(
     ).all()
 
 
+def _variacao(avaliacao: AvaliacaoEventoDB, sinal: int) -> Counter[str]:
+    """Calcula a variação do resumo ao somar ou subtrair uma avaliação.
+
+    Returns:
+        Counter[str]: Incremento de cada coluna; ``sinal=-1`` subtrai.
+
+    """
+    return Counter(
+        {
+            "quantidade": sinal,
+            "soma": sinal * avaliacao.avaliacao,
+            "gostaram": sinal * gostou_positivo(avaliacao.gostou),
+            f"nota_{avaliacao.avaliacao}": sinal,
+        }
+    )
+
+
+def _aplicar_no_resumo(
+    session: Session, evento_id: int, variacao: Counter[str]
+) -> None:
+    """Soma ``variacao`` às colunas do resumo do evento.
+
+    O ``UPDATE`` incrementa as colunas no próprio banco, então escritas
+    concorrentes no mesmo evento não perdem contagens. O evento, que traz o
+    resumo, ganha uma nova versão e sai do cache depois do commit.
+    """
+    colunas = {nome: delta for nome, delta in variacao.items() if delta}
+    if not colunas:
+        return
+    invalidar_apos_commit(session, CACHE_EVENTOS, evento_id)
+    incrementar_versoes(session, EventoDB, [evento_id])
+    if variacao["quantidade"] > 0:
+        inserir_ignorando_conflito(
+            session,
+            ResumoAvaliacoesDB.__table__,  # type: ignore[arg-type]
+            [{"evento_id": evento_id}],
+        )
+    tabela = ResumoAvaliacoesDB.__table__.c  # type: ignore[attr-defined]
+    session.connection().execute(
+        update(ResumoAvaliacoesDB)
+        .where(col(ResumoAvaliacoesDB.evento_id) == evento_id)
+        .values(
+            {nome: tabela[nome] + delta for nome, delta in colunas.items()}
+        )
+    )
+
+
 def adicionar_avaliacao(
     avaliacao: AvaliacaoEventoDB, session: Session
 ) -> AvaliacaoEventoDB:
@@ -71,29 +152,50 @@ def adicionar_avaliacao(
 
     """
     session.add(avaliacao)
+    session.flush()
+    _aplicar_no_resumo(session, avaliacao.evento_id, _variacao(avaliacao, 1))
     session.commit()
-    session.refresh(avaliacao)
     return avaliacao
 
 
 def atualizar_avaliacao(
-    avaliacao_id: int, avaliacao: AvaliacaoEventoDB, session: Session
+    avaliacao_id: int, valores: dict[str, Any], session: Session
 ) -> AvaliacaoEventoDB | None:
-    """Atualiza os dados de uma avaliação existente.
+    """Atualiza apenas as colunas enviadas de uma avaliação.
+
+    A linha anterior só é lida quando muda alguma coluna que entra no
+    resumo do evento; o resumo recebe então a diferença em um só
+    ``UPDATE`` por evento. A leitura trava a linha (``FOR UPDATE``) até o
+    commit, para que duas atualizações concorrentes da mesma avaliação não
+    subtraiam do resumo o mesmo valor anterior.
 
     Returns:
         AvaliacaoEventoDB | None: Avaliação atualizada ou None.
 
     """
-    avaliacao_existente = session.get(AvaliacaoEventoDB, avaliacao_id)
-    if not avaliacao_existente:
-        return None
-
-    avaliacao_existente.gostou = avaliacao.gostou
-    avaliacao_existente.avaliacao = avaliacao.avaliacao
+    variacoes: dict[int, Counter[str]] = defaultdict(Counter)
+    if valores.keys() & COLUNAS_DO_RESUMO:
+        anterior = session.get(
+            AvaliacaoEventoDB,
+            avaliacao_id,
+            populate_existing=True,
+            with_for_update=True,
+        )
+        if anterior is None:
+            return None
+        # O RETURNING sobrescreve o objeto da sessão: a variação é
+        # calculada antes.
+        variacoes[anterior.evento_id].update(_variacao(anterior, -1))
+
+    avaliacao = atualizar_retornando(
+        session, AvaliacaoEventoDB, avaliacao_id, valores
+    )
+    if avaliacao is not None and variacoes:
+        variacoes[avaliacao.evento_id].update(_variacao(avaliacao, 1))
+        for evento_id, variacao in variacoes.items():
+            _aplicar_no_resumo(session, evento_id, variacao)
     session.commit()
-    session.refresh(avaliacao_existente)
-    return avaliacao_existente
+    return avaliacao
 
 
 def remover_avaliacao(
@@ -105,9 +207,75 @@ def remover_avaliacao(
         AvaliacaoEventoDB | None: Avaliação removida ou None.
 
     """
-    avaliacao_existente = buscar_avaliacao_por_id(avaliacao_id, session)
-    if not avaliacao_existente:
-        return None
-    session.delete(avaliacao_existente)
+    avaliacao = remover_retornando(session, AvaliacaoEventoDB, avaliacao_id)
+    if avaliacao is not None:
+        _aplicar_no_resumo(
+            session, avaliacao.evento_id, _variacao(avaliacao, -1)
+        )
+    session.commit()
+    return avaliacao
+
+
+def buscar_resumo_avaliacoes(
+    evento_id: int, session: Session
+) -> ResumoAvaliacoesDB | None:
+    """Busca o resumo mantido para as avaliações de um evento.
+
+    Returns:
+        ResumoAvaliacoesDB | None: Resumo do evento ou None se ele ainda
+            não recebeu avaliações.
+
+    """
+    return session.get(ResumoAvaliacoesDB, evento_id)
+
+
+def reconstruir_resumos_avaliacoes(
+    session: Session, evento_id: int | None = None
+) -> int:
+    """Recalcula os resumos a partir das avaliações gravadas.
+
+    Corrige divergências (por exemplo, avaliações alteradas fora da API)
+    apagando os resumos e regravando-os com um único ``INSERT ... SELECT``
+    agrupado por evento.
+
+    Args:
+        session: Sessão do banco de dados.
+        evento_id: Limita a reconstrução a um evento; todos se None.
+
+    Returns:
+        int: Quantidade de eventos com resumo após a reconstrução.
+
+    """
+    avaliacao = col(AvaliacaoEventoDB.avaliacao)
+    consulta = select(
+        col(AvaliacaoEventoDB.evento_id),
+        func.count(),
+        func.coalesce(func.sum(avaliacao), 0),
+        func.count().filter(
+            func.lower(func.trim(AvaliacaoEventoDB.gostou)).in_(
+                RESPOSTAS_POSITIVAS
+            )
+        ),
+        *(
+            func.count().filter(avaliacao == nota)
+            for nota in range(NOTA_MINIMA, NOTA_MAXIMA + 1)
+        ),
+    ).group_by(col(AvaliacaoEventoDB.evento_id))
+    remocao = delete(ResumoAvaliacoesDB)
+    if evento_id is not None:
+        consulta = consulta.where(AvaliacaoEventoDB.evento_id == evento_id)
+        remocao = remocao.where(col(ResumoAvaliacoesDB.evento_id) == evento_id)
+
+    colunas = ["evento_id", "quantidade", "soma", "gostaram"]
+    colunas += [f"nota_{n}" for n in range(NOTA_MINIMA, NOTA_MAXIMA + 1)]
+    conexao = session.connection()
+    conexao.execute(remocao)
+    resultado = conexao.execute(
+        insert(ResumoAvaliacoesDB).from_select(colunas, consulta)
+    )
+    invalidar_apos_commit(session, CACHE_EVENTOS, evento_id)
+    incrementar_versoes(
+        session, EventoDB, None if evento_id is None else [evento_id]
+    )
     session.commit()
-    return avaliacao_existente
+    return resultado.rowcount
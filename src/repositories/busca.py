@@ -0,0 +1,132 @@
+"""Repositório da busca textual de obras."""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import (
+    Double,
+    Float,
+    String,
+    cast,
+    column,
+    func,
+    literal_column,
+    table,
+)
+from sqlmodel import Session, col, select
+
+from models.obra import ObraDB
+from models.paginacao import LIMITE_PADRAO
+from repositories.paginacao import (
+    Ordenacao,
+    ResultadoPagina,
+    codificar_cursor,
+    filtro_cursor,
+)
+
+INICIO_DESTAQUE = "<mark>"
+FIM_DESTAQUE = "</mark>"
+
+obras_fts = table("obras_fts", column("rowid"))
+
+
+@dataclass(frozen=True)
+class ObraEncontradaDB:
+    obra: ObraDB
+    relevancia: float
+    trecho: str
+
+
+def _expressoes_postgres(consulta: str) -> tuple[Any, Any, Any]:
+    termos = func.websearch_to_tsquery(
+        "portuguese", func.imutavel_unaccent(consulta)
+    )
+    busca = literal_column("obras.busca")
+    # ts_rank_cd é real; em double precision o valor lido pelo Python volta
+    # idêntico no cursor, e a comparação por tupla não pula empates.
+    relevancia = cast(func.ts_rank_cd(busca, termos), Double)
+    trecho = func.ts_headline(
+        "portuguese",
+        func.concat_ws(
+            " · ", ObraDB.titulo, ObraDB.autor, ObraDB.tecnica_criacao
+        ),
+        termos,
+        f"StartSel={INICIO_DESTAQUE}, StopSel={FIM_DESTAQUE}, "
+        "MaxWords=25, MinWords=8",
+        type_=String,
+    )
+    return busca.op("@@")(termos), relevancia, trecho
+
+
+def _expressoes_sqlite(consulta: str) -> tuple[Any, Any, Any]:
+    # Cada palavra vira uma frase entre aspas: o texto do visitante nunca é
+    # interpretado como sintaxe de consulta do FTS5.
+    expressao = " ".join(
+        f'"{termo}"' for termo in re.findall(r"\w+", consulta)
+    )
+    # Pesos por coluna equivalentes aos pesos A-D do tsvector do Postgres.
+    relevancia = literal_column("-bm25(obras_fts, 10.0, 5.0, 2.0, 1.0)", Float)
+    trecho = literal_column(
+        f"snippet(obras_fts, -1, '{INICIO_DESTAQUE}', '{FIM_DESTAQUE}', "
+        "'…', 12)",
+        String,
+    )
+    return (
+        literal_column("obras_fts").op("MATCH")(expressao),
+        relevancia,
+        trecho,
+    )
+
+
+def buscar_obras_por_texto(
+    consulta: str,
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+) -> ResultadoPagina[ObraEncontradaDB]:
+    """Busca obras por título, autor, técnica e tags, da mais relevante.
+
+    No PostgreSQL usa o ``tsvector`` indexado de ``obras.busca`` (radicais
+    em português, sem acentos); no SQLite, a tabela FTS5 ``obras_fts``.
+
+    Args:
+        consulta: Texto digitado pelo visitante.
+        session: Sessão do banco de dados.
+        cursor: Cursor devolvido pela página anterior.
+        limite: Quantidade máxima de itens.
+
+    Returns:
+        ResultadoPagina[ObraEncontradaDB]: Obras com relevância e trecho
+            destacado, e o cursor da próxima página.
+
+    """
+    if not re.search(r"\w", consulta):
+        return ResultadoPagina([], None)
+
+    if session.get_bind().dialect.name == "postgresql":
+        condicao, relevancia, trecho = _expressoes_postgres(consulta)
+        statement = select(ObraDB, relevancia, trecho)
+    else:
+        condicao, relevancia, trecho = _expressoes_sqlite(consulta)
+        statement = select(ObraDB, relevancia, trecho).join(
+            obras_fts, obras_fts.c.rowid == col(ObraDB.id)
+        )
+
+    ordem = Ordenacao((relevancia, ObraDB.id), descendente=True)
+    statement = statement.where(condicao)
+    if cursor is not None:
+        statement = statement.where(filtro_cursor(ordem, cursor))
+    linhas = session.exec(
+        statement.order_by(*ordem.criterios()).limit(limite + 1)
+    ).all()
+
+    itens = [
+        ObraEncontradaDB(obra, float(nota), trecho_obra)
+        for obra, nota, trecho_obra in linhas[:limite]
+    ]
+    proximo_cursor = None
+    if len(linhas) > limite:
+        ultimo = itens[-1]
+        proximo_cursor = codificar_cursor([ultimo.relevancia, ultimo.obra.id])
+    return ResultadoPagina(itens, proximo_cursor)
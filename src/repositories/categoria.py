@@ -1,28 +1,47 @@
 """Repositório para operações de categorias."""
 
-from collections.abc import Sequence
+from typing import Any
 
 from sqlmodel import Session, select
 
-from models.categoria import CategoriaDB
-
-
-def buscar_categorias(session: Session) -> Sequence[CategoriaDB]:
-    """Retorna todas as categorias.
+from cache import CacheEntidade, invalidar_apos_commit
+from config import settings
+from models.categoria import CategoriaDB, CategoriaResponse
+from models.paginacao import LIMITE_PADRAO
+from repositories.escrita import atualizar_retornando, remover_retornando
+from repositories.paginacao import Ordenacao, ResultadoPagina, paginar
+
+ORDEM = Ordenacao((CategoriaDB.id,))
+CACHE = CacheEntidade[CategoriaResponse](
+    "categorias",
+    settings.cache_ttl_categorias,
+    settings.cache_tamanho_maximo,
+    modelo=CategoriaResponse,
+)
+
+
+def buscar_categorias(
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+) -> ResultadoPagina[CategoriaDB]:
+    """Lista as categorias em ordem de ID.
 
     Args:
         session: Sessão do banco de dados.
+        cursor: Cursor devolvido pela página anterior.
+        limite: Quantidade máxima de itens.
 
     Returns:
-        Sequence[CategoriaDB]: Lista de categorias.
+        ResultadoPagina[CategoriaDB]: Página e o próximo cursor.
 
     """
-    return session.exec(select(CategoriaDB)).all()
+    return paginar(session, select(CategoriaDB), ORDEM, cursor, limite)
 
 
 def buscar_categoria_por_id(
     categoria_id: int, session: Session
-) -> CategoriaDB | None:
+) -> CategoriaResponse | None:
     """Busca uma categoria pelo ID.
 
     Args:
@@ -30,10 +49,14 @@ def buscar_categoria_por_id(
         session: Sessão do banco de dados.
 
     Returns:
-        CategoriaDB | None: Categoria encontrada ou None.
+        CategoriaResponse | None: Categoria encontrada ou None.
 
     """
-    return session.get(CategoriaDB, categoria_id)
+    return CACHE.obter_ou_carregar(
+        categoria_id,
+        session,
+        lambda sessao: sessao.get(CategoriaDB, categoria_id),
+    )
 
 
 def adicionar_categoria(
@@ -50,32 +73,32 @@ def adicionar_categoria(
 
     """
     session.add(categoria)
+    session.flush()
+    invalidar_apos_commit(session, CACHE, categoria.id)
     session.commit()
-    session.refresh(categoria)
     return categoria
 
 
 def atualizar_categoria_bd(
-    categoria_id: int, categoria: CategoriaDB, session: Session
+    categoria_id: int, valores: dict[str, Any], session: Session
 ) -> CategoriaDB | None:
-    """Atualiza uma categoria existente.
+    """Atualiza apenas as colunas enviadas de uma categoria.
 
     Args:
         categoria_id: ID da categoria a ser atualizada.
-        categoria: Novos dados da categoria.
+        valores: Colunas alteradas e seus novos valores.
         session: Sessão do banco de dados.
 
     Returns:
         CategoriaDB | None: Categoria atualizada ou None.
 
     """
-    categoria_existente = session.get(CategoriaDB, categoria_id)
-    if not categoria_existente:
-        return None
-    categoria_existente.nome = categoria.nome
+    categoria = atualizar_retornando(
+        session, CategoriaDB, categoria_id, valores
+    )
+    invalidar_apos_commit(session, CACHE, categoria_id)
     session.commit()
-    session.refresh(categoria_existente)
-    return categoria_existente
+    return categoria
 
 
 def remover_categoria(
@@ -91,9 +114,7 @@ def remover_categoria(
         CategoriaDB | None: Categoria removida ou None.
 
     """
-    categoria_existente = buscar_categoria_por_id(categoria_id, session)
-    if not categoria_existente:
-        return None
-    session.delete(categoria_existente)
+    categoria = remover_retornando(session, CategoriaDB, categoria_id)
+    invalidar_apos_commit(session, CACHE, categoria_id)
     session.commit()
-    return categoria_existente
+    return categoria
@@ -1,20 +1,36 @@
 """Repositório para operações de comentários em eventos."""
 
 from collections.abc import Sequence
+from typing import Any
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
-from models.comentario_evento import ComentarioEventoDB
+from models.comentario_evento import ComentarioEventoDB, StatusComentario
+from models.paginacao import LIMITE_PADRAO
+from repositories.escrita import atualizar_retornando, remover_retornando
+from repositories.paginacao import Ordenacao, ResultadoPagina, paginar
 
+ORDEM = Ordenacao((ComentarioEventoDB.id,))
 
-def buscar_comentarios(session: Session) -> Sequence[ComentarioEventoDB]:
-    """Retorna todos os comentários.
+
+def buscar_comentarios(
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+) -> ResultadoPagina[ComentarioEventoDB]:
+    """Lista os comentários em ordem de ID.
 
     Returns:
-        Sequence[ComentarioEventoDB]: Lista de todos os comentários.
+        ResultadoPagina[ComentarioEventoDB]: Página e o próximo cursor.
 
     """
-    return session.exec(select(ComentarioEventoDB)).all()
+    return paginar(
+        session,
+        select(ComentarioEventoDB),
+        ORDEM,
+        cursor,
+        limite,
+    )
 
 
 def buscar_comentario_por_id(
@@ -72,14 +88,13 @@ def adicionar_comentario(
     """
     session.add(comentario)
     session.commit()
-    session.refresh(comentario)
     return comentario
 
 
 def atualizar_comentario(
-    comentario_id: int, comentario: ComentarioEventoDB, session: Session
+    comentario_id: int, valores: dict[str, Any], session: Session
 ) -> ComentarioEventoDB | None:
-    """Atualiza os dados de um comentário existente.
+    """Atualiza apenas as colunas enviadas de um comentário.
 
     Returns
     -------
@@ -87,15 +102,11 @@ def atualizar_comentario(
             existir.
 
     """
-    comentario_existente = session.get(ComentarioEventoDB, comentario_id)
-    if not comentario_existente:
-        return None
-
-    comentario_existente.comentario = comentario.comentario
-    comentario_existente.status = comentario.status
+    comentario = atualizar_retornando(
+        session, ComentarioEventoDB, comentario_id, valores
+    )
     session.commit()
-    session.refresh(comentario_existente)
-    return comentario_existente
+    return comentario
 
 
 def remover_comentario(
@@ -108,9 +119,27 @@ def remover_comentario(
         ComentarioEventoDB | None: Comentário removido ou None se não existir.
 
     """
-    comentario_existente = buscar_comentario_por_id(comentario_id, session)
-    if not comentario_existente:
-        return None
-    session.delete(comentario_existente)
+    comentario = remover_retornando(session, ComentarioEventoDB, comentario_id)
     session.commit()
-    return comentario_existente
+    return comentario
+
+
+def buscar_comentarios_recentes(
+    evento_id: int, session: Session, limite: int
+) -> Sequence[ComentarioEventoDB]:
+    """Retorna os comentários ativos mais recentes de um evento.
+
+    Returns:
+        Sequence[ComentarioEventoDB]: Até ``limite`` comentários, do mais
+            novo para o mais antigo.
+
+    """
+    return session.exec(
+        select(ComentarioEventoDB)
+        .where(
+            ComentarioEventoDB.evento_id == evento_id,
+            ComentarioEventoDB.status == StatusComentario.ATIVO,
+        )
+        .order_by(col(ComentarioEventoDB.id).desc())
+        .limit(limite)
+    ).all()
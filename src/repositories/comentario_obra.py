@@ -1,23 +1,52 @@
 """Repositório para operações de comentários de obras."""
 
-from collections.abc import Sequence
+from typing import Any
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from models.comentario_obra import ComentarioObraDB
-
-
-def buscar_comentarios_obras(session: Session) -> Sequence[ComentarioObraDB]:
-    """Retorna todos os comentários de obras.
+from models.lote import ResultadoLote
+from models.obra import ObraDB
+from models.paginacao import LIMITE_PADRAO
+from models.usuario import UsuarioDB
+from repositories.escrita import (
+    atualizar_retornando,
+    inserir_em_lotes,
+    remover_referencias_inexistentes,
+    remover_retornando,
+)
+from repositories.paginacao import Ordenacao, ResultadoPagina, paginar
+
+ORDEM = Ordenacao((ComentarioObraDB.id,))
+REFERENCIAS_COMENTARIO = {
+    "usuario_id": col(UsuarioDB.id),
+    "obra_id": col(ObraDB.id),
+}
+
+
+def buscar_comentarios_obras(
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+) -> ResultadoPagina[ComentarioObraDB]:
+    """Lista os comentários de obras em ordem de ID.
 
     Args:
         session: Sessão do banco de dados.
+        cursor: Cursor devolvido pela página anterior.
+        limite: Quantidade máxima de itens.
 
     Returns:
-        Sequence[ComentarioObraDB]: Lista de comentários de obras.
+        ResultadoPagina[ComentarioObraDB]: Página e o próximo cursor.
 
     """
-    return session.exec(select(ComentarioObraDB)).all()
+    return paginar(
+        session,
+        select(ComentarioObraDB),
+        ORDEM,
+        cursor,
+        limite,
+    )
 
 
 def buscar_comentario_obra_por_id(
@@ -51,36 +80,50 @@ def adicionar_comentario_obra(
     """
     session.add(comentario)
     session.commit()
-    session.refresh(comentario)
     return comentario
 
 
+def adicionar_comentarios_obra_em_lote(
+    linhas: dict[int, dict[str, Any]], session: Session
+) -> ResultadoLote:
+    """Adiciona vários comentários de obras em lotes de inserção.
+
+    Args:
+        linhas: Valores validados de cada comentário, por índice na
+            requisição.
+        session: Sessão do banco de dados.
+
+    Returns:
+        ResultadoLote: Ids dos comentários criados e erros, por índice.
+
+    """
+    erros = remover_referencias_inexistentes(
+        session, linhas, REFERENCIAS_COMENTARIO
+    )
+    resultado = inserir_em_lotes(session, ComentarioObraDB, linhas)
+    resultado.erros += erros
+    return resultado
+
+
 def atualizar_comentario_obra_bd(
-    comentario_obra_id: int, comentario: ComentarioObraDB, session: Session
+    comentario_obra_id: int, valores: dict[str, Any], session: Session
 ) -> ComentarioObraDB | None:
-    """Atualiza um comentário de obra existente.
+    """Atualiza apenas as colunas enviadas de um comentário de obra.
 
     Args:
         comentario_obra_id: ID do comentário a ser atualizado.
-        comentario: Novos dados do comentário.
+        valores: Colunas alteradas e seus novos valores.
         session: Sessão do banco de dados.
 
     Returns:
         ComentarioObraDB | None: Comentário atualizado ou None.
 
     """
-    comentario_obra_existente = session.get(
-        ComentarioObraDB, comentario_obra_id
+    comentario_obra = atualizar_retornando(
+        session, ComentarioObraDB, comentario_obra_id, valores
     )
-    if not comentario_obra_existente:
-        return None
-
-    for field, value in comentario.model_dump().items():
-        setattr(comentario_obra_existente, field, value)
-
     session.commit()
-    session.refresh(comentario_obra_existente)
-    return comentario_obra_existente
+    return comentario_obra
 
 
 def remover_comentario_obra(
@@ -96,11 +139,8 @@ def remover_comentario_obra(
         ComentarioObraDB | None: Comentário removido ou None.
 
     """
-    comentario_obra_existente = buscar_comentario_obra_por_id(
-        comentario_obra_id, session
+    comentario_obra = remover_retornando(
+        session, ComentarioObraDB, comentario_obra_id
     )
-    if not comentario_obra_existente:
-        return None
-    session.delete(comentario_obra_existente)
     session.commit()
-    return comentario_obra_existente
+    return comentario_obra
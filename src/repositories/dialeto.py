@@ -0,0 +1,118 @@
+"""Comandos SQL que dependem do dialeto do banco."""
+
+import csv
+import io
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, Insert, Table, any_, bindparam
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped
+from sqlmodel import Session
+
+
+def comando_ignorando_conflito(session: Session, tabela: Table) -> Insert:
+    """Monta um ``INSERT ... ON CONFLICT DO NOTHING`` para ``tabela``.
+
+    A cláusula existe no PostgreSQL e no SQLite, com construtores próprios
+    de cada dialeto.
+
+    Returns:
+        Insert: Comando de inserção que ignora chaves repetidas.
+
+    """
+    insert = (
+        postgresql.insert
+        if session.get_bind().dialect.name == "postgresql"
+        else sqlite.insert
+    )
+    return insert(tabela).on_conflict_do_nothing()
+
+
+def inserir_ignorando_conflito(
+    session: Session, tabela: Table, valores: list[dict[str, Any]]
+) -> int:
+    """Insere linhas ignorando as que violam chave primária ou única.
+
+    Usa ``INSERT ... ON CONFLICT DO NOTHING`` para que inserções
+    concorrentes da mesma chave não falhem.
+
+    Returns:
+        int: Quantidade de linhas efetivamente inseridas.
+
+    """
+    if not valores:
+        return 0
+    resultado = session.connection().execute(
+        comando_ignorando_conflito(session, tabela), valores
+    )
+    return resultado.rowcount
+
+
+def pertence[T](
+    session: Session, coluna: Mapped[T], valores: Sequence[T]
+) -> ColumnElement[bool]:
+    """Condição de ``coluna`` estar entre ``valores``.
+
+    No PostgreSQL vira ``coluna = ANY(:valores)``, com a lista inteira em um
+    único parâmetro do tipo array: o comando é o mesmo para qualquer
+    quantidade de valores e não esbarra no limite de parâmetros. Nos demais
+    bancos, ``IN``.
+
+    Returns:
+        ColumnElement[bool]: Condição sobre ``coluna``.
+
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        return coluna == any_(bindparam(None, list(valores)))
+    return coluna.in_(valores)
+
+
+def copiar_linhas(
+    session: Session, tabela: Table, linhas: Sequence[dict[str, Any]]
+) -> None:
+    """Grava ``linhas`` em ``tabela``, com ``None`` nas colunas ausentes.
+
+    No PostgreSQL com o psycopg2 as linhas vão em um único ``COPY ... FROM
+    STDIN`` em CSV, com os valores convertidos pelos tipos das colunas como
+    num ``INSERT``; nos demais bancos e drivers (asyncpg e psycopg 3 têm
+    APIs de ``COPY`` próprias), em um ``executemany``.
+    """
+    nomes = [coluna.name for coluna in tabela.columns]
+    valores = [{nome: linha.get(nome) for nome in nomes} for linha in linhas]
+    if not valores:
+        return
+    conexao = session.connection()
+    dialeto = conexao.dialect
+    if (dialeto.name, dialeto.driver) != ("postgresql", "psycopg2"):
+        conexao.execute(tabela.insert(), valores)
+        return
+
+    conversores = [
+        coluna.type.dialect_impl(dialeto).bind_processor(dialeto)
+        for coluna in tabela.columns
+    ]
+    buffer = io.StringIO()
+    # Só textos vão entre aspas: um campo vazio sem aspas é NULL no COPY e
+    # a string vazia continua vazia.
+    escritor = csv.writer(buffer, quoting=csv.QUOTE_STRINGS)
+    for linha in valores:
+        escritor.writerow(
+            valor if converter is None or valor is None else converter(valor)
+            for converter, valor in zip(
+                conversores, linha.values(), strict=True
+            )
+        )
+    buffer.seek(0)
+
+    preparador = dialeto.identifier_preparer
+    colunas = ", ".join(preparador.quote(nome) for nome in nomes)
+    comando = (
+        f"COPY {preparador.format_table(tabela)} ({colunas}) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+    cursor: Any = conexao.connection.cursor()
+    try:
+        cursor.copy_expert(comando, buffer)
+    finally:
+        cursor.close()
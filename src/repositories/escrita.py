@@ -0,0 +1,301 @@
+"""Escritas com ``RETURNING``.
+
+``INSERT ... RETURNING``, ``UPDATE ... RETURNING`` e
+``DELETE ... RETURNING`` gravam e devolvem a linha na mesma ida ao banco,
+sem a leitura prévia por ``session.get`` nem o ``refresh`` depois do
+commit; as inserções em lote recebem os ids gerados da mesma forma.
+PostgreSQL e SQLite (3.35+) suportam a cláusula.
+
+Nas tabelas com ``versao`` e ``atualizado_em``, toda atualização incrementa
+a versão e carimba a hora no mesmo ``UPDATE``.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Mapping
+from itertools import batched
+from typing import Any
+
+from sqlalchemy import delete, func, insert, inspect, select, update
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlmodel import Session, SQLModel
+
+from models.lote import DetalheErro, ErroItem, ItemCriado, ResultadoLote
+
+LOTE_INSERCAO = 1000
+
+Linhas = dict[int, dict[str, Any]]
+AoInserir = Callable[[Session, list[tuple[dict[str, Any], int]]], None]
+
+
+def _chave_primaria(modelo: type[SQLModel]) -> Any:  # noqa: ANN401
+    return inspect(modelo).primary_key[0]
+
+
+def _nova_versao(modelo: type[SQLModel]) -> dict[str, Any]:
+    colunas = inspect(modelo).columns
+    if "versao" not in colunas:
+        return {}
+    return {"versao": colunas["versao"] + 1, "atualizado_em": func.now()}
+
+
+def incrementar_versoes(
+    session: Session, modelo: type[SQLModel], chaves: list[int] | None
+) -> None:
+    """Marca as linhas ``chaves`` (ou todas, com None) como alteradas.
+
+    Usada quando uma escrita em outra tabela muda a resposta da linha, como
+    uma avaliação muda o resumo de um evento. Não faz commit.
+
+    Args:
+        session: Sessão do banco de dados.
+        modelo: Modelo de tabela com ``versao`` e ``atualizado_em``.
+        chaves: Valores da chave primária; None para a tabela inteira.
+
+    """
+    statement = update(modelo).values(_nova_versao(modelo))
+    if chaves is not None:
+        statement = statement.where(_chave_primaria(modelo).in_(chaves))
+    session.connection().execute(statement)
+
+
+def inserir_retornando[M: SQLModel](
+    session: Session,
+    modelo: type[M],
+    valores: dict[str, Any],
+    *opcoes: ORMOption,
+) -> M:
+    """Insere uma linha com ``valores`` e a devolve como ficou gravada.
+
+    Os valores já validados vão direto para o ``INSERT``, sem montar e
+    validar o objeto do modelo antes. Não faz commit.
+
+    Args:
+        session: Sessão do banco de dados.
+        modelo: Modelo de tabela.
+        valores: Colunas enviadas e seus valores; as omitidas recebem o
+            padrão do banco.
+        *opcoes: Opções de carga dos relacionamentos devolvidos.
+
+    Returns:
+        M: Linha inserida, com id e valores gerados pelo banco.
+
+    """
+    statement = (
+        insert(modelo).values(valores).returning(modelo).options(*opcoes)
+    )
+    resultado = session.exec(statement)  # type: ignore[call-overload]
+    return resultado.scalar_one()
+
+
+def atualizar_retornando[M: SQLModel](
+    session: Session,
+    modelo: type[M],
+    chave: int,
+    valores: dict[str, Any],
+    *opcoes: ORMOption,
+) -> M | None:
+    """Atualiza apenas as colunas em ``valores`` da linha ``chave``.
+
+    Não faz commit.
+
+    Args:
+        session: Sessão do banco de dados.
+        modelo: Modelo de tabela atualizado.
+        chave: Valor da chave primária.
+        valores: Colunas enviadas e seus novos valores.
+        *opcoes: Opções de carga dos relacionamentos devolvidos.
+
+    Returns:
+        M | None: Linha como ficou gravada ou None se não existir.
+
+    """
+    if not valores:
+        return session.get(modelo, chave, options=opcoes)
+    statement = (
+        update(modelo)
+        .where(_chave_primaria(modelo) == chave)
+        .values(valores | _nova_versao(modelo))
+        .returning(modelo)
+        .options(*opcoes)
+    )
+    resultado = session.exec(statement)  # type: ignore[call-overload]
+    return resultado.scalar_one_or_none()
+
+
+def remover_retornando[M: SQLModel](
+    session: Session, modelo: type[M], chave: int, *opcoes: ORMOption
+) -> M | None:
+    """Remove a linha ``chave`` e devolve o que estava gravado.
+
+    O objeto devolvido é retirado da sessão, já que a linha não existe
+    mais. Não faz commit.
+
+    Args:
+        session: Sessão do banco de dados.
+        modelo: Modelo de tabela.
+        chave: Valor da chave primária.
+        *opcoes: Opções de carga dos relacionamentos devolvidos.
+
+    Returns:
+        M | None: Linha removida ou None se não existia.
+
+    """
+    statement = (
+        delete(modelo)
+        .where(_chave_primaria(modelo) == chave)
+        .returning(modelo)
+        .options(*opcoes)
+    )
+    resultado = session.exec(statement)  # type: ignore[call-overload]
+    removido = resultado.scalar_one_or_none()
+    if removido is not None:
+        session.expunge(removido)
+    return removido
+
+
+def remover_referencias_inexistentes(
+    session: Session,
+    linhas: Linhas,
+    referencias: Mapping[str, Mapped[Any]],
+) -> list[ErroItem]:
+    """Tira de ``linhas`` as que apontam para registros inexistentes.
+
+    Cada chave estrangeira é conferida com uma consulta por lote de valores
+    distintos, em vez de deixar a inserção falhar linha a linha (o SQLite
+    nem verifica chaves estrangeiras por padrão).
+
+    Args:
+        session: Sessão do banco de dados.
+        linhas: Valores por índice na requisição; alterado no lugar.
+        referencias: Coluna referenciada por cada campo de chave estrangeira.
+
+    Returns:
+        list[ErroItem]: Erros das linhas removidas.
+
+    """
+    detalhes: defaultdict[int, list[DetalheErro]] = defaultdict(list)
+    for campo, coluna in referencias.items():
+        valores = {linha[campo] for linha in linhas.values()}
+        existentes: set[Any] = set()
+        for lote in batched(sorted(valores), LOTE_INSERCAO):
+            existentes.update(
+                session.connection()
+                .execute(select(coluna).where(coluna.in_(lote)))
+                .scalars()
+            )
+        for indice, linha in linhas.items():
+            if linha[campo] not in existentes:
+                detalhes[indice].append(
+                    DetalheErro(
+                        loc=[campo],
+                        msg=f"Registro {linha[campo]} não existe",
+                        type="referencia_inexistente",
+                    )
+                )
+    for indice in detalhes:
+        del linhas[indice]
+    return [
+        ErroItem(indice=indice, erros=erros)
+        for indice, erros in detalhes.items()
+    ]
+
+
+def _inserir(
+    session: Session, modelo: type[SQLModel], linhas: list[dict[str, Any]]
+) -> list[int]:
+    # Linhas sem os campos opcionais (que ficam com o padrão do banco) não
+    # cabem no mesmo executemany das que os trazem: cada conjunto de campos
+    # vai em um comando.
+    por_campos: defaultdict[frozenset[str], list[int]] = defaultdict(list)
+    for posicao, linha in enumerate(linhas):
+        por_campos[frozenset(linha)].append(posicao)
+    statement = insert(modelo).returning(
+        _chave_primaria(modelo), sort_by_parameter_order=True
+    )
+    ids = [0] * len(linhas)
+    for posicoes in por_campos.values():
+        gerados = session.connection().execute(
+            statement, [linhas[posicao] for posicao in posicoes]
+        )
+        for posicao, chave in zip(posicoes, gerados.scalars(), strict=True):
+            ids[posicao] = chave
+    return ids
+
+
+def _inserir_lote(
+    session: Session,
+    modelo: type[SQLModel],
+    lote: tuple[tuple[int, dict[str, Any]], ...],
+    ao_inserir: AoInserir | None,
+) -> list[ItemCriado]:
+    indices = [indice for indice, _ in lote]
+    valores = [linha for _, linha in lote]
+    ids = _inserir(session, modelo, valores)
+    if ao_inserir is not None:
+        ao_inserir(session, list(zip(valores, ids, strict=True)))
+    session.commit()
+    return [
+        ItemCriado(indice=indice, id=chave)
+        for indice, chave in zip(indices, ids, strict=True)
+    ]
+
+
+def _erro_item(indice: int, erro: DBAPIError) -> ErroItem:
+    if isinstance(erro, IntegrityError):
+        detalhe = DetalheErro(
+            msg="Violação de restrição do banco", type="restricao"
+        )
+    else:
+        detalhe = DetalheErro(msg="Valor recusado pelo banco", type="banco")
+    return ErroItem(indice=indice, erros=[detalhe])
+
+
+def inserir_em_lotes(
+    session: Session,
+    modelo: type[SQLModel],
+    linhas: Linhas,
+    ao_inserir: AoInserir | None = None,
+) -> ResultadoLote:
+    """Insere as linhas em lotes, cada lote em uma transação.
+
+    Um lote que viola alguma restrição ou tem um valor recusado pelo banco
+    é desfeito e repetido linha a linha, para que só as linhas com erro
+    fiquem de fora. Falhas de conexão são propagadas.
+
+    Args:
+        session: Sessão do banco de dados.
+        modelo: Modelo de tabela.
+        linhas: Valores a inserir por índice na requisição.
+        ao_inserir: Escritas complementares de cada lote, na mesma
+            transação, com as linhas e os ids gerados.
+
+    Returns:
+        ResultadoLote: Ids criados e erros, por índice.
+
+    Raises:
+        DBAPIError: Se a conexão com o banco for perdida.
+
+    """
+    resultado = ResultadoLote()
+    for lote in batched(linhas.items(), LOTE_INSERCAO):
+        try:
+            resultado.criados += _inserir_lote(
+                session, modelo, lote, ao_inserir
+            )
+        except DBAPIError as erro:
+            session.rollback()
+            if erro.connection_invalidated:
+                raise
+            for item in lote:
+                try:
+                    resultado.criados += _inserir_lote(
+                        session, modelo, (item,), ao_inserir
+                    )
+                except DBAPIError as erro_item:
+                    session.rollback()
+                    if erro_item.connection_invalidated:
+                        raise
+                    resultado.erros.append(_erro_item(item[0], erro_item))
+    return resultado
@@ -1,41 +1,146 @@
 """Repositório para operações de eventos."""
 
 from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import and_, join
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from cache import CacheEntidade, invalidar_apos_commit
+from config import settings
+from models.campos import Campos
+from models.comentario_evento import ComentarioEventoDB
+from models.evento import EventoCreate, EventoDB, EventoGuardado
+from models.obra import ObraDB
+from models.obra_evento import ObraEventoDB
+from models.paginacao import LIMITE_PADRAO
+from models.versao import Versao
+from repositories.comentario_evento import buscar_comentarios_recentes
+from repositories.escrita import (
+    atualizar_retornando,
+    inserir_retornando,
+    remover_retornando,
+)
+from repositories.obra import buscar_obras_por_evento
+from repositories.paginacao import (
+    Ordenacao,
+    ResultadoPagina,
+    fatiar,
+    filtro_cursor,
+    paginar,
+)
+from repositories.projecao import opcoes_projecao
+
+ORDEM = Ordenacao((EventoDB.id,))
+# Lidas mesmo com ``campos``, para os validadores das respostas.
+COLUNAS_VERSAO = (col(EventoDB.versao), col(EventoDB.atualizado_em))
+CACHE = CacheEntidade[EventoGuardado](
+    "eventos",
+    settings.cache_ttl_eventos,
+    settings.cache_tamanho_maximo,
+    modelo=EventoGuardado,
+)
+# O resumo é carregado por junção nas consultas, mas UPDATE/DELETE com
+# RETURNING não fazem junção: ele vem em uma consulta à parte.
+CARGA_RESUMO = selectinload(EventoDB.resumo_avaliacoes)  # type: ignore[arg-type]
+
+
+def buscar_eventos(
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+    campos: Campos | None = None,
+) -> ResultadoPagina[EventoDB]:
+    """Lista os eventos em ordem de ID.
 
-from sqlmodel import Session, select
+    Args:
+        session: Sessão do banco de dados.
+        cursor: Cursor devolvido pela página anterior.
+        limite: Quantidade máxima de itens.
+        campos: Campos pedidos; as demais colunas não são lidas.
 
-from models.evento import EventoDB
-from models.obra import ObraDB
+    Returns:
+        ResultadoPagina[EventoDB]: Página e o próximo cursor.
+
+    """
+    statement = select(EventoDB).options(
+        *opcoes_projecao(EventoDB, campos, *ORDEM.colunas, *COLUNAS_VERSAO)
+    )
+    return paginar(session, statement, ORDEM, cursor, limite)
 
 
-def buscar_eventos(session: Session) -> Sequence[EventoDB]:
-    """Retorna todos os eventos.
+def selecionar_eventos(
+    campos: Campos | None = None,
+) -> SelectOfScalar[EventoDB]:
+    """Monta a consulta de todos os eventos na ordem da listagem.
+
+    Returns:
+        SelectOfScalar[EventoDB]: Consulta para ser transmitida sem paginação.
+
+    """
+    return (
+        select(EventoDB)
+        .options(*opcoes_projecao(EventoDB, campos))
+        .order_by(*ORDEM.criterios())
+    )
+
+
+def buscar_evento_por_id(
+    evento_id: int, session: Session, campos: Campos | None = None
+) -> EventoGuardado | EventoDB | None:
+    """Busca um evento pelo ID, passando pelo cache.
+
+    Só o evento completo, com o resumo das avaliações, é guardado; com
+    ``campos``, um evento já guardado é aproveitado.
 
     Args:
+        evento_id: ID do evento.
         session: Sessão do banco de dados.
+        campos: Campos pedidos; as demais colunas não são lidas.
 
     Returns:
-        Sequence[EventoDB]: Lista de eventos.
+        EventoGuardado | EventoDB | None: Evento encontrado ou None.
 
     """
-    return session.exec(select(EventoDB)).all()
+    if campos is None:
+        return CACHE.obter_ou_carregar(
+            evento_id, session, lambda sessao: sessao.get(EventoDB, evento_id)
+        )
+    return CACHE.obter(evento_id) or session.get(
+        EventoDB,
+        evento_id,
+        options=opcoes_projecao(EventoDB, campos, *COLUNAS_VERSAO),
+    )
 
 
-def buscar_evento_por_id(evento_id: int, session: Session) -> EventoDB | None:
-    """Busca um evento pelo ID.
+def buscar_versao_evento(evento_id: int, session: Session) -> Versao | None:
+    """Busca a versão de um evento sem carregá-lo.
+
+    Usa um evento guardado no cache, se houver; senão, lê só as colunas da
+    versão.
 
     Args:
         evento_id: ID do evento.
         session: Sessão do banco de dados.
 
     Returns:
-        EventoDB | None: Evento encontrado ou None.
+        Versao | None: Versão do evento ou None se não existir.
 
     """
-    return session.get(EventoDB, evento_id)
+    guardado = CACHE.obter(evento_id)
+    if guardado is not None:
+        return Versao.da_linha(guardado)
+    linha = session.exec(
+        select(*COLUNAS_VERSAO).where(EventoDB.id == evento_id)
+    ).first()
+    return None if linha is None else Versao(*linha)
 
 
-def adicionar_evento(evento: EventoDB, session: Session) -> EventoDB:
+def adicionar_evento(evento: EventoCreate, session: Session) -> EventoDB:
     """Adiciona um novo evento.
 
     Args:
@@ -46,38 +151,37 @@ def adicionar_evento(evento: EventoDB, session: Session) -> EventoDB:
         EventoDB: Evento adicionado.
 
     """
-    session.add(evento)
+    # Um evento novo ainda não tem avaliações: marcar o resumo como
+    # carregado evita a consulta ao relacionamento na resposta.
+    evento_db = inserir_retornando(
+        session, EventoDB, evento.model_dump(exclude_none=True)
+    )
+    set_committed_value(evento_db, "resumo_avaliacoes", None)
+    invalidar_apos_commit(session, CACHE, evento_db.id)
     session.commit()
-    session.refresh(evento)
-    return evento
+    return evento_db
 
 
 def atualizar_evento_bd(
-    evento_id: int, evento: EventoDB, session: Session
+    evento_id: int, valores: dict[str, Any], session: Session
 ) -> EventoDB | None:
-    """Atualiza um evento existente.
+    """Atualiza apenas as colunas enviadas de um evento.
 
     Args:
         evento_id: ID do evento a ser atualizado.
-        evento: Novos dados do evento.
+        valores: Colunas alteradas e seus novos valores.
         session: Sessão do banco de dados.
 
     Returns:
         EventoDB | None: Evento atualizado ou None.
 
     """
-    evento_existente = session.get(EventoDB, evento_id)
-    if not evento_existente:
-        return None
-    evento_existente.nome = evento.nome
-    evento_existente.data = evento.data
-    evento_existente.local = evento.local
-    evento_existente.endereco = evento.endereco
-    evento_existente.id_organizador = evento.id_organizador
-    evento_existente.id_responsavel = evento.id_responsavel
+    evento = atualizar_retornando(
+        session, EventoDB, evento_id, valores, CARGA_RESUMO
+    )
+    invalidar_apos_commit(session, CACHE, evento_id)
     session.commit()
-    session.refresh(evento_existente)
-    return evento_existente
+    return evento
 
 
 def remover_evento(evento_id: int, session: Session) -> EventoDB | None:
@@ -91,29 +195,116 @@ def remover_evento(evento_id: int, session: Session) -> EventoDB | None:
         EventoDB | None: Evento removido ou None.
 
     """
-    evento_existente = buscar_evento_por_id(evento_id, session)
-    if not evento_existente:
-        return None
-    session.delete(evento_existente)
+    evento = remover_retornando(session, EventoDB, evento_id, CARGA_RESUMO)
+    invalidar_apos_commit(session, CACHE, evento_id)
     session.commit()
-    return evento_existente
+    return evento
 
 
 def buscar_eventos_por_obra(
-    obra_id: int, session: Session
-) -> Sequence[EventoDB]:
-    """Retorna todos os eventos de uma obra específica.
+    obra_id: int,
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+) -> ResultadoPagina[EventoDB] | None:
+    """Lista os eventos de uma obra em uma única consulta.
+
+    A obra é a tabela base de um ``LEFT JOIN`` com ``obra_evento`` e
+    ``eventos``, com o cursor na condição de junção: nenhuma linha
+    significa obra inexistente; uma linha sem evento, obra sem eventos.
 
     Args:
         obra_id: ID da obra.
         session: Sessão do banco de dados.
+        cursor: Cursor devolvido pela página anterior.
+        limite: Quantidade máxima de itens.
+
+    Returns:
+        ResultadoPagina[EventoDB] | None: Página de eventos da obra ou None
+            se a obra não existir.
+
+    """
+    # A obra repetida na junção interna deixa o SQLite buscar pela chave
+    # primária de obra_evento em vez de materializar todas as associações.
+    condicoes = [
+        col(EventoDB.id) == col(ObraEventoDB.id_evento),
+        col(ObraEventoDB.id_obra) == obra_id,
+    ]
+    if cursor is not None:
+        condicoes.append(filtro_cursor(ORDEM, cursor))
+    eventos_da_obra = join(ObraEventoDB, EventoDB, and_(*condicoes))
+    statement = (
+        select(ObraDB.id, EventoDB)
+        .select_from(ObraDB)
+        .outerjoin(
+            eventos_da_obra,
+            col(ObraEventoDB.id_obra) == col(ObraDB.id),
+        )
+        .where(ObraDB.id == obra_id)
+        .order_by(*ORDEM.criterios())
+        .limit(limite + 1)
+    )
+
+    linhas = session.exec(statement).all()
+    if not linhas:
+        return None
+    eventos = [evento for _, evento in linhas if evento is not None]
+    return fatiar(eventos, ORDEM, limite)
+
+
+@dataclass(frozen=True)
+class EventoCompletoDB:
+    evento: EventoDB
+    obras: ResultadoPagina[ObraDB]
+    comentarios_recentes: Sequence[ComentarioEventoDB]
+
+
+def buscar_evento_completo(
+    evento_id: int,
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+    limite_comentarios: int = 10,
+) -> EventoCompletoDB | None:
+    """Carrega tudo o que a página de um evento exibe.
+
+    São sempre três consultas, qualquer que seja o tamanho do evento: o
+    evento com organizador, responsável e resumo das avaliações
+    (``joinedload``), a página de obras e os comentários ativos mais
+    recentes.
+    Comentários e obras usam consultas próprias com ``LIMIT`` em vez de
+    ``selectinload``, que carregaria a coleção inteira.
+
+    Args:
+        evento_id: ID do evento.
+        session: Sessão do banco de dados.
+        cursor: Cursor da página de obras.
+        limite: Quantidade máxima de obras.
+        limite_comentarios: Quantidade máxima de comentários.
 
     Returns:
-        Sequence[EventoDB]: Lista de eventos da obra.
+        EventoCompletoDB | None: Dados da página ou None se o evento não
+            existir.
 
     """
-    obra_existente = session.get(ObraDB, obra_id)
-    if not obra_existente:
-        return []
+    evento = session.exec(
+        select(EventoDB)
+        .where(EventoDB.id == evento_id)
+        .options(
+            joinedload(EventoDB.organizador),  # type: ignore[arg-type]
+            joinedload(EventoDB.responsavel),  # type: ignore[arg-type]
+        )
+    ).first()
+    if evento is None:
+        return None
 
-    return obra_existente.eventos
+    obras = buscar_obras_por_evento(
+        evento_id, session, cursor=cursor, limite=limite
+    )
+    return EventoCompletoDB(
+        evento=evento,
+        obras=obras or ResultadoPagina([], None),
+        comentarios_recentes=buscar_comentarios_recentes(
+            evento_id, session, limite_comentarios
+        ),
+    )
@@ -0,0 +1,65 @@
+"""Consulta da exportação do catálogo de obras."""
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Select, label, select
+from sqlalchemy.orm import Mapped
+from sqlmodel import col
+
+from models.categoria import CategoriaDB
+from models.exportacao import ColunaExportacao
+from models.obra import FiltrosObra, ObraDB
+from models.usuario import UsuarioDB
+from repositories.obra import condicoes_filtro
+
+COLUNAS: dict[ColunaExportacao, Mapped[Any]] = {
+    ColunaExportacao.ID: col(ObraDB.id),
+    ColunaExportacao.TITULO: col(ObraDB.titulo),
+    ColunaExportacao.AUTOR: col(ObraDB.autor),
+    ColunaExportacao.ANO_PRODUCAO: col(ObraDB.ano_producao),
+    ColunaExportacao.TECNICA_CRIACAO: col(ObraDB.tecnica_criacao),
+    ColunaExportacao.ALTURA_CENTIMETROS: col(ObraDB.altura_centimetros),
+    ColunaExportacao.LARGURA_CENTIMETROS: col(ObraDB.largura_centimetros),
+    ColunaExportacao.PESO_QUILOS: col(ObraDB.peso_quilos),
+    ColunaExportacao.TAGS: col(ObraDB.tags),
+    ColunaExportacao.PRECO: col(ObraDB.preco),
+    ColunaExportacao.STATUS: col(ObraDB.status),
+    ColunaExportacao.DATA_POSTAGEM: col(ObraDB.data_postagem),
+    ColunaExportacao.USUARIO_ID: col(ObraDB.usuario_id),
+    ColunaExportacao.USUARIO_NOME: col(UsuarioDB.nome),
+    ColunaExportacao.CATEGORIA_ID: col(ObraDB.categoria_id),
+    ColunaExportacao.CATEGORIA_NOME: col(CategoriaDB.nome),
+}
+
+
+def selecionar_exportacao(
+    colunas: Sequence[ColunaExportacao], filtros: FiltrosObra | None = None
+) -> Select[Any]:
+    """Monta a consulta das obras exportadas, com usuário e categoria.
+
+    Só as colunas pedidas são lidas, e as junções com ``usuarios`` e
+    ``categorias`` só entram quando alguma coluna delas é pedida. As
+    linhas saem na ordem do id, percorrendo a chave primária.
+
+    Args:
+        colunas: Colunas exportadas, na ordem pedida; vazia exporta todas.
+        filtros: Filtros opcionais, os mesmos da listagem de obras.
+
+    Returns:
+        Select[Any]: Consulta com uma coluna rotulada por coluna exportada.
+
+    """
+    escolhidas = list(dict.fromkeys(colunas)) or list(ColunaExportacao)
+    statement = select(
+        *(label(coluna.value, COLUNAS[coluna]) for coluna in escolhidas)
+    ).select_from(ObraDB)
+    if ColunaExportacao.USUARIO_NOME in escolhidas:
+        statement = statement.join(
+            UsuarioDB, col(UsuarioDB.id) == col(ObraDB.usuario_id)
+        )
+    if ColunaExportacao.CATEGORIA_NOME in escolhidas:
+        statement = statement.join(
+            CategoriaDB, col(CategoriaDB.id) == col(ObraDB.categoria_id)
+        )
+    return statement.where(*condicoes_filtro(filtros)).order_by(col(ObraDB.id))
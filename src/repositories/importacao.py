@@ -0,0 +1,256 @@
+"""Importação de obras a partir de arquivos CSV.
+
+O arquivo é lido em lotes: cada lote é validado com ``ObraCreate`` e as
+linhas válidas vão para uma tabela temporária (por ``COPY`` no
+PostgreSQL). No fim, um único ``INSERT ... SELECT`` passa para ``obras``
+as linhas cujas referências existem, e as tags são gravadas da mesma
+forma, sem nenhum comando por obra. A memória usada depende do tamanho do
+lote, não do arquivo.
+"""
+
+import csv
+from collections.abc import Iterator, Sequence
+from itertools import batched
+from typing import Any, TextIO
+
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
+    inspect,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlmodel import Session, col, func
+
+from models.importacao import LIMITE_ERROS, RelatorioImportacao
+from models.lote import DetalheErro, ErroItem, validar_lote
+from models.obra import ObraCreate, ObraDB
+from models.tag import SEPARADOR_TAGS, ObraTagDB, TagDB, normalizar_tags
+from repositories.dialeto import comando_ignorando_conflito, copiar_linhas
+from repositories.obra import REFERENCIAS_OBRA
+
+LOTE_IMPORTACAO = 5000
+
+CAMPOS = list(ObraCreate.model_fields)
+
+_metadata = MetaData()
+_colunas_obra = inspect(ObraDB).columns
+
+obras_importadas = Table(
+    "importacao_obras",
+    _metadata,
+    Column("linha", Integer, primary_key=True),
+    Column("id", Integer),
+    *(Column(campo, _colunas_obra[campo].type) for campo in CAMPOS),
+    prefixes=["TEMPORARY"],
+)
+tags_importadas = Table(
+    "importacao_obra_tags",
+    _metadata,
+    Column("linha", Integer, primary_key=True),
+    Column("tag", String, primary_key=True),
+    prefixes=["TEMPORARY"],
+)
+
+
+def _ler_csv(arquivo: TextIO) -> Iterator[tuple[int, dict[str, Any]]]:
+    # Campos vazios ficam de fora, para valerem os padrões de ObraCreate; as
+    # tags vêm em uma só coluna, separadas por ponto e vírgula.
+    leitor = csv.DictReader(arquivo)
+    for registro in leitor:
+        item: dict[str, Any] = {
+            campo: valor
+            for campo, valor in registro.items()
+            if campo is not None and valor
+        }
+        item["tags"] = [
+            tag.strip()
+            for tag in item.get("tags", "").split(SEPARADOR_TAGS)
+            if tag.strip()
+        ]
+        yield leitor.line_num, item
+
+
+def _carregar(
+    session: Session,
+    registros: Sequence[tuple[int, dict[str, Any]]],
+    relatorio: RelatorioImportacao,
+) -> None:
+    linhas = [linha for linha, _ in registros]
+    validos, erros = validar_lote(ObraCreate, [item for _, item in registros])
+    relatorio.lidas += len(registros)
+    relatorio.registrar_erros(
+        [
+            erro.model_copy(update={"indice": linhas[erro.indice]})
+            for erro in erros
+        ]
+    )
+    copiar_linhas(
+        session,
+        obras_importadas,
+        [
+            {"linha": linhas[indice]} | valores
+            for indice, valores in validos.items()
+        ],
+    )
+    copiar_linhas(
+        session,
+        tags_importadas,
+        [
+            {"linha": linhas[indice], "tag": tag}
+            for indice, valores in validos.items()
+            for tag in sorted(normalizar_tags(valores["tags"]))
+        ],
+    )
+
+
+def _descartar_referencias_inexistentes(
+    session: Session, relatorio: RelatorioImportacao
+) -> None:
+    importadas = obras_importadas.c
+    inexistentes = {
+        campo: ~select(coluna).where(coluna == importadas[campo]).exists()
+        for campo, coluna in REFERENCIAS_OBRA.items()
+    }
+    condicao = or_(*inexistentes.values())
+    conexao = session.connection()
+    amostra = conexao.execute(
+        select(
+            importadas.linha,
+            *(importadas[campo] for campo in inexistentes),
+            *(
+                inexistente.label(f"sem_{campo}")
+                for campo, inexistente in inexistentes.items()
+            ),
+        )
+        .where(condicao)
+        .order_by(importadas.linha)
+        .limit(LIMITE_ERROS)
+    ).mappings()
+    erros = [
+        ErroItem(
+            indice=linha["linha"],
+            erros=[
+                DetalheErro(
+                    loc=[campo],
+                    msg=f"Registro {linha[campo]} não existe",
+                    type="referencia_inexistente",
+                )
+                for campo in inexistentes
+                if linha[f"sem_{campo}"]
+            ],
+        )
+        for linha in amostra
+    ]
+    descartadas = conexao.execute(delete(obras_importadas).where(condicao))
+    relatorio.registrar_erros(erros)
+    relatorio.total_erros += descartadas.rowcount - len(erros)
+    conexao.execute(
+        delete(tags_importadas).where(
+            tags_importadas.c.linha.not_in(select(importadas.linha))
+        )
+    )
+
+
+def _proximos_ids(session: Session) -> ColumnElement[int]:
+    # Os ids são reservados antes da inserção para ligar as tags de cada
+    # linha à obra criada sem ler as obras de volta.
+    if session.get_bind().dialect.name == "postgresql":
+        sequencia = func.pg_get_serial_sequence(ObraDB.__tablename__, "id")
+        return func.nextval(sequencia)
+    maior = select(func.coalesce(func.max(ObraDB.id), 0)).scalar_subquery()
+    return maior + obras_importadas.c.linha
+
+
+def _mesclar(session: Session) -> int:
+    importadas = obras_importadas.c
+    conexao = session.connection()
+    conexao.execute(update(obras_importadas).values(id=_proximos_ids(session)))
+
+    campos = [campo for campo in CAMPOS if campo != "data_postagem"]
+    resultado = conexao.execute(
+        insert(ObraDB).from_select(
+            ["id", *campos, "data_postagem"],
+            select(
+                importadas.id,
+                *(importadas[campo] for campo in campos),
+                func.coalesce(importadas.data_postagem, func.now()),
+            ),
+        )
+    )
+
+    tags = tags_importadas.c
+    conexao.execute(
+        insert(ObraTagDB).from_select(
+            ["obra_id", "tag"],
+            select(importadas.id, tags.tag).join_from(
+                tags_importadas,
+                obras_importadas,
+                tags.linha == importadas.linha,
+            ),
+        )
+    )
+    conexao.execute(
+        comando_ignorando_conflito(
+            session,
+            TagDB.__table__,  # type: ignore[arg-type]
+        ).from_select(
+            ["nome", "quantidade"],
+            select(tags.tag, literal(0)).group_by(tags.tag),
+        )
+    )
+    acrescimo = (
+        select(func.count())
+        .select_from(tags_importadas)
+        .where(tags.tag == TagDB.nome)
+        .scalar_subquery()
+    )
+    conexao.execute(
+        update(TagDB)
+        .where(col(TagDB.nome).in_(select(tags.tag)))
+        .values(quantidade=col(TagDB.quantidade) + acrescimo)
+    )
+    return resultado.rowcount
+
+
+def importar_obras_csv(
+    arquivo: TextIO, session: Session, lote: int = LOTE_IMPORTACAO
+) -> RelatorioImportacao:
+    """Importa as obras de um CSV com uma coluna por campo de ``ObraCreate``.
+
+    A importação inteira é uma transação: as linhas válidas e com
+    referências existentes entram juntas, e as demais voltam no relatório
+    com o número da linha no arquivo.
+
+    Args:
+        arquivo: CSV aberto em modo texto, com cabeçalho.
+        session: Sessão do banco de dados.
+        lote: Quantidade de linhas validadas e copiadas por vez.
+
+    Returns:
+        RelatorioImportacao: Contagens e as primeiras linhas com erro.
+
+    """
+    relatorio = RelatorioImportacao()
+    conexao = session.connection()
+    for tabela in (obras_importadas, tags_importadas):
+        tabela.drop(conexao, checkfirst=True)
+        tabela.create(conexao)
+
+    for registros in batched(_ler_csv(arquivo), lote):
+        _carregar(session, registros, relatorio)
+    _descartar_referencias_inexistentes(session, relatorio)
+    relatorio.importadas = _mesclar(session)
+
+    for tabela in (tags_importadas, obras_importadas):
+        tabela.drop(conexao)
+    session.commit()
+    return relatorio
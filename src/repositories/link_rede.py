@@ -1,23 +1,34 @@
 """Repositório para operações de links de redes sociais."""
 
-from collections.abc import Sequence
+from typing import Any
 
 from sqlmodel import Session, select
 
 from models.link_rede import LinkRedeDB
+from models.paginacao import LIMITE_PADRAO
+from repositories.escrita import atualizar_retornando, remover_retornando
+from repositories.paginacao import Ordenacao, ResultadoPagina, paginar
 
+ORDEM = Ordenacao((LinkRedeDB.id,))
 
-def buscar_links_rede(session: Session) -> Sequence[LinkRedeDB]:
-    """Retorna todos os links de redes sociais.
+
+def buscar_links_rede(
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+) -> ResultadoPagina[LinkRedeDB]:
+    """Lista os links de redes sociais em ordem de ID.
 
     Args:
         session: Sessão do banco de dados.
+        cursor: Cursor devolvido pela página anterior.
+        limite: Quantidade máxima de itens.
 
     Returns:
-        Sequence[LinkRedeDB]: Lista de links de redes sociais.
+        ResultadoPagina[LinkRedeDB]: Página e o próximo cursor.
 
     """
-    return session.exec(select(LinkRedeDB)).all()
+    return paginar(session, select(LinkRedeDB), ORDEM, cursor, limite)
 
 
 def buscar_link_rede_por_id(
@@ -49,34 +60,28 @@ def adicionar_link_rede(link_rede: LinkRedeDB, session: Session) -> LinkRedeDB:
     """
     session.add(link_rede)
     session.commit()
-    session.refresh(link_rede)
     return link_rede
 
 
 def atualizar_link_rede_bd(
-    link_rede_id: int, link_rede: LinkRedeDB, session: Session
+    link_rede_id: int, valores: dict[str, Any], session: Session
 ) -> LinkRedeDB | None:
-    """Atualiza um link de rede social existente.
+    """Atualiza apenas as colunas enviadas de um link de rede social.
 
     Args:
         link_rede_id: ID do link de rede social a ser atualizado.
-        link_rede: Novos dados do link de rede social.
+        valores: Colunas alteradas e seus novos valores.
         session: Sessão do banco de dados.
 
     Returns:
         LinkRedeDB | None: Link de rede social atualizado ou None.
 
     """
-    link_rede_existente = session.get(LinkRedeDB, link_rede_id)
-    if not link_rede_existente:
-        return None
-    link_rede_existente.link = link_rede.link
-    link_rede_existente.nome_rede = link_rede.nome_rede
-    link_rede_existente.nome_usuario = link_rede.nome_usuario
-    link_rede_existente.id_usuario = link_rede.id_usuario
+    link_rede = atualizar_retornando(
+        session, LinkRedeDB, link_rede_id, valores
+    )
     session.commit()
-    session.refresh(link_rede_existente)
-    return link_rede_existente
+    return link_rede
 
 
 def remover_link_rede(
@@ -92,9 +97,6 @@ def remover_link_rede(
         LinkRedeDB | None: Link de rede social removido ou None.
 
     """
-    link_rede_existente = buscar_link_rede_por_id(link_rede_id, session)
-    if not link_rede_existente:
-        return None
-    session.delete(link_rede_existente)
+    link_rede = remover_retornando(session, LinkRedeDB, link_rede_id)
     session.commit()
-    return link_rede_existente
+    return link_rede
@@ -1,41 +1,181 @@
 """Repositório para operações de obras."""
 
-from collections.abc import Sequence
+from dataclasses import replace
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    String,
+    and_,
+    case,
+    cast,
+    join,
+    literal,
+    literal_column,
+    union_all,
+)
+from sqlmodel import Session, col, func, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from cache import CacheEntidade, invalidar_apos_commit
+from config import settings
+from models.campos import Campos
+from models.categoria import CategoriaDB
+from models.evento import EventoDB
+from models.lote import ResultadoLote
+from models.obra import (
+    FAIXAS_PRECO,
+    ContagemCategoria,
+    ContagemTecnica,
+    FacetasObra,
+    FaixaPreco,
+    FiltrosObra,
+    ObraBase,
+    ObraDB,
+    ObraGuardada,
+)
+from models.obra_evento import ObraEventoDB
+from models.paginacao import LIMITE_PADRAO
+from models.tag import normalizar_tags
+from models.usuario import UsuarioDB
+from models.versao import Versao
+from repositories.escrita import (
+    atualizar_retornando,
+    inserir_em_lotes,
+    inserir_retornando,
+    remover_referencias_inexistentes,
+    remover_retornando,
+)
+from repositories.paginacao import (
+    Ordenacao,
+    ResultadoPagina,
+    fatiar,
+    filtro_cursor,
+    paginar,
+)
+from repositories.projecao import opcoes_projecao
+from repositories.tag import (
+    adicionar_tags_obras,
+    buscar_tags_obra,
+    condicao_tags,
+    remover_tags_obra,
+    sincronizar_tags_obra,
+)
+
+ORDEM = Ordenacao((ObraDB.data_postagem, ObraDB.id), descendente=True)
+# Lidas mesmo com ``campos``, para os validadores das respostas.
+COLUNAS_VERSAO = (col(ObraDB.versao), col(ObraDB.atualizado_em))
+CACHE = CacheEntidade[ObraGuardada](
+    "obras",
+    settings.cache_ttl_obras,
+    settings.cache_tamanho_maximo,
+    modelo=ObraGuardada,
+)
+REFERENCIAS_OBRA = {
+    "usuario_id": col(UsuarioDB.id),
+    "categoria_id": col(CategoriaDB.id),
+}
+
+
+def buscar_obras(
+    session: Session,
+    filtros: FiltrosObra | None = None,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+    campos: Campos | None = None,
+) -> ResultadoPagina[ObraDB]:
+    """Lista as obras, das mais recentes para as mais antigas.
 
-from sqlmodel import Session, select
+    Args:
+        session: Sessão do banco de dados.
+        filtros: Filtros opcionais de status, categoria e tags.
+        cursor: Cursor devolvido pela página anterior.
+        limite: Quantidade máxima de itens.
+        campos: Campos pedidos; as demais colunas não são lidas.
 
-from models.evento import EventoDB
-from models.obra import ObraDB
+    Returns:
+        ResultadoPagina[ObraDB]: Página e o próximo cursor.
+
+    """
+    statement = (
+        select(ObraDB)
+        .where(*condicoes_filtro(filtros))
+        .options(
+            *opcoes_projecao(ObraDB, campos, *ORDEM.colunas, *COLUNAS_VERSAO)
+        )
+    )
+    return paginar(session, statement, ORDEM, cursor, limite)
+
+
+def selecionar_obras(
+    filtros: FiltrosObra | None = None, campos: Campos | None = None
+) -> SelectOfScalar[ObraDB]:
+    """Monta a consulta de todas as obras na ordem da listagem.
+
+    Returns:
+        SelectOfScalar[ObraDB]: Consulta para ser transmitida sem paginação.
+
+    """
+    return (
+        select(ObraDB)
+        .where(*condicoes_filtro(filtros))
+        .options(*opcoes_projecao(ObraDB, campos))
+        .order_by(*ORDEM.criterios())
+    )
 
 
-def buscar_obras(session: Session) -> Sequence[ObraDB]:
-    """Retorna todas as obras.
+def buscar_obra_por_id(
+    obra_id: int, session: Session, campos: Campos | None = None
+) -> ObraGuardada | ObraDB | None:
+    """Busca uma obra pelo ID, passando pelo cache.
+
+    Só a obra completa é guardada; com ``campos``, uma obra já guardada é
+    aproveitada, e a lida do banco (só com essas colunas) não é guardada.
 
     Args:
+        obra_id: ID da obra.
         session: Sessão do banco de dados.
+        campos: Campos pedidos; as demais colunas não são lidas.
 
     Returns:
-        Sequence[ObraDB]: Lista de obras.
+        ObraGuardada | ObraDB | None: Obra encontrada ou None.
 
     """
-    return session.exec(select(ObraDB)).all()
+    if campos is None:
+        return CACHE.obter_ou_carregar(
+            obra_id, session, lambda sessao: sessao.get(ObraDB, obra_id)
+        )
+    return CACHE.obter(obra_id) or session.get(
+        ObraDB,
+        obra_id,
+        options=opcoes_projecao(ObraDB, campos, *COLUNAS_VERSAO),
+    )
 
 
-def buscar_obra_por_id(obra_id: int, session: Session) -> ObraDB | None:
-    """Busca uma obra pelo ID.
+def buscar_versao_obra(obra_id: int, session: Session) -> Versao | None:
+    """Busca a versão de uma obra sem carregá-la.
+
+    Usa uma obra guardada no cache, se houver; senão, lê só as colunas da
+    versão.
 
     Args:
         obra_id: ID da obra.
         session: Sessão do banco de dados.
 
     Returns:
-        ObraDB | None: Obra encontrada ou None.
+        Versao | None: Versão da obra ou None se não existir.
 
     """
-    return session.get(ObraDB, obra_id)
+    guardada = CACHE.obter(obra_id)
+    if guardada is not None:
+        return Versao.da_linha(guardada)
+    linha = session.exec(
+        select(*COLUNAS_VERSAO).where(ObraDB.id == obra_id)
+    ).first()
+    return None if linha is None else Versao(*linha)
 
 
-def adicionar_obra(obra: ObraDB, session: Session) -> ObraDB:
+def adicionar_obra(obra: ObraBase, session: Session) -> ObraDB:
     """Adiciona uma nova obra.
 
     Args:
@@ -46,35 +186,74 @@ def adicionar_obra(obra: ObraDB, session: Session) -> ObraDB:
         ObraDB: Obra adicionada.
 
     """
-    session.add(obra)
+    obra_db = inserir_retornando(
+        session, ObraDB, obra.model_dump(exclude_none=True)
+    )
+    sincronizar_tags_obra(
+        session, obra_db.id, set(), normalizar_tags(obra_db.tags)
+    )
+    invalidar_apos_commit(session, CACHE, obra_db.id)
     session.commit()
-    session.refresh(obra)
-    return obra
+    return obra_db
+
+
+def _gravar_tags(
+    session: Session, criadas: list[tuple[dict[str, Any], int]]
+) -> None:
+    adicionar_tags_obras(
+        session,
+        {
+            obra_id: normalizar_tags(linha["tags"])
+            for linha, obra_id in criadas
+        },
+    )
+
+
+def adicionar_obras_em_lote(
+    linhas: dict[int, dict[str, Any]], session: Session
+) -> ResultadoLote:
+    """Adiciona várias obras, com suas tags, em lotes de inserção.
+
+    Args:
+        linhas: Valores validados de cada obra, por índice na requisição.
+        session: Sessão do banco de dados.
+
+    Returns:
+        ResultadoLote: Ids das obras criadas e erros, por índice.
+
+    """
+    erros = remover_referencias_inexistentes(session, linhas, REFERENCIAS_OBRA)
+    resultado = inserir_em_lotes(session, ObraDB, linhas, _gravar_tags)
+    resultado.erros += erros
+    return resultado
 
 
 def atualizar_obra_bd(
-    obra_id: int, obra: ObraDB, session: Session
+    obra_id: int, valores: dict[str, Any], session: Session
 ) -> ObraDB | None:
-    """Atualiza uma obra existente.
+    """Atualiza apenas as colunas enviadas de uma obra.
+
+    Quando ``tags`` é enviada, as tags normalizadas e as contagens também
+    são ajustadas.
 
     Args:
         obra_id: ID da obra a ser atualizada.
-        obra: Novos dados da obra.
+        valores: Colunas alteradas e seus novos valores.
         session: Sessão do banco de dados.
 
     Returns:
         ObraDB | None: Obra atualizada ou None.
 
     """
-    obra_existente = session.get(ObraDB, obra_id)
-    if not obra_existente:
-        return None
-    obra_existente.titulo = obra.titulo
-    obra_existente.autor = obra.autor
-    obra_existente.ano_producao = obra.ano_producao
+    antigas = buscar_tags_obra(obra_id, session) if "tags" in valores else None
+    obra = atualizar_retornando(session, ObraDB, obra_id, valores)
+    if obra is not None and antigas is not None:
+        sincronizar_tags_obra(
+            session, obra_id, antigas, normalizar_tags(obra.tags)
+        )
+    invalidar_apos_commit(session, CACHE, obra_id)
     session.commit()
-    session.refresh(obra_existente)
-    return obra_existente
+    return obra
 
 
 def remover_obra(obra_id: int, session: Session) -> ObraDB | None:
@@ -88,29 +267,173 @@ def remover_obra(obra_id: int, session: Session) -> ObraDB | None:
         ObraDB | None: Obra removida ou None.
 
     """
-    obra_existente = buscar_obra_por_id(obra_id, session)
-    if not obra_existente:
-        return None
-    session.delete(obra_existente)
+    remover_tags_obra(session, obra_id)
+    obra = remover_retornando(session, ObraDB, obra_id)
+    invalidar_apos_commit(session, CACHE, obra_id)
     session.commit()
-    return obra_existente
+    return obra
+
+
+IGUALDADES = {
+    "status": ObraDB.status,
+    "categoria_id": ObraDB.categoria_id,
+    "usuario_id": ObraDB.usuario_id,
+    "tecnica_criacao": ObraDB.tecnica_criacao,
+}
+FAIXAS = {
+    "preco": ObraDB.preco,
+    "ano_producao": ObraDB.ano_producao,
+    "altura": ObraDB.altura_centimetros,
+    "largura": ObraDB.largura_centimetros,
+    "peso": ObraDB.peso_quilos,
+}
+
+
+def condicoes_filtro(filtros: FiltrosObra | None) -> list[ColumnElement[bool]]:
+    """Monta as condições ``WHERE`` dos filtros informados.
+
+    Returns:
+        list[ColumnElement[bool]]: Uma condição por filtro preenchido.
+
+    """
+    if filtros is None:
+        return []
+    condicoes = [
+        col(coluna) == valor
+        for campo, coluna in IGUALDADES.items()
+        if (valor := getattr(filtros, campo)) is not None
+    ]
+    for campo, coluna in FAIXAS.items():
+        if (minimo := getattr(filtros, f"{campo}_min")) is not None:
+            condicoes.append(col(coluna) >= minimo)
+        if (maximo := getattr(filtros, f"{campo}_max")) is not None:
+            condicoes.append(col(coluna) <= maximo)
+    if filtros.tag:
+        condicoes.append(condicao_tags(filtros.tag, filtros.modo_tags))
+    return condicoes
+
+
+def contar_facetas(
+    session: Session, filtros: FiltrosObra | None = None
+) -> FacetasObra:
+    """Conta as obras por categoria, técnica e faixa de preço.
+
+    As três contagens saem de uma única consulta (``UNION ALL`` de três
+    agrupamentos). Cada faceta aplica todos os filtros menos o seu próprio,
+    para que a interface mostre as alternativas ao valor já escolhido.
+
+    Args:
+        session: Sessão do banco de dados.
+        filtros: Filtros aplicados à listagem.
+
+    Returns:
+        FacetasObra: Contagens de cada faceta, das maiores para as menores;
+            as faixas de preço seguem a ordem de ``FAIXAS_PRECO``.
+
+    """
+    filtros = filtros or FiltrosObra()
+    faixa = case(
+        *(
+            (col(ObraDB.preco) < limite, indice)
+            for indice, limite in enumerate(FAIXAS_PRECO[1:])
+        ),
+        else_=len(FAIXAS_PRECO) - 1,
+    )
+    agrupamentos = (
+        ("categoria", col(ObraDB.categoria_id), {"categoria_id": None}),
+        ("tecnica", col(ObraDB.tecnica_criacao), {"tecnica_criacao": None}),
+        ("preco", faixa, {"preco_min": None, "preco_max": None}),
+    )
+    consulta = union_all(
+        *(
+            select(
+                literal(faceta).label("faceta"),
+                cast(valor, String).label("valor"),
+                func.count().label("quantidade"),
+            )
+            .where(*condicoes_filtro(replace(filtros, **sem_filtro)))
+            # Agrupar pelo rótulo evita repetir a expressão no GROUP BY, o
+            # que no PostgreSQL geraria parâmetros distintos dos do SELECT.
+            .group_by(literal_column("valor"))
+            for faceta, valor, sem_filtro in agrupamentos
+        )
+    )
+
+    facetas = FacetasObra(
+        faixas_preco=[
+            FaixaPreco(minimo=minimo, maximo=maximo)
+            for minimo, maximo in zip(
+                FAIXAS_PRECO, (*FAIXAS_PRECO[1:], None), strict=True
+            )
+        ]
+    )
+    for faceta, valor, quantidade in session.connection().execute(consulta):
+        if faceta == "categoria":
+            facetas.categorias.append(
+                ContagemCategoria(
+                    categoria_id=int(valor), quantidade=quantidade
+                )
+            )
+        elif faceta == "tecnica":
+            facetas.tecnicas.append(
+                ContagemTecnica(tecnica_criacao=valor, quantidade=quantidade)
+            )
+        else:
+            facetas.faixas_preco[int(valor)].quantidade = quantidade
+    facetas.categorias.sort(key=lambda c: (-c.quantidade, c.categoria_id))
+    facetas.tecnicas.sort(key=lambda t: (-t.quantidade, t.tecnica_criacao))
+    return facetas
 
 
 def buscar_obras_por_evento(
-    evento_id: int, session: Session
-) -> Sequence[ObraDB]:
-    """Retorna todas as obras de um evento específico.
+    evento_id: int,
+    session: Session,
+    filtros: FiltrosObra | None = None,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+) -> ResultadoPagina[ObraDB] | None:
+    """Lista as obras de um evento em uma única consulta.
+
+    O evento é a tabela base de um ``LEFT JOIN`` com ``obra_evento`` e
+    ``obras``, com filtros e cursor na condição de junção: nenhuma linha
+    significa evento inexistente; uma linha sem obra, evento sem obras.
 
     Args:
         evento_id: ID do evento.
         session: Sessão do banco de dados.
+        filtros: Filtros opcionais de status e categoria.
+        cursor: Cursor devolvido pela página anterior.
+        limite: Quantidade máxima de itens.
 
     Returns:
-        Sequence[ObraDB]: Lista de obras do evento.
+        ResultadoPagina[ObraDB] | None: Página de obras do evento ou None
+            se o evento não existir.
 
     """
-    evento_existente = session.get(EventoDB, evento_id)
-    if not evento_existente:
-        return []
-
-    return evento_existente.obras
+    # O evento repetido na junção interna deixa o SQLite buscar pelo índice
+    # de obra_evento em vez de materializar a junção de todos os eventos.
+    condicoes = [
+        col(ObraDB.id) == col(ObraEventoDB.id_obra),
+        col(ObraEventoDB.id_evento) == evento_id,
+        *condicoes_filtro(filtros),
+    ]
+    if cursor is not None:
+        condicoes.append(filtro_cursor(ORDEM, cursor))
+    obras_do_evento = join(ObraEventoDB, ObraDB, and_(*condicoes))
+    statement = (
+        select(EventoDB.id, ObraDB)
+        .select_from(EventoDB)
+        .outerjoin(
+            obras_do_evento,
+            col(ObraEventoDB.id_evento) == col(EventoDB.id),
+        )
+        .where(EventoDB.id == evento_id)
+        .order_by(*ORDEM.criterios())
+        .limit(limite + 1)
+    )
+
+    linhas = session.exec(statement).all()
+    if not linhas:
+        return None
+    obras = [obra for _, obra in linhas if obra is not None]
+    return fatiar(obras, ORDEM, limite)
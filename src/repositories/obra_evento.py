@@ -1,8 +1,17 @@
 """Repositório para operações de associação entre obras e eventos."""
 
-from sqlmodel import Session, select
+from sqlalchemy import delete
+from sqlmodel import Session, col, select
 
-from models.obra_evento import ObraEventoDB
+from errors import ObrasInexistentesError
+from models.evento import EventoDB
+from models.obra import ObraDB
+from models.obra_evento import (
+    DiferencaObrasEvento,
+    ModoAssociacao,
+    ObraEventoDB,
+)
+from repositories.dialeto import comando_ignorando_conflito, pertence
 
 
 def adicionar_obra_ao_evento(
@@ -16,7 +25,6 @@ def adicionar_obra_ao_evento(
     """
     session.add(obra_evento)
     session.commit()
-    session.refresh(obra_evento)
     return obra_evento
 
 
@@ -29,15 +37,79 @@ def remover_obra_do_evento(
         bool: True se removido com sucesso, False caso contrário.
 
     """
-    statement = select(ObraEventoDB).where(
-        ObraEventoDB.id_obra == obra_evento.id_obra,
-        ObraEventoDB.id_evento == obra_evento.id_evento,
+    resultado = session.connection().execute(
+        delete(ObraEventoDB).where(
+            col(ObraEventoDB.id_obra) == obra_evento.id_obra,
+            col(ObraEventoDB.id_evento) == obra_evento.id_evento,
+        )
     )
+    session.commit()
+    return resultado.rowcount > 0
+
+
+def associar_obras_ao_evento(
+    evento_id: int,
+    obras: list[int],
+    modo: ModoAssociacao,
+    session: Session,
+) -> DiferencaObrasEvento | None:
+    """Define, acrescenta ou retira obras de um evento em uma transação.
+
+    As associações são gravadas com um único ``INSERT ... ON CONFLICT DO
+    NOTHING`` e retiradas com um único ``DELETE``, ambos com ``RETURNING``
+    para informar o que de fato mudou.
+
+    Args:
+        evento_id: ID do evento.
+        obras: IDs das obras enviadas.
+        modo: ``definir`` deixa o evento só com ``obras``; ``adicionar`` e
+            ``remover`` acrescentam ou retiram as obras informadas.
+        session: Sessão do banco de dados.
 
-    obra_evento_retornado = session.exec(statement).one_or_none()
+    Returns:
+        DiferencaObrasEvento | None: Obras adicionadas e removidas, ou None
+            se o evento não existir.
+
+    Raises:
+        ObrasInexistentesError: Se alguma obra a associar não existir.
 
-    if obra_evento_retornado:
-        session.delete(obra_evento_retornado)
-        session.commit()
-        return True
-    return False
+    """
+    if session.get(EventoDB, evento_id) is None:
+        return None
+    ids = sorted(set(obras))
+    conexao = session.connection()
+    if modo is not ModoAssociacao.REMOVER and ids:
+        existentes = set(
+            conexao.execute(
+                select(ObraDB.id).where(pertence(session, col(ObraDB.id), ids))
+            ).scalars()
+        )
+        if inexistentes := [i for i in ids if i not in existentes]:
+            raise ObrasInexistentesError(inexistentes)
+
+    diferenca = DiferencaObrasEvento()
+    if modo is not ModoAssociacao.ADICIONAR:
+        condicao = pertence(session, col(ObraEventoDB.id_obra), ids)
+        diferenca.removidas = sorted(
+            conexao.execute(
+                delete(ObraEventoDB)
+                .where(
+                    col(ObraEventoDB.id_evento) == evento_id,
+                    condicao if modo is ModoAssociacao.REMOVER else ~condicao,
+                )
+                .returning(col(ObraEventoDB.id_obra))
+            ).scalars()
+        )
+    if modo is not ModoAssociacao.REMOVER and ids:
+        diferenca.adicionadas = sorted(
+            conexao.execute(
+                comando_ignorando_conflito(
+                    session,
+                    ObraEventoDB.__table__,  # type: ignore[arg-type]
+                )
+                .values([{"id_obra": i, "id_evento": evento_id} for i in ids])
+                .returning(col(ObraEventoDB.id_obra))
+            ).scalars()
+        )
+    session.commit()
+    return diferenca
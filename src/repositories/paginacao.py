@@ -0,0 +1,171 @@
+"""Paginação por cursor (keyset) reutilizada pelos repositórios."""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import starmap
+from typing import Any
+
+from sqlalchemy import ColumnElement, tuple_
+from sqlmodel import Session
+from sqlmodel.sql.expression import SelectOfScalar
+
+from errors import CursorInvalidoError
+from models.paginacao import LIMITE_PADRAO
+
+# Faixa do BIGINT: inteiros fora dela não chegam ao banco.
+INTEIRO_MINIMO = -(2**63)
+INTEIRO_MAXIMO = 2**63 - 1
+
+
+@dataclass(frozen=True)
+class ResultadoPagina[T]:
+    itens: Sequence[T]
+    proximo_cursor: str | None
+
+
+@dataclass(frozen=True)
+class Ordenacao:
+    """Chave de ordenação de uma listagem paginada.
+
+    As colunas devem formar uma chave única (terminando na chave primária)
+    e estar cobertas por um índice, para que cada página seja uma busca
+    por intervalo em vez de um ``OFFSET``.
+    """
+
+    colunas: tuple[Any, ...]
+    descendente: bool = False
+
+    def criterios(self) -> list[Any]:
+        """Lista os critérios de ``ORDER BY`` na direção configurada.
+
+        Returns:
+            list[Any]: Colunas com ``ASC`` ou ``DESC`` aplicado.
+
+        """
+        return [
+            coluna.desc() if self.descendente else coluna.asc()
+            for coluna in self.colunas
+        ]
+
+    def cursor_de(self, item: Any) -> str:  # noqa: ANN401
+        """Gera o cursor que aponta para logo depois de ``item``.
+
+        Returns:
+            str: Cursor opaco com os valores da chave de ``item``.
+
+        """
+        return codificar_cursor(
+            [getattr(item, coluna.key) for coluna in self.colunas]
+        )
+
+
+def codificar_cursor(valores: Sequence[Any]) -> str:
+    """Serializa os valores da chave de ordenação em um cursor opaco.
+
+    Returns:
+        str: Cursor em base64 url-safe, sem padding.
+
+    """
+    conteudo = json.dumps(
+        [
+            valor.isoformat() if isinstance(valor, datetime) else valor
+            for valor in valores
+        ],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(conteudo.encode()).decode().rstrip("=")
+
+
+def _converter(coluna: Any, valor: Any) -> Any:  # noqa: ANN401
+    tipo = coluna.type.python_type
+    if tipo is datetime:
+        return datetime.fromisoformat(valor)
+    convertido = tipo(valor)
+    if tipo is int and not INTEIRO_MINIMO <= convertido <= INTEIRO_MAXIMO:
+        message = f"Inteiro fora da faixa: {convertido}"
+        raise ValueError(message)
+    return convertido
+
+
+def decodificar_cursor(cursor: str, colunas: Sequence[Any]) -> list[Any]:
+    """Recupera os valores da chave de ordenação a partir do cursor.
+
+    Returns:
+        list[Any]: Valores convertidos para o tipo Python de cada coluna.
+
+    Raises:
+        CursorInvalidoError: Se o cursor não puder ser lido para essas colunas.
+
+    """
+    try:
+        preenchimento = "=" * (-len(cursor) % 4)
+        valores = json.loads(base64.urlsafe_b64decode(cursor + preenchimento))
+        if not isinstance(valores, list) or len(valores) != len(colunas):
+            raise CursorInvalidoError(cursor)
+        return list(starmap(_converter, zip(colunas, valores, strict=True)))
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        OverflowError,
+        TypeError,
+        ValueError,
+    ) as e:
+        raise CursorInvalidoError(cursor) from e
+
+
+def filtro_cursor(ordem: Ordenacao, cursor: str) -> ColumnElement[bool]:
+    """Monta a condição que posiciona a consulta logo após o cursor.
+
+    Returns:
+        ColumnElement[bool]: Comparação de tupla ``(c1, c2) > (v1, v2)``.
+
+    """
+    valores = decodificar_cursor(cursor, ordem.colunas)
+    if len(ordem.colunas) == 1:
+        chave, referencia = ordem.colunas[0], valores[0]
+    else:
+        chave, referencia = tuple_(*ordem.colunas), tuple(valores)
+    return chave < referencia if ordem.descendente else chave > referencia
+
+
+def paginar[T](
+    session: Session,
+    statement: SelectOfScalar[T],
+    ordem: Ordenacao,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+) -> ResultadoPagina[T]:
+    """Executa ``statement`` ordenado por ``ordem`` a partir do cursor.
+
+    Returns:
+        ResultadoPagina[T]: Itens da página e o cursor da próxima, se houver.
+
+    """
+    if cursor is not None:
+        statement = statement.where(filtro_cursor(ordem, cursor))
+    statement = statement.order_by(*ordem.criterios()).limit(limite + 1)
+
+    return fatiar(session.exec(statement).all(), ordem, limite)
+
+
+def fatiar[T](
+    itens: Sequence[T], ordem: Ordenacao, limite: int
+) -> ResultadoPagina[T]:
+    """Corta os ``limite + 1`` itens lidos em uma página e seu cursor.
+
+    O item excedente só indica que há uma próxima página; o cursor aponta
+    para o último item devolvido.
+
+    Returns:
+        ResultadoPagina[T]: Itens da página e o cursor da próxima, se houver.
+
+    """
+    if len(itens) <= limite:
+        return ResultadoPagina(itens, None)
+
+    itens = itens[:limite]
+    return ResultadoPagina(itens, ordem.cursor_de(itens[-1]))
@@ -0,0 +1,46 @@
+"""Carga apenas das colunas pedidas em ``?fields=``."""
+
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import lazyload, load_only
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlmodel import SQLModel
+
+from models.campos import Campos
+
+
+def opcoes_projecao(
+    modelo: type[SQLModel],
+    campos: Campos | None,
+    *obrigatorias: Any,  # noqa: ANN401
+) -> list[ORMOption]:
+    """Monta as opções de carga que leem do banco só os ``campos``.
+
+    As demais colunas ficam fora do ``SELECT``, e os relacionamentos fora
+    de ``campos`` deixam de ser carregados por junção. A chave primária e
+    ``obrigatorias`` (como as colunas do cursor) são sempre lidas.
+
+    Returns:
+        list[ORMOption]: Opções para a consulta; vazia sem ``campos``.
+
+    """
+    if campos is None:
+        return []
+    mapeamento = inspect(modelo)
+    chaves = {
+        mapeamento.get_property_by_column(coluna).key
+        for coluna in mapeamento.primary_key
+    }
+    colunas = [
+        atributo.class_attribute
+        for atributo in mapeamento.column_attrs
+        if atributo.key in campos or atributo.key in chaves
+    ]
+    opcoes: list[ORMOption] = [load_only(*colunas, *obrigatorias)]
+    opcoes += [
+        lazyload(relacionamento.class_attribute)
+        for relacionamento in mapeamento.relationships
+        if relacionamento.key not in campos
+    ]
+    return opcoes
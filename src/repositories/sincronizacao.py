@@ -0,0 +1,104 @@
+"""Operações de banco de dados para a sincronização incremental."""
+
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import ColumnElement
+from sqlmodel import Session, col, select
+
+from models.sincronizacao import (
+    LIMITE_SINCRONIZACAO_PADRAO,
+    MODELOS_SINCRONIZADOS,
+    AlteracaoDB,
+)
+from models.usuario import Funcao, UsuarioDB
+from repositories.paginacao import codificar_cursor, decodificar_cursor
+
+# Só os perfis de artistas vão para os clientes; um usuário que deixa de
+# ser artista chega como removido.
+CONDICOES: dict[str, ColumnElement[bool]] = {
+    "usuarios": col(UsuarioDB.funcao) == Funcao.ARTISTA,
+}
+
+
+@dataclass(frozen=True)
+class AlteracoesDB:
+    alterados: dict[str, Sequence[Any]]
+    removidos: dict[str, list[int]]
+    token: str
+    mais: bool
+
+
+def decodificar_token(token: str | None) -> int:
+    """Recupera a posição na sequência de alterações guardada no token.
+
+    Returns:
+        int: Última alteração já entregue; 0 sem token.
+
+    """
+    if token is None:
+        return 0
+    return decodificar_cursor(token, [col(AlteracaoDB.seq)])[0]
+
+
+def buscar_alteracoes(
+    session: Session,
+    token: str | None = None,
+    limite: int = LIMITE_SINCRONIZACAO_PADRAO,
+) -> AlteracoesDB:
+    """Lista os registros alterados e removidos depois do token.
+
+    Lê no máximo ``limite`` alterações pelo índice de ``seq`` e depois os
+    registros alterados, uma consulta por entidade. Um registro alterado
+    várias vezes aparece uma vez, na versão atual. Sem token, devolve o
+    catálogo inteiro, página a página.
+
+    Args:
+        session: Sessão do banco de dados.
+        token: Token devolvido pela sincronização anterior.
+        limite: Quantidade máxima de registros alterados ou removidos.
+
+    Returns:
+        AlteracoesDB: Registros por entidade, ids removidos, o token da
+            próxima sincronização e se ainda há alterações depois dele.
+
+    """
+    desde = decodificar_token(token)
+    alteracoes = session.exec(
+        select(AlteracaoDB)
+        .where(col(AlteracaoDB.seq) > desde)
+        .order_by(col(AlteracaoDB.seq))
+        .limit(limite + 1)
+    ).all()
+    mais = len(alteracoes) > limite
+    alteracoes = alteracoes[:limite]
+
+    pendentes: dict[str, list[int]] = defaultdict(list)
+    removidos: dict[str, list[int]] = defaultdict(list)
+    for alteracao in alteracoes:
+        destino = removidos if alteracao.removido else pendentes
+        destino[alteracao.entidade].append(alteracao.registro_id)
+
+    alterados: dict[str, Sequence[Any]] = {}
+    for entidade, ids in pendentes.items():
+        modelo = MODELOS_SINCRONIZADOS[entidade]
+        condicoes: list[ColumnElement[bool]] = [
+            col(modelo.id).in_(ids)  # type: ignore[attr-defined]
+        ]
+        if entidade in CONDICOES:
+            condicoes.append(CONDICOES[entidade])
+        alterados[entidade] = session.exec(
+            select(modelo).where(*condicoes)
+        ).all()
+        # Removidos depois da leitura das alterações ou fora do filtro.
+        encontrados = {registro.id for registro in alterados[entidade]}
+        removidos[entidade].extend(
+            chave for chave in ids if chave not in encontrados
+        )
+
+    ultimo = alteracoes[-1].seq if alteracoes else desde
+    return AlteracoesDB(
+        alterados, dict(removidos), codificar_cursor([ultimo]), mais
+    )
@@ -0,0 +1,213 @@
+"""Repositório das tags das obras."""
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
+from itertools import batched
+
+from sqlalchemy import ColumnElement, delete, insert, update
+from sqlmodel import Session, col, func, select
+
+from models.obra import ObraDB
+from models.paginacao import LIMITE_PADRAO
+from models.tag import ModoTags, ObraTagDB, TagDB, normalizar_tags
+from repositories.dialeto import inserir_ignorando_conflito
+
+LOTE_RECONSTRUCAO = 1000
+
+
+def condicao_tags(tags: Iterable[str], modo: ModoTags) -> ColumnElement[bool]:
+    """Monta a condição de obras com qualquer uma ou todas as ``tags``.
+
+    A subconsulta percorre o índice ``(tag, obra_id)`` de ``obra_tags`` em
+    vez de ler a coluna JSON de cada obra.
+
+    Returns:
+        ColumnElement[bool]: Condição sobre ``obras.id``.
+
+    """
+    normalizadas = normalizar_tags(tags)
+    obras_marcadas = select(ObraTagDB.obra_id).where(
+        col(ObraTagDB.tag).in_(normalizadas)
+    )
+    if modo is ModoTags.TODAS:
+        obras_marcadas = obras_marcadas.group_by(
+            col(ObraTagDB.obra_id)
+        ).having(func.count() == len(normalizadas))
+    return col(ObraDB.id).in_(obras_marcadas)
+
+
+def _somar_contagens(
+    session: Session, nomes: list[str], acrescimo: int
+) -> None:
+    for lote in batched(nomes, LOTE_RECONSTRUCAO):
+        session.connection().execute(
+            update(TagDB)
+            .where(col(TagDB.nome).in_(lote))
+            .values(quantidade=col(TagDB.quantidade) + acrescimo)
+        )
+
+
+def sincronizar_tags_obra(
+    session: Session, obra_id: int, antigas: set[str], novas: set[str]
+) -> None:
+    """Ajusta ``obra_tags`` e as contagens à troca de tags de uma obra.
+
+    As contagens são incrementadas no próprio banco, então escritas
+    concorrentes com a mesma tag não perdem atualizações. Não faz commit.
+
+    Args:
+        session: Sessão do banco de dados.
+        obra_id: ID da obra alterada.
+        antigas: Tags normalizadas antes da escrita.
+        novas: Tags normalizadas depois da escrita.
+
+    """
+    # Ordenadas, as linhas de contagem são travadas sempre na mesma ordem e
+    # duas escritas concorrentes não entram em deadlock.
+    removidas = sorted(antigas - novas)
+    adicionadas = sorted(novas - antigas)
+    conexao = session.connection()
+    if removidas:
+        conexao.execute(
+            delete(ObraTagDB).where(
+                col(ObraTagDB.obra_id) == obra_id,
+                col(ObraTagDB.tag).in_(removidas),
+            )
+        )
+        _somar_contagens(session, removidas, -1)
+    if adicionadas:
+        conexao.execute(
+            insert(ObraTagDB),
+            [{"obra_id": obra_id, "tag": tag} for tag in adicionadas],
+        )
+        inserir_ignorando_conflito(
+            session,
+            TagDB.__table__,  # type: ignore[arg-type]
+            [{"nome": tag, "quantidade": 0} for tag in adicionadas],
+        )
+        _somar_contagens(session, adicionadas, 1)
+
+
+def adicionar_tags_obras(
+    session: Session, tags_por_obra: dict[int, set[str]]
+) -> None:
+    """Grava as tags de obras recém-criadas e soma as contagens.
+
+    Para um lote de obras, todas as linhas de ``obra_tags`` vão em um
+    ``executemany`` e as tags com o mesmo acréscimo são somadas em um só
+    ``UPDATE``. Não faz commit.
+
+    Args:
+        session: Sessão do banco de dados.
+        tags_por_obra: Tags normalizadas de cada obra criada.
+
+    """
+    linhas = [
+        {"obra_id": obra_id, "tag": tag}
+        for obra_id, tags in tags_por_obra.items()
+        for tag in sorted(tags)
+    ]
+    if not linhas:
+        return
+    session.connection().execute(insert(ObraTagDB), linhas)
+    contagens = Counter(linha["tag"] for linha in linhas)
+    inserir_ignorando_conflito(
+        session,
+        TagDB.__table__,  # type: ignore[arg-type]
+        [{"nome": tag, "quantidade": 0} for tag in sorted(contagens)],
+    )
+    por_acrescimo: defaultdict[int, list[str]] = defaultdict(list)
+    for tag, quantidade in sorted(contagens.items()):
+        por_acrescimo[quantidade].append(tag)
+    for acrescimo, nomes in por_acrescimo.items():
+        _somar_contagens(session, nomes, acrescimo)
+
+
+def buscar_tags_obra(obra_id: int, session: Session) -> set[str]:
+    """Busca as tags normalizadas gravadas para uma obra.
+
+    Returns:
+        set[str]: Tags da obra em ``obra_tags``.
+
+    """
+    return set(
+        session.exec(
+            select(ObraTagDB.tag).where(col(ObraTagDB.obra_id) == obra_id)
+        ).all()
+    )
+
+
+def remover_tags_obra(session: Session, obra_id: int) -> None:
+    """Apaga as tags de uma obra e desconta as contagens.
+
+    Um ``DELETE ... RETURNING`` informa quais contagens descontar, sem ler
+    a obra antes. Não faz commit.
+    """
+    removidas = (
+        session.connection()
+        .execute(
+            delete(ObraTagDB)
+            .where(col(ObraTagDB.obra_id) == obra_id)
+            .returning(col(ObraTagDB.tag))
+        )
+        .scalars()
+        .all()
+    )
+    if removidas:
+        _somar_contagens(session, sorted(removidas), -1)
+
+
+def buscar_tags(
+    session: Session, limite: int = LIMITE_PADRAO
+) -> Sequence[TagDB]:
+    """Lista as tags em uso, das mais para as menos frequentes.
+
+    Returns:
+        Sequence[TagDB]: Tags com a quantidade de obras de cada uma.
+
+    """
+    return session.exec(
+        select(TagDB)
+        .where(col(TagDB.quantidade) > 0)
+        .order_by(col(TagDB.quantidade).desc(), col(TagDB.nome))
+        .limit(limite)
+    ).all()
+
+
+def reconstruir_tags(session: Session) -> int:
+    """Regrava ``obra_tags`` e as contagens a partir de ``obras.tags``.
+
+    Corrige divergências, por exemplo obras alteradas fora da API. As tags
+    são lidas em lotes e as contagens recalculadas com um único
+    ``INSERT ... SELECT`` agrupado.
+
+    Returns:
+        int: Quantidade de tags distintas após a reconstrução.
+
+    """
+    conexao = session.connection()
+    conexao.execute(delete(ObraTagDB))
+    conexao.execute(delete(TagDB))
+
+    linhas = (
+        {"obra_id": obra_id, "tag": tag}
+        for obra_id, tags in conexao.execute(
+            select(ObraDB.id, ObraDB.tags).execution_options(
+                yield_per=LOTE_RECONSTRUCAO
+            )
+        )
+        for tag in normalizar_tags(tags or [])
+    )
+    for lote in batched(linhas, LOTE_RECONSTRUCAO):
+        conexao.execute(insert(ObraTagDB), list(lote))
+
+    resultado = conexao.execute(
+        insert(TagDB).from_select(
+            ["nome", "quantidade"],
+            select(col(ObraTagDB.tag), func.count()).group_by(
+                col(ObraTagDB.tag)
+            ),
+        )
+    )
+    session.commit()
+    return resultado.rowcount
@@ -1,42 +1,104 @@
 """Repositório para operações de usuários."""
 
-from collections.abc import Sequence
+from typing import Any
 
 from sqlmodel import Session, select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from cache import CacheEntidade, invalidar_apos_commit
+from config import settings
+from models.campos import Campos
+from models.lote import ResultadoLote
+from models.paginacao import LIMITE_PADRAO
+from models.usuario import UsuarioCreate, UsuarioDB, UsuarioResponse
+from repositories.escrita import (
+    atualizar_retornando,
+    inserir_em_lotes,
+    inserir_retornando,
+    remover_retornando,
+)
+from repositories.paginacao import Ordenacao, ResultadoPagina, paginar
+from repositories.projecao import opcoes_projecao
+
+ORDEM = Ordenacao((UsuarioDB.id,))
+# Guarda só os campos da resposta: a senha não vai para o cache.
+CACHE = CacheEntidade[UsuarioResponse](
+    "usuarios",
+    settings.cache_ttl_usuarios,
+    settings.cache_tamanho_maximo,
+    modelo=UsuarioResponse,
+)
+
+
+def buscar_usuarios(
+    session: Session,
+    cursor: str | None = None,
+    limite: int = LIMITE_PADRAO,
+    campos: Campos | None = None,
+) -> ResultadoPagina[UsuarioDB]:
+    """Lista os usuários em ordem de ID.
 
-from models.usuario import UsuarioDB
+    Args:
+        session: Sessão do banco de dados.
+        cursor: Cursor devolvido pela página anterior.
+        limite: Quantidade máxima de itens.
+        campos: Campos pedidos; as demais colunas não são lidas.
 
+    Returns:
+        ResultadoPagina[UsuarioDB]: Página e o próximo cursor.
 
-def buscar_usuarios(session: Session) -> Sequence[UsuarioDB]:
-    """Retorna todos os usuários.
+    """
+    statement = select(UsuarioDB).options(
+        *opcoes_projecao(UsuarioDB, campos, *ORDEM.colunas)
+    )
+    return paginar(session, statement, ORDEM, cursor, limite)
 
-    Args:
-        session: Sessão do banco de dados.
+
+def selecionar_usuarios(
+    campos: Campos | None = None,
+) -> SelectOfScalar[UsuarioDB]:
+    """Monta a consulta de todos os usuários na ordem da listagem.
 
     Returns:
-        Sequence[UsuarioDB]: Lista de usuários.
+        SelectOfScalar[UsuarioDB]: Consulta para ser transmitida sem paginação.
 
     """
-    return session.exec(select(UsuarioDB)).all()
+    return (
+        select(UsuarioDB)
+        .options(*opcoes_projecao(UsuarioDB, campos))
+        .order_by(*ORDEM.criterios())
+    )
 
 
 def buscar_usuario_por_id(
-    usuario_id: int, session: Session
-) -> UsuarioDB | None:
-    """Busca um usuário pelo ID.
+    usuario_id: int, session: Session, campos: Campos | None = None
+) -> UsuarioResponse | UsuarioDB | None:
+    """Busca um usuário pelo ID, passando pelo cache.
+
+    Só o usuário completo é guardado; com ``campos``, um usuário já guardado
+    é aproveitado, e o lido do banco (só com essas colunas) não é guardado.
 
     Args:
         usuario_id: ID do usuário.
         session: Sessão do banco de dados.
+        campos: Campos pedidos; as demais colunas não são lidas.
 
     Returns:
-        UsuarioDB | None: Usuário encontrado ou None.
+        UsuarioResponse | UsuarioDB | None: Usuário encontrado ou None.
 
     """
-    return session.get(UsuarioDB, usuario_id)
-
-
-def adicionar_usuario(usuario: UsuarioDB, session: Session) -> UsuarioDB:
+    if campos is None:
+        return CACHE.obter_ou_carregar(
+            usuario_id,
+            session,
+            lambda sessao: sessao.get(UsuarioDB, usuario_id),
+        )
+    return CACHE.obter(usuario_id) or session.get(
+        UsuarioDB, usuario_id, options=opcoes_projecao(UsuarioDB, campos)
+    )
+
+
+def adicionar_usuario(usuario: UsuarioCreate, session: Session) -> UsuarioDB:
     """Adiciona um novo usuário.
 
     Args:
@@ -47,34 +109,48 @@ def adicionar_usuario(usuario: UsuarioDB, session: Session) -> UsuarioDB:
         UsuarioDB: Usuário adicionado.
 
     """
-    session.add(usuario)
+    usuario_db = inserir_retornando(
+        session, UsuarioDB, usuario.model_dump(exclude_none=True)
+    )
+    invalidar_apos_commit(session, CACHE, usuario_db.id)
     session.commit()
-    session.refresh(usuario)
-    return usuario
+    return usuario_db
+
+
+def adicionar_usuarios_em_lote(
+    linhas: dict[int, dict[str, Any]], session: Session
+) -> ResultadoLote:
+    """Adiciona vários usuários em lotes de inserção.
+
+    Args:
+        linhas: Valores validados de cada usuário, por índice na requisição.
+        session: Sessão do banco de dados.
+
+    Returns:
+        ResultadoLote: Ids dos usuários criados e erros, por índice.
+
+    """
+    return inserir_em_lotes(session, UsuarioDB, linhas)
 
 
 def atualizar_usuario_bd(
-    usuario_id: int, usuario: UsuarioDB, session: Session
+    usuario_id: int, valores: dict[str, Any], session: Session
 ) -> UsuarioDB | None:
-    """Atualiza um usuário existente.
+    """Atualiza apenas as colunas enviadas de um usuário.
 
     Args:
         usuario_id: ID do usuário a ser atualizado.
-        usuario: Novos dados do usuário.
+        valores: Colunas alteradas e seus novos valores.
         session: Sessão do banco de dados.
 
     Returns:
         UsuarioDB | None: Usuário atualizado ou None.
 
     """
-    usuario_existente = session.get(UsuarioDB, usuario_id)
-    if not usuario_existente:
-        return None
-    usuario_existente.nome = usuario.nome
-    usuario_existente.email = usuario.email
+    usuario = atualizar_retornando(session, UsuarioDB, usuario_id, valores)
+    invalidar_apos_commit(session, CACHE, usuario_id)
     session.commit()
-    session.refresh(usuario_existente)
-    return usuario_existente
+    return usuario
 
 
 def remover_usuario(usuario_id: int, session: Session) -> UsuarioDB | None:
@@ -88,9 +164,7 @@ def remover_usuario(usuario_id: int, session: Session) -> UsuarioDB | None:
         UsuarioDB | None: Usuário removido ou None.
 
     """
-    usuario_existente = buscar_usuario_por_id(usuario_id, session)
-    if not usuario_existente:
-        return None
-    session.delete(usuario_existente)
+    usuario = remover_retornando(session, UsuarioDB, usuario_id)
+    invalidar_apos_commit(session, CACHE, usuario_id)
     session.commit()
-    return usuario_existente
+    return usuario
@@ -2,15 +2,17 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException
 
-from database import get_session
+from database import SessaoBanco, executar, obter_sessao
 from models.avaliacoes_eventos import (
+    AvaliacaoEventoAtualizacao,
     AvaliacaoEventoCreate,
     AvaliacaoEventoDB,
     AvaliacaoEventoResponse,
+    ResumoAvaliacoes,
 )
+from models.paginacao import Pagina, ParametrosPaginacao
 from repositories.avaliacoes_eventos import (
     adicionar_avaliacao,
     atualizar_avaliacao,
@@ -18,30 +20,40 @@ from repositories.avaliacoes_eventos import (
     buscar_avaliacoes,
     buscar_avaliacoes_por_evento,
     buscar_avaliacoes_por_usuario,
+    buscar_resumo_avaliacoes,
     remover_avaliacao,
 )
 
 rota = APIRouter(prefix="/avaliacoes", tags=["avaliacoes"])
 
-SessionInjetada = Annotated[Session, Depends(get_session)]
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+PaginacaoInjetada = Annotated[ParametrosPaginacao, Depends()]
 
 
 @rota.get("/")
-def obter_avaliacoes(
-    session: SessionInjetada,
-) -> list[AvaliacaoEventoResponse]:
-    """Recupera todas as avaliações de eventos do banco de dados.
+async def obter_avaliacoes(
+    session: SessionInjetada, paginacao: PaginacaoInjetada
+) -> Pagina[AvaliacaoEventoResponse]:
+    """Recupera uma página de avaliações de eventos do banco de dados.
 
     Returns:
-        list[AvaliacaoEventoResponse]: Lista de avaliações.
+        Pagina[AvaliacaoEventoResponse]: Página e o cursor da próxima.
 
     """
-    avaliacoes_list = buscar_avaliacoes(session)
-    return list(map(AvaliacaoEventoResponse.model_validate, avaliacoes_list))
+    pagina = await executar(
+        session,
+        buscar_avaliacoes,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+    )
+    return Pagina(
+        itens=list(map(AvaliacaoEventoResponse.model_validate, pagina.itens)),
+        proximo_cursor=pagina.proximo_cursor,
+    )
 
 
 @rota.get("/{avaliacao_id}")
-def ler_avaliacao(
+async def ler_avaliacao(
     avaliacao_id: int, session: SessionInjetada
 ) -> AvaliacaoEventoResponse | None:
     """Recupera uma avaliação específica pelo seu ID.
@@ -50,7 +62,7 @@ def ler_avaliacao(
         AvaliacaoEventoResponse | None: Avaliação encontrada ou None.
 
     """
-    avaliacao = buscar_avaliacao_por_id(avaliacao_id, session)
+    avaliacao = await executar(session, buscar_avaliacao_por_id, avaliacao_id)
     return (
         AvaliacaoEventoResponse.model_validate(avaliacao)
         if avaliacao
@@ -59,7 +71,7 @@ def ler_avaliacao(
 
 
 @rota.get("/evento/{evento_id}")
-def obter_avaliacoes_por_evento(
+async def obter_avaliacoes_por_evento(
     evento_id: int, session: SessionInjetada
 ) -> list[AvaliacaoEventoResponse]:
     """Recupera todas as avaliações de um evento específico.
@@ -68,12 +80,32 @@ def obter_avaliacoes_por_evento(
         list[AvaliacaoEventoResponse]: Lista de avaliações do evento.
 
     """
-    avaliacoes_list = buscar_avaliacoes_por_evento(evento_id, session)
+    avaliacoes_list = await executar(
+        session, buscar_avaliacoes_por_evento, evento_id
+    )
     return list(map(AvaliacaoEventoResponse.model_validate, avaliacoes_list))
 
 
+@rota.get("/evento/{evento_id}/resumo")
+async def obter_resumo_avaliacoes(
+    evento_id: int, session: SessionInjetada
+) -> ResumoAvaliacoes:
+    """Recupera o resumo das avaliações de um evento.
+
+    O resumo é mantido a cada escrita de avaliação, então a leitura é uma
+    busca por chave primária, sem percorrer as avaliações.
+
+    Returns:
+        ResumoAvaliacoes: Quantidade, soma, média, histograma de notas e
+            total de respostas positivas em ``gostou``.
+
+    """
+    resumo = await executar(session, buscar_resumo_avaliacoes, evento_id)
+    return ResumoAvaliacoes.model_validate(resumo or ResumoAvaliacoes())
+
+
 @rota.get("/usuario/{usuario_id}")
-def obter_avaliacoes_por_usuario(
+async def obter_avaliacoes_por_usuario(
     usuario_id: int, session: SessionInjetada
 ) -> list[AvaliacaoEventoResponse]:
     """Recupera todas as avaliações de um usuário específico.
@@ -82,12 +114,14 @@ def obter_avaliacoes_por_usuario(
         list[AvaliacaoEventoResponse]: Lista de avaliações do usuário.
 
     """
-    avaliacoes_list = buscar_avaliacoes_por_usuario(usuario_id, session)
+    avaliacoes_list = await executar(
+        session, buscar_avaliacoes_por_usuario, usuario_id
+    )
     return list(map(AvaliacaoEventoResponse.model_validate, avaliacoes_list))
 
 
 @rota.post("/")
-def criar_avaliacao(
+async def criar_avaliacao(
     avaliacao: AvaliacaoEventoCreate, session: SessionInjetada
 ) -> AvaliacaoEventoResponse:
     """Cria uma nova avaliação de evento no banco de dados.
@@ -98,35 +132,66 @@ def criar_avaliacao(
     """
     avaliacao_db = AvaliacaoEventoDB.model_validate(avaliacao)
     return AvaliacaoEventoResponse.model_validate(
-        adicionar_avaliacao(avaliacao_db, session)
+        await executar(session, adicionar_avaliacao, avaliacao_db)
     )
 
 
 @rota.put("/{avaliacao_id}")
-def atualizar_avaliacao_router(
+async def atualizar_avaliacao_router(
     avaliacao_id: int,
     avaliacao: AvaliacaoEventoCreate,
     session: SessionInjetada,
-) -> AvaliacaoEventoResponse | None:
+) -> AvaliacaoEventoResponse:
     """Atualiza os dados de uma avaliação existente.
 
     Returns:
-        AvaliacaoEventoResponse | None: Avaliação atualizada ou None.
+        AvaliacaoEventoResponse: Avaliação atualizada.
+
+    Raises:
+        HTTPException: Se a avaliação não for encontrada (status 404).
 
     """
-    avaliacao_db = AvaliacaoEventoDB.model_validate(avaliacao)
-    avaliacao_atualizada = atualizar_avaliacao(
-        avaliacao_id, avaliacao_db, session
+    avaliacao_atualizada = await executar(
+        session,
+        atualizar_avaliacao,
+        avaliacao_id,
+        avaliacao.model_dump(exclude_unset=True),
     )
-    return (
-        AvaliacaoEventoResponse.model_validate(avaliacao_atualizada)
-        if avaliacao_atualizada
-        else None
+    if not avaliacao_atualizada:
+        raise HTTPException(status_code=404, detail="Avaliação não encontrada")
+    return AvaliacaoEventoResponse.model_validate(avaliacao_atualizada)
+
+
+@rota.patch("/{avaliacao_id}")
+async def alterar_avaliacao(
+    avaliacao_id: int,
+    avaliacao: AvaliacaoEventoAtualizacao,
+    session: SessionInjetada,
+) -> AvaliacaoEventoResponse:
+    """Altera apenas os campos enviados de uma avaliação.
+
+    Campos ausentes ou nulos mantêm o valor gravado.
+
+    Returns:
+        AvaliacaoEventoResponse: Avaliação alterada.
+
+    Raises:
+        HTTPException: Se a avaliação não for encontrada (status 404).
+
+    """
+    avaliacao_alterada = await executar(
+        session,
+        atualizar_avaliacao,
+        avaliacao_id,
+        avaliacao.model_dump(exclude_unset=True, exclude_none=True),
     )
+    if not avaliacao_alterada:
+        raise HTTPException(status_code=404, detail="Avaliação não encontrada")
+    return AvaliacaoEventoResponse.model_validate(avaliacao_alterada)
 
 
 @rota.delete("/{avaliacao_id}")
-def excluir_avaliacao(
+async def excluir_avaliacao(
     avaliacao_id: int, session: SessionInjetada
 ) -> AvaliacaoEventoResponse | None:
     """Remove uma avaliação do banco de dados.
@@ -135,7 +200,9 @@ def excluir_avaliacao(
         AvaliacaoEventoResponse | None: Avaliação removida ou None.
 
     """
-    avaliacao_removida = remover_avaliacao(avaliacao_id, session)
+    avaliacao_removida = await executar(
+        session, remover_avaliacao, avaliacao_id
+    )
     return (
         AvaliacaoEventoResponse.model_validate(avaliacao_removida)
         if avaliacao_removida
@@ -2,11 +2,16 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
-
-from database import get_session
-from models.categoria import CategoriaCreate, CategoriaDB, CategoriaResponse
+from fastapi import APIRouter, Depends, HTTPException
+
+from database import SessaoBanco, executar, obter_sessao
+from models.categoria import (
+    CategoriaAtualizacao,
+    CategoriaCreate,
+    CategoriaDB,
+    CategoriaResponse,
+)
+from models.paginacao import Pagina, ParametrosPaginacao
 from repositories.categoria import (
     adicionar_categoria,
     atualizar_categoria_bd,
@@ -18,23 +23,34 @@ from repositories.categoria import (
 rota = APIRouter(prefix="/categorias", tags=["categorias"])
 
 
-SessionInjetada = Annotated[Session, Depends(get_session)]
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+PaginacaoInjetada = Annotated[ParametrosPaginacao, Depends()]
 
 
 @rota.get("/")
-def obter_categorias(session: SessionInjetada) -> list[CategoriaResponse]:
-    """Recupera todas as categorias do banco de dados.
+async def obter_categorias(
+    session: SessionInjetada, paginacao: PaginacaoInjetada
+) -> Pagina[CategoriaResponse]:
+    """Recupera uma página de categorias do banco de dados.
 
     Returns:
-        list[CategoriaResponse]: Lista de categorias.
+        Pagina[CategoriaResponse]: Página e o cursor da próxima.
 
     """
-    categorias_list = buscar_categorias(session)
-    return list(map(CategoriaResponse.model_validate, categorias_list))
+    pagina = await executar(
+        session,
+        buscar_categorias,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+    )
+    return Pagina(
+        itens=list(map(CategoriaResponse.model_validate, pagina.itens)),
+        proximo_cursor=pagina.proximo_cursor,
+    )
 
 
 @rota.get("/{categoria_id}")
-def ler_categoria(
+async def ler_categoria(
     categoria_id: int, session: SessionInjetada
 ) -> CategoriaResponse | None:
     """Recupera uma categoria específica pelo seu ID.
@@ -43,12 +59,12 @@ def ler_categoria(
         CategoriaResponse | None: Categoria encontrada ou None se não existir.
 
     """
-    categoria = buscar_categoria_por_id(categoria_id, session)
+    categoria = await executar(session, buscar_categoria_por_id, categoria_id)
     return CategoriaResponse.model_validate(categoria) if categoria else None
 
 
 @rota.post("/")
-def criar_categoria(
+async def criar_categoria(
     categoria: CategoriaCreate, session: SessionInjetada
 ) -> CategoriaResponse:
     """Cria uma nova categoria no banco de dados.
@@ -59,12 +75,12 @@ def criar_categoria(
     """
     categoria_db = CategoriaDB.model_validate(categoria)
     return CategoriaResponse.model_validate(
-        adicionar_categoria(categoria_db, session)
+        await executar(session, adicionar_categoria, categoria_db)
     )
 
 
 @rota.put("/{categoria_id}")
-def atualizar_categoria(
+async def atualizar_categoria(
     categoria_id: int, categoria: CategoriaCreate, session: SessionInjetada
 ) -> CategoriaResponse | None:
     """Atualiza os dados de uma categoria existente.
@@ -73,15 +89,45 @@ def atualizar_categoria(
         CategoriaResponse | None: Categoria atualizada ou None se não existir.
 
     """
-    categoria_db = CategoriaDB.model_validate(categoria)
-    categoria_atualizada = atualizar_categoria_bd(
-        categoria_id, categoria_db, session
+    categoria_atualizada = await executar(
+        session,
+        atualizar_categoria_bd,
+        categoria_id,
+        categoria.model_dump(exclude_unset=True),
     )
     return CategoriaResponse.model_validate(categoria_atualizada)
 
 
+@rota.patch("/{categoria_id}")
+async def alterar_categoria(
+    categoria_id: int,
+    categoria: CategoriaAtualizacao,
+    session: SessionInjetada,
+) -> CategoriaResponse:
+    """Altera apenas os campos enviados de uma categoria.
+
+    Campos ausentes ou nulos mantêm o valor gravado.
+
+    Returns:
+        CategoriaResponse: Categoria alterada.
+
+    Raises:
+        HTTPException: Se a categoria não for encontrada (status 404).
+
+    """
+    categoria_alterada = await executar(
+        session,
+        atualizar_categoria_bd,
+        categoria_id,
+        categoria.model_dump(exclude_unset=True, exclude_none=True),
+    )
+    if not categoria_alterada:
+        raise HTTPException(status_code=404, detail="Categoria não encontrada")
+    return CategoriaResponse.model_validate(categoria_alterada)
+
+
 @rota.delete("/{categoria_id}")
-def excluir_categoria(
+async def excluir_categoria(
     categoria_id: int, session: SessionInjetada
 ) -> CategoriaResponse | None:
     """Remove uma categoria do banco de dados.
@@ -90,5 +136,7 @@ def excluir_categoria(
         CategoriaResponse | None: Categoria removida ou None se não existir.
 
     """
-    categoria_removida = remover_categoria(categoria_id, session)
+    categoria_removida = await executar(
+        session, remover_categoria, categoria_id
+    )
     return CategoriaResponse.model_validate(categoria_removida)
@@ -2,15 +2,16 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException
 
-from database import get_session
+from database import SessaoBanco, executar, obter_sessao
 from models.comentario_evento import (
+    ComentarioEventoAtualizacao,
     ComentarioEventoCreate,
     ComentarioEventoDB,
     ComentarioEventoResponse,
 )
+from models.paginacao import Pagina, ParametrosPaginacao
 from repositories.comentario_evento import (
     adicionar_comentario,
     atualizar_comentario,
@@ -23,25 +24,34 @@ from repositories.comentario_evento import (
 
 rota = APIRouter(prefix="/comentarios", tags=["comentarios"])
 
-SessionInjetada = Annotated[Session, Depends(get_session)]
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+PaginacaoInjetada = Annotated[ParametrosPaginacao, Depends()]
 
 
 @rota.get("/")
-def obter_comentarios(
-    session: SessionInjetada,
-) -> list[ComentarioEventoResponse]:
-    """Recupera todos os comentários do banco de dados.
+async def obter_comentarios(
+    session: SessionInjetada, paginacao: PaginacaoInjetada
+) -> Pagina[ComentarioEventoResponse]:
+    """Recupera uma página de comentários do banco de dados.
 
     Returns:
-        list[ComentarioEventoResponse]: Lista de comentários.
+        Pagina[ComentarioEventoResponse]: Página e o cursor da próxima.
 
     """
-    comentarios_list = buscar_comentarios(session)
-    return list(map(ComentarioEventoResponse.model_validate, comentarios_list))
+    pagina = await executar(
+        session,
+        buscar_comentarios,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+    )
+    return Pagina(
+        itens=list(map(ComentarioEventoResponse.model_validate, pagina.itens)),
+        proximo_cursor=pagina.proximo_cursor,
+    )
 
 
 @rota.get("/{comentario_id}")
-def ler_comentario(
+async def ler_comentario(
     comentario_id: int, session: SessionInjetada
 ) -> ComentarioEventoResponse | None:
     """Recupera um comentário específico pelo seu ID.
@@ -50,7 +60,9 @@ def ler_comentario(
         ComentarioEventoResponse | None: Comentário encontrado ou None.
 
     """
-    comentario = buscar_comentario_por_id(comentario_id, session)
+    comentario = await executar(
+        session, buscar_comentario_por_id, comentario_id
+    )
     return (
         ComentarioEventoResponse.model_validate(comentario)
         if comentario
@@ -59,7 +71,7 @@ def ler_comentario(
 
 
 @rota.get("/evento/{evento_id}")
-def obter_comentarios_por_evento(
+async def obter_comentarios_por_evento(
     evento_id: int, session: SessionInjetada
 ) -> list[ComentarioEventoResponse]:
     """Recupera todos os comentários de um evento específico.
@@ -68,12 +80,14 @@ def obter_comentarios_por_evento(
         list[ComentarioEventoResponse]: Lista de comentários do evento.
 
     """
-    comentarios_list = buscar_comentarios_por_evento(evento_id, session)
+    comentarios_list = await executar(
+        session, buscar_comentarios_por_evento, evento_id
+    )
     return list(map(ComentarioEventoResponse.model_validate, comentarios_list))
 
 
 @rota.get("/usuario/{usuario_id}")
-def obter_comentarios_por_usuario(
+async def obter_comentarios_por_usuario(
     usuario_id: int, session: SessionInjetada
 ) -> list[ComentarioEventoResponse]:
     """Recupera todos os comentários de um usuário específico.
@@ -82,12 +96,14 @@ def obter_comentarios_por_usuario(
         list[ComentarioEventoResponse]: Lista de comentários do usuário.
 
     """
-    comentarios_list = buscar_comentarios_por_usuario(usuario_id, session)
+    comentarios_list = await executar(
+        session, buscar_comentarios_por_usuario, usuario_id
+    )
     return list(map(ComentarioEventoResponse.model_validate, comentarios_list))
 
 
 @rota.post("/")
-def criar_comentario(
+async def criar_comentario(
     comentario: ComentarioEventoCreate, session: SessionInjetada
 ) -> ComentarioEventoResponse:
     """Cria um novo comentário no banco de dados.
@@ -98,12 +114,12 @@ def criar_comentario(
     """
     comentario_db = ComentarioEventoDB.model_validate(comentario)
     return ComentarioEventoResponse.model_validate(
-        adicionar_comentario(comentario_db, session)
+        await executar(session, adicionar_comentario, comentario_db)
     )
 
 
 @rota.put("/{comentario_id}")
-def atualizar_comentario_router(
+async def atualizar_comentario_router(
     comentario_id: int,
     comentario: ComentarioEventoCreate,
     session: SessionInjetada,
@@ -114,15 +130,47 @@ def atualizar_comentario_router(
         ComentarioEventoResponse | None: Comentário atualizado ou None.
 
     """
-    comentario_db = ComentarioEventoDB.model_validate(comentario)
-    comentario_atualizado = atualizar_comentario(
-        comentario_id, comentario_db, session
+    comentario_atualizado = await executar(
+        session,
+        atualizar_comentario,
+        comentario_id,
+        comentario.model_dump(exclude_unset=True),
     )
     return ComentarioEventoResponse.model_validate(comentario_atualizado)
 
 
+@rota.patch("/{comentario_id}")
+async def alterar_comentario(
+    comentario_id: int,
+    comentario: ComentarioEventoAtualizacao,
+    session: SessionInjetada,
+) -> ComentarioEventoResponse:
+    """Altera apenas os campos enviados de um comentário.
+
+    Campos ausentes ou nulos mantêm o valor gravado.
+
+    Returns:
+        ComentarioEventoResponse: Comentário alterado.
+
+    Raises:
+        HTTPException: Se o comentário não for encontrado (status 404).
+
+    """
+    comentario_alterado = await executar(
+        session,
+        atualizar_comentario,
+        comentario_id,
+        comentario.model_dump(exclude_unset=True, exclude_none=True),
+    )
+    if not comentario_alterado:
+        raise HTTPException(
+            status_code=404, detail="Comentário não encontrado"
+        )
+    return ComentarioEventoResponse.model_validate(comentario_alterado)
+
+
 @rota.delete("/{comentario_id}")
-def excluir_comentario(
+async def excluir_comentario(
     comentario_id: int, session: SessionInjetada
 ) -> ComentarioEventoResponse | None:
     """Remove um comentário do banco de dados.
@@ -131,5 +179,7 @@ def excluir_comentario(
         ComentarioEventoResponse | None: Comentário removido ou None.
 
     """
-    comentario_removido = remover_comentario(comentario_id, session)
+    comentario_removido = await executar(
+        session, remover_comentario, comentario_id
+    )
     return ComentarioEventoResponse.model_validate(comentario_removido)
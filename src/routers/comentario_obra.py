@@ -2,17 +2,20 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException
 
-from database import get_session
+from database import SessaoBanco, executar, obter_sessao
 from models.comentario_obra import (
+    ComentarioObraAtualizacao,
     ComentarioObraCreate,
     ComentarioObraDB,
     ComentarioObraResponse,
 )
+from models.lote import CorpoLote, ResultadoLote, validar_lote
+from models.paginacao import Pagina, ParametrosPaginacao
 from repositories.comentario_obra import (
     adicionar_comentario_obra,
+    adicionar_comentarios_obra_em_lote,
     atualizar_comentario_obra_bd,
     buscar_comentario_obra_por_id,
     buscar_comentarios_obras,
@@ -22,25 +25,34 @@ from repositories.comentario_obra import (
 rota = APIRouter(prefix="/comentarios_obra", tags=["comentarios_obra"])
 
 
-SessionInjetada = Annotated[Session, Depends(get_session)]
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+PaginacaoInjetada = Annotated[ParametrosPaginacao, Depends()]
 
 
 @rota.get("/")
-def obter_comentarios_obras(
-    session: SessionInjetada,
-) -> list[ComentarioObraResponse]:
-    """Recupera todos os comentários de obras do banco de dados.
+async def obter_comentarios_obras(
+    session: SessionInjetada, paginacao: PaginacaoInjetada
+) -> Pagina[ComentarioObraResponse]:
+    """Recupera uma página de comentários de obras do banco de dados.
 
     Returns:
-        list[ComentarioObraResponse]: Lista de comentários de obras.
+        Pagina[ComentarioObraResponse]: Página e o cursor da próxima.
 
     """
-    comentarios_list = buscar_comentarios_obras(session)
-    return list(map(ComentarioObraResponse.model_validate, comentarios_list))
+    pagina = await executar(
+        session,
+        buscar_comentarios_obras,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+    )
+    return Pagina(
+        itens=list(map(ComentarioObraResponse.model_validate, pagina.itens)),
+        proximo_cursor=pagina.proximo_cursor,
+    )
 
 
 @rota.get("/{comentario_obra_id}")
-def ler_comentario_obra(
+async def ler_comentario_obra(
     comentario_obra_id: int, session: SessionInjetada
 ) -> ComentarioObraResponse | None:
     """Recupera um comentário de obra específico pelo seu ID.
@@ -49,8 +61,8 @@ def ler_comentario_obra(
         ComentarioObraResponse | None: Comentário encontrado ou None.
 
     """
-    comentario_obra = buscar_comentario_obra_por_id(
-        comentario_obra_id, session
+    comentario_obra = await executar(
+        session, buscar_comentario_obra_por_id, comentario_obra_id
     )
     return (
         ComentarioObraResponse.model_validate(comentario_obra)
@@ -60,7 +72,7 @@ def ler_comentario_obra(
 
 
 @rota.post("/")
-def criar_comentario_obra(
+async def criar_comentario_obra(
     comentario_obra: ComentarioObraCreate, session: SessionInjetada
 ) -> ComentarioObraResponse:
     """Cria um novo comentário em uma obra no banco de dados.
@@ -71,12 +83,33 @@ def criar_comentario_obra(
     """
     comentario_obra_db = ComentarioObraDB.model_validate(comentario_obra)
     return ComentarioObraResponse.model_validate(
-        adicionar_comentario_obra(comentario_obra_db, session)
+        await executar(session, adicionar_comentario_obra, comentario_obra_db)
+    )
+
+
+@rota.post("/bulk")
+async def criar_comentarios_obra_em_lote(
+    comentarios_obra: CorpoLote, session: SessionInjetada
+) -> ResultadoLote:
+    """Cria vários comentários de obras de uma vez, em lotes de inserção.
+
+    Cada item é validado separadamente: itens inválidos voltam em ``erros``
+    com o índice na lista enviada, sem impedir a criação dos demais.
+    Comentários de usuário ou obra inexistente também voltam como erro.
+
+    Returns:
+        ResultadoLote: Ids criados e erros, por índice.
+
+    """
+    linhas, erros = validar_lote(ComentarioObraCreate, comentarios_obra)
+    resultado = await executar(
+        session, adicionar_comentarios_obra_em_lote, linhas=linhas
     )
+    return resultado.com_erros(erros)
 
 
 @rota.put("/{comentario_obra_id}")
-def atualizar_comentario_obra(
+async def atualizar_comentario_obra(
     comentario_obra_id: int,
     comentario_obra: ComentarioObraCreate,
     session: SessionInjetada,
@@ -87,9 +120,11 @@ def atualizar_comentario_obra(
         ComentarioObraResponse | None: Comentário atualizado ou None.
 
     """
-    comentario_obra_db = ComentarioObraDB.model_validate(comentario_obra)
-    comentario_obra_atualizado = atualizar_comentario_obra_bd(
-        comentario_obra_id, comentario_obra_db, session
+    comentario_obra_atualizado = await executar(
+        session,
+        atualizar_comentario_obra_bd,
+        comentario_obra_id,
+        comentario_obra.model_dump(exclude_unset=True),
     )
     return (
         ComentarioObraResponse.model_validate(comentario_obra_atualizado)
@@ -98,8 +133,38 @@ def atualizar_comentario_obra(
     )
 
 
+@rota.patch("/{comentario_obra_id}")
+async def alterar_comentario_obra(
+    comentario_obra_id: int,
+    comentario_obra: ComentarioObraAtualizacao,
+    session: SessionInjetada,
+) -> ComentarioObraResponse:
+    """Altera apenas os campos enviados de um comentário de obra.
+
+    Campos ausentes ou nulos mantêm o valor gravado.
+
+    Returns:
+        ComentarioObraResponse: Comentário de obra alterado.
+
+    Raises:
+        HTTPException: Se o comentário de obra não for encontrado (status 404).
+
+    """
+    comentario_obra_alterado = await executar(
+        session,
+        atualizar_comentario_obra_bd,
+        comentario_obra_id,
+        comentario_obra.model_dump(exclude_unset=True, exclude_none=True),
+    )
+    if not comentario_obra_alterado:
+        raise HTTPException(
+            status_code=404, detail="Comentário não encontrado"
+        )
+    return ComentarioObraResponse.model_validate(comentario_obra_alterado)
+
+
 @rota.delete("/{comentario_obra_id}")
-def excluir_comentario_obra(
+async def excluir_comentario_obra(
     comentario_obra_id: int, session: SessionInjetada
 ) -> ComentarioObraResponse | None:
     """Remove um comentário de obra do banco de dados.
@@ -108,7 +173,7 @@ def excluir_comentario_obra(
         ComentarioObraResponse | None: Comentário removido ou None.
 
     """
-    comentario_obra_removido = remover_comentario_obra(
-        comentario_obra_id, session
+    comentario_obra_removido = await executar(
+        session, remover_comentario_obra, comentario_obra_id
     )
     return ComentarioObraResponse.model_validate(comentario_obra_removido)
@@ -1,105 +1,312 @@
 """Rotas para gerenciamento de eventos."""
 
-from collections.abc import Sequence
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
-from database import get_session
-from models.evento import EventoCreate, EventoDB, EventoResponse
+from coalescencia import Coalescedor, executar_coalescido
+from condicional import (
+    Validadores,
+    cabecalhos_registro,
+    condicional,
+    nao_modificado,
+    resposta_nao_modificada,
+)
+from config import settings
+from database import SessaoBanco, executar, obter_sessao, transmitir
+from models.campos import Campos, campos_da_resposta, modelo_parcial
+from models.comentario_evento import ComentarioEventoResponse
+from models.evento import (
+    EventoAtualizacao,
+    EventoCompleto,
+    EventoCreate,
+    EventoResponse,
+)
+from models.obra import ObraResponse
+from models.paginacao import Pagina, ParametrosPaginacao
+from models.usuario import UsuarioResponse
 from repositories.evento import (
     adicionar_evento,
     atualizar_evento_bd,
+    buscar_evento_completo,
     buscar_evento_por_id,
     buscar_eventos,
     buscar_eventos_por_obra,
+    buscar_versao_evento,
     remover_evento,
+    selecionar_eventos,
 )
+from serializacao import RespostaJSON, construir
+from streaming import RESPOSTA_NDJSON, modo_streaming, resposta_ndjson
 
 rota = APIRouter(prefix="/eventos", tags=["eventos"])
+COALESCEDOR = Coalescedor("eventos", settings.coalescencia_timeout)
+
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+PaginacaoInjetada = Annotated[ParametrosPaginacao, Depends()]
+StreamingInjetado = Annotated[bool, Depends(modo_streaming)]
+CamposInjetados = Annotated[
+    Campos | None, Depends(campos_da_resposta(EventoResponse))
+]
 
-SessionInjetada = Annotated[Session, Depends(get_session)]
 
+@rota.get(
+    "/", response_model=Pagina[EventoResponse], responses=RESPOSTA_NDJSON
+)
+async def obter_eventos(
+    request: Request,
+    session: SessionInjetada,
+    paginacao: PaginacaoInjetada,
+    streaming: StreamingInjetado,
+    campos: CamposInjetados,
+) -> Response:
+    """Recupera uma página de eventos ou transmite todos em NDJSON.
 
-@rota.get("/")
-def obter_eventos(session: SessionInjetada) -> list[EventoResponse]:
-    """Recupera todos os eventos do banco de dados.
+    Com ``?fields=`` os itens trazem só os campos pedidos. Com
+    ``If-None-Match`` igual ao ETag da página, responde 304 sem serializá-la.
 
     Returns:
-        list[EventoResponse]: Lista de eventos.
+        Response: Página e o cursor da próxima ou, em modo streaming, todos
+            os registros.
 
     """
-    eventos_list = buscar_eventos(session)
-    return list(map(EventoResponse.model_validate, eventos_list))
+    modelo = (
+        EventoResponse
+        if campos is None
+        else modelo_parcial(EventoResponse, campos)
+    )
+    if streaming:
+        return resposta_ndjson(
+            transmitir(request, selecionar_eventos(campos)), modelo
+        )
+    pagina = await executar(
+        session,
+        buscar_eventos,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+        campos=campos,
+    )
+    validadores = Validadores.da_pagina(
+        pagina.itens, pagina.proximo_cursor, campos and sorted(campos)
+    )
+    if nao_modificado(request, validadores):
+        return resposta_nao_modificada(validadores)
+    return RespostaJSON(
+        Pagina[modelo].model_construct(
+            itens=[construir(modelo, evento) for evento in pagina.itens],
+            proximo_cursor=pagina.proximo_cursor,
+        ),
+        headers=validadores.cabecalhos(),
+    )
 
 
-@rota.get("/{evento_id}")
-def ler_evento(
-    evento_id: int, session: SessionInjetada
-) -> EventoResponse | None:
+@rota.get("/{evento_id}", response_model=EventoResponse | None)
+async def ler_evento(
+    evento_id: int,
+    request: Request,
+    session: SessionInjetada,
+    campos: CamposInjetados,
+) -> Response:
     """Recupera um evento específico pelo seu ID.
 
+    Leituras simultâneas do mesmo evento compartilham uma consulta. Com
+    ``If-None-Match`` ou ``If-Modified-Since`` ainda válidos, responde 304
+    depois de consultar só a versão do evento.
+
     Returns:
-        EventoResponse | None: Evento encontrado ou None se não existir.
+        Response: Evento encontrado, só com os campos de ``?fields=`` se
+            enviado, ou None se não existir.
 
     """
-    evento = buscar_evento_por_id(evento_id, session)
-    return EventoResponse.model_validate(evento) if evento else None
+    if condicional(request):
+        versao = await executar(session, buscar_versao_evento, evento_id)
+        if versao is not None:
+            validadores = Validadores.do_registro(evento_id, versao, campos)
+            if nao_modificado(request, validadores):
+                return resposta_nao_modificada(validadores)
+    evento = await executar_coalescido(
+        COALESCEDOR,
+        request,
+        session,
+        buscar_evento_por_id,
+        evento_id,
+        campos=campos,
+    )
+    modelo = (
+        EventoResponse
+        if campos is None
+        else modelo_parcial(EventoResponse, campos)
+    )
+    return RespostaJSON(
+        evento and construir(modelo, evento),
+        headers=cabecalhos_registro(evento, campos),
+    )
+
 
+@rota.get("/{evento_id}/completo", response_model=EventoCompleto)
+async def ler_evento_completo(
+    evento_id: int,
+    session: SessionInjetada,
+    paginacao: PaginacaoInjetada,
+    comentarios: Annotated[
+        int, Query(ge=0, le=50, description="Comentários recentes.")
+    ] = 10,
+) -> Response:
+    """Recupera tudo o que a página de um evento exibe em uma requisição.
+
+    Returns:
+        Response: Evento com organizador, responsável, resumo das
+            avaliações, uma página de obras e os comentários ativos
+            recentes.
+
+    Raises:
+        HTTPException: Se o evento não for encontrado (status 404).
+
+    """
+    dados = await executar(
+        session,
+        buscar_evento_completo,
+        evento_id,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+        limite_comentarios=comentarios,
+    )
+    if dados is None:
+        raise HTTPException(status_code=404, detail="Evento não encontrado")
+    evento = dados.evento
+    return RespostaJSON(
+        EventoCompleto.model_construct(
+            **dict(construir(EventoResponse, evento)),
+            nome=evento.nome,
+            organizador=construir(UsuarioResponse, evento.organizador),
+            responsavel=construir(UsuarioResponse, evento.responsavel),
+            obras=Pagina[ObraResponse].model_construct(
+                itens=dados.obras.itens,
+                proximo_cursor=dados.obras.proximo_cursor,
+            ),
+            comentarios_recentes=[
+                construir(ComentarioEventoResponse, comentario)
+                for comentario in dados.comentarios_recentes
+            ],
+        ),
+        tipo=EventoCompleto,
+    )
 
-@rota.post("/")
-def criar_evento(
-    evento: EventoCreate, session: SessionInjetada
-) -> EventoResponse:
+
+@rota.post("/", response_model=EventoResponse)
+async def criar_evento(
+    evento: EventoCreate, session: SessionInjetada, response: Response
+) -> Response:
     """Cria um novo evento no banco de dados.
 
     Returns:
-        EventoResponse: Dados do evento criado.
+        Response: Dados do evento criado.
 
     """
-    evento_db = EventoDB.model_validate(evento)
-    return EventoResponse.model_validate(adicionar_evento(evento_db, session))
+    evento_db = await executar(session, adicionar_evento, evento)
+    return RespostaJSON(construir(EventoResponse, evento_db), origem=response)
 
 
-@rota.put("/{evento_id}")
-def atualizar_evento(
-    evento_id: int, evento: EventoCreate, session: SessionInjetada
-) -> EventoResponse | None:
+@rota.put("/{evento_id}", response_model=EventoResponse | None)
+async def atualizar_evento(
+    evento_id: int,
+    evento: EventoCreate,
+    session: SessionInjetada,
+    response: Response,
+) -> Response:
     """Atualiza os dados de um evento existente.
 
     Returns:
-        EventoResponse | None: Evento atualizado ou None se não existir.
+        Response: Evento atualizado ou None se não existir.
+
+    """
+    evento_atualizado = await executar(
+        session,
+        atualizar_evento_bd,
+        evento_id,
+        evento.model_dump(exclude_unset=True),
+    )
+    return RespostaJSON(
+        evento_atualizado and construir(EventoResponse, evento_atualizado),
+        origem=response,
+    )
+
+
+@rota.patch("/{evento_id}", response_model=EventoResponse)
+async def alterar_evento(
+    evento_id: int,
+    evento: EventoAtualizacao,
+    session: SessionInjetada,
+    response: Response,
+) -> Response:
+    """Altera apenas os campos enviados de um evento.
+
+    Campos ausentes ou nulos mantêm o valor gravado.
+
+    Returns:
+        Response: Evento alterado.
+
+    Raises:
+        HTTPException: Se o evento não for encontrado (status 404).
 
     """
-    evento_db = EventoDB.model_validate(evento)
-    evento_atualizado = atualizar_evento_bd(evento_id, evento_db, session)
-    return EventoResponse.model_validate(evento_atualizado)
+    evento_alterado = await executar(
+        session,
+        atualizar_evento_bd,
+        evento_id,
+        evento.model_dump(exclude_unset=True, exclude_none=True),
+    )
+    if not evento_alterado:
+        raise HTTPException(status_code=404, detail="Evento não encontrado")
+    return RespostaJSON(
+        construir(EventoResponse, evento_alterado), origem=response
+    )
 
 
-@rota.delete("/{evento_id}")
-def excluir_evento(
-    evento_id: int, session: SessionInjetada
-) -> EventoResponse | None:
+@rota.delete("/{evento_id}", response_model=EventoResponse | None)
+async def excluir_evento(
+    evento_id: int, session: SessionInjetada, response: Response
+) -> Response:
     """Remove um evento do banco de dados.
 
     Returns:
-        EventoResponse | None: Evento removido ou None se não existir.
+        Response: Evento removido ou None se não existir.
 
     """
-    evento_removido = remover_evento(evento_id, session)
-    return EventoResponse.model_validate(evento_removido)
+    evento_removido = await executar(session, remover_evento, evento_id)
+    return RespostaJSON(
+        evento_removido and construir(EventoResponse, evento_removido),
+        origem=response,
+    )
 
 
-@rota.get("/obra/{obra_id}")
-def obter_eventos_por_obras(
-    obra_id: int, session: SessionInjetada
-) -> Sequence[EventoResponse]:
-    """Recupera todos os eventos associados a uma obra específica.
+@rota.get("/obra/{obra_id}", response_model=Pagina[EventoResponse])
+async def obter_eventos_por_obras(
+    obra_id: int, session: SessionInjetada, paginacao: PaginacaoInjetada
+) -> Response:
+    """Recupera uma página dos eventos associados a uma obra específica.
 
     Returns:
-        Sequence[EventoResponse]: Lista de eventos associados à obra.
+        Response: Eventos da obra e o cursor da próxima página.
+
+    Raises:
+        HTTPException: Se a obra não for encontrada (status 404).
 
     """
-    obras_list = buscar_eventos_por_obra(obra_id, session)
-    return list(map(EventoResponse.model_validate, obras_list))
+    pagina = await executar(
+        session,
+        buscar_eventos_por_obra,
+        obra_id,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+    )
+    if pagina is None:
+        raise HTTPException(status_code=404, detail="Obra não encontrada")
+    return RespostaJSON(
+        Pagina[EventoResponse].model_construct(
+            itens=[
+                construir(EventoResponse, evento) for evento in pagina.itens
+            ],
+            proximo_cursor=pagina.proximo_cursor,
+        )
+    )
@@ -0,0 +1,95 @@
+"""Rotas de exportação do catálogo de obras."""
+
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from database import transmitir_linhas
+from exportacao import (
+    MEDIA_TYPE_CSV,
+    MEDIA_TYPE_PARQUET,
+    gerar_csv,
+    gerar_parquet,
+    parquet_disponivel,
+    resposta_exportacao,
+)
+from models.exportacao import ColunaExportacao
+from models.obra import FiltrosObra
+from repositories.exportacao import selecionar_exportacao
+
+rota = APIRouter(prefix="/exports", tags=["exportacao"])
+
+
+FiltrosInjetados = Annotated[FiltrosObra, Depends()]
+ColunasExportadas = Annotated[
+    list[ColunaExportacao] | None,
+    Query(description="Colunas exportadas, na ordem; omitidas, todas."),
+]
+
+
+def _resposta_arquivo(media_type: str) -> dict[int | str, dict[str, Any]]:
+    return {200: {"content": {media_type: {}}, "description": "Arquivo."}}
+
+
+@rota.get(
+    "/obras.csv",
+    response_class=StreamingResponse,
+    responses=_resposta_arquivo(MEDIA_TYPE_CSV),
+)
+async def exportar_obras_csv(
+    request: Request,
+    filtros: FiltrosInjetados,
+    colunas: ColunasExportadas = None,
+) -> StreamingResponse:
+    """Exporta as obras com o nome do usuário e da categoria em CSV.
+
+    Aceita os mesmos filtros da listagem de obras. As tags saem em uma
+    coluna, separadas por ``;``, como a importação espera.
+
+    Returns:
+        StreamingResponse: CSV transmitido à medida que é lido do banco.
+
+    """
+    statement = selecionar_exportacao(colunas or [], filtros)
+    return resposta_exportacao(
+        gerar_csv(
+            transmitir_linhas(request, statement), statement.selected_columns
+        ),
+        MEDIA_TYPE_CSV,
+        "obras.csv",
+    )
+
+
+@rota.get(
+    "/obras.parquet",
+    response_class=StreamingResponse,
+    responses=_resposta_arquivo(MEDIA_TYPE_PARQUET),
+)
+async def exportar_obras_parquet(
+    request: Request,
+    filtros: FiltrosInjetados,
+    colunas: ColunasExportadas = None,
+) -> StreamingResponse:
+    """Exporta as obras com o nome do usuário e da categoria em Parquet.
+
+    Returns:
+        StreamingResponse: Arquivo Parquet, um grupo de linhas por lote.
+
+    Raises:
+        HTTPException: 501 se o extra ``parquet`` não estiver instalado.
+
+    """
+    if not parquet_disponivel():
+        raise HTTPException(
+            status_code=501,
+            detail="Exportação em Parquet requer o extra 'parquet' (pyarrow)",
+        )
+    statement = selecionar_exportacao(colunas or [], filtros)
+    return resposta_exportacao(
+        gerar_parquet(
+            transmitir_linhas(request, statement), statement.selected_columns
+        ),
+        MEDIA_TYPE_PARQUET,
+        "obras.parquet",
+    )
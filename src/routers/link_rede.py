@@ -2,11 +2,16 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
-
-from database import get_session
-from models.link_rede import LinkRedeCreate, LinkRedeDB, LinkRedeResponse
+from fastapi import APIRouter, Depends, HTTPException
+
+from database import SessaoBanco, executar, obter_sessao
+from models.link_rede import (
+    LinkRedeAtualizacao,
+    LinkRedeCreate,
+    LinkRedeDB,
+    LinkRedeResponse,
+)
+from models.paginacao import Pagina, ParametrosPaginacao
 from repositories.link_rede import (
     adicionar_link_rede,
     atualizar_link_rede_bd,
@@ -18,23 +23,34 @@ from repositories.link_rede import (
 rota = APIRouter(prefix="/links_rede", tags=["links_rede"])
 
 
-SessionInjetada = Annotated[Session, Depends(get_session)]
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+PaginacaoInjetada = Annotated[ParametrosPaginacao, Depends()]
 
 
 @rota.get("/")
-def obter_links_rede(session: SessionInjetada) -> list[LinkRedeResponse]:
-    """Recupera todos os links de redes sociais do banco de dados.
+async def obter_links_rede(
+    session: SessionInjetada, paginacao: PaginacaoInjetada
+) -> Pagina[LinkRedeResponse]:
+    """Recupera uma página de links de redes sociais do banco de dados.
 
     Returns:
-        list[LinkRedeResponse]: Lista de links de redes sociais.
+        Pagina[LinkRedeResponse]: Página e o cursor da próxima.
 
     """
-    links_rede_list = buscar_links_rede(session)
-    return list(map(LinkRedeResponse.model_validate, links_rede_list))
+    pagina = await executar(
+        session,
+        buscar_links_rede,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+    )
+    return Pagina(
+        itens=list(map(LinkRedeResponse.model_validate, pagina.itens)),
+        proximo_cursor=pagina.proximo_cursor,
+    )
 
 
 @rota.get("/{link_rede_id}")
-def ler_link_rede(
+async def ler_link_rede(
     link_rede_id: int, session: SessionInjetada
 ) -> LinkRedeResponse | None:
     """Recupera um link de rede social específico pelo seu ID.
@@ -43,12 +59,12 @@ def ler_link_rede(
         LinkRedeResponse | None: Link encontrado ou None se não existir.
 
     """
-    link_rede = buscar_link_rede_por_id(link_rede_id, session)
+    link_rede = await executar(session, buscar_link_rede_por_id, link_rede_id)
     return LinkRedeResponse.model_validate(link_rede) if link_rede else None
 
 
 @rota.post("/")
-def criar_link_rede(
+async def criar_link_rede(
     link_rede: LinkRedeCreate, session: SessionInjetada
 ) -> LinkRedeResponse:
     """Cria um novo link de rede social no banco de dados.
@@ -59,12 +75,12 @@ def criar_link_rede(
     """
     link_rede_db = LinkRedeDB.model_validate(link_rede)
     return LinkRedeResponse.model_validate(
-        adicionar_link_rede(link_rede_db, session)
+        await executar(session, adicionar_link_rede, link_rede_db)
     )
 
 
 @rota.put("/{link_rede_id}")
-def atualizar_link_rede(
+async def atualizar_link_rede(
     link_rede_id: int, link_rede: LinkRedeCreate, session: SessionInjetada
 ) -> LinkRedeResponse | None:
     """Atualiza os dados de um link de rede social existente.
@@ -73,15 +89,43 @@ def atualizar_link_rede(
         LinkRedeResponse | None: Link atualizado ou None se não existir.
 
     """
-    link_rede_db = LinkRedeDB.model_validate(link_rede)
-    link_rede_atualizado = atualizar_link_rede_bd(
-        link_rede_id, link_rede_db, session
+    link_rede_atualizado = await executar(
+        session,
+        atualizar_link_rede_bd,
+        link_rede_id,
+        link_rede.model_dump(exclude_unset=True),
     )
     return LinkRedeResponse.model_validate(link_rede_atualizado)
 
 
+@rota.patch("/{link_rede_id}")
+async def alterar_link_rede(
+    link_rede_id: int, link_rede: LinkRedeAtualizacao, session: SessionInjetada
+) -> LinkRedeResponse:
+    """Altera apenas os campos enviados de um link de rede social.
+
+    Campos ausentes ou nulos mantêm o valor gravado.
+
+    Returns:
+        LinkRedeResponse: Link de rede social alterado.
+
+    Raises:
+        HTTPException: Se o link não for encontrado (status 404).
+
+    """
+    link_rede_alterado = await executar(
+        session,
+        atualizar_link_rede_bd,
+        link_rede_id,
+        link_rede.model_dump(exclude_unset=True, exclude_none=True),
+    )
+    if not link_rede_alterado:
+        raise HTTPException(status_code=404, detail="Link não encontrado")
+    return LinkRedeResponse.model_validate(link_rede_alterado)
+
+
 @rota.delete("/{link_rede_id}")
-def excluir_link_rede(
+async def excluir_link_rede(
     link_rede_id: int, session: SessionInjetada
 ) -> LinkRedeResponse | None:
     """Remove um link de rede social do banco de dados.
@@ -90,5 +134,7 @@ def excluir_link_rede(
         LinkRedeResponse | None: Link removido ou None se não existir.
 
     """
-    link_rede_removido = remover_link_rede(link_rede_id, session)
+    link_rede_removido = await executar(
+        session, remover_link_rede, link_rede_id
+    )
     return LinkRedeResponse.model_validate(link_rede_removido)
@@ -0,0 +1,57 @@
+"""Rotas de métricas operacionais da API."""
+
+from itertools import starmap
+
+from fastapi import APIRouter
+
+from cache import caches_registrados
+from coalescencia import coalescedores_registrados
+from database import pools_monitorados
+from models.metricas import (
+    EstatisticasCache,
+    EstatisticasCoalescencia,
+    EstatisticasPool,
+)
+from pool import estatisticas_pool
+
+rota = APIRouter(prefix="/metricas", tags=["metricas"])
+
+
+@rota.get("/pool")
+async def obter_estatisticas_pool() -> list[EstatisticasPool]:
+    """Recupera o estado dos pools de conexão com o banco.
+
+    Returns:
+        list[EstatisticasPool]: Conexões em uso, ociosas, overflow e o
+            tempo que os checkouts esperaram por uma conexão.
+
+    """
+    return list(starmap(estatisticas_pool, pools_monitorados().items()))
+
+
+@rota.get("/cache")
+async def obter_estatisticas_cache() -> list[EstatisticasCache]:
+    """Recupera os contadores dos caches de entidades do processo.
+
+    Returns:
+        list[EstatisticasCache]: Ocupação, acertos, faltas, expirações,
+            despejos e invalidações de cada cache.
+
+    """
+    return [cache.estatisticas() for cache in caches_registrados()]
+
+
+@rota.get("/coalescencia")
+async def obter_estatisticas_coalescencia() -> list[EstatisticasCoalescencia]:
+    """Recupera os contadores da coalescência de leituras do processo.
+
+    Returns:
+        list[EstatisticasCoalescencia]: Consultas executadas, requisições
+            atendidas pela consulta de outra e esperas encerradas pelo
+            timeout de cada rota.
+
+    """
+    return [
+        coalescedor.estatisticas()
+        for coalescedor in coalescedores_registrados()
+    ]
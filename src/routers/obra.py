@@ -2,105 +2,341 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
-from database import get_session
-from models.obra import ObraCreate, ObraDB, ObraResponse
+from coalescencia import Coalescedor, executar_coalescido
+from condicional import (
+    Validadores,
+    cabecalhos_registro,
+    condicional,
+    nao_modificado,
+    resposta_nao_modificada,
+)
+from config import settings
+from database import SessaoBanco, executar, obter_sessao, transmitir
+from models.campos import Campos, campos_da_resposta, modelo_parcial
+from models.lote import CorpoLote, ResultadoLote, validar_lote
+from models.obra import (
+    FiltrosObra,
+    ObraAtualizacao,
+    ObraCreate,
+    ObraEncontrada,
+    ObraResponse,
+    PaginaObras,
+)
+from models.paginacao import Pagina, ParametrosPaginacao
+from repositories.busca import buscar_obras_por_texto
 from repositories.obra import (
     adicionar_obra,
+    adicionar_obras_em_lote,
     atualizar_obra_bd,
     buscar_obra_por_id,
     buscar_obras,
     buscar_obras_por_evento,
+    buscar_versao_obra,
+    contar_facetas,
     remover_obra,
+    selecionar_obras,
 )
+from serializacao import RespostaJSON, construir
+from streaming import RESPOSTA_NDJSON, modo_streaming, resposta_ndjson
 
 rota = APIRouter(prefix="/obras", tags=["obras"])
+COALESCEDOR_EVENTO = Coalescedor("obras_evento", settings.coalescencia_timeout)
+
+
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+PaginacaoInjetada = Annotated[ParametrosPaginacao, Depends()]
+StreamingInjetado = Annotated[bool, Depends(modo_streaming)]
+FiltrosInjetados = Annotated[FiltrosObra, Depends()]
+CamposInjetados = Annotated[
+    Campos | None, Depends(campos_da_resposta(ObraResponse))
+]
 
 
-SessionInjetada = Annotated[Session, Depends(get_session)]
+@rota.get("/", response_model=PaginaObras, responses=RESPOSTA_NDJSON)
+async def obter_obras(  # noqa: PLR0913, PLR0917
+    request: Request,
+    session: SessionInjetada,
+    filtros: FiltrosInjetados,
+    paginacao: PaginacaoInjetada,
+    streaming: StreamingInjetado,
+    campos: CamposInjetados,
+) -> Response:
+    """Recupera uma página de obras ou transmite todas em NDJSON.
+
+    Aceita filtros por status, categoria, usuário, técnica, faixas de preço,
+    ano e dimensões, e tags (``?tag=a&tag=b``, com ``modo_tags``
+    ``qualquer`` ou ``todas``). A primeira página (sem ``cursor``) traz as
+    contagens por categoria, técnica e faixa de preço para montar os
+    filtros da interface; as seguintes não repetem a agregação. Com
+    ``?fields=`` as obras trazem só os campos pedidos. Com ``If-None-Match``
+    igual ao ETag da página, responde 304 sem serializá-la.
+
+    Returns:
+        Response: Página, cursor da próxima e facetas ou, em modo
+            streaming, todos os registros.
+
+    """
+    modelo = (
+        ObraResponse
+        if campos is None
+        else modelo_parcial(ObraResponse, campos)
+    )
+    if streaming:
+        return resposta_ndjson(
+            transmitir(request, selecionar_obras(filtros, campos)), modelo
+        )
+    pagina = await executar(
+        session,
+        buscar_obras,
+        filtros=filtros,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+        campos=campos,
+    )
+    facetas = (
+        None
+        if paginacao.cursor
+        else await executar(session, contar_facetas, filtros=filtros)
+    )
+    validadores = Validadores.da_pagina(
+        pagina.itens, pagina.proximo_cursor, facetas, campos and sorted(campos)
+    )
+    if nao_modificado(request, validadores):
+        return resposta_nao_modificada(validadores)
+    itens = [construir(modelo, obra) for obra in pagina.itens]
+    if campos is not None:
+        return RespostaJSON(
+            {
+                "itens": itens,
+                "proximo_cursor": pagina.proximo_cursor,
+                "facetas": facetas,
+            },
+            headers=validadores.cabecalhos(),
+        )
+    return RespostaJSON(
+        PaginaObras.model_construct(
+            itens=itens,
+            proximo_cursor=pagina.proximo_cursor,
+            facetas=facetas,
+        ),
+        headers=validadores.cabecalhos(),
+    )
 
 
-@rota.get("/")
-def obter_obras(session: SessionInjetada) -> list[ObraResponse]:
-    """Recupera todas as obras do banco de dados.
+@rota.get("/busca", response_model=Pagina[ObraEncontrada])
+async def buscar_obras_texto(
+    q: Annotated[str, Query(min_length=1, description="Texto buscado.")],
+    session: SessionInjetada,
+    paginacao: PaginacaoInjetada,
+) -> Response:
+    """Busca obras por título, autor, técnica e tags.
 
     Returns:
-        list[ObraResponse]: Lista de obras.
+        Response: Obras da mais para a menos relevante, com
+            os termos encontrados destacados em ``trecho``.
 
     """
-    obras_list = buscar_obras(session)
-    return list(map(ObraResponse.model_validate, obras_list))
+    pagina = await executar(
+        session,
+        buscar_obras_por_texto,
+        q,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+    )
+    return RespostaJSON(
+        Pagina[ObraEncontrada].model_construct(
+            itens=[
+                ObraEncontrada.model_construct(
+                    **dict(construir(ObraResponse, encontrada.obra)),
+                    relevancia=encontrada.relevancia,
+                    trecho=encontrada.trecho,
+                )
+                for encontrada in pagina.itens
+            ],
+            proximo_cursor=pagina.proximo_cursor,
+        ),
+        tipo=Pagina[ObraEncontrada],
+    )
 
 
-@rota.get("/{obra_id}")
-def ler_obra(obra_id: int, session: SessionInjetada) -> ObraResponse | None:
+@rota.get("/{obra_id}", response_model=ObraResponse | None)
+async def ler_obra(
+    obra_id: int,
+    request: Request,
+    session: SessionInjetada,
+    campos: CamposInjetados,
+) -> Response:
     """Recupera uma obra específica pelo seu ID.
 
+    Com ``If-None-Match`` ou ``If-Modified-Since`` ainda válidos, responde
+    304 depois de consultar só a versão da obra.
+
     Returns:
-        ObraResponse | None: Obra encontrada ou None se não existir.
+        Response: Obra encontrada, só com os campos de ``?fields=`` se
+            enviado, ou None se não existir.
 
     """
-    obra = buscar_obra_por_id(obra_id, session)
-    return ObraResponse.model_validate(obra) if obra else None
+    if condicional(request):
+        versao = await executar(session, buscar_versao_obra, obra_id)
+        if versao is not None:
+            validadores = Validadores.do_registro(obra_id, versao, campos)
+            if nao_modificado(request, validadores):
+                return resposta_nao_modificada(validadores)
+    obra = await executar(session, buscar_obra_por_id, obra_id, campos=campos)
+    cabecalhos = cabecalhos_registro(obra, campos)
+    if campos is not None:
+        parcial = modelo_parcial(ObraResponse, campos)
+        return RespostaJSON(
+            obra and construir(parcial, obra), headers=cabecalhos
+        )
+    return RespostaJSON(obra, headers=cabecalhos, tipo=ObraResponse | None)
 
 
-@rota.post("/")
-def criar_obra(obra: ObraCreate, session: SessionInjetada) -> ObraResponse:
+@rota.post("/", response_model=ObraResponse)
+async def criar_obra(
+    obra: ObraCreate, session: SessionInjetada, response: Response
+) -> Response:
     """Cria uma nova obra no banco de dados.
 
     Returns:
-        ObraResponse: Dados da obra criada.
+        Response: Dados da obra criada.
 
     """
-    obra_db = ObraDB.model_validate(obra)
-    return ObraResponse.model_validate(adicionar_obra(obra_db, session))
+    obra_db = await executar(session, adicionar_obra, obra)
+    return RespostaJSON(obra_db, tipo=ObraResponse, origem=response)
+
+
+@rota.post("/bulk")
+async def criar_obras_em_lote(
+    obras: CorpoLote, session: SessionInjetada
+) -> ResultadoLote:
+    """Cria várias obras de uma vez, em lotes de inserção.
 
+    Cada item é validado separadamente: itens inválidos voltam em ``erros``
+    com o índice na lista enviada, sem impedir a criação dos demais.
+    Obras com usuário ou categoria inexistente também voltam como erro.
+
+    Returns:
+        ResultadoLote: Ids criados e erros, por índice.
+
+    """
+    linhas, erros = validar_lote(ObraCreate, obras)
+    resultado = await executar(session, adicionar_obras_em_lote, linhas=linhas)
+    return resultado.com_erros(erros)
 
-@rota.put("/{obra_id}")
-def atualizar_obra(
-    obra_id: int, obra: ObraCreate, session: SessionInjetada
-) -> ObraResponse | None:
+
+@rota.put("/{obra_id}", response_model=ObraResponse)
+async def atualizar_obra(
+    obra_id: int,
+    obra: ObraCreate,
+    session: SessionInjetada,
+    response: Response,
+) -> Response:
     """Atualiza os dados de uma obra existente.
 
     Returns:
-        ObraResponse | None: Obra atualizada.
+        Response: Obra atualizada.
 
     Raises:
         HTTPException: Se a obra não for encontrada (status 404).
 
     """
-    obra_db = ObraDB.model_validate(obra)
-    obra_atualizada = atualizar_obra_bd(obra_id, obra_db, session)
+    obra_atualizada = await executar(
+        session,
+        atualizar_obra_bd,
+        obra_id,
+        obra.model_dump(exclude_unset=True),
+    )
     if not obra_atualizada:
         raise HTTPException(status_code=404, detail="Obra não encontrada")
-    return ObraResponse.model_validate(obra_atualizada)
+    return RespostaJSON(obra_atualizada, tipo=ObraResponse, origem=response)
+
+
+@rota.patch("/{obra_id}", response_model=ObraResponse)
+async def alterar_obra(
+    obra_id: int,
+    obra: ObraAtualizacao,
+    session: SessionInjetada,
+    response: Response,
+) -> Response:
+    """Altera apenas os campos enviados de uma obra.
+
+    Campos ausentes ou nulos mantêm o valor gravado.
 
+    Returns:
+        Response: Obra alterada.
+
+    Raises:
+        HTTPException: Se a obra não for encontrada (status 404).
 
-@rota.delete("/{obra_id}")
-def excluir_obra(
-    obra_id: int, session: SessionInjetada
-) -> ObraResponse | None:
+    """
+    obra_alterada = await executar(
+        session,
+        atualizar_obra_bd,
+        obra_id,
+        obra.model_dump(exclude_unset=True, exclude_none=True),
+    )
+    if not obra_alterada:
+        raise HTTPException(status_code=404, detail="Obra não encontrada")
+    return RespostaJSON(obra_alterada, tipo=ObraResponse, origem=response)
+
+
+@rota.delete("/{obra_id}", response_model=ObraResponse | None)
+async def excluir_obra(
+    obra_id: int, session: SessionInjetada, response: Response
+) -> Response:
     """Remove uma obra do banco de dados.
 
     Returns:
-        ObraResponse | None: Obra removida ou None se não existir.
+        Response: Obra removida ou None se não existir.
 
     """
-    categoria_removida = remover_obra(obra_id, session)
-    return ObraResponse.model_validate(categoria_removida)
+    obra_removida = await executar(session, remover_obra, obra_id)
+    return RespostaJSON(
+        obra_removida, tipo=ObraResponse | None, origem=response
+    )
 
 
-@rota.get("/evento/{evento_id}")
-def obter_obras_por_evento(
-    evento_id: int, session: SessionInjetada
-) -> list[ObraResponse]:
-    """Recupera todas as obras associadas a um evento específico.
+@rota.get("/evento/{evento_id}", response_model=Pagina[ObraResponse])
+async def obter_obras_por_evento(
+    evento_id: int,
+    request: Request,
+    session: SessionInjetada,
+    filtros: FiltrosInjetados,
+    paginacao: PaginacaoInjetada,
+) -> Response:
+    """Recupera uma página das obras associadas a um evento específico.
+
+    Leituras simultâneas da mesma página compartilham uma consulta. Com
+    ``If-None-Match`` igual ao ETag da página, responde 304.
 
     Returns:
-        list[ObraResponse]: Lista de obras associadas ao evento.
+        Response: Obras do evento e o cursor da próxima página.
+
+    Raises:
+        HTTPException: Se o evento não for encontrado (status 404).
 
     """
-    obras_list = buscar_obras_por_evento(evento_id, session)
-    return list(map(ObraResponse.model_validate, obras_list))
+    pagina = await executar_coalescido(
+        COALESCEDOR_EVENTO,
+        request,
+        session,
+        buscar_obras_por_evento,
+        evento_id,
+        filtros=filtros,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+    )
+    if pagina is None:
+        raise HTTPException(status_code=404, detail="Evento não encontrado")
+    validadores = Validadores.da_pagina(pagina.itens, pagina.proximo_cursor)
+    if nao_modificado(request, validadores):
+        return resposta_nao_modificada(validadores)
+    return RespostaJSON(
+        Pagina[ObraResponse].model_construct(
+            itens=pagina.itens, proximo_cursor=pagina.proximo_cursor
+        ),
+        headers=validadores.cabecalhos(),
+    )
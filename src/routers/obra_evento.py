@@ -3,23 +3,24 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
 
-from database import get_session
+from database import SessaoBanco, executar, obter_sessao
 from models import ObraEventoDB
+from models.obra_evento import AssociacaoObras, DiferencaObrasEvento
 from repositories.obra_evento import (
     adicionar_obra_ao_evento,
+    associar_obras_ao_evento,
     remover_obra_do_evento,
 )
 
 rota = APIRouter(prefix="/obras-evento", tags=["obras eventos"])
 
 
-SessionInjetada = Annotated[Session, Depends(get_session)]
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
 
 
 @rota.post("/")
-def criar_obra_evento(
+async def criar_obra_evento(
     obra: ObraEventoDB, session: SessionInjetada
 ) -> ObraEventoDB:
     """Associa uma obra a um evento.
@@ -28,19 +29,51 @@ def criar_obra_evento(
         ObraEventoDB: Dados da associação criada.
 
     """
-    return adicionar_obra_ao_evento(session, obra)
+    return await executar(session, adicionar_obra_ao_evento, obra_evento=obra)
 
 
 @rota.delete("/", status_code=204)
-def excluir_obra(obra: ObraEventoDB, session: SessionInjetada) -> None:
+async def excluir_obra(obra: ObraEventoDB, session: SessionInjetada) -> None:
     """Remove a associação de uma obra com um evento.
 
     Raises:
         HTTPException: Se a obra não for encontrada no evento (status 404).
 
     """
-    obra_removida = remover_obra_do_evento(session, obra)
+    obra_removida = await executar(
+        session, remover_obra_do_evento, obra_evento=obra
+    )
     if not obra_removida:
         raise HTTPException(
             status_code=404, detail="Obra não encontrada no evento"
         )
+
+
+@rota.put("/{evento_id}")
+async def associar_obras(
+    evento_id: int, associacao: AssociacaoObras, session: SessionInjetada
+) -> DiferencaObrasEvento:
+    """Define, acrescenta ou retira várias obras de um evento de uma vez.
+
+    Com ``modo`` ``definir`` (padrão) o evento fica exatamente com as obras
+    enviadas; ``adicionar`` e ``remover`` alteram só as informadas. Tudo
+    acontece em uma transação.
+
+    Returns:
+        DiferencaObrasEvento: Obras que passaram a fazer parte do evento e
+            obras que deixaram de fazer.
+
+    Raises:
+        HTTPException: Se o evento não for encontrado (status 404).
+
+    """
+    diferenca = await executar(
+        session,
+        associar_obras_ao_evento,
+        evento_id,
+        associacao.obras,
+        associacao.modo,
+    )
+    if diferenca is None:
+        raise HTTPException(status_code=404, detail="Evento não encontrado")
+    return diferenca
@@ -0,0 +1,85 @@
+"""Rota de sincronização incremental para clientes com cópia local."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Response
+
+from database import SessaoBanco, executar, obter_sessao
+from models.categoria import CategoriaResponse
+from models.evento import EventoResponse
+from models.obra import ObraResponse
+from models.sincronizacao import (
+    LIMITE_SINCRONIZACAO_MAXIMO,
+    LIMITE_SINCRONIZACAO_PADRAO,
+    RemovidosSincronizacao,
+    Sincronizacao,
+)
+from models.usuario import UsuarioResponse
+from repositories.sincronizacao import buscar_alteracoes
+from serializacao import RespostaJSON, construir
+
+rota = APIRouter(tags=["sincronizacao"])
+
+
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+
+
+@rota.get("/sync", response_model=Sincronizacao)
+async def sincronizar(
+    session: SessionInjetada,
+    since: Annotated[
+        str | None,
+        Query(description="Token devolvido pela sincronização anterior."),
+    ] = None,
+    limite: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=LIMITE_SINCRONIZACAO_MAXIMO,
+            description="Registros alterados ou removidos por resposta.",
+        ),
+    ] = LIMITE_SINCRONIZACAO_PADRAO,
+) -> Response:
+    """Recupera as obras, eventos, categorias e artistas alterados.
+
+    O cliente guarda o ``token`` e o envia em ``since`` na próxima
+    chamada; sem ``since``, recebe o catálogo inteiro. Enquanto ``mais``
+    for verdadeiro, há alterações depois do token devolvido.
+
+    Returns:
+        Response: Registros criados ou alterados, ids removidos e o token
+            da próxima sincronização.
+
+    """
+    alteracoes = await executar(
+        session, buscar_alteracoes, token=since, limite=limite
+    )
+    alterados, removidos = alteracoes.alterados, alteracoes.removidos
+    return RespostaJSON(
+        Sincronizacao.model_construct(
+            obras=[
+                construir(ObraResponse, obra)
+                for obra in alterados.get("obras", [])
+            ],
+            eventos=[
+                construir(EventoResponse, evento)
+                for evento in alterados.get("eventos", [])
+            ],
+            categorias=[
+                construir(CategoriaResponse, categoria)
+                for categoria in alterados.get("categorias", [])
+            ],
+            usuarios=[
+                construir(UsuarioResponse, usuario)
+                for usuario in alterados.get("usuarios", [])
+            ],
+            removidos=RemovidosSincronizacao.model_construct(
+                obras=removidos.get("obras", []),
+                eventos=removidos.get("eventos", []),
+                categorias=removidos.get("categorias", []),
+                usuarios=removidos.get("usuarios", []),
+            ),
+            token=alteracoes.token,
+            mais=alteracoes.mais,
+        )
+    )
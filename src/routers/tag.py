@@ -0,0 +1,35 @@
+"""Rotas para consulta das tags das obras."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from database import SessaoBanco, executar, obter_sessao
+from models.paginacao import LIMITE_MAXIMO, LIMITE_PADRAO
+from models.tag import TagResponse
+from repositories.tag import buscar_tags
+
+rota = APIRouter(prefix="/tags", tags=["tags"])
+
+
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+
+
+@rota.get("/")
+async def obter_tags(
+    session: SessionInjetada,
+    limite: Annotated[
+        int, Query(ge=1, le=LIMITE_MAXIMO, description="Tags retornadas.")
+    ] = LIMITE_PADRAO,
+) -> list[TagResponse]:
+    """Recupera as tags mais usadas com a quantidade de obras de cada uma.
+
+    As contagens são mantidas a cada escrita de obra, então a consulta não
+    percorre ``obras``.
+
+    Returns:
+        list[TagResponse]: Tags da mais para a menos frequente.
+
+    """
+    tags = await executar(session, buscar_tags, limite=limite)
+    return list(map(TagResponse.model_validate, tags))
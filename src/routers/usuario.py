@@ -2,91 +2,209 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
-
-from database import get_session
-from models.usuario import UsuarioCreate, UsuarioDB, UsuarioResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+
+from database import SessaoBanco, executar, obter_sessao, transmitir
+from models.campos import Campos, campos_da_resposta, modelo_parcial
+from models.lote import CorpoLote, ResultadoLote, validar_lote
+from models.paginacao import Pagina, ParametrosPaginacao
+from models.usuario import (
+    UsuarioAtualizacao,
+    UsuarioCreate,
+    UsuarioResponse,
+)
 from repositories.usuario import (
     adicionar_usuario,
+    adicionar_usuarios_em_lote,
     atualizar_usuario_bd,
     buscar_usuario_por_id,
     buscar_usuarios,
     remover_usuario,
+    selecionar_usuarios,
 )
+from serializacao import RespostaJSON, construir
+from streaming import RESPOSTA_NDJSON, modo_streaming, resposta_ndjson
 
 rota = APIRouter(prefix="/usuarios", tags=["usuarios"])
 
 
-SessionInjetada = Annotated[Session, Depends(get_session)]
+SessionInjetada = Annotated[SessaoBanco, Depends(obter_sessao)]
+PaginacaoInjetada = Annotated[ParametrosPaginacao, Depends()]
+StreamingInjetado = Annotated[bool, Depends(modo_streaming)]
+CamposInjetados = Annotated[
+    Campos | None, Depends(campos_da_resposta(UsuarioResponse))
+]
 
 
-@rota.get("/")
-def obter_usuarios(session: SessionInjetada) -> list[UsuarioResponse]:
-    """Recupera todos os usuários do banco de dados.
+@rota.get(
+    "/", response_model=Pagina[UsuarioResponse], responses=RESPOSTA_NDJSON
+)
+async def obter_usuarios(
+    request: Request,
+    session: SessionInjetada,
+    paginacao: PaginacaoInjetada,
+    streaming: StreamingInjetado,
+    campos: CamposInjetados,
+) -> Response:
+    """Recupera uma página de usuarios ou transmite todos em NDJSON.
+
+    Com ``?fields=`` os itens trazem só os campos pedidos.
 
     Returns:
-        list[UsuarioResponse]: Lista de usuários.
+        Response: Página e o cursor da próxima ou, em modo streaming, todos
+            os registros.
 
     """
-    usuarios_list = buscar_usuarios(session)
-    return list(map(UsuarioResponse.model_validate, usuarios_list))
+    modelo = (
+        UsuarioResponse
+        if campos is None
+        else modelo_parcial(UsuarioResponse, campos)
+    )
+    if streaming:
+        return resposta_ndjson(
+            transmitir(request, selecionar_usuarios(campos)), modelo
+        )
+    pagina = await executar(
+        session,
+        buscar_usuarios,
+        cursor=paginacao.cursor,
+        limite=paginacao.limite,
+        campos=campos,
+    )
+    return RespostaJSON(
+        Pagina[modelo].model_construct(
+            itens=[construir(modelo, usuario) for usuario in pagina.itens],
+            proximo_cursor=pagina.proximo_cursor,
+        )
+    )
 
 
-@rota.get("/{usuario_id}")
-def ler_usuario(
-    usuario_id: int, session: SessionInjetada
-) -> UsuarioResponse | None:
+@rota.get("/{usuario_id}", response_model=UsuarioResponse | None)
+async def ler_usuario(
+    usuario_id: int, session: SessionInjetada, campos: CamposInjetados
+) -> Response:
     """Recupera um usuário específico pelo seu ID.
 
     Returns:
-        UsuarioResponse | None: Usuário encontrado ou None se não existir.
+        Response: Usuário encontrado, só com os campos de ``?fields=`` se
+            enviado, ou None se não existir.
 
     """
-    usuario = buscar_usuario_por_id(usuario_id, session)
-    return UsuarioResponse.model_validate(usuario) if usuario else None
+    usuario = await executar(
+        session, buscar_usuario_por_id, usuario_id, campos=campos
+    )
+    modelo = (
+        UsuarioResponse
+        if campos is None
+        else modelo_parcial(UsuarioResponse, campos)
+    )
+    return RespostaJSON(usuario and construir(modelo, usuario))
 
 
-@rota.post("/")
-def criar_usuario(
-    usuario: UsuarioCreate, session: SessionInjetada
-) -> UsuarioResponse:
+@rota.post("/", response_model=UsuarioResponse)
+async def criar_usuario(
+    usuario: UsuarioCreate, session: SessionInjetada, response: Response
+) -> Response:
     """Cria um novo usuário no banco de dados.
 
     Returns:
-        UsuarioResponse: Dados do usuário criado.
+        Response: Dados do usuário criado.
+
+    """
+    usuario_db = await executar(session, adicionar_usuario, usuario)
+    return RespostaJSON(
+        construir(UsuarioResponse, usuario_db), origem=response
+    )
+
+
+@rota.post("/bulk")
+async def criar_usuarios_em_lote(
+    usuarios: CorpoLote, session: SessionInjetada
+) -> ResultadoLote:
+    """Cria vários usuários de uma vez, em lotes de inserção.
+
+    Cada item é validado separadamente: itens inválidos voltam em ``erros``
+    com o índice na lista enviada, sem impedir a criação dos demais.
+
+    Returns:
+        ResultadoLote: Ids criados e erros, por índice.
 
     """
-    usuario_db = UsuarioDB.model_validate(usuario)
-    return UsuarioResponse.model_validate(
-        adicionar_usuario(usuario_db, session)
+    linhas, erros = validar_lote(UsuarioCreate, usuarios)
+    resultado = await executar(
+        session, adicionar_usuarios_em_lote, linhas=linhas
     )
+    return resultado.com_erros(erros)
 
 
-@rota.put("/{usuario_id}")
-def atualizar_usuario(
-    usuario_id: int, usuario: UsuarioCreate, session: SessionInjetada
-) -> UsuarioResponse | None:
+@rota.put("/{usuario_id}", response_model=UsuarioResponse | None)
+async def atualizar_usuario(
+    usuario_id: int,
+    usuario: UsuarioCreate,
+    session: SessionInjetada,
+    response: Response,
+) -> Response:
     """Atualiza os dados de um usuário existente.
 
     Returns:
-        UsuarioResponse | None: Usuário atualizado ou None se não existir.
+        Response: Usuário atualizado ou None se não existir.
 
     """
-    usuario_db = UsuarioDB.model_validate(usuario)
-    usuario_atualizado = atualizar_usuario_bd(usuario_id, usuario_db, session)
-    return UsuarioResponse.model_validate(usuario_atualizado)
+    usuario_atualizado = await executar(
+        session,
+        atualizar_usuario_bd,
+        usuario_id,
+        usuario.model_dump(exclude_unset=True),
+    )
+    return RespostaJSON(
+        usuario_atualizado and construir(UsuarioResponse, usuario_atualizado),
+        origem=response,
+    )
 
 
-@rota.delete("/{usuario_id}")
-def excluir_usuario(
-    usuario_id: int, session: SessionInjetada
-) -> UsuarioResponse | None:
+@rota.patch("/{usuario_id}", response_model=UsuarioResponse)
+async def alterar_usuario(
+    usuario_id: int,
+    usuario: UsuarioAtualizacao,
+    session: SessionInjetada,
+    response: Response,
+) -> Response:
+    """Altera apenas os campos enviados de um usuário.
+
+    Campos ausentes ou nulos mantêm o valor gravado.
+
+    Returns:
+        Response: Usuário alterado.
+
+    Raises:
+        HTTPException: Se o usuário não for encontrado (status 404).
+
+    """
+    usuario_alterado = await executar(
+        session,
+        atualizar_usuario_bd,
+        usuario_id,
+        usuario.model_dump(exclude_unset=True, exclude_none=True),
+    )
+    if not usuario_alterado:
+        raise HTTPException(status_code=404, detail="Usuário não encontrado")
+    return RespostaJSON(
+        construir(UsuarioResponse, usuario_alterado), origem=response
+    )
+
+
+@rota.delete("/{usuario_id}", response_model=UsuarioResponse | None)
+async def excluir_usuario(
+    usuario_id: int, session: SessionInjetada, response: Response
+) -> Response:
     """Remove um usuário do banco de dados.
 
     Returns:
-        UsuarioResponse | None: Usuário removido ou None se não existir.
+        Response: Usuário removido ou None se não existir.
 
     """
-    usuario_removido = remover_usuario(usuario_id, session)
-    return UsuarioResponse.model_validate(usuario_removido)
+    usuario_removido = await executar(session, remover_usuario, usuario_id)
+    return RespostaJSON(
+        usuario_removido and construir(UsuarioResponse, usuario_removido),
+        origem=response,
+    )
@@ -0,0 +1,100 @@
+"""Serialização das respostas sem revalidar o que veio do banco.
+
+Linhas lidas do banco ou devolvidas por ``RETURNING`` já respeitam os
+modelos de resposta. Em vez de passar cada uma por ``model_validate`` (e de
+o FastAPI validar a resposta de novo antes de codificá-la), elas são
+serializadas direto em JSON pelo esquema do modelo, no ``pydantic-core``.
+"""
+
+from collections.abc import Mapping
+from functools import cache
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+# Descrevem o corpo, e não o que as dependências gravaram.
+CABECALHOS_DO_CORPO = frozenset({b"content-length", b"content-type"})
+
+
+@cache
+def _adaptador(tipo: Any) -> TypeAdapter[Any]:  # noqa: ANN401
+    return TypeAdapter(tipo)
+
+
+def serializar(conteudo: object, tipo: Any = Any) -> bytes:  # noqa: ANN401
+    """Codifica ``conteudo`` em JSON conforme o esquema de ``tipo``.
+
+    Objetos de classes derivadas do modelo em ``tipo``, como ``ObraDB``
+    para ``ObraResponse``, saem só com os campos do modelo.
+
+    Returns:
+        bytes: JSON em UTF-8.
+
+    """
+    return _adaptador(tipo).dump_json(conteudo)
+
+
+def construir[M: BaseModel](modelo: type[M], objeto: object) -> M:
+    """Monta ``modelo`` com os atributos de ``objeto``, sem validá-los.
+
+    Instâncias de ``modelo`` (ou de classes derivadas) são devolvidas como
+    estão. Modelos com validadores passam por ``model_validate``, já que os
+    validadores podem transformar os valores lidos.
+
+    Returns:
+        M: Modelo com os valores de ``objeto``.
+
+    """
+    if isinstance(objeto, modelo):
+        return objeto
+    decoradores = modelo.__pydantic_decorators__
+    if decoradores.field_validators or decoradores.model_validators:
+        return modelo.model_validate(objeto)
+    return modelo.model_construct(
+        **{nome: getattr(objeto, nome) for nome in modelo.model_fields}
+    )
+
+
+class RespostaJSON(JSONResponse):
+    """Resposta JSON codificada pelo serializador do ``pydantic-core``.
+
+    É a classe de resposta padrão da aplicação. As rotas que devolvem
+    linhas do banco a instanciam com o ``tipo`` da resposta, e o FastAPI
+    não valida o conteúdo de novo. Como o FastAPI só aplica os cabeçalhos
+    do ``Response`` injetado nas respostas que ele mesmo monta, as rotas o
+    repassam em ``origem`` (com o cookie ``primario_ate`` das escritas,
+    por exemplo).
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        content: object,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        *,
+        tipo: Any = Any,  # noqa: ANN401
+        origem: Response | None = None,
+    ) -> None:
+        """Guarda o ``tipo`` usado para serializar ``content``."""
+        self.tipo = tipo
+        super().__init__(content, status_code, headers, media_type, background)
+        if origem is not None:
+            self.raw_headers.extend(
+                (nome, valor)
+                for nome, valor in origem.raw_headers
+                if nome not in CABECALHOS_DO_CORPO
+            )
+
+    def render(self, content: object) -> bytes:
+        """Serializa ``content`` conforme ``tipo``.
+
+        Returns:
+            bytes: Corpo da resposta.
+
+        """
+        return serializar(content, self.tipo)
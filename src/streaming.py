@@ -0,0 +1,58 @@
+"""Respostas em NDJSON para listagens completas."""
+
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
+
+from fastapi import Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from serializacao import construir, serializar
+
+MEDIA_TYPE_NDJSON = "application/x-ndjson"
+
+RESPOSTA_NDJSON: dict[int | str, dict[str, Any]] = {
+    200: {
+        "content": {MEDIA_TYPE_NDJSON: {}},
+        "description": (
+            "Com `?stream=1` ou `Accept: application/x-ndjson`, todos os "
+            "registros, um objeto JSON por linha."
+        ),
+    },
+}
+
+
+def modo_streaming(
+    request: Request,
+    stream: Annotated[
+        bool,
+        Query(description="Transmite a listagem completa em NDJSON."),
+    ] = False,
+) -> bool:
+    """Indica se o cliente pediu a listagem completa em streaming.
+
+    Returns:
+        bool: ``True`` com ``?stream=1`` ou ``Accept: application/x-ndjson``.
+
+    """
+    return stream or MEDIA_TYPE_NDJSON in request.headers.get("accept", "")
+
+
+def resposta_ndjson(
+    itens: AsyncIterator[Any], modelo: type[BaseModel]
+) -> StreamingResponse:
+    """Serializa ``itens`` linha a linha conforme são lidos do banco.
+
+    As linhas não são validadas de novo: saem direto pelo esquema de
+    ``modelo``.
+
+    Returns:
+        StreamingResponse: Resposta ``application/x-ndjson``.
+
+    """
+
+    async def linhas() -> AsyncIterator[bytes]:
+        async for item in itens:
+            yield serializar(construir(modelo, item), modelo) + b"\n"
+
+    return StreamingResponse(linhas(), media_type=MEDIA_TYPE_NDJSON)
@@ -1,18 +1,23 @@
 """Configuração de fixtures do pytest."""
 
 import logging
+import os
 import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
 from alembic import command
 from alembic.config import Config
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel
 from testcontainers.postgres import PostgresContainer
 
+from models import ObraDB
+
 # Configurar logging para testes
 logging.basicConfig(
     level=logging.DEBUG,
@@ -21,6 +26,10 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Os módulos de src leem DATABASE_URL na importação; os testes unitários
+# usam um SQLite em memória quando nenhuma URL foi configurada.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
 
 @pytest.fixture
 def alembic_config() -> Config:
@@ -39,6 +48,14 @@ def alembic_config() -> Config:
     return config
 
 
+@pytest.fixture(autouse=True)
+def sem_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Desliga o cache de entidades, já que cada teste tem o próprio banco."""
+    from config import settings  # noqa: PLC0415
+
+    monkeypatch.setattr(settings, "cache_habilitado", False)
+
+
 @pytest.fixture
 def sqlite_engine() -> Generator[Engine, None, None]:
     """Cria um engine SQLite temporário para testes.
@@ -62,6 +79,65 @@ def sqlite_engine() -> Generator[Engine, None, None]:
         Path(db_path).unlink()
 
 
+@pytest.fixture
+def engine_memoria() -> Generator[Engine, None, None]:
+    """Cria um SQLite em memória com as tabelas dos modelos.
+
+    Yields:
+        Engine: Engine com o schema criado via ``create_all``.
+
+    """
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def consultas(engine_memoria: Engine) -> list[str]:
+    """Registra os comandos SQL executados em ``engine_memoria``.
+
+    Returns:
+        list[str]: Comandos na ordem de execução, preenchida durante o teste.
+
+    """
+    registradas: list[str] = []
+
+    @event.listens_for(engine_memoria, "before_cursor_execute")
+    def registrar(*args: object) -> None:
+        registradas.append(str(args[2]))
+
+    return registradas
+
+
+@pytest.fixture
+def nova_obra() -> Callable[..., ObraDB]:
+    """Fornece uma fábrica de obras com valores padrão.
+
+    Returns:
+        Callable[..., ObraDB]: Recebe o título e campos a sobrescrever.
+
+    """
+
+    def criar(titulo: str, **campos: Any) -> ObraDB:  # noqa: ANN401
+        valores: dict[str, Any] = {
+            "autor": "Autora",
+            "ano_producao": 2020,
+            "tecnica_criacao": "Óleo",
+            "altura_centimetros": 1,
+            "largura_centimetros": 1,
+            "peso_quilos": 1,
+            "tags": [],
+            "preco": 1,
+            "status": True,
+            "usuario_id": 1,
+            "categoria_id": 1,
+        }
+        return ObraDB(titulo=titulo, **valores | campos)
+
+    return criar
+
+
 @pytest.fixture(scope="module")
 def postgres_container() -> Generator[PostgresContainer, None, None]:
     """Cria um container PostgreSQL usando testcontainers.
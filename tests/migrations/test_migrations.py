@@ -186,7 +186,15 @@ def test_migration_consistency(
     sqlite_inspector = inspect(sqlite_engine)
     postgres_inspector = inspect(postgres_engine)
 
-    sqlite_tables = set(sqlite_inspector.get_table_names())
+    # A busca textual do SQLite usa a tabela virtual FTS5 ``obras_fts``, e o
+    # SQLite cria para ela as tabelas internas ``obras_fts_*``; no
+    # PostgreSQL a busca é a coluna ``obras.busca`` (tsvector com índice
+    # GIN), sem tabela à parte.
+    sqlite_tables = {
+        tabela
+        for tabela in sqlite_inspector.get_table_names()
+        if not tabela.startswith("obras_fts")
+    }
     postgres_tables = set(postgres_inspector.get_table_names())
 
     assert sqlite_tables == postgres_tables, (
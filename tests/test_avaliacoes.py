@@ -0,0 +1,147 @@
+"""Testes do resumo persistido das avaliações de eventos."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+from app import app
+from database import RoteadorLeitura
+from models import AvaliacaoEventoDB, EventoDB, UsuarioDB
+from models.avaliacoes_eventos import ResumoAvaliacoes
+from models.usuario import Funcao
+from repositories.avaliacoes_eventos import (
+    adicionar_avaliacao,
+    atualizar_avaliacao,
+    buscar_resumo_avaliacoes,
+    reconstruir_resumos_avaliacoes,
+    remover_avaliacao,
+)
+
+
+def _avaliacao(nota: int, gostou: str = "sim") -> AvaliacaoEventoDB:
+    return AvaliacaoEventoDB(
+        usuario_id=1, evento_id=1, gostou=gostou, avaliacao=nota
+    )
+
+
+def _resumo(session: Session) -> ResumoAvaliacoes:
+    resumo = buscar_resumo_avaliacoes(1, session)
+    assert resumo is not None
+    return ResumoAvaliacoes.model_validate(resumo)
+
+
+def test_resumo_acompanha_as_escritas(engine_memoria: Engine) -> None:
+    """Criar, alterar e remover avaliações atualiza o resumo do evento."""
+    with Session(engine_memoria) as session:
+        adicionar_avaliacao(_avaliacao(5), session)
+        adicionar_avaliacao(_avaliacao(3, "não"), session)
+        alterada = adicionar_avaliacao(_avaliacao(1), session)
+        atualizar_avaliacao(
+            alterada.id, {"avaliacao": 4, "gostou": "Sim"}, session
+        )
+        removida = adicionar_avaliacao(_avaliacao(2), session)
+        remover_avaliacao(removida.id, session)
+
+        resumo = _resumo(session)
+
+    assert resumo.model_dump() == {
+        "quantidade": 3,
+        "soma": 12,
+        "gostaram": 2,
+        "media": 4.0,
+        "histograma": {1: 0, 2: 0, 3: 1, 4: 1, 5: 1},
+    }
+
+
+def test_reconstrucao_corrige_divergencias(engine_memoria: Engine) -> None:
+    """A reconstrução recalcula o resumo a partir das avaliações gravadas."""
+    with Session(engine_memoria) as session:
+        adicionar_avaliacao(_avaliacao(5), session)
+        esperado = _resumo(session).model_dump()
+        session.add(_avaliacao(1, "não"))
+        session.commit()
+
+        assert reconstruir_resumos_avaliacoes(session) == 1
+        resumo = _resumo(session)
+
+    assert resumo.quantidade == esperado["quantidade"] + 1
+    assert resumo.histograma[1] == 1
+    assert resumo.gostaram == esperado["gostaram"]
+
+
+@pytest.mark.parametrize("metodo", ["PUT", "PATCH"])
+def test_atualizar_avaliacao_inexistente(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, metodo: str
+) -> None:
+    """PUT e PATCH de uma avaliação inexistente respondem 404."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+
+    response = TestClient(app).request(
+        metodo,
+        "/avaliacoes/1",
+        json={
+            "usuario_id": 1,
+            "evento_id": 1,
+            "gostou": "sim",
+            "avaliacao": 3,
+        },
+    )
+    engine.dispose()
+
+    assert response.status_code == 404  # noqa: PLR2004
+
+
+@pytest.mark.integration
+def test_atualizacoes_concorrentes_mantem_o_resumo(
+    postgres_engine: Engine,
+) -> None:
+    """Atualizações simultâneas da mesma avaliação não desviam o resumo."""
+    SQLModel.metadata.create_all(postgres_engine)
+    with Session(postgres_engine) as session:
+        session.add(
+            UsuarioDB(
+                nome="Ana",
+                email="ana@exemplo.com",
+                funcao=Funcao.ARTISTA,
+                biografia="",
+                senha="x",
+            )
+        )
+        session.add(
+            EventoDB(
+                nome="Bienal",
+                endereco="Rua A",
+                local="Sala",
+                data=datetime(2025, 1, 1),  # noqa: DTZ001
+                id_organizador=1,
+                id_responsavel=1,
+            )
+        )
+        session.commit()
+        avaliacao_id = adicionar_avaliacao(_avaliacao(1), session).id
+
+    def atualizar(nota: int) -> None:
+        with Session(postgres_engine) as session:
+            atualizar_avaliacao(avaliacao_id, {"avaliacao": nota}, session)
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(atualizar, [2, 3, 4, 5] * 5))
+
+    with Session(postgres_engine) as session:
+        resumo = _resumo(session)
+        final = session.get(AvaliacaoEventoDB, avaliacao_id)
+
+    assert final is not None
+    assert resumo.quantidade == 1
+    assert resumo.soma == final.avaliacao
+    assert resumo.histograma == {
+        nota: int(nota == final.avaliacao) for nota in range(1, 6)
+    }
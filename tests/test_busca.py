@@ -0,0 +1,101 @@
+"""Testes da busca textual de obras (FTS5 no SQLite)."""
+
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+from app import app
+from database import RoteadorLeitura
+from models import ObraDB
+from repositories.busca import buscar_obras_por_texto
+
+
+@pytest.fixture
+def session(
+    engine_memoria: Engine, nova_obra: Callable[..., ObraDB]
+) -> Generator[Session, None, None]:
+    """Cadastra obras com o termo "ponte" em campos de pesos diferentes.
+
+    Yields:
+        Session: Sessão sobre o catálogo cadastrado.
+
+    """
+    session = Session(engine_memoria)
+    session.add_all(
+        [
+            nova_obra("Retrato", tags=["ponte"]),
+            nova_obra("A Ponte", autor="Ana"),
+            nova_obra("Estudo", tecnica_criacao="Óleo sobre tela"),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_resultados_ordenados_por_relevancia(session: Session) -> None:
+    """Termos no título pesam mais que nas tags e aparecem destacados."""
+    pagina = buscar_obras_por_texto("ponte", session)
+
+    assert [item.obra.titulo for item in pagina.itens] == [
+        "A Ponte",
+        "Retrato",
+    ]
+    assert pagina.itens[0].trecho == "A <mark>Ponte</mark>"
+
+
+def test_busca_ignora_acentos_e_sintaxe(session: Session) -> None:
+    """Acentos não importam e o texto digitado não vira sintaxe do FTS."""
+    pagina = buscar_obras_por_texto('oleo SOBRE "(*', session)
+    assert [item.obra.titulo for item in pagina.itens] == ["Estudo"]
+    assert buscar_obras_por_texto("  ", session).itens == []
+
+
+def test_indice_acompanha_as_escritas(session: Session) -> None:
+    """Alterações e remoções de obras refletem na busca."""
+    estudo = session.get(ObraDB, 3)
+    assert estudo is not None
+    estudo.titulo = "Ponte ao entardecer"
+    session.delete(session.get(ObraDB, 2))
+    session.commit()
+
+    primeira = buscar_obras_por_texto("ponte", session, limite=1)
+    segunda = buscar_obras_por_texto(
+        "ponte", session, cursor=primeira.proximo_cursor, limite=1
+    )
+
+    assert [item.obra.titulo for item in primeira.itens] == [
+        "Ponte ao entardecer"
+    ]
+    assert [item.obra.titulo for item in segunda.itens] == ["Retrato"]
+    assert segunda.proximo_cursor is None
+
+
+def test_rota_de_busca(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    nova_obra: Callable[..., ObraDB],
+) -> None:
+    """``/obras/busca`` devolve as obras com a relevância e o trecho."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([nova_obra("A Ponte"), nova_obra("Retrato")])
+        session.commit()
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+
+    resposta = TestClient(app).get("/obras/busca", params={"q": "ponte"})
+    engine.dispose()
+
+    assert resposta.status_code == 200  # noqa: PLR2004
+    [obra] = resposta.json()["itens"]
+    assert obra["id"] == 1
+    assert obra["titulo"] == "A Ponte"
+    assert obra["trecho"] == "A <mark>Ponte</mark>"
+    assert obra["relevancia"] > 0
+    assert "versao" not in obra
@@ -0,0 +1,364 @@
+"""Testes do cache de entidades."""
+
+import json
+import time
+from collections.abc import Generator, Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import redis
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+from app import app
+from barramento import BarramentoInvalidacao, aplicar_invalidacoes
+from cache import (
+    BackendMemoria,
+    CacheEntidade,
+    carga_invalidacoes,
+    invalidar_apos_commit,
+)
+from cache_redis import BackendRedis
+from config import settings
+from database import RoteadorLeitura
+from models.avaliacoes_eventos import ResumoAvaliacoesDB
+from models.categoria import CategoriaDB, CategoriaResponse
+from models.evento import EventoDB, EventoGuardado
+from models.usuario import Funcao, UsuarioDB, UsuarioResponse
+from repositories.categoria import (
+    CACHE,
+    adicionar_categoria,
+    atualizar_categoria_bd,
+    buscar_categoria_por_id,
+)
+
+# Os valores dos testes do cache não vêm do banco.
+SEM_BANCO = Session()
+
+
+@pytest.fixture
+def com_cache(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Liga o cache, vazio, durante o teste.
+
+    Yields:
+        None: Cache ligado.
+
+    """
+    monkeypatch.setattr(settings, "cache_habilitado", True)
+    CACHE.limpar()
+    yield
+    CACHE.limpar()
+
+
+class RedisFalso:
+    """Servidor Redis em memória, com os comandos usados pelo backend."""
+
+    def __init__(self) -> None:
+        self.dados: dict[str, bytes] = {}
+        self.fora_do_ar = False
+
+    def _verificar(self) -> None:
+        if self.fora_do_ar:
+            raise redis.ConnectionError
+
+    def get(self, name: str) -> bytes | None:
+        self._verificar()
+        return self.dados.get(name)
+
+    def set(self, name: str, value: bytes, *, px: int) -> bool:
+        self._verificar()
+        assert px > 0
+        self.dados[name] = value
+        return True
+
+    def delete(self, *names: str) -> int:
+        self._verificar()
+        return sum(self.dados.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match: str) -> Iterator[str]:
+        self._verificar()
+        prefixo = match.removesuffix("*")
+        return iter(
+            [chave for chave in self.dados if chave.startswith(prefixo)]
+        )
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_lru_com_ttl() -> None:
+    """O item mais antigo sai ao lotar e os vencidos não são devolvidos."""
+    agora = [0.0]
+    cache = CacheEntidade[str](
+        "teste", 10, 2, BackendMemoria(2, relogio=lambda: agora[0])
+    )
+    for chave in "abc":
+        cache.obter_ou_carregar(
+            chave, SEM_BANCO, lambda _, chave=chave: chave.upper()
+        )
+
+    assert cache.obter("a") is None
+    assert cache.obter("b") == "B"
+    agora[0] = 10
+    assert cache.obter("c") is None
+
+    estatisticas = cache.estatisticas()
+    assert (
+        estatisticas.acertos,
+        estatisticas.faltas,
+        estatisticas.despejos,
+        estatisticas.expiracoes,
+        estatisticas.tamanho,
+    ) == (1, 5, 1, 1, 1)
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_leitura_anterior_a_invalidacao_nao_e_guardada() -> None:
+    """Uma escrita durante a leitura impede que o valor lido seja guardado."""
+    cache = CacheEntidade[str]("teste", 10, 2, BackendMemoria(2))
+
+    def carregar(_: Session) -> str:
+        cache.invalidar("a")
+        return "antigo"
+
+    assert cache.obter_ou_carregar("a", SEM_BANCO, carregar) == "antigo"
+    assert cache.obter("a") is None
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_escrita_invalida_a_categoria(
+    engine_memoria: Engine, consultas: list[str]
+) -> None:
+    """Leituras repetidas não vão ao banco até a categoria ser alterada."""
+    with Session(engine_memoria, expire_on_commit=False) as session:
+        adicionar_categoria(CategoriaDB(nome="Pintura"), session)
+        consultas.clear()
+        buscar_categoria_por_id(1, session)
+        session.expunge_all()
+        buscar_categoria_por_id(1, session)
+        assert len(consultas) == 1
+
+        atualizar_categoria_bd(1, {"nome": "Gravura"}, session)
+        session.expunge_all()
+        categoria = buscar_categoria_por_id(1, session)
+
+    assert categoria is not None
+    assert categoria.nome == "Gravura"
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_falta_carregada_do_primario(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Uma réplica atrasada não põe a versão anterior no cache."""
+    primario, replica = (
+        create_engine(f"sqlite:///{tmp_path / nome}")
+        for nome in ("primario.db", "replica.db")
+    )
+    for engine, nome in ((primario, "Gravura"), (replica, "Pintura")):
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(CategoriaDB(nome=nome))
+            session.commit()
+    monkeypatch.setattr(
+        database, "roteador", RoteadorLeitura(primario, [replica])
+    )
+
+    with Session(replica) as session:
+        categoria = buscar_categoria_por_id(1, session)
+    primario.dispose()
+    replica.dispose()
+
+    assert categoria is not None
+    assert categoria.nome == "Gravura"
+    guardada = CACHE.obter(1)
+    assert guardada is not None
+    assert guardada.nome == "Gravura"
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_metricas_do_cache() -> None:
+    """``/metricas/cache`` traz os contadores de cada entidade."""
+    response = TestClient(app).get("/metricas/cache")
+
+    nomes = {cache["nome"] for cache in response.json()}
+    assert {"categorias", "obras", "eventos"} <= nomes
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_backend_redis_compartilhado_entre_processos() -> None:
+    """Uma escrita invalida a chave que o outro processo leria do Redis."""
+    servidor = RedisFalso()
+    processo_a, processo_b = (
+        CacheEntidade[CategoriaResponse](
+            "categorias_redis",
+            60,
+            10,
+            BackendRedis(servidor, "cache:c", CategoriaResponse),
+            modelo=CategoriaResponse,
+        )
+        for _ in range(2)
+    )
+    processo_a.obter_ou_carregar(
+        1, SEM_BANCO, lambda _: CategoriaDB(id=1, nome="Óleo")
+    )
+
+    categoria = processo_b.obter(1)
+    assert categoria == CategoriaResponse(id=1, nome="Óleo")
+    assert json.loads(servidor.dados["cache:c:1"]) == {"id": 1, "nome": "Óleo"}
+
+    processo_a.invalidar(1)
+    assert processo_b.obter(1) is None
+
+    processo_a.obter_ou_carregar(
+        2, SEM_BANCO, lambda _: CategoriaDB(id=2, nome="Aquarela")
+    )
+    processo_b.limpar()
+    assert not servidor.dados
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_redis_fora_do_ar_vira_falta() -> None:
+    """Sem o Redis, as leituras seguem para o banco."""
+    servidor = RedisFalso()
+    cache = CacheEntidade[CategoriaResponse](
+        "teste", 60, 10, BackendRedis(servidor, "t", CategoriaResponse)
+    )
+    servidor.fora_do_ar = True
+    categoria = CategoriaResponse(id=1, nome="Óleo")
+
+    assert (
+        cache.obter_ou_carregar(1, SEM_BANCO, lambda _: categoria) == categoria
+    )
+    assert cache.estatisticas().faltas == 1
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_redis_guarda_so_os_campos_da_resposta() -> None:
+    """O usuário vai ao Redis em JSON, sem a senha."""
+    servidor = RedisFalso()
+    cache = CacheEntidade[UsuarioResponse](
+        "usuarios_redis",
+        60,
+        10,
+        BackendRedis(servidor, "u", UsuarioResponse),
+        modelo=UsuarioResponse,
+    )
+    usuario = UsuarioDB(
+        id=1,
+        nome="Ana",
+        email="ana@exemplo.com",
+        funcao=Funcao.ARTISTA,
+        biografia="",
+        senha="segredo",
+    )
+
+    cache.obter_ou_carregar(1, SEM_BANCO, lambda _: usuario)
+
+    assert "senha" not in json.loads(servidor.dados["u:1"])
+    guardado = cache.obter(1)
+    assert isinstance(guardado, UsuarioResponse)
+    assert guardado.nome == "Ana"
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_redis_preserva_o_histograma_do_evento() -> None:
+    """As contagens por nota voltam do JSON com o evento guardado."""
+    servidor = RedisFalso()
+    cache = CacheEntidade[EventoGuardado](
+        "eventos_redis",
+        60,
+        10,
+        BackendRedis(servidor, "e", EventoGuardado),
+        modelo=EventoGuardado,
+    )
+    evento = EventoDB(
+        id=1,
+        nome="Evento",
+        endereco="Rua A",
+        local="Sala",
+        data=datetime(2025, 1, 1),  # noqa: DTZ001
+        id_organizador=1,
+        id_responsavel=1,
+        versao=3,
+        atualizado_em=datetime(2025, 1, 2),  # noqa: DTZ001
+    )
+    evento.resumo_avaliacoes = ResumoAvaliacoesDB(
+        evento_id=1, quantidade=2, soma=9, nota_4=1, nota_5=1
+    )
+
+    cache.obter_ou_carregar(1, SEM_BANCO, lambda _: evento)
+    guardado = cache.obter(1)
+
+    assert guardado is not None
+    assert guardado.versao == 3  # noqa: PLR2004
+    assert guardado.resumo_avaliacoes.histograma == {
+        1: 0,
+        2: 0,
+        3: 0,
+        4: 1,
+        5: 1,
+    }
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_redis_entrada_invalida_vira_falta() -> None:
+    """Uma entrada fora do esquema do modelo não é desserializada."""
+    servidor = RedisFalso()
+    servidor.dados["t:1"] = b"\x80\x04garbage"
+    cache = CacheEntidade[CategoriaResponse](
+        "teste", 60, 10, BackendRedis(servidor, "t", CategoriaResponse)
+    )
+
+    assert cache.obter(1) is None
+
+
+@pytest.mark.usefixtures("com_cache")
+def test_invalidacoes_de_outro_processo() -> None:
+    """O barramento aplica as invalidações alheias e ignora as próprias."""
+    CACHE.obter_ou_carregar(
+        1, SEM_BANCO, lambda _: CategoriaDB(id=1, nome="Óleo")
+    )
+    propria = carga_invalidacoes([("categorias", 1)])
+    alheia = json.dumps(
+        {"origem": "outro", "invalidacoes": [["categorias", 1], ["x", None]]}
+    )
+
+    assert aplicar_invalidacoes(propria) == 0
+    assert CACHE.obter(1) is not None
+    assert aplicar_invalidacoes(alheia) == 1
+    assert CACHE.obter(1) is None
+
+
+def test_carga_grande_invalida_o_cache_todo() -> None:
+    """Sem caber no ``NOTIFY``, a carga troca as chaves pelo cache todo."""
+    carga = carga_invalidacoes([("obras", i) for i in range(5000)])
+
+    assert json.loads(carga)["invalidacoes"] == [["obras", None]]
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("com_cache")
+def test_barramento_postgres(postgres_engine: Engine) -> None:
+    """O commit publica a invalidação e o barramento a recebe."""
+    cache = CacheEntidade[str]("barramento", 60, 10, BackendMemoria(10))
+    barramento = BarramentoInvalidacao(postgres_engine, intervalo=0.1)
+    barramento.iniciar()
+    try:
+        with (
+            pytest.MonkeyPatch.context() as monkeypatch,
+            Session(postgres_engine) as session,
+        ):
+            # Sem trocar a origem, o processo ignoraria a própria escrita.
+            monkeypatch.setattr("barramento.ORIGEM", "outro")
+            time.sleep(0.5)
+            invalidar_apos_commit(session, cache, 1)
+            session.commit()
+            limite = time.monotonic() + 5
+            while cache.invalidacoes < 2 and time.monotonic() < limite:  # noqa: PLR2004
+                time.sleep(0.05)
+    finally:
+        barramento.parar()
+
+    assert cache.invalidacoes == 2  # noqa: PLR2004
@@ -0,0 +1,130 @@
+"""Testes da seleção de campos das respostas (``?fields=``)."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Generator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+from app import app
+from database import RoteadorLeitura
+from models import EventoDB, ObraDB
+from models import campos as modulo_campos
+from models.campos import modelo_parcial
+from models.obra import ObraResponse
+
+
+@pytest.fixture
+def comandos(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    nova_obra: Callable[..., ObraDB],
+) -> Generator[list[str], None, None]:
+    """Aponta a aplicação para um SQLite com obras e um evento.
+
+    Yields:
+        list[str]: Comandos SQL executados pela aplicação.
+
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            nova_obra(f"Obra {i}", data_postagem=datetime(2025, 1, i + 1))  # noqa: DTZ001
+            for i in range(3)
+        )
+        session.add(
+            EventoDB(
+                nome="Evento",
+                endereco="Rua A",
+                local="Sala",
+                data=datetime(2025, 1, 1),  # noqa: DTZ001
+                id_organizador=1,
+                id_responsavel=1,
+            )
+        )
+        session.commit()
+    executados: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def registrar(*args: object) -> None:
+        executados.append(str(args[2]))
+
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+    yield executados
+    engine.dispose()
+
+
+def test_listagem_com_campos(comandos: list[str]) -> None:
+    """Só os campos pedidos voltam e só suas colunas são lidas."""
+    client = TestClient(app)
+
+    response = client.get(
+        "/obras/", params={"fields": "id,titulo", "limite": 2}
+    )
+
+    pagina = response.json()
+    assert [obra.keys() for obra in pagina["itens"]] == [{"id", "titulo"}] * 2
+    consulta = comandos[0]
+    assert consulta.startswith("SELECT obras.titulo, obras.id, obras.data_")
+    assert "obras.preco" not in consulta
+
+    seguinte = client.get(
+        "/obras/",
+        params={"fields": "titulo", "cursor": pagina["proximo_cursor"]},
+    ).json()
+    assert seguinte["itens"] == [{"titulo": "Obra 0"}]
+
+
+@pytest.mark.usefixtures("comandos")
+def test_detalhe_com_campos() -> None:
+    """O detalhe também aceita ``?fields=``, inclusive para relações."""
+    response = TestClient(app).get(
+        "/eventos/1", params={"fields": ["local", "resumo_avaliacoes"]}
+    )
+
+    assert response.json() == {
+        "local": "Sala",
+        "resumo_avaliacoes": {
+            "quantidade": 0,
+            "soma": 0,
+            "media": None,
+            "histograma": {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0},
+            "gostaram": 0,
+        },
+    }
+
+
+@pytest.mark.usefixtures("comandos")
+def test_campo_inexistente() -> None:
+    """Campos que a resposta não tem são rejeitados com 422."""
+    response = TestClient(app).get("/usuarios/", params={"fields": "id,x"})
+
+    assert response.status_code == 422  # noqa: PLR2004
+    assert response.json()["detail"][0]["loc"] == ["query", "fields"]
+
+
+def test_modelos_parciais_limitados(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Só as combinações de campos usadas por último ficam guardadas."""
+    monkeypatch.setattr(modulo_campos, "MODELOS_PARCIAIS_MAXIMO", 2)
+    monkeypatch.setattr(modulo_campos, "_modelos_parciais", OrderedDict())
+    id_, titulo, autor = (
+        frozenset({"id"}),
+        frozenset({"titulo"}),
+        frozenset({"autor"}),
+    )
+
+    primeiro = modelo_parcial(ObraResponse, id_)
+    modelo_parcial(ObraResponse, titulo)
+    assert modelo_parcial(ObraResponse, id_) is primeiro
+    modelo_parcial(ObraResponse, autor)
+
+    assert list(modulo_campos._modelos_parciais) == [  # noqa: SLF001
+        (ObraResponse, id_),
+        (ObraResponse, autor),
+    ]
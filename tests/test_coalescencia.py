@@ -0,0 +1,165 @@
+"""Testes da coalescência de leituras simultâneas."""
+
+import asyncio
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+import routers.evento
+from app import app
+from coalescencia import Coalescedor
+from database import RoteadorLeitura
+from models import EventoDB
+from models.categoria import CategoriaDB
+from models.evento import EventoGuardado
+from repositories.evento import buscar_evento_por_id
+
+
+def _leituras(
+    coalescedor: Coalescedor, chaves: list[str], espera: float = 0.05
+) -> tuple[list[str], list[str]]:
+    executadas: list[str] = []
+
+    async def ler(chave: str) -> str:
+        executadas.append(chave)
+        await asyncio.sleep(espera)
+        return chave.upper()
+
+    async def cenario() -> list[str]:
+        return await asyncio.gather(
+            *(
+                coalescedor.executar(chave, lambda chave=chave: ler(chave))
+                for chave in chaves
+            )
+        )
+
+    return asyncio.run(cenario()), executadas
+
+
+def test_leituras_iguais_compartilham_a_execucao() -> None:
+    """Cada chave é lida uma vez; as demais requisições aguardam."""
+    coalescedor = Coalescedor("teste", timeout=1)
+
+    resultados, executadas = _leituras(coalescedor, ["a", "a", "b", "a"])
+
+    assert resultados == ["A", "A", "B", "A"]
+    assert executadas == ["a", "b"]
+    estatisticas = coalescedor.estatisticas()
+    assert (estatisticas.execucoes, estatisticas.coalescidas) == (2, 2)
+    assert estatisticas.em_andamento == 0
+
+
+def test_espera_alem_do_timeout_le_de_novo() -> None:
+    """Quem espera além do timeout faz a própria leitura."""
+    coalescedor = Coalescedor("teste", timeout=0.01)
+
+    resultados, executadas = _leituras(coalescedor, ["a", "a"], espera=0.1)
+
+    assert resultados == ["A", "A"]
+    assert executadas == ["a", "a"]
+    assert coalescedor.estatisticas().timeouts == 1
+
+
+def test_leitura_anterior_a_um_commit_nao_e_aproveitada(
+    engine_memoria: Engine,
+) -> None:
+    """Depois de uma escrita, a próxima leitura não reaproveita a anterior."""
+    coalescedor = Coalescedor("teste", timeout=1)
+    executadas: list[int] = []
+
+    async def ler() -> int:
+        executadas.append(len(executadas))
+        await asyncio.sleep(0.05)
+        return len(executadas)
+
+    async def escrever() -> None:
+        await asyncio.sleep(0.01)
+        with Session(engine_memoria) as session:
+            session.add(CategoriaDB(nome="Pintura"))
+            session.commit()
+
+    async def cenario() -> tuple[Any, ...]:
+        primeira = asyncio.ensure_future(coalescedor.executar("a", ler))
+        await escrever()
+        return (await coalescedor.executar("a", ler), await primeira)
+
+    asyncio.run(cenario())
+
+    assert executadas == [0, 1]
+
+
+def test_erro_chega_a_todas_as_requisicoes() -> None:
+    """Uma falha na leitura compartilhada vale para quem aguardava."""
+    coalescedor = Coalescedor("teste", timeout=1)
+
+    async def falhar() -> None:
+        await asyncio.sleep(0.01)
+        raise LookupError
+
+    async def cenario() -> tuple[BaseException | None, ...]:
+        return await asyncio.gather(
+            coalescedor.executar("a", falhar),
+            coalescedor.executar("a", falhar),
+            return_exceptions=True,
+        )
+
+    erros = asyncio.run(cenario())
+
+    assert [type(erro) for erro in erros] == [LookupError, LookupError]
+    assert coalescedor.estatisticas().execucoes == 1
+
+
+def test_rota_de_evento_coalesce(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Requisições simultâneas ao mesmo evento fazem uma consulta."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(
+            EventoDB(
+                nome="Evento",
+                endereco="Rua A",
+                local="Sala",
+                data=datetime(2025, 1, 1),  # noqa: DTZ001
+                id_organizador=1,
+                id_responsavel=1,
+            )
+        )
+        session.commit()
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+    chamadas: list[int] = []
+
+    def buscar_devagar(
+        evento_id: int,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> EventoGuardado | EventoDB | None:
+        chamadas.append(evento_id)
+        time.sleep(0.1)
+        return buscar_evento_por_id(evento_id, **kwargs)
+
+    monkeypatch.setattr(routers.evento, "buscar_evento_por_id", buscar_devagar)
+
+    async def cenario() -> list[httpx.Response]:
+        transporte = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transporte, base_url="http://teste"
+        ) as cliente:
+            return await asyncio.gather(
+                *(cliente.get("/eventos/1") for _ in range(5)),
+                cliente.get("/eventos/1?fields=local"),
+            )
+
+    respostas = asyncio.run(cenario())
+    engine.dispose()
+
+    assert chamadas == [1, 1]
+    assert {resposta.json()["local"] for resposta in respostas[:5]} == {"Sala"}
+    assert respostas[5].json() == {"local": "Sala"}
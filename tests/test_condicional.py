@@ -0,0 +1,193 @@
+"""Testes das respostas condicionais (ETag e Last-Modified)."""
+
+from collections.abc import Callable, Generator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+from app import app
+from database import RoteadorLeitura
+from models import AvaliacaoEventoDB, EventoDB, ObraDB, UsuarioDB
+from models.usuario import Funcao
+from repositories.avaliacoes_eventos import adicionar_avaliacao
+
+
+@pytest.fixture
+def banco(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    nova_obra: Callable[..., ObraDB],
+) -> Generator[Engine, None, None]:
+    """Aponta a aplicação para um SQLite com obras e um evento.
+
+    Yields:
+        Engine: Engine usado pela aplicação.
+
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            nova_obra(f"Obra {i}", data_postagem=datetime(2025, 1, i + 1))  # noqa: DTZ001
+            for i in range(2)
+        )
+        session.add(
+            EventoDB(
+                nome="Evento",
+                endereco="Rua A",
+                local="Sala",
+                data=datetime(2025, 1, 1),  # noqa: DTZ001
+                id_organizador=1,
+                id_responsavel=1,
+            )
+        )
+        session.commit()
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+    yield engine
+    engine.dispose()
+
+
+def test_detalhe_nao_modificado(banco: Engine) -> None:
+    """Com o ETag atual, a obra não é carregada e a resposta é 304."""
+    client = TestClient(app)
+    response = client.get("/obras/1")
+    etag = response.headers["ETag"]
+    comandos: list[str] = []
+    event.listen(
+        banco,
+        "before_cursor_execute",
+        lambda *args: comandos.append(str(args[2])),
+    )
+
+    nao_modificada = client.get("/obras/1", headers={"If-None-Match": etag})
+
+    assert nao_modificada.status_code == 304  # noqa: PLR2004
+    assert not nao_modificada.content
+    assert nao_modificada.headers["ETag"] == etag
+    assert len(comandos) == 1
+    assert comandos[0].startswith("SELECT obras.versao, obras.atualizado_em")
+
+
+@pytest.mark.usefixtures("banco")
+def test_escrita_troca_o_etag() -> None:
+    """Depois de uma alteração, o ETag antigo recebe a obra nova."""
+    client = TestClient(app)
+    etag = client.get("/obras/1").headers["ETag"]
+    parcial = client.get("/obras/1", params={"fields": "titulo"})
+
+    client.patch("/obras/1", json={"preco": 5})
+    response = client.get("/obras/1", headers={"If-None-Match": etag})
+
+    assert parcial.headers["ETag"] != etag
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.json()["preco"] == 5  # noqa: PLR2004
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.usefixtures("banco")
+def test_if_modified_since() -> None:
+    """``If-Modified-Since`` compara com a última escrita, em segundos."""
+    client = TestClient(app)
+    modificado_em = client.get("/eventos/1").headers["Last-Modified"]
+
+    atual = client.get(
+        "/eventos/1", headers={"If-Modified-Since": modificado_em}
+    )
+    antiga = client.get(
+        "/eventos/1",
+        headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+    )
+
+    assert atual.status_code == 304  # noqa: PLR2004
+    assert antiga.status_code == 200  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("banco")
+def test_pagina_nao_modificada() -> None:
+    """A listagem devolve 304 enquanto os itens da página não mudam."""
+    client = TestClient(app)
+    response = client.get("/obras/", params={"limite": 1})
+    etag = response.headers["ETag"]
+
+    repetida = client.get(
+        "/obras/", params={"limite": 1}, headers={"If-None-Match": etag}
+    )
+    client.patch("/obras/2", json={"titulo": "Outra"})
+    alterada = client.get(
+        "/obras/", params={"limite": 1}, headers={"If-None-Match": etag}
+    )
+
+    assert "Last-Modified" not in response.headers
+    assert repetida.status_code == 304  # noqa: PLR2004
+    assert alterada.status_code == 200  # noqa: PLR2004
+    assert alterada.json()["itens"][0]["titulo"] == "Outra"
+
+
+def test_avaliacao_muda_a_versao_do_evento(banco: Engine) -> None:
+    """O resumo faz parte da resposta do evento: avaliá-lo gera versão."""
+    with Session(banco) as session:
+        adicionar_avaliacao(
+            AvaliacaoEventoDB(
+                usuario_id=1, evento_id=1, gostou="sim", avaliacao=5
+            ),
+            session,
+        )
+        evento = session.get(EventoDB, 1)
+
+        assert evento is not None
+        assert evento.versao == 2  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("banco")
+def test_rotas_sem_validadores() -> None:
+    """Listagens sem ETag continuam respondendo normalmente."""
+    response = TestClient(app).get("/eventos/obra/1")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.json() == {"itens": [], "proximo_cursor": None}
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.integration
+def test_postgres_grava_a_escrita_com_fuso(postgres_engine: Engine) -> None:
+    """A última escrita não depende do TimeZone da sessão."""
+    engine = create_engine(
+        postgres_engine.url,
+        connect_args={"options": "-c timezone=America/Sao_Paulo"},
+    )
+    SQLModel.metadata.create_all(engine)
+    antes = datetime.now(UTC).replace(microsecond=0)
+    with Session(engine) as session:
+        session.add(
+            UsuarioDB.model_validate(
+                {
+                    "nome": "Ana",
+                    "email": "ana@exemplo.com",
+                    "funcao": Funcao.ARTISTA.value,
+                    "biografia": "",
+                    "senha": "segredo",
+                }
+            )
+        )
+        session.flush()
+        evento = EventoDB(
+            nome="Evento",
+            endereco="Rua A",
+            local="Sala",
+            data=datetime(2025, 1, 1),  # noqa: DTZ001
+            id_organizador=1,
+            id_responsavel=1,
+        )
+        session.add(evento)
+        session.commit()
+        session.refresh(evento)
+
+    assert evento.atualizado_em is not None
+    assert antes <= evento.atualizado_em <= datetime.now(UTC)
+    engine.dispose()
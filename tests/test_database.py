@@ -0,0 +1,198 @@
+"""Testes do acesso ao banco nos modos síncrono e assíncrono."""
+
+import asyncio
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi import Request, Response
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import database
+from app import app
+from database import (
+    COOKIE_PRIMARIO,
+    RoteadorLeitura,
+    executar,
+    url_assincrona,
+)
+from models import CategoriaDB, EventoDB, ObraDB, UsuarioDB
+from models.usuario import Funcao
+from repositories.categoria import adicionar_categoria, buscar_categorias
+
+
+@pytest.mark.parametrize(
+    ("database_url", "esperado"),
+    [
+        (
+            "postgresql://u:s@localhost:5432/arte",
+            "postgresql+asyncpg://u:s@localhost:5432/arte",
+        ),
+        (
+            "postgresql+psycopg2://u:s@localhost/arte",
+            "postgresql+asyncpg://u:s@localhost/arte",
+        ),
+        ("sqlite:///database.db", "sqlite+aiosqlite:///database.db"),
+    ],
+)
+def test_url_assincrona(database_url: str, esperado: str) -> None:
+    """Converte a URL síncrona para o driver assíncrono equivalente."""
+    assert url_assincrona(database_url) == esperado
+
+
+def test_url_assincrona_sem_driver() -> None:
+    """Rejeita bancos sem driver assíncrono conhecido."""
+    with pytest.raises(ValueError, match="driver assíncrono"):
+        url_assincrona("mysql://u:s@localhost/arte")
+
+
+def test_executar_nos_dois_modos(tmp_path: Path) -> None:
+    """A mesma função de repositório roda em Session e AsyncSession."""
+    database_url = f"sqlite:///{tmp_path / 'teste.db'}"
+    engine = create_engine(database_url)
+    SQLModel.metadata.create_all(engine)
+
+    async def cenario() -> list[str]:
+        with Session(engine) as session:
+            await executar(
+                session, adicionar_categoria, CategoriaDB(nome="Pintura")
+            )
+
+        async_engine = create_async_engine(url_assincrona(database_url))
+        async with AsyncSession(
+            async_engine, expire_on_commit=False
+        ) as session:
+            await executar(
+                session, adicionar_categoria, CategoriaDB(nome="Escultura")
+            )
+            categorias = await executar(session, buscar_categorias)
+        await async_engine.dispose()
+        return [categoria.nome for categoria in categorias.itens]
+
+    assert asyncio.run(cenario()) == ["Pintura", "Escultura"]
+    engine.dispose()
+
+
+def _requisicao(metodo: str, cookie: str | None = None) -> Request:
+    headers = []
+    if cookie is not None:
+        headers.append((b"cookie", f"{COOKIE_PRIMARIO}={cookie}".encode()))
+    return Request({"type": "http", "method": metodo, "headers": headers})
+
+
+def test_roteador_leitura_envia_gets_para_replicas() -> None:
+    """GETs alternam entre as réplicas e escritas usam o primário."""
+    primario = create_engine("sqlite://")
+    replicas = [create_engine("sqlite://"), create_engine("sqlite://")]
+    roteador = RoteadorLeitura(primario, replicas)
+
+    escolhidos = [
+        roteador.escolher(_requisicao("GET"), Response()) for _ in range(4)
+    ]
+    assert escolhidos == [*replicas, *replicas]
+
+    response = Response()
+    assert roteador.escolher(_requisicao("POST"), response) is primario
+    assert COOKIE_PRIMARIO in response.headers["set-cookie"]
+
+
+def test_roteador_leitura_respeita_janela_pos_escrita() -> None:
+    """Um cliente que acabou de escrever continua lendo do primário."""
+    primario = create_engine("sqlite://")
+    replica = create_engine("sqlite://")
+    roteador = RoteadorLeitura(primario, [replica], janela_segundos=5)
+
+    response = Response()
+    roteador.escolher(_requisicao("PUT"), response)
+    cookie = response.headers["set-cookie"].split(";")[0].split("=")[1]
+
+    assert roteador.escolher(_requisicao("GET", cookie), Response()) is (
+        primario
+    )
+    assert roteador.escolher(_requisicao("GET", "0"), Response()) is replica
+    assert roteador.escolher(_requisicao("GET", "x"), Response()) is replica
+
+
+USUARIO: dict[str, Any] = {
+    "nome": "Ana",
+    "email": "ana@exemplo.com",
+    "funcao": Funcao.ARTISTA.value,
+    "biografia": "",
+    "senha": "segredo",
+}
+EVENTO: dict[str, Any] = {
+    "nome": "Bienal",
+    "endereco": "Rua A",
+    "local": "Sala",
+    "data": "2025-01-01T00:00:00",
+    "id_organizador": 1,
+    "id_responsavel": 1,
+}
+
+
+@pytest.fixture
+def com_replica(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    nova_obra: Callable[..., ObraDB],
+) -> Generator[None, None, None]:
+    """Aponta a aplicação para um primário com dados e uma réplica vazia.
+
+    Yields:
+        None: Roteador com a réplica configurado.
+
+    """
+    primario = create_engine(f"sqlite:///{tmp_path / 'primario.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    SQLModel.metadata.create_all(primario)
+    with Session(primario) as session:
+        session.add(UsuarioDB.model_validate(USUARIO))
+        session.add(CategoriaDB(nome="Pintura"))
+        session.add(nova_obra("Obra"))
+        session.add(EventoDB.model_validate(EVENTO))
+        session.commit()
+    monkeypatch.setattr(
+        database, "roteador", RoteadorLeitura(primario, [replica])
+    )
+    yield
+    primario.dispose()
+    replica.dispose()
+
+
+@pytest.mark.usefixtures("com_replica")
+@pytest.mark.parametrize(
+    ("metodo", "caminho", "corpo"),
+    [
+        ("POST", "/obras/", "obra"),
+        ("PUT", "/obras/1", "obra"),
+        ("PATCH", "/obras/1", {"preco": 2}),
+        ("DELETE", "/obras/1", None),
+        ("POST", "/eventos/", EVENTO),
+        ("PUT", "/eventos/1", EVENTO),
+        ("PATCH", "/eventos/1", {"local": "Pátio"}),
+        ("DELETE", "/eventos/1", None),
+        ("POST", "/usuarios/", USUARIO | {"email": "bia@exemplo.com"}),
+        ("PUT", "/usuarios/1", USUARIO),
+        ("PATCH", "/usuarios/1", {"biografia": "Pintora"}),
+        ("DELETE", "/usuarios/1", None),
+    ],
+)
+def test_escritas_gravam_o_cookie_do_primario(
+    nova_obra: Callable[..., ObraDB],
+    metodo: str,
+    caminho: str,
+    corpo: dict[str, Any] | str | None,
+) -> None:
+    """As rotas que devolvem a resposta pronta mantêm o ``primario_ate``."""
+    if corpo == "obra":
+        corpo = nova_obra("Nova").model_dump(exclude={"id", "data_postagem"})
+
+    response = TestClient(app).request(metodo, caminho, json=corpo)
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.json() is not None
+    assert COOKIE_PRIMARIO in response.cookies
@@ -0,0 +1,76 @@
+"""Testes das escritas com ``RETURNING``."""
+
+from collections.abc import Callable
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from models import ObraDB
+from models.categoria import CategoriaDB
+from repositories.categoria import (
+    adicionar_categoria,
+    atualizar_categoria_bd,
+    remover_categoria,
+)
+from repositories.obra import adicionar_obra, atualizar_obra_bd, remover_obra
+from repositories.tag import buscar_tags
+
+
+def test_insercao_sem_releitura(
+    engine_memoria: Engine,
+    consultas: list[str],
+    nova_obra: Callable[..., ObraDB],
+) -> None:
+    """O INSERT devolve o id e a data gerada pelo banco, sem ``SELECT``."""
+    with Session(engine_memoria, expire_on_commit=False) as session:
+        consultas.clear()
+        categoria = adicionar_categoria(CategoriaDB(nome="Pintura"), session)
+        assert [c.split()[0] for c in consultas] == ["INSERT"]
+        assert categoria.id == 1
+
+        consultas.clear()
+        obra = adicionar_obra(nova_obra("A"), session)
+        assert [c.split()[0] for c in consultas] == ["INSERT"]
+        assert obra.data_postagem is not None
+
+
+def test_uma_instrucao_por_escrita(
+    engine_memoria: Engine, consultas: list[str]
+) -> None:
+    """Atualizar e remover gravam e devolvem a linha em um só comando."""
+    with Session(engine_memoria) as session:
+        session.add(CategoriaDB(nome="Pintura"))
+        session.commit()
+
+        consultas.clear()
+        atualizada = atualizar_categoria_bd(1, {"nome": "Escultura"}, session)
+        assert [c.split()[0] for c in consultas] == ["UPDATE"]
+        assert atualizada is not None
+        assert atualizada.nome == "Escultura"
+
+        consultas.clear()
+        removida = remover_categoria(1, session)
+        assert [c.split()[0] for c in consultas] == ["DELETE"]
+        assert removida is not None
+        assert removida.nome == "Escultura"
+
+        assert atualizar_categoria_bd(1, {"nome": "X"}, session) is None
+        assert remover_categoria(1, session) is None
+
+
+def test_atualizacao_parcial_da_obra(
+    engine_memoria: Engine, nova_obra: Callable[..., ObraDB]
+) -> None:
+    """Só as colunas enviadas mudam e as contagens de tags acompanham."""
+    with Session(engine_memoria) as session:
+        obra = adicionar_obra(nova_obra("A", tags=["Azul", "mar"]), session)
+
+        atualizada = atualizar_obra_bd(
+            obra.id, {"preco": 42.0, "tags": ["mar", "Sol"]}, session
+        )
+        assert atualizada is not None
+        assert (atualizada.titulo, atualizada.preco) == ("A", 42.0)
+        assert {t.nome for t in buscar_tags(session)} == {"mar", "sol"}
+
+        remover_obra(obra.id, session)
+        assert buscar_tags(session) == []
@@ -0,0 +1,157 @@
+"""Testes da consulta da página completa de um evento."""
+
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+from app import app
+from database import RoteadorLeitura
+from models import (
+    AvaliacaoEventoDB,
+    ComentarioEventoDB,
+    EventoDB,
+    ObraDB,
+    ObraEventoDB,
+    UsuarioDB,
+)
+from models.comentario_evento import StatusComentario
+from models.usuario import Funcao
+from repositories.avaliacoes_eventos import reconstruir_resumos_avaliacoes
+from repositories.evento import buscar_evento_completo
+
+CONSULTAS_POR_PAGINA = 3
+
+
+def _cadastrar_evento(
+    session: Session, nova_obra: Callable[..., ObraDB], tamanho: int
+) -> int:
+    usuario = UsuarioDB(
+        nome="Ana",
+        email="ana@example.com",
+        funcao=Funcao.ARTISTA,
+        biografia="",
+        senha="x",
+    )
+    session.add(usuario)
+    session.flush()
+    evento = EventoDB(
+        nome="Bienal",
+        endereco="Rua A",
+        local="Pavilhão",
+        data=datetime(2025, 1, 1),  # noqa: DTZ001
+        id_organizador=usuario.id,
+        id_responsavel=usuario.id,
+    )
+    obras = [nova_obra(f"O{i}", usuario_id=usuario.id) for i in range(tamanho)]
+    session.add_all([evento, *obras])
+    session.flush()
+    session.add_all(
+        ObraEventoDB(id_obra=obra.id, id_evento=evento.id) for obra in obras
+    )
+    session.add_all(
+        ComentarioEventoDB(
+            usuario_id=usuario.id,
+            evento_id=evento.id,
+            comentario=f"C{i}",
+            status=StatusComentario.ATIVO
+            if i % 2
+            else StatusComentario.INATIVO,
+        )
+        for i in range(tamanho)
+    )
+    session.add_all(
+        AvaliacaoEventoDB(
+            usuario_id=usuario.id,
+            evento_id=evento.id,
+            gostou="sim",
+            avaliacao=1 + i % 5,
+        )
+        for i in range(tamanho)
+    )
+    session.commit()
+    reconstruir_resumos_avaliacoes(session)
+    return evento.id
+
+
+@pytest.mark.parametrize("tamanho", [4, 40])
+def test_quantidade_de_consultas_fixa(
+    engine_memoria: Engine,
+    nova_obra: Callable[..., ObraDB],
+    consultas: list[str],
+    tamanho: int,
+) -> None:
+    """O número de consultas não depende do tamanho do evento."""
+    with Session(engine_memoria) as session:
+        evento_id = _cadastrar_evento(session, nova_obra, tamanho)
+    consultas.clear()
+
+    with Session(engine_memoria) as session:
+        dados = buscar_evento_completo(
+            evento_id, session, limite=3, limite_comentarios=2
+        )
+        assert dados is not None
+        assert dados.evento.organizador.nome == "Ana"
+        assert dados.evento.responsavel.nome == "Ana"
+
+    assert len(consultas) == CONSULTAS_POR_PAGINA
+    assert len(dados.obras.itens) == min(tamanho, 3)
+    assert [c.comentario for c in dados.comentarios_recentes] == [
+        f"C{tamanho - 1}",
+        f"C{tamanho - 3}",
+    ]
+    assert dados.evento.resumo_avaliacoes is not None
+    assert dados.evento.resumo_avaliacoes.quantidade == tamanho
+
+
+def test_evento_inexistente(engine_memoria: Engine) -> None:
+    """Evento inexistente retorna None sem carregar o restante."""
+    with Session(engine_memoria) as session:
+        assert buscar_evento_completo(999, session) is None
+
+
+def test_rota_do_evento_completo(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    nova_obra: Callable[..., ObraDB],
+) -> None:
+    """A rota monta a página com os dados de cada parte."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        evento_id = _cadastrar_evento(session, nova_obra, 4)
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+
+    resposta = TestClient(app).get(
+        f"/eventos/{evento_id}/completo",
+        params={"limite": 2, "comentarios": 1},
+    )
+    engine.dispose()
+
+    assert resposta.status_code == 200  # noqa: PLR2004
+    completo = resposta.json()
+    assert completo["nome"] == "Bienal"
+    assert completo["organizador"]["nome"] == "Ana"
+    assert "senha" not in completo["responsavel"]
+    assert [obra["titulo"] for obra in completo["obras"]["itens"]] == [
+        "O3",
+        "O2",
+    ]
+    assert completo["obras"]["proximo_cursor"] is not None
+    assert [c["comentario"] for c in completo["comentarios_recentes"]] == [
+        "C3"
+    ]
+    assert completo["resumo_avaliacoes"]["quantidade"] == 4  # noqa: PLR2004
+    assert completo["resumo_avaliacoes"]["histograma"] == {
+        "1": 1,
+        "2": 1,
+        "3": 1,
+        "4": 1,
+        "5": 0,
+    }
+    assert "versao" not in completo
@@ -0,0 +1,92 @@
+"""Testes da exportação do catálogo de obras."""
+
+import csv
+import io
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+from app import app
+from database import RoteadorLeitura
+from exportacao import MEDIA_TYPE_CSV
+from models import CategoriaDB, ObraDB, UsuarioDB
+from models.usuario import Funcao
+
+
+@pytest.fixture
+def obras_cadastradas(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    nova_obra: Callable[..., ObraDB],
+) -> Generator[None, None, None]:
+    """Aponta a aplicação para um SQLite com algumas obras.
+
+    Yields:
+        None: Banco populado durante o teste.
+
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(
+            UsuarioDB(
+                nome="Ana",
+                email="ana@example.com",
+                funcao=Funcao.ARTISTA,
+                biografia="",
+                senha="x",
+            )
+        )
+        session.add_all(
+            [CategoriaDB(nome="Pintura"), CategoriaDB(nome="Foto")]
+        )
+        session.add_all(
+            [
+                nova_obra("Mar", tags=["azul", "mar"], preco=100),
+                nova_obra("Rio", categoria_id=2, preco=20),
+                nova_obra("Céu", tags=["azul"], preco=300),
+            ]
+        )
+        session.commit()
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+    monkeypatch.setattr(database.settings, "database_streaming_lote", 2)
+    yield
+    engine.dispose()
+
+
+@pytest.mark.usefixtures("obras_cadastradas")
+def test_exportacao_csv_com_colunas_e_filtros() -> None:
+    """Só as colunas pedidas saem, na ordem pedida e com os filtros."""
+    response = TestClient(app).get(
+        "/exports/obras.csv",
+        params={
+            "colunas": ["titulo", "categoria_nome", "tags"],
+            "preco_min": 50,
+        },
+    )
+
+    assert response.headers["content-type"].startswith(MEDIA_TYPE_CSV)
+    assert "attachment" in response.headers["content-disposition"]
+    assert list(csv.reader(io.StringIO(response.text))) == [
+        ["titulo", "categoria_nome", "tags"],
+        ["Mar", "Pintura", "azul;mar"],
+        ["Céu", "Pintura", "azul"],
+    ]
+
+
+@pytest.mark.usefixtures("obras_cadastradas")
+def test_exportacao_parquet() -> None:
+    """O Parquet traz todas as colunas com os tipos do banco."""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    response = TestClient(app).get("/exports/obras.parquet")
+
+    tabela = pq.read_table(io.BytesIO(response.content))
+    assert tabela.num_rows == 3  # noqa: PLR2004
+    assert tabela.column("usuario_nome").to_pylist() == ["Ana"] * 3
+    assert tabela.column("tags").to_pylist() == [["azul", "mar"], [], ["azul"]]
+    assert str(tabela.schema.field("preco").type) == "double"
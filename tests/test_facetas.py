@@ -0,0 +1,116 @@
+"""Testes dos filtros de obras e das contagens por faceta."""
+
+from collections.abc import Callable, Generator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+from app import app
+from database import RoteadorLeitura
+from models import ObraDB
+from models.obra import FiltrosObra
+from repositories.obra import buscar_obras, contar_facetas
+
+
+@pytest.fixture
+def session(
+    engine_memoria: Engine, nova_obra: Callable[..., ObraDB]
+) -> Generator[Session, None, None]:
+    """Cadastra obras variando categoria, técnica, preço e dimensões.
+
+    Yields:
+        Session: Sessão sobre as obras cadastradas.
+
+    """
+    session = Session(engine_memoria)
+    session.add_all(
+        [
+            nova_obra("A", categoria_id=1, preco=50, ano_producao=1990),
+            nova_obra("B", categoria_id=1, preco=700, altura_centimetros=90),
+            nova_obra(
+                "C", categoria_id=2, preco=20_000, tecnica_criacao="Bronze"
+            ),
+            nova_obra("D", categoria_id=2, preco=80, usuario_id=2),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.mark.parametrize(
+    ("filtros", "esperados"),
+    [
+        (FiltrosObra(categoria_id=1, preco_min=100), {"B"}),
+        (FiltrosObra(preco_max=80, ano_producao_max=2000), {"A"}),
+        (FiltrosObra(tecnica_criacao="Bronze"), {"C"}),
+        (FiltrosObra(usuario_id=2), {"D"}),
+        (FiltrosObra(altura_min=10, altura_max=100), {"B"}),
+    ],
+)
+def test_filtros_combinados(
+    session: Session, filtros: FiltrosObra, esperados: set[str]
+) -> None:
+    """Os filtros de igualdade e de faixa se combinam com ``AND``."""
+    pagina = buscar_obras(session, filtros)
+    assert {obra.titulo for obra in pagina.itens} == esperados
+
+
+def test_facetas_em_uma_consulta(
+    session: Session, consultas: list[str]
+) -> None:
+    """Cada faceta ignora o próprio filtro e respeita os demais."""
+    consultas.clear()
+    facetas = contar_facetas(session, FiltrosObra(categoria_id=1))
+
+    assert len(consultas) == 1
+    assert [(c.categoria_id, c.quantidade) for c in facetas.categorias] == [
+        (1, 2),
+        (2, 2),
+    ]
+    assert [(t.tecnica_criacao, t.quantidade) for t in facetas.tecnicas] == [
+        ("Óleo", 2)
+    ]
+    assert [f.quantidade for f in facetas.faixas_preco] == [1, 0, 1, 0, 0, 0]
+    assert facetas.faixas_preco[-1].maximo is None
+
+
+def test_facetas_so_na_primeira_pagina(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    nova_obra: Callable[..., ObraDB],
+) -> None:
+    """As páginas seguintes não repetem a agregação das facetas."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            nova_obra(titulo, data_postagem=datetime(2025, 1, dia))  # noqa: DTZ001
+            for dia, titulo in enumerate("ABC", start=1)
+        )
+        session.commit()
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+    client = TestClient(app)
+
+    primeira = client.get("/obras/", params={"limite": 2}).json()
+    comandos: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: comandos.append(str(args[2])),
+    )
+    segunda = client.get(
+        "/obras/", params={"limite": 2, "cursor": primeira["proximo_cursor"]}
+    ).json()
+    engine.dispose()
+
+    assert [c["quantidade"] for c in primeira["facetas"]["categorias"]] == [3]
+    assert [obra["titulo"] for obra in segunda["itens"]] == ["A"]
+    assert segunda["facetas"] is None
+    assert len(comandos) == 1
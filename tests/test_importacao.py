@@ -0,0 +1,112 @@
+"""Testes da importação de obras por CSV."""
+
+import io
+from collections.abc import Generator
+from datetime import datetime
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, col, select
+
+from models import CategoriaDB, ObraDB, ObraTagDB, TagDB, UsuarioDB
+from models.usuario import Funcao
+from repositories.importacao import importar_obras_csv
+
+CABECALHO = (
+    "titulo,autor,ano_producao,tecnica_criacao,altura_centimetros,"
+    "largura_centimetros,peso_quilos,tags,preco,status,usuario_id,"
+    "categoria_id,data_postagem"
+)
+LINHAS = (
+    "Mar,Ana,2020,Óleo,10,20,1,Paisagem; mar,100,true,1,1,",
+    "Sem ano,Ana,mil,Óleo,10,20,1,,100,true,1,1,",
+    'Retrato,"Silva, J.",2019,Guache,5,5,1,retrato;MAR,50,false,1,1,'
+    "2024-05-01T10:00:00",
+    "Órfã,Ana,2020,Óleo,10,20,1,,100,true,9,1,",
+    "Vazia,Ana,2021,Aquarela,1,1,1,,10,true,1,1,",
+)
+ARQUIVO = "\n".join((CABECALHO, *LINHAS))
+
+
+def _cadastrar_referencias(session: Session) -> None:
+    session.add(
+        UsuarioDB(
+            nome="Ana",
+            email="ana@example.com",
+            funcao=Funcao.ARTISTA,
+            biografia="",
+            senha="x",
+        )
+    )
+    session.add(CategoriaDB(nome="Pintura"))
+    session.add(TagDB(nome="mar", quantidade=3))
+    session.commit()
+
+
+@pytest.fixture
+def session(engine_memoria: Engine) -> Generator[Session, None, None]:
+    """Cadastra o usuário e a categoria referenciados pelo CSV.
+
+    Yields:
+        Session: Sessão sobre o banco em memória.
+
+    """
+    session = Session(engine_memoria)
+    _cadastrar_referencias(session)
+    yield session
+    session.close()
+
+
+def test_importacao_csv(session: Session, consultas: list[str]) -> None:
+    """Linhas inválidas ou órfãs voltam no relatório; as demais entram."""
+    consultas.clear()
+    relatorio = importar_obras_csv(io.StringIO(ARQUIVO), session, lote=2)
+
+    assert (
+        relatorio.lidas,
+        relatorio.importadas,
+        relatorio.total_erros,
+    ) == (5, 3, 2)
+    assert [(e.indice, e.erros[0].loc) for e in relatorio.erros] == [
+        (3, ["ano_producao"]),
+        (5, ["usuario_id"]),
+    ]
+    assert sum(c.startswith("INSERT INTO obras ") for c in consultas) == 1
+
+    obras = {
+        obra.titulo: obra
+        for obra in session.exec(select(ObraDB).order_by(col(ObraDB.id)))
+    }
+    assert list(obras) == ["Mar", "Retrato", "Vazia"]
+    assert obras["Retrato"].autor == "Silva, J."
+    assert obras["Retrato"].data_postagem == datetime(2024, 5, 1, 10)  # noqa: DTZ001
+    assert obras["Mar"].tags == ["Paisagem", "mar"]
+    assert set(session.exec(select(ObraTagDB.obra_id, ObraTagDB.tag))) == {
+        (obras["Mar"].id, "paisagem"),
+        (obras["Mar"].id, "mar"),
+        (obras["Retrato"].id, "retrato"),
+        (obras["Retrato"].id, "mar"),
+    }
+    tags = session.exec(select(TagDB.nome, TagDB.quantidade)).all()
+    assert dict(tags) == {
+        "mar": 5,
+        "paisagem": 1,
+        "retrato": 1,
+    }
+    assert not inspect(session.connection()).get_temp_table_names()
+
+
+@pytest.mark.integration
+def test_importacao_csv_postgres(postgres_engine: Engine) -> None:
+    """No PostgreSQL as linhas chegam à tabela temporária por ``COPY``."""
+    SQLModel.metadata.create_all(postgres_engine)
+    with Session(postgres_engine) as session:
+        _cadastrar_referencias(session)
+        relatorio = importar_obras_csv(io.StringIO(ARQUIVO), session, lote=2)
+        titulos = session.exec(select(ObraDB.titulo)).all()
+        tags = session.exec(select(TagDB.nome, TagDB.quantidade)).all()
+
+    assert (relatorio.importadas, relatorio.total_erros) == (3, 2)
+    assert sorted(titulos) == ["Mar", "Retrato", "Vazia"]
+    assert dict(tags) == {"mar": 5, "paisagem": 1, "retrato": 1}
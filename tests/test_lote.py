@@ -0,0 +1,85 @@
+"""Testes das criações em lote."""
+
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from models import CategoriaDB, ObraDB, UsuarioDB
+from models.lote import validar_lote
+from models.obra import ObraCreate
+from models.usuario import Funcao
+from repositories.escrita import inserir_em_lotes
+from repositories.obra import adicionar_obras_em_lote
+from repositories.tag import buscar_tags
+
+
+def _obra(nova_obra: Callable[..., ObraDB], **campos: Any) -> dict[str, Any]:  # noqa: ANN401
+    obra = nova_obra("A").model_dump(exclude={"id", "data_postagem"})
+    return obra | campos
+
+
+def test_erros_por_item(
+    engine_memoria: Engine, nova_obra: Callable[..., ObraDB]
+) -> None:
+    """Itens inválidos ou sem referência viram erro e os demais entram."""
+    with Session(engine_memoria) as session:
+        session.add(
+            UsuarioDB(
+                nome="U",
+                email="u@example.com",
+                funcao=Funcao.ARTISTA,
+                biografia="",
+                senha="x",
+            )
+        )
+        session.add(CategoriaDB(nome="C"))
+        session.commit()
+
+        linhas, erros = validar_lote(
+            ObraCreate,
+            [
+                _obra(nova_obra, tags=["Azul", "mar"]),
+                _obra(nova_obra, preco="caro"),
+                _obra(nova_obra, categoria_id=9),
+                _obra(nova_obra, tags=["azul"]),
+            ],
+        )
+        resultado = adicionar_obras_em_lote(linhas, session).com_erros(erros)
+        tags = {tag.nome: tag.quantidade for tag in buscar_tags(session)}
+
+    assert [item.indice for item in resultado.criados] == [0, 3]
+    assert [(e.indice, e.erros[0].loc) for e in resultado.erros] == [
+        (1, ["preco"]),
+        (2, ["categoria_id"]),
+    ]
+    assert tags == {"azul": 2, "mar": 1}
+
+
+def test_lote_com_violacao_repete_linha_a_linha(
+    engine_memoria: Engine,
+) -> None:
+    """Uma linha que viola restrição não impede as outras do mesmo lote."""
+    with Session(engine_memoria) as session:
+        resultado = inserir_em_lotes(
+            session, CategoriaDB, {0: {"nome": "A"}, 1: {}, 2: {"nome": "B"}}
+        )
+        nomes = [c.nome for c in session.exec(select(CategoriaDB))]
+
+    assert [item.indice for item in resultado.criados] == [0, 2]
+    assert [erro.indice for erro in resultado.erros] == [1]
+    assert nomes == ["A", "B"]
+
+
+def test_valor_recusado_pelo_banco_vira_erro(engine_memoria: Engine) -> None:
+    """Um valor que o driver não aceita é reportado só na sua linha."""
+    with Session(engine_memoria) as session:
+        resultado = inserir_em_lotes(
+            session, CategoriaDB, {0: {"nome": "A"}, 1: {"nome": ["B"]}}
+        )
+
+    assert [item.indice for item in resultado.criados] == [0]
+    assert [(e.indice, e.erros[0].type) for e in resultado.erros] == [
+        (1, "banco")
+    ]
@@ -0,0 +1,144 @@
+"""Testes das obras de um evento: listagens e associação em lote."""
+
+from collections.abc import Callable, Generator
+from datetime import datetime
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from errors import ObrasInexistentesError
+from models import EventoDB, ObraDB, ObraEventoDB
+from models.obra import FiltrosObra
+from models.obra_evento import ModoAssociacao
+from repositories.evento import buscar_eventos_por_obra
+from repositories.obra import buscar_obras_por_evento
+from repositories.obra_evento import associar_obras_ao_evento
+
+
+def _evento(local: str) -> EventoDB:
+    return EventoDB(
+        nome=local,
+        endereco="Rua A",
+        local=local,
+        data=datetime(2025, 1, 1),  # noqa: DTZ001
+        id_organizador=1,
+        id_responsavel=1,
+    )
+
+
+@pytest.fixture
+def session(
+    engine_memoria: Engine, nova_obra: Callable[..., ObraDB]
+) -> Generator[Session, None, None]:
+    """Cadastra um evento com quatro obras, uma obra solta e um evento vazio.
+
+    Yields:
+        Session: Sessão aberta sobre os dados cadastrados.
+
+    """
+    session = Session(engine_memoria)
+    evento, vazio = _evento("Galeria"), _evento("Vazio")
+    obras = [
+        nova_obra(
+            f"O{i}",
+            data_postagem=datetime(2025, 1, i + 1),  # noqa: DTZ001
+            status=i % 2 == 0,
+            categoria_id=1 + i // 2,
+        )
+        for i in range(4)
+    ]
+    session.add_all([evento, vazio, *obras, nova_obra("Solta")])
+    session.flush()
+    session.add_all(
+        ObraEventoDB(id_obra=obra.id, id_evento=evento.id) for obra in obras
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_evento_inexistente_e_evento_vazio(
+    session: Session, consultas: list[str]
+) -> None:
+    """Distingue evento inexistente de evento sem obras em uma consulta."""
+    assert buscar_obras_por_evento(999, session) is None
+    pagina = buscar_obras_por_evento(2, session)
+    assert pagina is not None
+    assert list(pagina.itens) == []
+    assert len(consultas) == len(["inexistente", "vazio"])
+
+
+def test_obras_do_evento_paginadas_e_filtradas(
+    session: Session, consultas: list[str]
+) -> None:
+    """Filtros e cursor são aplicados na mesma consulta da junção."""
+    primeira = buscar_obras_por_evento(1, session, limite=3)
+    assert primeira is not None
+    assert [obra.titulo for obra in primeira.itens] == ["O3", "O2", "O1"]
+    assert len(consultas) == 1
+
+    segunda = buscar_obras_por_evento(
+        1, session, cursor=primeira.proximo_cursor, limite=3
+    )
+    assert segunda is not None
+    assert [obra.titulo for obra in segunda.itens] == ["O0"]
+    assert segunda.proximo_cursor is None
+
+    filtradas = buscar_obras_por_evento(
+        1, session, FiltrosObra(status=True, categoria_id=2)
+    )
+    assert filtradas is not None
+    assert [obra.titulo for obra in filtradas.itens] == ["O2"]
+
+
+def test_eventos_da_obra(session: Session) -> None:
+    """A listagem inversa também distingue obra inexistente de obra solta."""
+    assert buscar_eventos_por_obra(999, session) is None
+    solta = buscar_eventos_por_obra(5, session)
+    assert solta is not None
+    assert list(solta.itens) == []
+    pagina = buscar_eventos_por_obra(1, session)
+    assert pagina is not None
+    assert [evento.local for evento in pagina.itens] == ["Galeria"]
+
+
+@pytest.mark.parametrize(
+    ("modo", "obras", "esperada"),
+    [
+        (ModoAssociacao.DEFINIR, [2, 3, 5, 5], ([5], [1, 4])),
+        (ModoAssociacao.ADICIONAR, [1, 5], ([5], [])),
+        (ModoAssociacao.REMOVER, [1, 2, 5], ([], [1, 2])),
+        (ModoAssociacao.DEFINIR, [], ([], [1, 2, 3, 4])),
+    ],
+)
+def test_associacao_em_lote(
+    session: Session,
+    consultas: list[str],
+    modo: ModoAssociacao,
+    obras: list[int],
+    esperada: tuple[list[int], list[int]],
+) -> None:
+    """Cada modo devolve a diferença aplicada, com um comando por escrita."""
+    consultas.clear()
+    diferenca = associar_obras_ao_evento(1, obras, modo, session)
+
+    assert diferenca is not None
+    assert (diferenca.adicionadas, diferenca.removidas) == esperada
+    escritas = [c.split()[0] for c in consultas if c.split()[0] != "SELECT"]
+    assert escritas.count("DELETE") <= 1
+    assert escritas.count("INSERT") <= 1
+
+
+def test_associacao_com_obra_ou_evento_inexistente(session: Session) -> None:
+    """Evento inexistente devolve None e obra inexistente não grava nada."""
+    assert (
+        associar_obras_ao_evento(999, [1], ModoAssociacao.DEFINIR, session)
+        is None
+    )
+    with pytest.raises(ObrasInexistentesError) as erro:
+        associar_obras_ao_evento(2, [1, 998], ModoAssociacao.DEFINIR, session)
+    assert erro.value.ids == [998]
+    pagina = buscar_obras_por_evento(1, session)
+    assert pagina is not None
+    assert len(pagina.itens) == len(["O0", "O1", "O2", "O3"])
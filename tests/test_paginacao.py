@@ -0,0 +1,89 @@
+"""Testes da paginação por cursor (keyset)."""
+
+from collections.abc import Callable
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app import app
+from errors import CursorInvalidoError
+from models import CategoriaDB, ObraDB
+from repositories.categoria import buscar_categorias
+from repositories.obra import ORDEM, buscar_obras
+from repositories.paginacao import codificar_cursor, decodificar_cursor
+
+BAD_REQUEST = 400
+
+
+def test_cursor_preserva_tipos() -> None:
+    """O cursor devolve datas e inteiros com o tipo de cada coluna."""
+    valores = [datetime(2025, 1, 2, 3, 4, 5), 42]  # noqa: DTZ001
+    cursor = codificar_cursor(valores)
+    assert decodificar_cursor(cursor, ORDEM.colunas) == valores
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "não-é-base64",
+        codificar_cursor([1]),
+        codificar_cursor(["2025-01-01T00:00:00", 1e999]),
+        codificar_cursor(["2025-01-01T00:00:00", 2**63]),
+    ],
+)
+def test_cursor_invalido(cursor: str) -> None:
+    """Cursores malformados, de outra listagem ou fora da faixa do banco."""
+    with pytest.raises(CursorInvalidoError):
+        decodificar_cursor(cursor, ORDEM.colunas)
+
+
+def test_paginas_cobrem_a_tabela_sem_repetir(engine_memoria: Engine) -> None:
+    """Seguir os cursores percorre todos os registros uma única vez."""
+    with Session(engine_memoria) as session:
+        session.add_all(CategoriaDB(nome=f"C{i}") for i in range(7))
+        session.commit()
+
+        nomes: list[str] = []
+        cursor = None
+        while True:
+            pagina = buscar_categorias(session, cursor=cursor, limite=3)
+            nomes += [categoria.nome for categoria in pagina.itens]
+            if pagina.proximo_cursor is None:
+                break
+            cursor = pagina.proximo_cursor
+
+    assert nomes == [f"C{i}" for i in range(7)]
+
+
+def test_obras_mais_recentes_primeiro(
+    engine_memoria: Engine, nova_obra: Callable[..., ObraDB]
+) -> None:
+    """Obras com a mesma data de postagem são desempatadas pelo ID."""
+    mesma_data = datetime(2025, 5, 1)  # noqa: DTZ001
+    with Session(engine_memoria) as session:
+        session.add_all(
+            [
+                nova_obra("antiga", data_postagem=datetime(2024, 1, 1)),  # noqa: DTZ001
+                nova_obra("a", data_postagem=mesma_data),
+                nova_obra("b", data_postagem=mesma_data),
+            ]
+        )
+        session.commit()
+
+        primeira = buscar_obras(session, limite=2)
+        segunda = buscar_obras(
+            session, cursor=primeira.proximo_cursor, limite=2
+        )
+
+    assert [obra.titulo for obra in primeira.itens] == ["b", "a"]
+    assert [obra.titulo for obra in segunda.itens] == ["antiga"]
+    assert segunda.proximo_cursor is None
+
+
+def test_api_rejeita_cursor_invalido() -> None:
+    """A API responde 400 para cursores adulterados."""
+    response = TestClient(app).get("/obras/", params={"cursor": "%%%"})
+    assert response.status_code == BAD_REQUEST
@@ -0,0 +1,212 @@
+"""Testes de regressão dos planos de execução das consultas frequentes.
+
+Cada consulta de repositório é executada sobre um banco populado, os
+comandos SQL emitidos são gravados e o ``EXPLAIN`` de cada um não pode
+conter varredura sequencial de tabela. Um índice removido ou uma consulta
+reescrita sem aproveitar os índices faz o teste falhar.
+"""
+
+import re
+from collections.abc import Callable, Generator
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlmodel import Session, SQLModel
+
+from models import (
+    AvaliacaoEventoDB,
+    CategoriaDB,
+    ComentarioEventoDB,
+    EventoDB,
+    ObraDB,
+    ObraEventoDB,
+    UsuarioDB,
+)
+from models.obra import FiltrosObra
+from models.usuario import Funcao
+from repositories.avaliacoes_eventos import (
+    buscar_avaliacoes_por_evento,
+    buscar_avaliacoes_por_usuario,
+)
+from repositories.comentario_evento import (
+    buscar_comentarios_por_evento,
+    buscar_comentarios_por_usuario,
+    buscar_comentarios_recentes,
+)
+from repositories.evento import buscar_evento_completo, buscar_eventos_por_obra
+from repositories.obra import (
+    adicionar_obra,
+    buscar_obras,
+    buscar_obras_por_evento,
+)
+
+QUANTIDADE = 20
+
+CONSULTAS_FREQUENTES: dict[str, Callable[[Session], object]] = {
+    "comentarios_por_evento": lambda s: buscar_comentarios_por_evento(1, s),
+    "comentarios_por_usuario": lambda s: buscar_comentarios_por_usuario(1, s),
+    "comentarios_recentes": lambda s: buscar_comentarios_recentes(1, s, 5),
+    "avaliacoes_por_evento": lambda s: buscar_avaliacoes_por_evento(1, s),
+    "avaliacoes_por_usuario": lambda s: buscar_avaliacoes_por_usuario(1, s),
+    "obras_por_evento": lambda s: buscar_obras_por_evento(1, s),
+    "eventos_por_obra": lambda s: buscar_eventos_por_obra(1, s),
+    "evento_completo": lambda s: buscar_evento_completo(1, s),
+    "obras_por_categoria": lambda s: buscar_obras(
+        s, FiltrosObra(categoria_id=1)
+    ),
+    "obras_por_usuario": lambda s: buscar_obras(s, FiltrosObra(usuario_id=1)),
+    "obras_por_tag": lambda s: buscar_obras(s, FiltrosObra(tag=["tag1"])),
+}
+
+# "SCAN tabela" sem "USING ... INDEX" é a leitura da tabela inteira; junções
+# e subconsultas materializadas aparecem entre parênteses e não contam.
+VARREDURA_SQLITE = re.compile(r"^SCAN \w+( AS \w+)?( LEFT-JOIN)?$")
+
+
+def _popular(engine: Engine, nova_obra: Callable[..., ObraDB]) -> None:
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for i in range(1, QUANTIDADE + 1):
+            session.add(
+                UsuarioDB(
+                    nome=f"U{i}",
+                    email=f"u{i}@example.com",
+                    funcao=Funcao.ARTISTA,
+                    biografia="",
+                    senha="x",
+                )
+            )
+            session.add(CategoriaDB(nome=f"C{i}"))
+        session.flush()
+        for i in range(1, QUANTIDADE + 1):
+            session.add(
+                EventoDB(
+                    nome=f"E{i}",
+                    endereco="Rua A",
+                    local="Galeria",
+                    data=datetime(2025, 1, i),  # noqa: DTZ001
+                    id_organizador=i,
+                    id_responsavel=i,
+                )
+            )
+            session.add(
+                ComentarioEventoDB(usuario_id=i, evento_id=i, comentario="c")
+            )
+            session.add(
+                AvaliacaoEventoDB(
+                    usuario_id=i, evento_id=i, gostou="sim", avaliacao=5
+                )
+            )
+        session.commit()
+        for i in range(1, QUANTIDADE + 1):
+            adicionar_obra(
+                nova_obra(
+                    f"O{i}",
+                    usuario_id=i,
+                    categoria_id=i,
+                    tags=[f"tag{i}"],
+                    data_postagem=datetime(2025, 1, i),  # noqa: DTZ001
+                ),
+                session,
+            )
+            session.add(ObraEventoDB(id_obra=i, id_evento=i))
+        session.commit()
+        session.exec(text("ANALYZE"))  # type: ignore[call-overload]
+        session.commit()
+
+
+def _comandos(
+    engine: Engine, consulta: Callable[[Session], object]
+) -> list[tuple[str, Any]]:
+    comandos: list[tuple[str, Any]] = []
+
+    def gravar(*args: Any) -> None:  # noqa: ANN401
+        comandos.append((args[2], args[3]))
+
+    event.listen(engine, "before_cursor_execute", gravar)
+    try:
+        with Session(engine) as session:
+            consulta(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", gravar)
+    return comandos
+
+
+def _varreduras_sqlite(
+    conexao: Connection,
+    comando: str,
+    parametros: Any,  # noqa: ANN401
+) -> list[str]:
+    plano = conexao.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {comando}", parametros
+    ).all()
+    return [
+        linha.detail for linha in plano if VARREDURA_SQLITE.match(linha.detail)
+    ]
+
+
+def _varreduras_postgres(
+    conexao: Connection,
+    comando: str,
+    parametros: Any,  # noqa: ANN401
+) -> list[str]:
+    # Com poucas linhas o planejador prefere varrer a tabela mesmo havendo
+    # índice; desligar a varredura sequencial deixa só as que não têm
+    # alternativa.
+    conexao.exec_driver_sql("SET enable_seqscan = off")
+    plano = conexao.exec_driver_sql(f"EXPLAIN {comando}", parametros).all()
+    return [linha[0] for linha in plano if "Seq Scan" in linha[0]]
+
+
+def _verificar_planos(engine: Engine, nome: str) -> None:
+    varreduras = (
+        _varreduras_postgres
+        if engine.dialect.name == "postgresql"
+        else _varreduras_sqlite
+    )
+    comandos = _comandos(engine, CONSULTAS_FREQUENTES[nome])
+    assert comandos
+    with engine.connect() as conexao:
+        encontradas = [
+            (comando, linha)
+            for comando, parametros in comandos
+            for linha in varreduras(conexao, comando, parametros)
+        ]
+    assert not encontradas, f"{nome} varre tabelas: {encontradas}"
+
+
+@pytest.fixture
+def banco_sqlite(
+    nova_obra: Callable[..., ObraDB],
+) -> Generator[Engine, None, None]:
+    """Cria um SQLite em memória populado com algumas linhas por tabela.
+
+    Yields:
+        Engine: Engine com o banco populado e estatísticas coletadas.
+
+    """
+    engine = create_engine("sqlite://")
+    _popular(engine, nova_obra)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("nome", CONSULTAS_FREQUENTES)
+def test_sqlite_sem_varredura_sequencial(
+    banco_sqlite: Engine, nome: str
+) -> None:
+    """As consultas frequentes usam índices no SQLite."""
+    _verificar_planos(banco_sqlite, nome)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("nome", CONSULTAS_FREQUENTES)
+def test_postgres_sem_varredura_sequencial(
+    postgres_engine: Engine, nova_obra: Callable[..., ObraDB], nome: str
+) -> None:
+    """As consultas frequentes usam índices no PostgreSQL."""
+    _popular(postgres_engine, nova_obra)
+    _verificar_planos(postgres_engine, nome)
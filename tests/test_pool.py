@@ -0,0 +1,46 @@
+"""Testes das métricas do pool de conexões."""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import exc
+
+from pool import PoolMonitorado, estatisticas_pool
+
+
+def test_estatisticas_refletem_checkouts() -> None:
+    """Conexões em uso, ociosas e esperas aparecem nas estatísticas."""
+    pool = PoolMonitorado(
+        lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=1
+    )
+    primeira = pool.connect()
+    segunda = pool.connect()
+
+    estatisticas = estatisticas_pool("teste", pool)
+    assert estatisticas.em_uso == 2  # noqa: PLR2004
+    assert estatisticas.overflow == 1
+    assert estatisticas.aquisicoes == 2  # noqa: PLR2004
+
+    segunda.close()
+    primeira.close()
+    estatisticas = estatisticas_pool("teste", pool)
+    assert estatisticas.em_uso == 0
+    assert estatisticas.ociosas == 1
+
+
+def test_timeout_do_pool_e_contabilizado() -> None:
+    """Um checkout que estoura o pool_timeout conta como timeout."""
+    pool = PoolMonitorado(
+        lambda: sqlite3.connect(":memory:"),
+        pool_size=1,
+        max_overflow=0,
+        timeout=0.01,
+    )
+    conexao = pool.connect()
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+
+    estatisticas = estatisticas_pool("teste", pool)
+    assert estatisticas.timeouts == 1
+    assert estatisticas.espera_maxima_segundos >= 0.01  # noqa: PLR2004
+    conexao.close()
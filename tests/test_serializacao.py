@@ -0,0 +1,60 @@
+"""Testes da serialização das respostas sem nova validação."""
+
+import json
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from models import EventoDB, ObraDB, UsuarioDB
+from models.evento import EventoResponse
+from models.obra import ObraResponse
+from models.usuario import Funcao, UsuarioResponse
+from serializacao import RespostaJSON, construir
+
+
+def _corpo(resposta: RespostaJSON) -> Any:  # noqa: ANN401
+    return json.loads(bytes(resposta.body))
+
+
+def test_linhas_saem_so_com_os_campos_da_resposta(
+    nova_obra: Callable[..., ObraDB],
+) -> None:
+    """Nem campos da tabela fora da resposta (a senha) nem validação."""
+    usuario = UsuarioDB(
+        id=1,
+        nome="Ana",
+        email="ana@example.com",
+        funcao=Funcao.ARTISTA,
+        biografia="",
+        senha="segredo",
+    )
+    obra = nova_obra("Mar", id=1)
+
+    assert construir(ObraResponse, obra) is obra
+    assert _corpo(RespostaJSON(construir(UsuarioResponse, usuario))) == {
+        "id": 1,
+        "nome": "Ana",
+        "email": "ana@example.com",
+        "funcao": Funcao.ARTISTA.value,
+        "biografia": "",
+    }
+    assert _corpo(RespostaJSON(obra, tipo=ObraResponse)).keys() == (
+        ObraResponse.model_fields.keys()
+    )
+
+
+def test_modelos_com_validadores_sao_validados() -> None:
+    """O validador do resumo troca a ausência de avaliações pelo padrão."""
+    evento = EventoDB(
+        id=1,
+        nome="Evento",
+        endereco="Rua A",
+        local="Sala",
+        data=datetime(2025, 1, 1),  # noqa: DTZ001
+        id_organizador=1,
+        id_responsavel=1,
+    )
+
+    resposta = _corpo(RespostaJSON(construir(EventoResponse, evento)))
+
+    assert resposta["resumo_avaliacoes"]["quantidade"] == 0
@@ -0,0 +1,184 @@
+"""Testes da sincronização incremental (``GET /sync``)."""
+
+from collections.abc import Callable, Generator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, col, create_engine, select
+
+import database
+from app import app
+from database import RoteadorLeitura
+from models import AlteracaoDB, CategoriaDB, EventoDB, ObraDB, UsuarioDB
+from models.usuario import Funcao
+from repositories.paginacao import codificar_cursor
+
+
+def _usuario(nome: str, funcao: Funcao) -> UsuarioDB:
+    return UsuarioDB(
+        nome=nome,
+        email=f"{nome}@exemplo.com",
+        funcao=funcao,
+        biografia="",
+        senha="segredo",
+    )
+
+
+@pytest.fixture
+def banco(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    nova_obra: Callable[..., ObraDB],
+) -> Generator[Engine, None, None]:
+    """Aponta a aplicação para um SQLite com um pouco de cada entidade.
+
+    Yields:
+        Engine: Engine usado pela aplicação.
+
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                _usuario("artista", Funcao.ARTISTA),
+                _usuario("visitante", Funcao.CONSUMIDOR),
+                CategoriaDB(nome="Pintura"),
+                CategoriaDB(nome="Escultura"),
+            ]
+        )
+        session.add_all(
+            nova_obra(f"Obra {i}", data_postagem=datetime(2025, 1, i + 1))  # noqa: DTZ001
+            for i in range(2)
+        )
+        session.add(
+            EventoDB(
+                nome="Evento",
+                endereco="Rua A",
+                local="Sala",
+                data=datetime(2025, 1, 1),  # noqa: DTZ001
+                id_organizador=1,
+                id_responsavel=1,
+            )
+        )
+        session.commit()
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+    yield engine
+    engine.dispose()
+
+
+def _sincronizar_tudo(client: TestClient, limite: int) -> list[dict[str, Any]]:
+    respostas = [client.get("/sync", params={"limite": limite}).json()]
+    while respostas[-1]["mais"]:
+        respostas.append(
+            client.get(
+                "/sync",
+                params={"since": respostas[-1]["token"], "limite": limite},
+            ).json()
+        )
+    return respostas
+
+
+def _ids(respostas: list[dict[str, Any]], entidade: str) -> list[int]:
+    return [
+        registro["id"]
+        for resposta in respostas
+        for registro in resposta[entidade]
+    ]
+
+
+@pytest.mark.usefixtures("banco")
+def test_sincronizacao_completa_em_paginas() -> None:
+    """Sem token, o catálogo inteiro chega em páginas limitadas."""
+    respostas = _sincronizar_tudo(TestClient(app), limite=3)
+
+    assert len(respostas) == 3  # noqa: PLR2004
+    assert _ids(respostas, "obras") == [1, 2]
+    assert _ids(respostas, "eventos") == [1]
+    assert sorted(_ids(respostas, "categorias")) == [1, 2]
+    assert _ids(respostas, "usuarios") == [1]
+    removidos = [
+        registro_id
+        for resposta in respostas
+        for registro_id in resposta["removidos"]["usuarios"]
+    ]
+    assert removidos == [2]
+    assert all(
+        "senha" not in usuario
+        for resposta in respostas
+        for usuario in resposta["usuarios"]
+    )
+
+
+def test_sincronizacao_incremental(banco: Engine) -> None:
+    """Com token, só o que mudou depois dele é lido e devolvido."""
+    client = TestClient(app)
+    token = _sincronizar_tudo(client, limite=100)[-1]["token"]
+    client.patch("/obras/2", json={"preco": 7})
+    client.patch("/obras/2", json={"preco": 8})
+    client.delete("/categorias/2")
+    client.patch("/usuarios/1", json={"funcao": Funcao.CONSUMIDOR.value})
+    comandos: list[str] = []
+    event.listen(
+        banco,
+        "before_cursor_execute",
+        lambda *args: comandos.append(str(args[2])),
+    )
+
+    resposta = client.get("/sync", params={"since": token}).json()
+
+    assert [obra["preco"] for obra in resposta["obras"]] == [8]
+    assert resposta["eventos"] == resposta["categorias"] == []
+    assert resposta["removidos"] == {
+        "obras": [],
+        "eventos": [],
+        "categorias": [2],
+        "usuarios": [1],
+    }
+    assert not resposta["mais"]
+    assert len(comandos) == len(["alteracoes", "obras", "usuarios"])
+    assert all("eventos" not in comando for comando in comandos)
+
+    seguinte = client.get("/sync", params={"since": resposta["token"]}).json()
+    assert seguinte["token"] == resposta["token"]
+    assert seguinte["obras"] == seguinte["removidos"]["categorias"] == []
+
+
+@pytest.mark.usefixtures("banco")
+@pytest.mark.parametrize(
+    "token",
+    ["@@", codificar_cursor([1e999]), codificar_cursor([-(2**63) - 1])],
+)
+def test_token_invalido(token: str) -> None:
+    """Um token adulterado é rejeitado como um cursor inválido."""
+    response = TestClient(app).get("/sync", params={"since": token})
+
+    assert response.status_code == 400  # noqa: PLR2004
+
+
+@pytest.mark.integration
+def test_postgres_numera_na_ordem_dos_commits(postgres_engine: Engine) -> None:
+    """Uma transação aberta antes recebe número maior se confirmar depois."""
+    SQLModel.metadata.create_all(postgres_engine)
+    with Session(postgres_engine) as lenta, Session(postgres_engine) as rapida:
+        lenta.add(CategoriaDB(nome="Lenta"))
+        lenta.flush()
+        rapida.add(CategoriaDB(nome="Rápida"))
+        rapida.commit()
+        lenta.commit()
+
+    with Session(postgres_engine) as session:
+        alteracoes = session.exec(
+            select(AlteracaoDB).order_by(col(AlteracaoDB.seq))
+        ).all()
+        nomes = {
+            categoria.id: categoria.nome
+            for categoria in session.exec(select(CategoriaDB))
+        }
+
+    assert [nomes[a.registro_id] for a in alteracoes] == ["Rápida", "Lenta"]
@@ -0,0 +1,80 @@
+"""Testes do modo streaming (NDJSON) das listagens."""
+
+import json
+from collections.abc import Generator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, create_engine
+
+import database
+from app import app
+from database import RoteadorLeitura
+from models import EventoDB
+from streaming import MEDIA_TYPE_NDJSON
+
+TOTAL_EVENTOS = 5
+
+
+@pytest.fixture
+def eventos_cadastrados(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    """Aponta a aplicação para um SQLite com alguns eventos.
+
+    Yields:
+        None: Banco populado durante o teste.
+
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'teste.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            EventoDB(
+                nome=f"Evento {i}",
+                endereco="Rua A",
+                local=f"Sala {i}",
+                data=datetime(2025, 1, 1),  # noqa: DTZ001
+                id_organizador=1,
+                id_responsavel=1,
+            )
+            for i in range(TOTAL_EVENTOS)
+        )
+        session.commit()
+    monkeypatch.setattr(database, "roteador", RoteadorLeitura(engine, []))
+    monkeypatch.setattr(database.settings, "database_streaming_lote", 2)
+    yield
+    engine.dispose()
+
+
+@pytest.mark.usefixtures("eventos_cadastrados")
+@pytest.mark.parametrize(
+    ("params", "headers"),
+    [({"stream": "1"}, {}), ({}, {"accept": MEDIA_TYPE_NDJSON})],
+)
+def test_listagem_transmitida_em_ndjson(
+    params: dict[str, str], headers: dict[str, str]
+) -> None:
+    """Todos os registros chegam, um objeto JSON por linha."""
+    response = TestClient(app).get("/eventos/", params=params, headers=headers)
+
+    assert response.headers["content-type"] == MEDIA_TYPE_NDJSON
+    linhas = [json.loads(linha) for linha in response.text.splitlines()]
+    assert [evento["local"] for evento in linhas] == [
+        f"Sala {i}" for i in range(TOTAL_EVENTOS)
+    ]
+
+
+@pytest.mark.usefixtures("eventos_cadastrados")
+def test_listagem_sem_streaming_continua_paginada() -> None:
+    """Sem ``stream`` a rota mantém a resposta paginada em JSON."""
+    response = TestClient(app).get("/eventos/", params={"limite": 2})
+
+    corpo = response.json()
+    assert [evento["local"] for evento in corpo["itens"]] == [
+        "Sala 0",
+        "Sala 1",
+    ]
+    assert corpo["proximo_cursor"] is not None
@@ -0,0 +1,70 @@
+"""Testes do filtro por tags e das contagens mantidas por tag."""
+
+from collections.abc import Callable, Generator
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from models import ObraDB
+from models.obra import FiltrosObra
+from models.tag import ModoTags
+from repositories.obra import adicionar_obra, buscar_obras, remover_obra
+from repositories.tag import buscar_tags, reconstruir_tags
+
+
+@pytest.fixture
+def session(
+    engine_memoria: Engine, nova_obra: Callable[..., ObraDB]
+) -> Generator[Session, None, None]:
+    """Cadastra obras pela API do repositório, mantendo as contagens.
+
+    Yields:
+        Session: Sessão sobre as obras cadastradas.
+
+    """
+    session = Session(engine_memoria)
+    adicionar_obra(nova_obra("Mar", tags=["Azul", "paisagem"]), session)
+    adicionar_obra(nova_obra("Céu", tags=["azul ", "AZUL"]), session)
+    adicionar_obra(nova_obra("Campo", tags=["Paisagem", "verde"]), session)
+    yield session
+    session.close()
+
+
+def _titulos(session: Session, modo: ModoTags, *tags: str) -> set[str]:
+    filtros = FiltrosObra(tag=list(tags), modo_tags=modo)
+    return {obra.titulo for obra in buscar_obras(session, filtros).itens}
+
+
+def test_filtro_qualquer_ou_todas(session: Session) -> None:
+    """As tags são comparadas normalizadas, em modo qualquer ou todas."""
+    assert _titulos(session, ModoTags.QUALQUER, "AZUL", "verde") == {
+        "Mar",
+        "Céu",
+        "Campo",
+    }
+    assert _titulos(session, ModoTags.TODAS, "azul", " Paisagem") == {"Mar"}
+    assert _titulos(session, ModoTags.TODAS, "azul", "verde") == set()
+
+
+def test_contagens_acompanham_as_escritas(session: Session) -> None:
+    """Criar e remover obras ajusta as contagens sem reler ``obras``."""
+    remover_obra(1, session)
+
+    contagens = {tag.nome: tag.quantidade for tag in buscar_tags(session)}
+
+    assert contagens == {"azul": 1, "paisagem": 1, "verde": 1}
+    assert _titulos(session, ModoTags.QUALQUER, "azul") == {"Céu"}
+
+
+def test_reconstrucao_corrige_divergencias(session: Session) -> None:
+    """A reconstrução recalcula as tags a partir de ``obras.tags``."""
+    obra = session.get(ObraDB, 3)
+    assert obra is not None
+    obra.tags = ["azul"]
+    session.commit()
+
+    esperadas = [("azul", 3), ("paisagem", 1)]
+
+    assert reconstruir_tags(session) == len(esperadas)
+    assert [(t.nome, t.quantidade) for t in buscar_tags(session)] == esperadas